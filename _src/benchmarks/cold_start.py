@@ -0,0 +1,332 @@
+"""
+Cold-start benchmark for the agent apps
+
+Measures how long an agent app takes from process start to its first served request and records the
+results in a JSON Lines history, so regressions in framework import cost or app startup show up as a
+failing run:
+
+- Framework imports: the statements from import_time.py, median over fresh interpreters.
+- App import: ``import agentApp`` in the app directory, with a ``python -X importtime`` breakdown per package.
+- App time to ready: from spawning uvicorn for the FastAPI app until it accepts connections,
+  and the latency of the first request to ``/health``.
+- First agent run: importing the OpenAI client, ``create_agent`` and the first and second ``run`` against
+  a local stub OpenAI-compatible server, see first_agent_run.py.
+
+Each run appends one record to the history. Every metric is compared with the median of the previous
+runs on the same Python version and platform, and the script exits with status 1 when one regressed.
+A measurement that fails is recorded under ``failures`` with its error, the other measurements still run
+and the script exits with status 1.
+
+Usage:
+    python cold_start.py
+    python cold_start.py --app-dir ../useKey/agentConcurrentOrchestrator --repeat 5
+    python cold_start.py --fetch-news          # also time /api/fetch-news, needs the Azure configuration
+    python cold_start.py --no-history --json
+"""
+
+import argparse
+import datetime
+import json
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+from import_time import DEFAULT_BUDGETS, PythonRunError, import_breakdown, measure_import, python_code, run_python
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+DEFAULT_APP_DIR = BENCHMARK_DIR.parent / "useEntra" / "agentConcurrentOrchestrator"
+DEFAULT_HISTORY = BENCHMARK_DIR / "results" / "history.jsonl"
+
+
+# region Stub OpenAI-compatible server
+
+
+class _StubOpenAIHandler(BaseHTTPRequestHandler):
+    """Answers every chat completion with a fixed reply, streamed when the request asks for it."""
+
+    def do_POST(self) -> None:
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        if not self.path.endswith("/chat/completions"):
+            self.send_error(404)
+            return
+        model = body.get("model", "stub")
+        if body.get("stream"):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.end_headers()
+            for delta, finish_reason in (({"role": "assistant", "content": "pong"}, None), ({}, "stop")):
+                chunk = {
+                    "id": "chatcmpl-stub",
+                    "object": "chat.completion.chunk",
+                    "created": int(time.time()),
+                    "model": model,
+                    "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+                }
+                self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+            self.wfile.write(b"data: [DONE]\n\n")
+            return
+        payload = json.dumps(
+            {
+                "id": "chatcmpl-stub",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [
+                    {"index": 0, "message": {"role": "assistant", "content": "pong"}, "finish_reason": "stop"}
+                ],
+                "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class StubOpenAIServer:
+    """A local OpenAI-compatible chat completions server running in a background thread."""
+
+    def __enter__(self) -> "StubOpenAIServer":
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _StubOpenAIHandler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}/v1"
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+# region Measurements
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _request_ms(url: str, method: str = "GET", timeout: float = 300) -> float:
+    start = time.perf_counter()
+    with urllib.request.urlopen(urllib.request.Request(url, method=method), timeout=timeout) as response:
+        response.read()
+    return (time.perf_counter() - start) * 1000
+
+
+def measure_app_start(
+    app_dir: Path, app: str, library: str | None, fetch_news: bool, timeout: float
+) -> dict[str, float]:
+    """Start the FastAPI app with uvicorn and time it until ready, then time its first requests."""
+    port = _free_port()
+    server = f"import uvicorn; uvicorn.run({app!r}, host='127.0.0.1', port={port}, log_level='warning')"
+    code = python_code(server, library)
+    # stderr goes to a file, an undrained pipe could block a chatty app.
+    stderr = tempfile.TemporaryFile(mode="w+")
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, "-c", code], cwd=app_dir, stdout=subprocess.DEVNULL, stderr=stderr)
+    try:
+        while True:
+            if process.poll() is not None:
+                stderr.seek(0)
+                raise RuntimeError(f"{app} exited before it was ready:\n{stderr.read()}")
+            if time.perf_counter() - start > timeout:
+                raise RuntimeError(f"{app} was not ready after {timeout} seconds.")
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+                break
+            except OSError:
+                time.sleep(0.005)
+        timings = {"app_time_to_ready": (time.perf_counter() - start) * 1000}
+        timings["app_first_request"] = _request_ms(f"http://127.0.0.1:{port}/health")
+        timings["app_second_request"] = _request_ms(f"http://127.0.0.1:{port}/health")
+        if fetch_news:
+            timings["app_fetch_news"] = _request_ms(f"http://127.0.0.1:{port}/api/fetch-news", method="POST")
+        return timings
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+        stderr.close()
+
+
+def measure_first_agent_run(base_url: str, library: str | None) -> dict[str, float]:
+    args = [str(BENCHMARK_DIR / "first_agent_run.py"), "--base-url", base_url]
+    if library:
+        args += ["--library", library]
+    return json.loads(run_python(args).stdout.strip().splitlines()[-1])
+
+
+def package_totals(modules: list[dict[str, Any]], top: int) -> dict[str, float]:
+    """Sum the self time of the imported modules per top-level package."""
+    totals: defaultdict[str, float] = defaultdict(float)
+    for module in modules:
+        totals[module["module"].split(".")[0]] += module["self_ms"]
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True)[:top])
+
+
+def _median_of_runs(runs: list[dict[str, float]]) -> dict[str, float]:
+    return {name: statistics.median(run[name] for run in runs) for name in runs[0]}
+
+
+def _error_summary(error: Exception) -> str:
+    if isinstance(error, PythonRunError):
+        return error.summary
+    lines = str(error).strip().splitlines()
+    return lines[-1] if lines else type(error).__name__
+
+
+# region History
+
+
+def _git_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BENCHMARK_DIR, capture_output=True, text=True, timeout=10
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return result.stdout.strip() or None
+
+
+def _environment() -> dict[str, str]:
+    return {"python": platform.python_version(), "platform": platform.platform(), "machine": platform.machine()}
+
+
+def load_history(path: Path) -> list[dict[str, Any]]:
+    if not path.exists():
+        return []
+    with path.open(encoding="utf-8") as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+def find_regressions(
+    record: dict[str, Any], history: list[dict[str, Any]], baseline_runs: int, threshold: float, min_delta_ms: float
+) -> list[dict[str, Any]]:
+    """Compare the metrics with the median of the last runs in the same environment."""
+    previous = [entry for entry in history if entry.get("environment") == record["environment"]][-baseline_runs:]
+    regressions = []
+    for name, value in record["metrics"].items():
+        baseline_values = [entry["metrics"][name] for entry in previous if name in entry.get("metrics", {})]
+        if not baseline_values:
+            continue
+        baseline = statistics.median(baseline_values)
+        if value > baseline * (1 + threshold) and value - baseline > min_delta_ms:
+            regressions.append({"metric": name, "value_ms": value, "baseline_ms": baseline})
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure agent app import time, time to ready and first requests.")
+    parser.add_argument("--app-dir", type=Path, default=DEFAULT_APP_DIR, help="Directory of the FastAPI app.")
+    parser.add_argument("--app", default="agentApp:app", help="The app as module:attribute (default: agentApp:app).")
+    parser.add_argument("--library", help="Directory with agent_framework to use when it is not installed.")
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh processes per measurement (default: 3).")
+    parser.add_argument("--fetch-news", action="store_true", help="Also time /api/fetch-news (needs Azure).")
+    parser.add_argument("--skip-app", action="store_true", help="Only measure the framework and the agent run.")
+    parser.add_argument("--timeout", type=float, default=120, help="Seconds to wait for the app to be ready.")
+    parser.add_argument("--top", type=int, default=10, help="Packages to list in the app import breakdown.")
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY, help="JSON Lines file with past runs.")
+    parser.add_argument("--no-history", action="store_true", help="Do not read or append the history.")
+    parser.add_argument("--baseline-runs", type=int, default=5, help="Past runs the baseline is the median of.")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown over the baseline (0.2=20%%).")
+    parser.add_argument("--min-delta", type=float, default=10, help="Ignore slowdowns below this many milliseconds.")
+    parser.add_argument("--json", action="store_true", help="Print the record as JSON.")
+    args = parser.parse_args()
+
+    metrics: dict[str, float] = {}
+    # Measurement -> error; a failed measurement is reported and the others still run
+    failures: dict[str, str] = {}
+    for statement in DEFAULT_BUDGETS:
+        try:
+            metrics[f"import:{statement}"] = statistics.median(measure_import(statement, args.repeat, args.library))
+        except PythonRunError as ex:
+            failures[f"import:{statement}"] = ex.summary
+
+    try:
+        with StubOpenAIServer() as stub:
+            runs = [measure_first_agent_run(stub.base_url, args.library) for _ in range(args.repeat)]
+        metrics.update(_median_of_runs(runs))
+    except (RuntimeError, ValueError) as ex:
+        failures["agent_run"] = _error_summary(ex)
+
+    app_packages: dict[str, float] = {}
+    if not args.skip_app:
+        module = args.app.split(":")[0]
+        app_dir = str(args.app_dir.resolve())
+        try:
+            timings = measure_import(f"import {module}", args.repeat, args.library, app_dir)
+            metrics["app_import"] = statistics.median(timings)
+            app_packages = package_totals(import_breakdown(f"import {module}", None, args.library, app_dir), args.top)
+        except PythonRunError as ex:
+            failures["app_import"] = ex.summary
+        try:
+            runs = [
+                measure_app_start(args.app_dir.resolve(), args.app, args.library, args.fetch_news, args.timeout)
+                for _ in range(args.repeat)
+            ]
+            metrics.update(_median_of_runs(runs))
+        except (OSError, RuntimeError) as ex:
+            failures["app_start"] = _error_summary(ex)
+
+    record = {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "environment": _environment(),
+        "repeat": args.repeat,
+        "metrics": {name: round(value, 2) for name, value in metrics.items()},
+        "app_import_packages": {name: round(value, 2) for name, value in app_packages.items()},
+        "failures": failures,
+    }
+    regressions = []
+    if not args.no_history:
+        regressions = find_regressions(
+            record, load_history(args.history), args.baseline_runs, args.threshold, args.min_delta
+        )
+        args.history.parent.mkdir(parents=True, exist_ok=True)
+        with args.history.open("a", encoding="utf-8") as file:
+            file.write(json.dumps(record) + "\n")
+
+    if args.json:
+        print(json.dumps({**record, "regressions": regressions}, indent=2))
+    else:
+        for name, value in record["metrics"].items():
+            print(f"{value:10.1f} ms  {name}")
+        if app_packages:
+            print(f"\nApp import, self time per package ({args.app}):")
+            for name, value in record["app_import_packages"].items():
+                print(f"{value:10.1f} ms  {name}")
+        for regression in regressions:
+            print(
+                f"\nREGRESSION {regression['metric']}: {regression['value_ms']:.1f} ms, "
+                f"baseline {regression['baseline_ms']:.1f} ms"
+            )
+        if failures:
+            print()
+        for name, error in failures.items():
+            print(f"FAILED {name}: {error}")
+
+    return 1 if regressions or failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
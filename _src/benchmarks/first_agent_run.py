@@ -0,0 +1,60 @@
+"""
+First agent run against an OpenAI-compatible server
+
+Run by cold_start.py in a fresh interpreter. It times the steps an app takes before its first agent
+response: importing the OpenAI client, creating the agent, the first run and a second, warm run. The
+timings are printed as one JSON object in milliseconds.
+
+Usage:
+    python first_agent_run.py --base-url http://127.0.0.1:8001/v1
+"""
+
+import time
+
+_START = time.perf_counter()
+
+import argparse  # noqa: E402
+import asyncio  # noqa: E402
+import json  # noqa: E402
+import os  # noqa: E402
+import sys  # noqa: E402
+
+
+def _elapsed_ms(start: float) -> float:
+    return (time.perf_counter() - start) * 1000
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Time the first agent run against an OpenAI-compatible server.")
+    parser.add_argument("--base-url", required=True, help="Base URL of the OpenAI-compatible server.")
+    parser.add_argument("--library", help="Directory with agent_framework to use when it is not installed.")
+    args = parser.parse_args()
+    if args.library:
+        sys.path.append(os.path.abspath(args.library))
+
+    timings = {}
+    start = time.perf_counter()
+    from agent_framework.openai import OpenAIChatClient
+
+    timings["agent_import"] = _elapsed_ms(start)
+
+    start = time.perf_counter()
+    agent = OpenAIChatClient(base_url=args.base_url, api_key="stub", model_id="stub").create_agent(
+        name="benchmark", instructions="You are a benchmark assistant."
+    )
+    timings["agent_create"] = _elapsed_ms(start)
+
+    start = time.perf_counter()
+    await agent.run("ping")
+    timings["agent_first_run"] = _elapsed_ms(start)
+    timings["agent_time_to_first_response"] = _elapsed_ms(_START)
+
+    start = time.perf_counter()
+    await agent.run("ping")
+    timings["agent_second_run"] = _elapsed_ms(start)
+
+    print(json.dumps(timings))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
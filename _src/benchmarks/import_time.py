@@ -0,0 +1,150 @@
+"""
+Import-time benchmark for agent_framework
+
+Measures how long common agent_framework imports take in a fresh interpreter and fails when one of
+them exceeds its cold-start budget, so a change that makes ``import agent_framework`` eager again is
+caught before it reaches the CLI scripts and serverless workers.
+
+Every scenario runs in its own subprocess, ``--repeat`` times, and the median is compared with the budget.
+A statement that fails to import is reported as failed, the remaining statements are still measured.
+
+Usage:
+    python import_time.py
+    python import_time.py --library path/to/site-packages --repeat 7
+    python import_time.py --budget "import agent_framework=50" --top 15
+    python import_time.py --json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# Statement -> cold-start budget in milliseconds.
+DEFAULT_BUDGETS = {
+    "import agent_framework": 100.0,
+    "from agent_framework import ChatAgent": 500.0,
+    "from agent_framework.azure import AzureAIAgentClient": 1000.0,
+    "from agent_framework import WorkflowBuilder": 750.0,
+}
+
+_TIMER = "import time; _start = time.perf_counter(); {statement}; print(time.perf_counter() - _start)"
+
+
+def python_code(statement: str, library: str | None = None) -> str:
+    """Code for ``python -c``; the library directory is appended to sys.path, after the installed packages."""
+    if not library:
+        return statement
+    return f"import sys; sys.path.append({os.path.abspath(library)!r}); {statement}"
+
+
+class PythonRunError(RuntimeError):
+    """A fresh interpreter exited with an error."""
+
+    def __init__(self, args: list[str], stderr: str) -> None:
+        super().__init__(f"{' '.join(args)} failed:\n{stderr}")
+        self.stderr = stderr
+
+    @property
+    def summary(self) -> str:
+        """The last line of the error output, usually the exception."""
+        lines = self.stderr.strip().splitlines()
+        return lines[-1] if lines else "exited with an error"
+
+
+def run_python(args: list[str], cwd: str | None = None) -> subprocess.CompletedProcess[str]:
+    """Run a fresh interpreter and raise PythonRunError with its error output when it fails."""
+    result = subprocess.run([sys.executable, *args], capture_output=True, text=True, cwd=cwd)
+    if result.returncode != 0:
+        raise PythonRunError(args, result.stderr)
+    return result
+
+
+def measure_import(statement: str, repeat: int, library: str | None = None, cwd: str | None = None) -> list[float]:
+    """Run the statement in `repeat` fresh interpreters and return the import times in milliseconds."""
+    code = python_code(_TIMER.format(statement=statement), library)
+    return [float(run_python(["-c", code], cwd).stdout.strip().splitlines()[-1]) * 1000 for _ in range(repeat)]
+
+
+def import_breakdown(
+    statement: str, top: int | None, library: str | None = None, cwd: str | None = None
+) -> list[dict[str, float | str]]:
+    """Return the `top` modules (all when None) with the highest cumulative time from ``python -X importtime``."""
+    result = run_python(["-X", "importtime", "-c", python_code(statement, library)], cwd)
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line[len("import time:") :].split("|"))
+        modules.append(
+            {"module": name, "self_ms": int(self_us) / 1000, "cumulative_ms": int(cumulative_us) / 1000}
+        )
+    return sorted(modules, key=lambda module: module["cumulative_ms"], reverse=True)[:top]
+
+
+def parse_budgets(overrides: list[str]) -> dict[str, float]:
+    """Merge "statement=milliseconds" overrides into the default budgets."""
+    budgets = dict(DEFAULT_BUDGETS)
+    for override in overrides:
+        statement, _, budget = override.rpartition("=")
+        if not statement:
+            raise SystemExit(f"Invalid budget '{override}', expected \"statement=milliseconds\".")
+        budgets[statement.strip()] = float(budget)
+    return budgets
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure agent_framework import times against cold-start budgets.")
+    parser.add_argument("--library", help="Directory with agent_framework to use when it is not installed.")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per statement (default: 5).")
+    parser.add_argument(
+        "--budget", action="append", default=[], help='Override or add a budget as "statement=milliseconds".'
+    )
+    parser.add_argument("--top", type=int, default=0, help="Also show the N slowest modules per statement.")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON.")
+    args = parser.parse_args()
+
+    results = []
+    for statement, budget in parse_budgets(args.budget).items():
+        try:
+            timings = measure_import(statement, args.repeat, args.library)
+            slowest_modules = import_breakdown(statement, args.top, args.library) if args.top else None
+        except PythonRunError as ex:
+            # Keep measuring the other statements, the failure is reported with the results
+            results.append({"statement": statement, "budget_ms": budget, "within_budget": False, "error": ex.summary})
+            continue
+        result = {
+            "statement": statement,
+            "median_ms": statistics.median(timings),
+            "min_ms": min(timings),
+            "max_ms": max(timings),
+            "budget_ms": budget,
+            "within_budget": statistics.median(timings) <= budget,
+        }
+        if slowest_modules is not None:
+            result["slowest_modules"] = slowest_modules
+        results.append(result)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for result in results:
+            if "error" in result:
+                print(f"{'':12}(budget {result['budget_ms']:.0f} ms)  {'FAILED':11}  {result['statement']}")
+                print(f"{'':12}{result['error']}")
+                continue
+            status = "ok" if result["within_budget"] else "OVER BUDGET"
+            print(
+                f"{result['median_ms']:8.1f} ms (budget {result['budget_ms']:.0f} ms)  {status:11}  "
+                f"{result['statement']}"
+            )
+            for module in result.get("slowest_modules", []):
+                print(f"{'':12}{module['cumulative_ms']:8.1f} ms  {module['module']}")
+
+    return 0 if all(result["within_budget"] for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
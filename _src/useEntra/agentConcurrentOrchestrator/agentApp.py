@@ -104,6 +104,8 @@ class AgentOrchestrator:
                     async_credential=credential,
                     endpoint=os.getenv("AZURE_AI_PROJECT_ENDPOINT"),
                     deployment_name=os.getenv("AZURE_AI_MODEL_DEPLOYMENT_NAME"),
+                    # Reuse server-side agents across requests instead of creating and deleting one each time
+                    agent_registry=True,
                 ) as agentClient
             ):
                 # Create BBC News Agent
@@ -105,6 +105,8 @@ class AgentOrchestrator:
                 # model_deployment_name=os.getenv("AZURE_AI_MODEL_DEPLOYMENT_NAME"),
                 endpoint=os.getenv("AZURE_AI_PROJECT_ENDPOINT"),
                 deployment_name=os.getenv("AZURE_AI_MODEL_DEPLOYMENT_NAME"),
+                # Reuse server-side agents across requests instead of creating and deleting one each time
+                agent_registry=True,
             ).create_agent(
                 name="IntelligentAssistant",
                 instructions="""You are a helpful BBC news & crypto currency assistant. Provide concise and informative 
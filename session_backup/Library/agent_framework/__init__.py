@@ -1,7 +1,8 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import importlib
 import importlib.metadata
-from typing import Final
+from typing import Any, Final
 
 try:
     _version = importlib.metadata.version(__name__)
@@ -9,14 +10,214 @@ except importlib.metadata.PackageNotFoundError:
     _version = "0.0.0"  # Fallback for development mode
 __version__: Final[str] = _version
 
-from ._agents import *  # noqa: F403
-from ._clients import *  # noqa: F403
-from ._logging import *  # noqa: F403
-from ._mcp import *  # noqa: F403
-from ._memory import *  # noqa: F403
-from ._middleware import *  # noqa: F403
-from ._telemetry import *  # noqa: F403
-from ._threads import *  # noqa: F403
-from ._tools import *  # noqa: F403
-from ._types import *  # noqa: F403
-from ._workflows import *  # noqa: F403
+# Imported eagerly, because importing it configures the logging format.
+from ._logging import *  # noqa: E402, F403
+
+# The remaining public names are imported on first access (PEP 562), so ``import agent_framework`` does not
+# pay for the workflows package, the MCP SDK and the other optional parts until they are used.
+_IMPORTS: dict[str, tuple[str, ...]] = {
+    "_agents": (
+        "AgentProtocol",
+        "BaseAgent",
+        "ChatAgent",
+    ),
+    "_clients": (
+        "BaseChatClient",
+        "ChatClientProtocol",
+    ),
+    "_mcp": (
+        "MCPCatalogueCache",
+        "MCPStdioTool",
+        "MCPStreamableHTTPTool",
+        "MCPToolPool",
+        "MCPWebsocketTool",
+    ),
+    "_memory": (
+        "AggregateContextProvider",
+        "Context",
+        "ContextProvider",
+    ),
+    "_middleware": (
+        "AgentMiddleware",
+        "AgentMiddlewares",
+        "AgentRunContext",
+        "ChatContext",
+        "ChatMiddleware",
+        "FunctionInvocationContext",
+        "FunctionMiddleware",
+        "Middleware",
+        "agent_middleware",
+        "chat_middleware",
+        "function_middleware",
+        "use_agent_middleware",
+        "use_chat_middleware",
+    ),
+    "_telemetry": (
+        "AGENT_FRAMEWORK_USER_AGENT",
+        "APP_INFO",
+        "USER_AGENT_KEY",
+        "USER_AGENT_TELEMETRY_DISABLED_ENV_VAR",
+        "prepend_agent_framework_to_user_agent",
+    ),
+    "_threads": (
+        "AgentThread",
+        "ChatHistoryCompactor",
+        "ChatMessageStore",
+        "ChatMessageStoreProtocol",
+        "CompactableChatMessageStoreProtocol",
+        "TokenBudgetChatMessageStore",
+    ),
+    "_tools": (
+        "AIFunction",
+        "FUNCTION_INVOKING_CHAT_CLIENT_MARKER",
+        "FunctionInvocationConfiguration",
+        "HostedCodeInterpreterTool",
+        "HostedFileSearchTool",
+        "HostedMCPSpecificApproval",
+        "HostedMCPTool",
+        "HostedWebSearchTool",
+        "InMemoryToolResultCache",
+        "ToolProtocol",
+        "ToolResultCacheProtocol",
+        "ai_function",
+        "use_function_invocation",
+    ),
+    "_types": (
+        "AgentRunResponse",
+        "AgentRunResponseUpdate",
+        "AnnotatedRegions",
+        "Annotations",
+        "BaseAnnotation",
+        "BaseContent",
+        "ChatMessage",
+        "ChatOptions",
+        "ChatResponse",
+        "ChatResponseUpdate",
+        "CitationAnnotation",
+        "Contents",
+        "DataContent",
+        "ErrorContent",
+        "FinishReason",
+        "FunctionApprovalRequestContent",
+        "FunctionApprovalResponseContent",
+        "FunctionCallContent",
+        "FunctionResultContent",
+        "HostedFileContent",
+        "HostedVectorStoreContent",
+        "Role",
+        "TextContent",
+        "TextReasoningContent",
+        "TextSpanRegion",
+        "ToolMode",
+        "UriContent",
+        "UsageContent",
+        "UsageDetails",
+        "prepare_function_call_results",
+    ),
+    "_workflows": (
+        "AgentExecutor",
+        "AgentExecutorRequest",
+        "AgentExecutorResponse",
+        "AgentRunEvent",
+        "AgentRunUpdateEvent",
+        "Case",
+        "CheckpointStorage",
+        "ConcurrentBuilder",
+        "DEFAULT_MANAGER_INSTRUCTIONS",
+        "DEFAULT_MANAGER_STRUCTURED_OUTPUT_PROMPT",
+        "DEFAULT_MAX_ITERATIONS",
+        "Default",
+        "Edge",
+        "EdgeDuplicationError",
+        "Executor",
+        "ExecutorCompletedEvent",
+        "ExecutorEvent",
+        "ExecutorFailedEvent",
+        "ExecutorInvokedEvent",
+        "FanInEdgeGroup",
+        "FanOutEdgeGroup",
+        "FileCheckpointStorage",
+        "FunctionExecutor",
+        "GraphConnectivityError",
+        "GroupChatBuilder",
+        "GroupChatDirective",
+        "GroupChatStateSnapshot",
+        "HandoffBuilder",
+        "HandoffUserInputRequest",
+        "InMemoryCheckpointStorage",
+        "InProcRunnerContext",
+        "MagenticAgentDeltaEvent",
+        "MagenticAgentMessageEvent",
+        "MagenticBuilder",
+        "MagenticContext",
+        "MagenticFinalResultEvent",
+        "MagenticManagerBase",
+        "MagenticOrchestratorMessageEvent",
+        "MagenticPlanReviewDecision",
+        "MagenticPlanReviewReply",
+        "MagenticPlanReviewRequest",
+        "ManagerDirectiveModel",
+        "Message",
+        "OrchestrationState",
+        "RequestInfoEvent",
+        "Runner",
+        "RunnerContext",
+        "SequentialBuilder",
+        "SharedConversation",
+        "SharedState",
+        "SingleEdgeGroup",
+        "StandardMagenticManager",
+        "SubWorkflowRequestMessage",
+        "SubWorkflowResponseMessage",
+        "SwitchCaseEdgeGroup",
+        "SwitchCaseEdgeGroupCase",
+        "SwitchCaseEdgeGroupDefault",
+        "TypeCompatibilityError",
+        "ValidationTypeEnum",
+        "Workflow",
+        "WorkflowAgent",
+        "WorkflowBuilder",
+        "WorkflowCheckpoint",
+        "WorkflowCheckpointSummary",
+        "WorkflowContext",
+        "WorkflowErrorDetails",
+        "WorkflowEvent",
+        "WorkflowEventSource",
+        "WorkflowExecutor",
+        "WorkflowFailedEvent",
+        "WorkflowLifecycleEvent",
+        "WorkflowOutputEvent",
+        "WorkflowProfiler",
+        "WorkflowRunResult",
+        "WorkflowRunState",
+        "WorkflowStartedEvent",
+        "WorkflowStatusEvent",
+        "WorkflowValidationError",
+        "WorkflowViz",
+        "create_edge_runner",
+        "executor",
+        "get_checkpoint_summary",
+        "handler",
+        "response_handler",
+        "validate_workflow_graph",
+    ),
+}
+_SUBMODULES = ("exceptions", "observability")
+_MODULE_BY_NAME = {name: module_name for module_name, names in _IMPORTS.items() for name in names}
+
+__all__ = ["__version__", "get_logger", *_MODULE_BY_NAME]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _MODULE_BY_NAME.get(name)
+    if module_name is not None:
+        value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+        globals()[name] = value
+        return value
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"Module {__name__} has no attribute {name}.")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_MODULE_BY_NAME, *_SUBMODULES})
@@ -0,0 +1,19 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from typing import Final
+
+from . import exceptions as exceptions
+from . import observability as observability
+from ._agents import *  # noqa: F403
+from ._clients import *  # noqa: F403
+from ._logging import *  # noqa: F403
+from ._mcp import *  # noqa: F403
+from ._memory import *  # noqa: F403
+from ._middleware import *  # noqa: F403
+from ._telemetry import *  # noqa: F403
+from ._threads import *  # noqa: F403
+from ._tools import *  # noqa: F403
+from ._types import *  # noqa: F403
+from ._workflows import *  # noqa: F403
+
+__version__: Final[str]
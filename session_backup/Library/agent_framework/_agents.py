@@ -7,22 +7,18 @@ from collections.abc import AsyncIterable, Awaitable, Callable, MutableMapping,
 from contextlib import AbstractAsyncContextManager, AsyncExitStack
 from copy import copy
 from itertools import chain
-from typing import Any, ClassVar, Literal, Protocol, TypeVar, cast, runtime_checkable
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, Protocol, TypeVar, cast, runtime_checkable
 from uuid import uuid4
 
-from mcp import types
-from mcp.server.lowlevel import Server
-from mcp.shared.exceptions import McpError
 from pydantic import BaseModel, Field, create_model
 
-from ._clients import BaseChatClient, ChatClientProtocol
+from ._clients import BaseChatClient, ChatClientProtocol, _is_mcp_tool
 from ._logging import get_logger
-from ._mcp import LOG_LEVEL_MAPPING, MCPTool
 from ._memory import AggregateContextProvider, Context, ContextProvider
 from ._middleware import Middleware, use_agent_middleware
 from ._serialization import SerializationMixin
-from ._threads import AgentThread, ChatMessageStoreProtocol
-from ._tools import FUNCTION_INVOKING_CHAT_CLIENT_MARKER, AIFunction, ToolProtocol
+from ._threads import AgentThread, ChatHistoryCompactor, ChatMessageStoreProtocol
+from ._tools import FUNCTION_INVOKING_CHAT_CLIENT_MARKER, AIFunction, SpeculativeFunctionCalls, ToolProtocol
 from ._types import (
     AgentRunResponse,
     AgentRunResponseUpdate,
@@ -32,10 +28,14 @@ from ._types import (
     ChatResponseUpdate,
     Role,
     ToolMode,
+    _as_ai_function,
 )
 from .exceptions import AgentExecutionException, AgentInitializationError
 from .observability import use_agent_observability
 
+if TYPE_CHECKING:
+    from mcp.server.lowlevel import Server
+
 if sys.version_info >= (3, 12):
     from typing import override  # type: ignore # pragma: no cover
 else:
@@ -610,6 +610,7 @@ class ChatAgent(BaseAgent):
         top_p: float | None = None,
         user: str | None = None,
         additional_chat_options: dict[str, Any] | None = None,
+        speculative_function_calls: SpeculativeFunctionCalls | None = None,
         **kwargs: Any,
     ) -> None:
         """Initialize a ChatAgent instance.
@@ -652,6 +653,12 @@ class ChatAgent(BaseAgent):
             additional_chat_options: A dictionary of other values that will be passed through
                 to the chat_client ``get_response`` and ``get_streaming_response`` methods.
                 This can be used to pass provider specific parameters.
+            speculative_function_calls: Function calls to start concurrently with the first model request
+                of every run, as a mapping of function name to arguments, or a callable that predicts them
+                from the request messages. Results are reused when the model requests the same calls.
+                Useful for agents that call the same tool on (almost) every run. Only functions marked
+                ``side_effect_free`` are started. Requires a function invoking chat client, see
+                ``FunctionInvocationConfiguration``.
             kwargs: Any additional keyword arguments. Will be stored as ``additional_properties``.
 
         Raises:
@@ -678,14 +685,15 @@ class ChatAgent(BaseAgent):
         )
         self.chat_client = chat_client
         self.chat_message_store_factory = chat_message_store_factory
+        self.speculative_function_calls = speculative_function_calls
 
         # We ignore the MCP Servers here and store them separately,
         # we add their functions to the tools list at runtime
         normalized_tools: list[ToolProtocol | Callable[..., Any] | MutableMapping[str, Any]] = (  # type:ignore[reportUnknownVariableType]
             [] if tools is None else tools if isinstance(tools, list) else [tools]  # type: ignore[list-item]
         )
-        self._local_mcp_tools = [tool for tool in normalized_tools if isinstance(tool, MCPTool)]
-        agent_tools = [tool for tool in normalized_tools if not isinstance(tool, MCPTool)]
+        self._local_mcp_tools = [tool for tool in normalized_tools if _is_mcp_tool(tool)]
+        agent_tools = [self._as_tool(tool) for tool in normalized_tools if not _is_mcp_tool(tool)]
         self.chat_options = ChatOptions(
             model_id=model_id,
             conversation_id=conversation_id,
@@ -741,8 +749,26 @@ class ChatAgent(BaseAgent):
             exc_val: The exception value if an exception was raised, None otherwise.
             exc_tb: The exception traceback if an exception was raised, None otherwise.
         """
+        if self.context_provider is not None:
+            # Deliver invoked notifications still queued in the background
+            await self.context_provider.aclose()
         await self._async_exit_stack.aclose()
 
+    def _as_tool(
+        self, tool: ToolProtocol | Callable[..., Any] | MutableMapping[str, Any]
+    ) -> ToolProtocol | MutableMapping[str, Any]:
+        """Wrap a plain function into this agent's AIFunction for it, created once per agent and function."""
+        if isinstance(tool, (ToolProtocol, MutableMapping)):
+            return tool
+        return _as_ai_function(tool, self)
+
+    def _add_speculative_function_calls(self, kwargs: dict[str, Any]) -> None:
+        """Pass the agent's speculative function calls to a function invoking chat client, unless set per run."""
+        if self.speculative_function_calls is not None and hasattr(
+            self.chat_client, FUNCTION_INVOKING_CHAT_CLIENT_MARKER
+        ):
+            kwargs.setdefault("speculative_function_calls", self.speculative_function_calls)
+
     def _update_agent_name(self) -> None:
         """Update the agent name in the chat client.
 
@@ -829,12 +855,12 @@ class ChatAgent(BaseAgent):
         final_tools: list[ToolProtocol | Callable[..., Any] | dict[str, Any]] = []
         # Normalize tools argument to a list without mutating the original parameter
         for tool in normalized_tools:
-            if isinstance(tool, MCPTool):
+            if _is_mcp_tool(tool):
                 if not tool.is_connected:
                     await self._async_exit_stack.enter_async_context(tool)
                 final_tools.extend(tool.functions)  # type: ignore
             else:
-                final_tools.append(tool)  # type: ignore
+                final_tools.append(self._as_tool(tool))  # type: ignore
 
         for mcp_server in self._local_mcp_tools:
             if not mcp_server.is_connected:
@@ -860,6 +886,7 @@ class ChatAgent(BaseAgent):
             user=user,
             **(additional_chat_options or {}),
         )
+        self._add_speculative_function_calls(kwargs)
         response = await self.chat_client.get_response(messages=thread_messages, chat_options=co, **kwargs)
 
         await self._update_thread_with_type_and_conversation_id(thread, response.conversation_id)
@@ -957,12 +984,12 @@ class ChatAgent(BaseAgent):
         )
         # Normalize tools argument to a list without mutating the original parameter
         for tool in normalized_tools:
-            if isinstance(tool, MCPTool):
+            if _is_mcp_tool(tool):
                 if not tool.is_connected:
                     await self._async_exit_stack.enter_async_context(tool)
                 final_tools.extend(tool.functions)  # type: ignore
             else:
-                final_tools.append(tool)
+                final_tools.append(self._as_tool(tool))
 
         for mcp_server in self._local_mcp_tools:
             if not mcp_server.is_connected:
@@ -989,6 +1016,7 @@ class ChatAgent(BaseAgent):
             **(additional_chat_options or {}),
         )
 
+        self._add_speculative_function_calls(kwargs)
         response_updates: list[ChatResponseUpdate] = []
         async for update in self.chat_client.get_streaming_response(
             messages=thread_messages, chat_options=co, **kwargs
@@ -1018,6 +1046,7 @@ class ChatAgent(BaseAgent):
         self,
         *,
         service_thread_id: str | None = None,
+        compactor: ChatHistoryCompactor | None = None,
         **kwargs: Any,
     ) -> AgentThread:
         """Get a new conversation thread for the agent.
@@ -1038,6 +1067,7 @@ class ChatAgent(BaseAgent):
 
         Keyword Args:
             service_thread_id: Optional service managed thread ID.
+            compactor: Optional ChatHistoryCompactor for locally managed threads.
             kwargs: Not used at present.
 
         Returns:
@@ -1057,8 +1087,9 @@ class ChatAgent(BaseAgent):
             return AgentThread(
                 message_store=self.chat_message_store_factory(),
                 context_provider=self.context_provider,
+                compactor=compactor,
             )
-        return AgentThread(context_provider=self.context_provider)
+        return AgentThread(context_provider=self.context_provider, compactor=compactor)
 
     def as_mcp_server(
         self,
@@ -1084,6 +1115,12 @@ class ChatAgent(BaseAgent):
         Returns:
             The MCP server instance.
         """
+        from mcp import types
+        from mcp.server.lowlevel import Server
+        from mcp.shared.exceptions import McpError
+
+        from ._mcp import LOG_LEVEL_MAPPING
+
         server_args: dict[str, Any] = {
             "name": server_name,
             "version": version,
@@ -1225,7 +1262,9 @@ class ChatAgent(BaseAgent):
         Raises:
             AgentExecutionException: If the conversation IDs on the thread and agent don't match.
         """
-        chat_options = copy(self.chat_options) if self.chat_options else ChatOptions()
+        # The agent's options are shared by all runs and only copied when a context provider changes them.
+        # The callers layer the per-run options on top with ``&``, which never mutates either side.
+        chat_options = self.chat_options if self.chat_options else ChatOptions()
         thread = thread or self.get_new_thread()
         if thread.service_thread_id and thread.context_provider:
             await thread.context_provider.thread_created(thread.service_thread_id)
@@ -1239,6 +1278,8 @@ class ChatAgent(BaseAgent):
                 if context:
                     if context.messages:
                         thread_messages.extend(context.messages)
+                    if context.tools or context.instructions:
+                        chat_options = copy(chat_options)
                     if context.tools:
                         if chat_options.tools is not None:
                             chat_options.tools.extend(context.tools)
@@ -1,14 +1,15 @@
 # Copyright (c) Microsoft. All rights reserved.
 
 import asyncio
+import sys
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterable, Callable, MutableMapping, MutableSequence, Sequence
-from typing import TYPE_CHECKING, Any, ClassVar, Literal, Protocol, TypeVar, runtime_checkable
+from copy import copy
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, Protocol, TypeGuard, TypeVar, runtime_checkable
 
 from pydantic import BaseModel
 
 from ._logging import get_logger
-from ._mcp import MCPTool
 from ._memory import AggregateContextProvider, ContextProvider
 from ._middleware import (
     ChatMiddleware,
@@ -24,6 +25,7 @@ from ._types import ChatMessage, ChatOptions, ChatResponse, ChatResponseUpdate,
 
 if TYPE_CHECKING:
     from ._agents import ChatAgent
+    from ._mcp import MCPTool
 
 
 TInput = TypeVar("TInput", contravariant=True)
@@ -38,6 +40,15 @@ __all__ = [
 ]
 
 
+def _is_mcp_tool(tool: Any) -> "TypeGuard[MCPTool]":
+    """Check whether a tool is an MCPTool without importing the MCP SDK.
+
+    No MCPTool can exist before its module was imported, so while it is not loaded the answer is no.
+    """
+    mcp_module = sys.modules.get("agent_framework._mcp")
+    return mcp_module is not None and isinstance(tool, mcp_module.MCPTool)
+
+
 # region ChatClientProtocol Protocol
 
 
@@ -330,6 +341,9 @@ class BaseChatClient(SerializationMixin, ABC):
     DEFAULT_EXCLUDE: ClassVar[set[str]] = {"additional_properties"}
     # This is used for OTel setup, should be overridden in subclasses
 
+    # The instructions of the last request and the system message built for them
+    _instructions_message: tuple[str, ChatMessage] | None = None
+
     def __init__(
         self,
         *,
@@ -423,7 +437,7 @@ class BaseChatClient(SerializationMixin, ABC):
             else [tools]
         )
         for tool in tools_list:  # type: ignore[reportUnknownType]
-            if isinstance(tool, MCPTool):
+            if _is_mcp_tool(tool):
                 if not tool.is_connected:
                     await tool.connect()
                 final_tools.extend(tool.functions)  # type: ignore
@@ -570,11 +584,7 @@ class BaseChatClient(SerializationMixin, ABC):
             )
             chat_options.store = True
 
-        if chat_options.instructions:
-            system_msg = ChatMessage(role="system", text=chat_options.instructions)
-            prepped_messages = [system_msg, *prepare_messages(messages)]
-        else:
-            prepped_messages = prepare_messages(messages)
+        prepped_messages = self._prepare_request_messages(messages, chat_options.instructions)
         self._prepare_tool_choice(chat_options=chat_options)
 
         filtered_kwargs = self._filter_internal_kwargs(kwargs)
@@ -669,11 +679,7 @@ class BaseChatClient(SerializationMixin, ABC):
             )
             chat_options.store = True
 
-        if chat_options.instructions:
-            system_msg = ChatMessage(role="system", text=chat_options.instructions)
-            prepped_messages = [system_msg, *prepare_messages(messages)]
-        else:
-            prepped_messages = prepare_messages(messages)
+        prepped_messages = self._prepare_request_messages(messages, chat_options.instructions)
         self._prepare_tool_choice(chat_options=chat_options)
 
         filtered_kwargs = self._filter_internal_kwargs(kwargs)
@@ -682,6 +688,33 @@ class BaseChatClient(SerializationMixin, ABC):
         ):
             yield update
 
+    def _prepare_request_messages(
+        self, messages: str | ChatMessage | list[str] | list[ChatMessage], instructions: str | None
+    ) -> list[ChatMessage]:
+        """Prepare the messages of a request, preceded by a system message with the instructions if set.
+
+        The system message is built once per distinct instructions and every request gets a shallow copy
+        of it with its own contents and properties, since agents send the same instructions with every request and
+        middleware or the service may change the messages of a request.
+
+        Args:
+            messages: The message or messages to send to the model.
+            instructions: The instructions of the request, if any.
+
+        Returns:
+            A new list of messages for the request.
+        """
+        prepped_messages = prepare_messages(messages)
+        if instructions:
+            cached = self._instructions_message
+            if cached is None or cached[0] != instructions:
+                cached = self._instructions_message = (instructions, ChatMessage(role="system", text=instructions))
+            system_message = copy(cached[1])
+            system_message.contents = list(system_message.contents)
+            system_message.additional_properties = dict(system_message.additional_properties or {})
+            prepped_messages.insert(0, system_message)
+        return prepped_messages
+
     def _prepare_tool_choice(self, chat_options: ChatOptions) -> None:
         """Prepare the tools and tool choice for the chat options.
 
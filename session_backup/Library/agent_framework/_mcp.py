@@ -1,15 +1,22 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
+import hashlib
+import itertools
 import json
 import logging
+import os
 import re
 import sys
+import time
 from abc import abstractmethod
-from collections.abc import Collection
-from contextlib import AsyncExitStack, _AsyncGeneratorContextManager  # type: ignore
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Collection
+from contextlib import AsyncExitStack, _AsyncGeneratorContextManager, asynccontextmanager  # type: ignore
 from datetime import timedelta
 from functools import partial
-from typing import TYPE_CHECKING, Any, Literal
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal, cast
 
 from mcp import types
 from mcp.client.session import ClientSession
@@ -49,8 +56,10 @@ LOG_LEVEL_MAPPING: dict[types.LoggingLevel, int] = {
 }
 
 __all__ = [
+    "MCPCatalogueCache",
     "MCPStdioTool",
     "MCPStreamableHTTPTool",
+    "MCPToolPool",
     "MCPWebsocketTool",
 ]
 
@@ -178,7 +187,27 @@ def _get_input_model_from_mcp_prompt(prompt: types.Prompt) -> type[BaseModel]:
     return create_model(f"{prompt.name}_input", **field_definitions)
 
 
+# Least recently used input models, keyed by the hash of the tool name and schema
+_INPUT_MODEL_CACHE: OrderedDict[str, type[BaseModel]] = OrderedDict()
+_INPUT_MODEL_CACHE_SIZE = 1024
+
+
 def _get_input_model_from_mcp_tool(tool: types.Tool) -> type[BaseModel]:
+    """Get the Pydantic model for a tools parameters, reusing the model built earlier for the same schema."""
+    key = hashlib.sha256(
+        json.dumps([tool.name, tool.inputSchema], sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+    input_model = _INPUT_MODEL_CACHE.get(key)
+    if input_model is None:
+        input_model = _INPUT_MODEL_CACHE[key] = _create_input_model_from_mcp_tool(tool)
+        if len(_INPUT_MODEL_CACHE) > _INPUT_MODEL_CACHE_SIZE:
+            _INPUT_MODEL_CACHE.popitem(last=False)
+    else:
+        _INPUT_MODEL_CACHE.move_to_end(key)
+    return input_model
+
+
+def _create_input_model_from_mcp_tool(tool: types.Tool) -> type[BaseModel]:
     """Creates a Pydantic model from a tools parameters."""
     properties = tool.inputSchema.get("properties", None)
     required = tool.inputSchema.get("required", [])
@@ -240,6 +269,128 @@ def _normalize_mcp_name(name: str) -> str:
     return re.sub(r"[^A-Za-z0-9_.-]", "-", name)
 
 
+# region: MCP Catalogue Cache
+
+CatalogueKind = Literal["tools", "prompts"]
+
+
+class MCPCatalogueCache:
+    """On-disk cache of the tool and prompt lists of MCP servers.
+
+    Entries are keyed by the identity of the server (the command and arguments of a stdio server or the URL
+    of a remote server) together with the name, version and protocol version the server reports when the
+    session is initialized, so upgrading a server starts from an empty entry. An MCPTool with a cache reads its
+    catalogue from it instead of listing tools and prompts on every connect, and drops the entry when the
+    server sends a list changed notification.
+
+    Servers that change their catalogue without a version bump or a notification are covered in two ways:
+    entries older than ``max_age`` are ignored, and a catalogue read from the cache is listed again in the
+    background after connecting, replacing the cached entry and the loaded functions when it changed.
+
+    Examples:
+        .. code-block:: python
+
+            from agent_framework import MCPCatalogueCache, MCPStdioTool
+
+            mcp_tool = MCPStdioTool(
+                name="filesystem",
+                command="npx",
+                args=["-y", "@modelcontextprotocol/server-filesystem", "/tmp"],
+                catalogue_cache=MCPCatalogueCache(),
+            )
+
+            # Connect in the background at startup, the first request awaits the same connection
+            mcp_tool.warm_up()
+    """
+
+    def __init__(
+        self,
+        directory: str | Path | None = None,
+        *,
+        max_age: float | None = 24 * 60 * 60,
+        revalidate: bool = True,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            directory: The directory to store the catalogues in,
+                defaults to ``agent_framework/mcp`` in the user cache directory.
+
+        Keyword Args:
+            max_age: Seconds a cached catalogue is used for, defaults to one day.
+                Set to None to keep entries until the server changes or notifies a change.
+            revalidate: Whether to list a catalogue read from the cache again in the background after connecting.
+        """
+        if directory is None:
+            directory = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "agent_framework" / "mcp"
+        self.directory = Path(directory)
+        self.max_age = max_age
+        self.revalidate = revalidate
+
+    @staticmethod
+    def key(identity: dict[str, Any], server: types.InitializeResult) -> str:
+        """Compute the cache key of a server.
+
+        Args:
+            identity: How the server is reached, e.g. its command and arguments or its URL.
+            server: The result of initializing a session with the server.
+        """
+        payload = json.dumps(
+            {
+                "identity": identity,
+                "name": server.serverInfo.name,
+                "version": server.serverInfo.version,
+                "protocol_version": server.protocolVersion,
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def load(self, key: str, kind: CatalogueKind) -> list[dict[str, Any]] | None:
+        """Load a catalogue, returns None when it is not cached, expired or cannot be read."""
+        return await asyncio.to_thread(self._read, self._path(key, kind), self.max_age)
+
+    async def store(self, key: str, kind: CatalogueKind, items: list[dict[str, Any]]) -> None:
+        """Store a catalogue, failures are logged and otherwise ignored."""
+        await asyncio.to_thread(self._write, self._path(key, kind), items)
+
+    async def invalidate(self, key: str, kind: CatalogueKind) -> None:
+        """Remove a catalogue from the cache."""
+        await asyncio.to_thread(self._path(key, kind).unlink, missing_ok=True)
+
+    def _path(self, key: str, kind: CatalogueKind) -> Path:
+        return self.directory / f"{key}.{kind}.json"
+
+    @staticmethod
+    def _read(path: Path, max_age: float | None = None) -> list[dict[str, Any]] | None:
+        try:
+            with path.open("r", encoding="utf-8") as file:
+                if max_age is not None and time.time() - os.fstat(file.fileno()).st_mtime > max_age:
+                    return None
+                items = json.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as ex:
+            logger.warning("Ignoring unreadable MCP catalogue cache entry %s: %s", path, ex)
+            return None
+        return items if isinstance(items, list) else None
+
+    @staticmethod
+    def _write(path: Path, items: list[dict[str, Any]]) -> None:
+        # Write to a temporary file first, so concurrent readers never see a partial catalogue.
+        temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with temp_path.open("w", encoding="utf-8") as file:
+                json.dump(items, file, separators=(",", ":"))
+            os.replace(temp_path, path)
+        except OSError as ex:
+            logger.warning("Failed to write MCP catalogue cache entry %s: %s", path, ex)
+            temp_path.unlink(missing_ok=True)
+
+
 # region: MCP Plugin
 
 
@@ -273,6 +424,7 @@ class MCPTool:
         request_timeout: int | None = None,
         chat_client: "ChatClientProtocol | None" = None,
         additional_properties: dict[str, Any] | None = None,
+        catalogue_cache: MCPCatalogueCache | None = None,
     ) -> None:
         """Initialize the MCP Tool base.
 
@@ -291,7 +443,16 @@ class MCPTool:
         self.session = session
         self.request_timeout = request_timeout
         self.chat_client = chat_client
-        self._functions: list[AIFunction[Any, Any]] = []
+        self.catalogue_cache = catalogue_cache
+        self._catalogue_key: str | None = None
+        self._tool_functions: list[AIFunction[Any, Any]] = []
+        self._prompt_functions: list[AIFunction[Any, Any]] = []
+        # The allowed tools the functions were filtered with and the filtered functions
+        self._functions: tuple[Collection[str] | None, list[AIFunction[Any, Any]]] | None = None
+        self._revalidation_tasks: set[asyncio.Task[None]] = set()
+        self._warm_up: asyncio.Future[None] | None = None
+        self._warm_up_task: asyncio.Task[None] | None = None
+        self._warm_up_release: asyncio.Event | None = None
         self.is_connected: bool = False
 
     def __str__(self) -> str:
@@ -299,10 +460,67 @@ class MCPTool:
 
     @property
     def functions(self) -> list[AIFunction[Any, Any]]:
-        """Get the list of functions that are allowed."""
-        if not self.allowed_tools:
-            return self._functions
-        return [func for func in self._functions if func.name in self.allowed_tools]
+        """Get the list of functions that are allowed.
+
+        The list is built once and reused until the tools or prompts are loaded again or ``allowed_tools``
+        is replaced.
+        """
+        if self._functions is None or self._functions[0] is not self.allowed_tools:
+            functions = [*self._tool_functions, *self._prompt_functions]
+            if self.allowed_tools:
+                functions = [func for func in functions if func.name in self.allowed_tools]
+            self._functions = (self.allowed_tools, functions)
+        return self._functions[1]
+
+    def warm_up(self) -> "asyncio.Future[None]":
+        """Connect to the MCP server in a background task.
+
+        Call this at application start, so the connection and the catalogue are ready before the first request.
+        A ``connect()`` while the warm-up is running waits for it instead of connecting a second time, and
+        ``close()`` asks the background task to close the connection it opened.
+
+        Returns:
+            A future that completes once connected, or holds the connection error.
+        """
+        if self._warm_up is None:
+            self._warm_up = asyncio.get_running_loop().create_future()
+            self._warm_up_release = asyncio.Event()
+            self._warm_up_task = asyncio.create_task(self._hold_warm_up_connection(), name=f"{self.name}-mcp-warm-up")
+        return self._warm_up
+
+    async def _hold_warm_up_connection(self) -> None:
+        """Connect, and keep the connection open in this task until close() releases it."""
+        warm_up, release = cast(asyncio.Future[None], self._warm_up), cast(asyncio.Event, self._warm_up_release)
+        try:
+            try:
+                await self.connect()
+            except Exception as ex:
+                logger.warning("Failed to warm up MCP server %s: %s", self.name, ex)
+                warm_up.set_exception(ex)
+                # The failure is logged above, callers that never await the future should not log it again
+                warm_up.exception()
+                return
+            warm_up.set_result(None)
+            await release.wait()
+            await self.close()
+        finally:
+            self._warm_up = self._warm_up_task = self._warm_up_release = None
+
+    async def _join_warm_up(self) -> bool:
+        """Wait for a running warm-up instead of connecting, returns whether there was one."""
+        if self._warm_up is None or asyncio.current_task() is self._warm_up_task:
+            return False
+        await asyncio.shield(self._warm_up)
+        return True
+
+    async def _release_warm_up(self) -> bool:
+        """Let the warm-up task close its connection, returns whether there was one."""
+        task = self._warm_up_task
+        if task is None or asyncio.current_task() is task:
+            return False
+        cast(asyncio.Event, self._warm_up_release).set()
+        await task
+        return True
 
     async def connect(self) -> None:
         """Connect to the MCP server.
@@ -313,6 +531,9 @@ class MCPTool:
         Raises:
             ToolException: If connection or session initialization fails.
         """
+        if await self._join_warm_up():
+            return
+        server: types.InitializeResult | None = None
         if not self.session:
             try:
                 transport = await self._exit_stack.enter_async_context(self.get_mcp_client())
@@ -341,7 +562,7 @@ class MCPTool:
                     message="Failed to create MCP session. Please check your configuration.", inner_exception=ex
                 ) from ex
             try:
-                await session.initialize()
+                server = await session.initialize()
             except Exception as ex:
                 await self._exit_stack.aclose()
                 # Provide context about initialization failure
@@ -356,9 +577,11 @@ class MCPTool:
             self.session = session
         elif self.session._request_id == 0:  # type: ignore[reportPrivateUsage]
             # If the session is not initialized, we need to reinitialize it
-            await self.session.initialize()
+            server = await self.session.initialize()
         logger.debug("Connected to MCP server: %s", self.session)
         self.is_connected = True
+        if self.catalogue_cache and server:
+            self._catalogue_key = self.catalogue_cache.key(self._server_identity(), server)
         if self.load_tools_flag:
             await self.load_tools()
         if self.load_prompts_flag:
@@ -473,12 +696,33 @@ class MCPTool:
         if isinstance(message, types.ServerNotification):
             match message.root.method:
                 case "notifications/tools/list_changed":
+                    await self._invalidate_catalogue("tools")
                     await self.load_tools()
                 case "notifications/prompts/list_changed":
+                    await self._invalidate_catalogue("prompts")
                     await self.load_prompts()
                 case _:
                     logger.debug("Unhandled notification: %s", message.root.method)
 
+    def _server_identity(self) -> dict[str, Any]:
+        """Describe how the server is reached, used to key the catalogue cache."""
+        return {"type": type(self).__name__, "name": self.name}
+
+    async def _load_catalogue(self, kind: CatalogueKind) -> list[dict[str, Any]] | None:
+        if not self.catalogue_cache or not self._catalogue_key:
+            return None
+        return await self.catalogue_cache.load(self._catalogue_key, kind)
+
+    async def _store_catalogue(self, kind: CatalogueKind, items: list[types.Tool] | list[types.Prompt]) -> None:
+        if self.catalogue_cache and self._catalogue_key:
+            await self.catalogue_cache.store(
+                self._catalogue_key, kind, [item.model_dump(mode="json", exclude_none=True) for item in items]
+            )
+
+    async def _invalidate_catalogue(self, kind: CatalogueKind) -> None:
+        if self.catalogue_cache and self._catalogue_key:
+            await self.catalogue_cache.invalidate(self._catalogue_key, kind)
+
     def _determine_approval_mode(
         self,
         local_name: str,
@@ -494,23 +738,35 @@ class MCPTool:
     async def load_prompts(self) -> None:
         """Load prompts from the MCP server.
 
-        Retrieves available prompts from the connected MCP server and converts
-        them into AIFunction instances.
+        Retrieves available prompts from the connected MCP server, or from the catalogue cache,
+        and converts them into AIFunction instances that replace the previously loaded prompts.
 
         Raises:
             ToolExecutionException: If the MCP server is not connected.
         """
         if not self.session:
             raise ToolExecutionException("MCP server not connected, please call connect() before using this method.")
+        cached = await self._load_catalogue("prompts")
+        if cached is not None:
+            self._set_prompt_functions([types.Prompt.model_validate(item) for item in cached])
+            self._revalidate_catalogue("prompts", cached)
+            return
         try:
-            prompt_list = await self.session.list_prompts()
+            prompts = (await self.session.list_prompts()).prompts
         except Exception as exc:
             logger.info(
                 "Prompt could not be loaded, you can exclude trying to load, by setting: load_prompts=False",
                 exc_info=exc,
             )
-            prompt_list = None
-        for prompt in prompt_list.prompts if prompt_list else []:
+            prompts = []
+        else:
+            await self._store_catalogue("prompts", prompts)
+        self._set_prompt_functions(prompts)
+
+    def _set_prompt_functions(self, prompts: list[types.Prompt]) -> None:
+        """Convert prompts into AIFunction instances that replace the previously loaded prompts."""
+        functions: list[AIFunction[Any, Any]] = []
+        for prompt in prompts:
             local_name = _normalize_mcp_name(prompt.name)
             input_model = _get_input_model_from_mcp_prompt(prompt)
             approval_mode = self._determine_approval_mode(local_name)
@@ -521,28 +777,42 @@ class MCPTool:
                 approval_mode=approval_mode,
                 input_model=input_model,
             )
-            self._functions.append(func)
+            functions.append(func)
+        self._prompt_functions = functions
+        self._functions = None
 
     async def load_tools(self) -> None:
         """Load tools from the MCP server.
 
-        Retrieves available tools from the connected MCP server and converts
-        them into AIFunction instances.
+        Retrieves available tools from the connected MCP server, or from the catalogue cache,
+        and converts them into AIFunction instances that replace the previously loaded tools.
 
         Raises:
             ToolExecutionException: If the MCP server is not connected.
         """
         if not self.session:
             raise ToolExecutionException("MCP server not connected, please call connect() before using this method.")
+        cached = await self._load_catalogue("tools")
+        if cached is not None:
+            self._set_tool_functions([types.Tool.model_validate(item) for item in cached])
+            self._revalidate_catalogue("tools", cached)
+            return
         try:
-            tool_list = await self.session.list_tools()
+            tools = (await self.session.list_tools()).tools
         except Exception as exc:
             logger.info(
                 "Tools could not be loaded, you can exclude trying to load, by setting: load_tools=False",
                 exc_info=exc,
             )
-            tool_list = None
-        for tool in tool_list.tools if tool_list else []:
+            tools = []
+        else:
+            await self._store_catalogue("tools", tools)
+        self._set_tool_functions(tools)
+
+    def _set_tool_functions(self, tools: list[types.Tool]) -> None:
+        """Convert tools into AIFunction instances that replace the previously loaded tools."""
+        functions: list[AIFunction[Any, Any]] = []
+        for tool in tools:
             local_name = _normalize_mcp_name(tool.name)
             input_model = _get_input_model_from_mcp_tool(tool)
             approval_mode = self._determine_approval_mode(local_name)
@@ -554,13 +824,60 @@ class MCPTool:
                 approval_mode=approval_mode,
                 input_model=input_model,
             )
-            self._functions.append(func)
+            functions.append(func)
+        self._tool_functions = functions
+        self._functions = None
+
+    def _revalidate_catalogue(self, kind: CatalogueKind, cached: list[dict[str, Any]]) -> None:
+        """List a catalogue that was read from the cache again, in a background task."""
+        if not self.catalogue_cache or not self.catalogue_cache.revalidate:
+            return
+        task = asyncio.create_task(self._refresh_catalogue(kind, cached), name=f"{self.name}-mcp-revalidate-{kind}")
+        self._revalidation_tasks.add(task)
+        task.add_done_callback(self._revalidation_tasks.discard)
+
+    async def _refresh_catalogue(self, kind: CatalogueKind, cached: list[dict[str, Any]]) -> None:
+        """Replace the cached catalogue and the loaded functions when the server lists a different catalogue."""
+        session, key = self.session, self._catalogue_key
+        if session is None:
+            return
+        try:
+            items: list[types.Tool] | list[types.Prompt] = (
+                (await session.list_tools()).tools if kind == "tools" else (await session.list_prompts()).prompts
+            )
+        except Exception as ex:
+            logger.debug("Failed to revalidate the cached %s of MCP server %s: %s", kind, self.name, ex)
+            return
+        if [item.model_dump(mode="json", exclude_none=True) for item in items] == cached:
+            return
+        if self._catalogue_key != key:
+            # Reconnected to a different version of the server in the meantime
+            return
+        logger.debug("Cached %s of MCP server %s changed, reloading them", kind, self.name)
+        await self._store_catalogue(kind, items)
+        # A reconnect in the meantime already loaded the catalogue again
+        if self.session is session:
+            if kind == "tools":
+                self._set_tool_functions(cast(list[types.Tool], items))
+            else:
+                self._set_prompt_functions(cast(list[types.Prompt], items))
+
+    async def _cancel_revalidation(self) -> None:
+        """Stop the background revalidation of the catalogue, before the session is closed."""
+        tasks = list(self._revalidation_tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     async def close(self) -> None:
         """Disconnect from the MCP server.
 
         Closes the connection and cleans up resources.
         """
+        if await self._release_warm_up():
+            return
+        await self._cancel_revalidation()
         await self._exit_stack.aclose()
         self.session = None
         self.is_connected = False
@@ -714,6 +1031,7 @@ class MCPStdioTool(MCPTool):
         encoding: str | None = None,
         chat_client: "ChatClientProtocol | None" = None,
         additional_properties: dict[str, Any] | None = None,
+        catalogue_cache: MCPCatalogueCache | None = None,
         **kwargs: Any,
     ) -> None:
         """Initialize the MCP stdio tool.
@@ -745,6 +1063,7 @@ class MCPStdioTool(MCPTool):
             env: The environment variables to set for the command.
             encoding: The encoding to use for the command output.
             chat_client: The chat client to use for sampling.
+            catalogue_cache: The cache to read the tool and prompt lists from instead of listing them on connect.
             kwargs: Any extra arguments to pass to the stdio client.
         """
         super().__init__(
@@ -758,6 +1077,7 @@ class MCPStdioTool(MCPTool):
             load_tools=load_tools,
             load_prompts=load_prompts,
             request_timeout=request_timeout,
+            catalogue_cache=catalogue_cache,
         )
         self.command = command
         self.args = args or []
@@ -765,6 +1085,9 @@ class MCPStdioTool(MCPTool):
         self.encoding = encoding
         self._client_kwargs = kwargs
 
+    def _server_identity(self) -> dict[str, Any]:
+        return {"command": self.command, "args": self.args, "env": self.env}
+
     def get_mcp_client(self) -> _AsyncGeneratorContextManager[Any, None]:
         """Get an MCP stdio client.
 
@@ -825,6 +1148,7 @@ class MCPStreamableHTTPTool(MCPTool):
         terminate_on_close: bool | None = None,
         chat_client: "ChatClientProtocol | None" = None,
         additional_properties: dict[str, Any] | None = None,
+        catalogue_cache: MCPCatalogueCache | None = None,
         **kwargs: Any,
     ) -> None:
         """Initialize the MCP streamable HTTP tool.
@@ -858,6 +1182,7 @@ class MCPStreamableHTTPTool(MCPTool):
             sse_read_timeout: The timeout for reading from the SSE stream.
             terminate_on_close: Close the transport when the MCP client is terminated.
             chat_client: The chat client to use for sampling.
+            catalogue_cache: The cache to read the tool and prompt lists from instead of listing them on connect.
             kwargs: Any extra arguments to pass to the SSE client.
         """
         super().__init__(
@@ -871,6 +1196,7 @@ class MCPStreamableHTTPTool(MCPTool):
             load_tools=load_tools,
             load_prompts=load_prompts,
             request_timeout=request_timeout,
+            catalogue_cache=catalogue_cache,
         )
         self.url = url
         self.headers = headers or {}
@@ -879,6 +1205,9 @@ class MCPStreamableHTTPTool(MCPTool):
         self.terminate_on_close = terminate_on_close
         self._client_kwargs = kwargs
 
+    def _server_identity(self) -> dict[str, Any]:
+        return {"url": self.url}
+
     def get_mcp_client(self) -> _AsyncGeneratorContextManager[Any, None]:
         """Get an MCP streamable HTTP client.
 
@@ -936,6 +1265,7 @@ class MCPWebsocketTool(MCPTool):
         allowed_tools: Collection[str] | None = None,
         chat_client: "ChatClientProtocol | None" = None,
         additional_properties: dict[str, Any] | None = None,
+        catalogue_cache: MCPCatalogueCache | None = None,
         **kwargs: Any,
     ) -> None:
         """Initialize the MCP WebSocket tool.
@@ -965,6 +1295,7 @@ class MCPWebsocketTool(MCPTool):
             allowed_tools: A list of tools that are allowed to use this tool.
             additional_properties: Additional properties.
             chat_client: The chat client to use for sampling.
+            catalogue_cache: The cache to read the tool and prompt lists from instead of listing them on connect.
             kwargs: Any extra arguments to pass to the WebSocket client.
         """
         super().__init__(
@@ -978,10 +1309,14 @@ class MCPWebsocketTool(MCPTool):
             load_tools=load_tools,
             load_prompts=load_prompts,
             request_timeout=request_timeout,
+            catalogue_cache=catalogue_cache,
         )
         self.url = url
         self._client_kwargs = kwargs
 
+    def _server_identity(self) -> dict[str, Any]:
+        return {"url": self.url}
+
     def get_mcp_client(self) -> _AsyncGeneratorContextManager[Any, None]:
         """Get an MCP WebSocket client.
 
@@ -994,3 +1329,348 @@ class MCPWebsocketTool(MCPTool):
         if self._client_kwargs:
             args.update(self._client_kwargs)
         return websocket_client(**args)
+
+
+# region: MCP Tool Pool
+
+
+class _MCPPoolSlot:
+    """One member session of an MCPToolPool and the state used to dispatch to it."""
+
+    __slots__ = ("index", "tool", "in_flight", "ready", "wake", "started", "task")
+
+    def __init__(self, index: int, tool: MCPTool) -> None:
+        self.index = index
+        self.tool = tool
+        self.in_flight = 0
+        self.ready = asyncio.Event()
+        self.wake = asyncio.Event()
+        self.started: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self.task: asyncio.Task[None] | None = None
+
+
+class MCPToolPool(MCPTool):
+    """A pool of MCP sessions to the same server that dispatches tool and prompt calls across them.
+
+    A single MCPTool keeps one session, so for stdio servers every call in the process is handled by one
+    subprocess. The pool creates ``size`` members from ``tool_factory`` (``size`` subprocesses for
+    :class:`MCPStdioTool`, ``size`` sessions for :class:`MCPStreamableHTTPTool` and :class:`MCPWebsocketTool`)
+    and sends every call to the least loaded, or the next, healthy member.
+
+    The tool and prompt catalogue is loaded once, from the first member, and shared by all members; the
+    members themselves do not load tools or prompts. A list changed notification from that member reloads the
+    shared catalogue.
+
+    Each member is owned by a supervisor task that connects it, pings it every ``health_check_interval``
+    seconds and restarts it when the ping fails. A call that fails with a transport error triggers an immediate
+    health check of its member. Because members are connected and closed by their supervisor task, the pool
+    can be closed from a different task than the one that connected it.
+
+    Examples:
+        .. code-block:: python
+
+            from agent_framework import ChatAgent, MCPStdioTool, MCPToolPool
+
+            # Run four server processes, the factory must return a new tool on every call
+            pool = MCPToolPool(
+                lambda: MCPStdioTool(name="calculator", command="uvx", args=["mcp-server-calculator"]),
+                size=4,
+            )
+
+            async with pool:
+                agent = ChatAgent(chat_client=client, name="assistant", tools=pool)
+                response = await agent.run("What is 42 * 17?")
+    """
+
+    def __init__(
+        self,
+        tool_factory: Callable[[], MCPTool],
+        *,
+        size: int | None = None,
+        strategy: Literal["least_loaded", "round_robin"] = "least_loaded",
+        health_check_interval: float | None = 30.0,
+        acquire_timeout: float | None = 30.0,
+        name: str | None = None,
+        description: str | None = None,
+    ) -> None:
+        """Initialize the MCP tool pool.
+
+        Args:
+            tool_factory: A callable that returns a new, unconnected MCPTool for the server.
+                It is called once per member and again whenever a member is restarted.
+                The name, approval mode, allowed tools, load flags, request timeout and chat client
+                of the pool are taken from the first tool it returns.
+
+        Keyword Args:
+            size: The number of member sessions, defaults to the number of CPUs.
+            strategy: How calls are dispatched to healthy members:
+                - "least_loaded": The member with the fewest calls in flight, ties are broken round-robin.
+                - "round_robin": The next member in turn.
+            health_check_interval: Seconds between pings of each member.
+                Set to None to only check members after a failed call.
+            acquire_timeout: Seconds a call waits for a healthy member when none is available.
+                Set to None to wait indefinitely.
+            name: The name of the tool, defaults to the name of the first member.
+            description: The description of the tool, defaults to the description of the first member.
+        """
+        template = tool_factory()
+        super().__init__(
+            name=name or template.name,
+            description=description or template.description,
+            approval_mode=template.approval_mode,
+            allowed_tools=template.allowed_tools,
+            additional_properties=template.additional_properties,
+            chat_client=template.chat_client,
+            load_tools=template.load_tools_flag,
+            load_prompts=template.load_prompts_flag,
+            request_timeout=template.request_timeout,
+            catalogue_cache=template.catalogue_cache,
+        )
+        size = size if size is not None else os.cpu_count() or 1
+        if size < 1:
+            raise ValueError("size must be at least 1.")
+        self.size = size
+        self.strategy = strategy
+        self.health_check_interval = health_check_interval
+        self.acquire_timeout = acquire_timeout
+        self._tool_factory = tool_factory
+        self._template: MCPTool | None = template
+        self._slots: list[_MCPPoolSlot] = []
+        self._catalogue_slot: _MCPPoolSlot | None = None
+        self._dispatch_counter = itertools.count()
+        self._closing = False
+
+    def __str__(self) -> str:
+        return f"MCPToolPool(name={self.name}, size={self.size}, description={self.description})"
+
+    @property
+    def in_flight(self) -> list[int]:
+        """Get the number of calls in flight per member."""
+        return [slot.in_flight for slot in self._slots]
+
+    async def connect(self) -> None:
+        """Connect all members and load the shared tool and prompt catalogue.
+
+        Raises:
+            ToolException: If any of the members fails to connect.
+        """
+        if await self._join_warm_up() or self._slots:
+            return
+        self._closing = False
+        self._slots = [_MCPPoolSlot(index, self._new_member(index)) for index in range(self.size)]
+        for slot in self._slots:
+            slot.task = asyncio.create_task(self._supervise(slot), name=f"{self.name}-mcp-pool-{slot.index}")
+        results = await asyncio.gather(*(slot.started for slot in self._slots), return_exceptions=True)
+        if error := next((result for result in results if isinstance(result, BaseException)), None):
+            await self.close()
+            raise error
+        self._catalogue_slot = self._slots[0]
+        self.session = self._catalogue_slot.tool.session
+        self._catalogue_key = self._catalogue_slot.tool._catalogue_key  # type: ignore[reportPrivateUsage]
+        self.is_connected = True
+        logger.debug("Connected MCP tool pool %s with %d sessions", self.name, self.size)
+        if self.load_tools_flag:
+            await self.load_tools()
+        if self.load_prompts_flag:
+            await self.load_prompts()
+
+    async def close(self) -> None:
+        """Close all members of the pool."""
+        if await self._release_warm_up():
+            return
+        await self._cancel_revalidation()
+        self._closing = True
+        for slot in self._slots:
+            slot.wake.set()
+        tasks = [slot.task for slot in self._slots if slot.task is not None]
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._slots = []
+        self._catalogue_slot = None
+        await self._exit_stack.aclose()
+        self.session = None
+        self.is_connected = False
+
+    def get_mcp_client(self) -> _AsyncGeneratorContextManager[Any, None]:
+        """Get an MCP client for a new member.
+
+        Returns:
+            An async context manager for the transport of a new member.
+        """
+        return self._tool_factory().get_mcp_client()
+
+    async def call_tool(self, tool_name: str, **kwargs: Any) -> list[Contents]:
+        """Call a tool on one of the members of the pool.
+
+        Args:
+            tool_name: The name of the tool to call.
+
+        Keyword Args:
+            kwargs: Arguments to pass to the tool.
+
+        Returns:
+            A list of content items returned by the tool.
+
+        Raises:
+            ToolExecutionException: If the pool is not connected, tools are not loaded,
+                no healthy member becomes available or the tool call fails.
+        """
+        if not self.load_tools_flag:
+            raise ToolExecutionException(
+                "Tools are not loaded for this server, please set load_tools=True in the constructor."
+            )
+        async with self._acquire() as slot:
+            try:
+                session = cast(ClientSession, slot.tool.session)
+                return _mcp_call_tool_result_to_ai_contents(await session.call_tool(tool_name, arguments=kwargs))
+            except McpError as mcp_exc:
+                raise ToolExecutionException(mcp_exc.error.message, inner_exception=mcp_exc) from mcp_exc
+            except Exception as ex:
+                slot.wake.set()
+                raise ToolExecutionException(f"Failed to call tool '{tool_name}'.", inner_exception=ex) from ex
+
+    async def get_prompt(self, prompt_name: str, **kwargs: Any) -> list[ChatMessage]:
+        """Get a prompt from one of the members of the pool.
+
+        Args:
+            prompt_name: The name of the prompt to retrieve.
+
+        Keyword Args:
+            kwargs: Arguments to pass to the prompt.
+
+        Returns:
+            A list of chat messages returned by the prompt.
+
+        Raises:
+            ToolExecutionException: If the pool is not connected, prompts are not loaded,
+                no healthy member becomes available or the prompt call fails.
+        """
+        if not self.load_prompts_flag:
+            raise ToolExecutionException(
+                "Prompts are not loaded for this server, please set load_prompts=True in the constructor."
+            )
+        async with self._acquire() as slot:
+            try:
+                session = cast(ClientSession, slot.tool.session)
+                prompt_result = await session.get_prompt(prompt_name, arguments=kwargs)
+                return [_mcp_prompt_message_to_chat_message(message) for message in prompt_result.messages]
+            except McpError as mcp_exc:
+                raise ToolExecutionException(mcp_exc.error.message, inner_exception=mcp_exc) from mcp_exc
+            except Exception as ex:
+                slot.wake.set()
+                raise ToolExecutionException(f"Failed to call prompt '{prompt_name}'.", inner_exception=ex) from ex
+
+    def _new_member(self, index: int) -> MCPTool:
+        """Create a member that does not load its own catalogue and forwards list changes to the pool."""
+        member, self._template = self._template or self._tool_factory(), None
+        member.load_tools_flag = False
+        member.load_prompts_flag = False
+        # The session is created with the member's bound handler, so it has to be replaced before connecting.
+        member.message_handler = partial(  # type: ignore[method-assign]
+            self._member_message_handler, index, member.message_handler
+        )
+        return member
+
+    async def _member_message_handler(
+        self,
+        index: int,
+        handler: Callable[..., Any],
+        message: RequestResponder[types.ServerRequest, types.ClientResult] | types.ServerNotification | Exception,
+    ) -> None:
+        """Route list changed notifications of the catalogue member to the pool, everything else to the member."""
+        if isinstance(message, types.ServerNotification) and message.root.method in (
+            "notifications/tools/list_changed",
+            "notifications/prompts/list_changed",
+        ):
+            if self._catalogue_slot is not None and self._catalogue_slot.index == index:
+                await self.message_handler(message)
+            return
+        await handler(message)
+
+    async def _supervise(self, slot: _MCPPoolSlot) -> None:
+        """Connect, health check and restart one member until the pool is closed."""
+        failures = 0
+        while not self._closing:
+            try:
+                await slot.tool.connect()
+            except Exception as ex:
+                if not slot.started.done():
+                    slot.started.set_exception(ex)
+                    return
+                failures += 1
+                logger.warning("Failed to restart member %d of MCP tool pool %s: %s", slot.index, self.name, ex)
+                await self._wait(slot, min(2**failures, 30))
+                slot.tool = self._new_member(slot.index)
+                continue
+            failures = 0
+            if slot is self._catalogue_slot:
+                self.session = slot.tool.session
+                self._catalogue_key = slot.tool._catalogue_key  # type: ignore[reportPrivateUsage]
+            slot.ready.set()
+            if not slot.started.done():
+                slot.started.set_result(None)
+            while not self._closing and await self._is_healthy(slot):
+                await self._wait(slot, self.health_check_interval)
+            slot.ready.clear()
+            try:
+                await slot.tool.close()
+            except Exception as ex:
+                logger.debug("Failed to close member %d of MCP tool pool %s: %s", slot.index, self.name, ex)
+            if not self._closing:
+                logger.warning("Restarting unhealthy member %d of MCP tool pool %s", slot.index, self.name)
+                slot.tool = self._new_member(slot.index)
+
+    async def _is_healthy(self, slot: _MCPPoolSlot) -> bool:
+        """Ping a member, unless it was only woken up to be closed."""
+        if self._closing or slot.tool.session is None:
+            return False
+        if not slot.wake.is_set():
+            return True
+        slot.wake.clear()
+        try:
+            await asyncio.wait_for(slot.tool.session.send_ping(), timeout=self.request_timeout or 10)
+        except Exception as ex:
+            logger.debug("Health check of member %d of MCP tool pool %s failed: %s", slot.index, self.name, ex)
+            return False
+        return True
+
+    @staticmethod
+    async def _wait(slot: _MCPPoolSlot, timeout: float | None) -> None:
+        """Wait until the slot is woken up or the timeout expires, the latter marks a scheduled health check."""
+        try:
+            await asyncio.wait_for(slot.wake.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            slot.wake.set()
+
+    @asynccontextmanager
+    async def _acquire(self) -> AsyncIterator[_MCPPoolSlot]:
+        """Select a healthy member and count the call as in flight while it runs."""
+        if not self._slots:
+            raise ToolExecutionException("MCP server not connected, please call connect() before using this method.")
+        slot = self._select()
+        if slot is None:
+            waiters = [asyncio.ensure_future(slot.ready.wait()) for slot in self._slots]
+            try:
+                await asyncio.wait(waiters, timeout=self.acquire_timeout, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                for waiter in waiters:
+                    waiter.cancel()
+            slot = self._select()
+            if slot is None:
+                raise ToolExecutionException(f"No healthy session available in MCP tool pool '{self.name}'.")
+        slot.in_flight += 1
+        try:
+            yield slot
+        finally:
+            slot.in_flight -= 1
+
+    def _select(self) -> _MCPPoolSlot | None:
+        """Pick a healthy member according to the dispatch strategy."""
+        healthy = [slot for slot in self._slots if slot.ready.is_set()]
+        if not healthy:
+            return None
+        start = next(self._dispatch_counter) % len(healthy)
+        ordered = healthy[start:] + healthy[:start]
+        if self.strategy == "round_robin":
+            return ordered[0]
+        return min(ordered, key=lambda slot: slot.in_flight)
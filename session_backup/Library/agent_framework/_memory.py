@@ -3,13 +3,18 @@
 import asyncio
 import sys
 from abc import ABC, abstractmethod
-from collections.abc import MutableSequence, Sequence
+from collections.abc import Awaitable, MutableSequence, Sequence
 from contextlib import AsyncExitStack
+from time import perf_counter
 from types import TracebackType
-from typing import Any, Final, cast
+from typing import Any, Final, TypeVar, cast
 
-from ._tools import ToolProtocol
+from opentelemetry.metrics import Histogram
+
+from ._logging import get_logger
+from ._tools import _NOOP_HISTOGRAM, ToolProtocol
 from ._types import ChatMessage
+from .observability import OPERATION_DURATION_BUCKET_BOUNDARIES, OtelAttr, get_meter
 
 if sys.version_info >= (3, 12):
     from typing import override  # type: ignore # pragma: no cover
@@ -20,6 +25,10 @@ if sys.version_info >= (3, 11):
 else:
     from typing_extensions import Self  # pragma: no cover
 
+logger = get_logger()
+
+TResult = TypeVar("TResult")
+
 # region Context
 
 __all__ = ["AggregateContextProvider", "Context", "ContextProvider"]
@@ -84,6 +93,11 @@ class ContextProvider(ABC):
         also implement the ``invoked()`` and ``thread_created()`` methods to track conversation
         state, but these are optional.
 
+        The agent enters and exits its context provider on every run. Providers that write in the
+        background, such as the Mem0 and Redis providers in write-behind mode, therefore only wait for
+        their pending writes when the outermost ``async with`` exits, as in the example below, or when
+        ``flush()`` or ``aclose()`` is awaited. Exits nested inside it return without waiting.
+
     Examples:
         .. code-block:: python
 
@@ -104,6 +118,10 @@ class ContextProvider(ABC):
     # Default prompt to be used by all context providers when assembling memories/instructions
     DEFAULT_CONTEXT_PROMPT: Final[str] = "## Memories\nConsider the following memories when answering user questions:"
 
+    # Deadline in seconds for ``invoking`` when used through an ``AggregateContextProvider``, None uses
+    # the aggregate's default. A provider that misses its deadline contributes no context to that turn.
+    invoking_timeout: float | None = None
+
     async def thread_created(self, thread_id: str | None) -> None:
         """Called just after a new thread is created.
 
@@ -218,17 +236,40 @@ class AggregateContextProvider(ContextProvider):
             agent.context_providers.add(provider4)
     """
 
-    def __init__(self, context_providers: ContextProvider | Sequence[ContextProvider] | None = None) -> None:
+    def __init__(
+        self,
+        context_providers: ContextProvider | Sequence[ContextProvider] | None = None,
+        *,
+        invoking_timeout: float | None = None,
+        background_invoked: bool = False,
+        max_pending_invoked: int = 64,
+    ) -> None:
         """Initialize the AggregateContextProvider with context providers.
 
         Args:
             context_providers: The context provider(s) to add.
+
+        Keyword Args:
+            invoking_timeout: Default deadline in seconds for each provider's ``invoking``, used for providers
+                that do not set their own ``invoking_timeout``. A provider that misses its deadline contributes
+                no context instead of stalling the turn. None waits for every provider.
+            background_invoked: Run ``invoked`` notifications in a background queue instead of awaiting them,
+                so memory writes do not delay returning the response. Notifications are processed in order;
+                call ``flush()`` (done by ``ChatAgent`` on exit) to wait for them.
+            max_pending_invoked: Maximum number of queued ``invoked`` notifications; ``invoked`` waits for
+                space when the queue is full.
         """
         if isinstance(context_providers, ContextProvider):
             self.providers = [context_providers]
         else:
             self.providers = cast(list[ContextProvider], context_providers) or []
         self._exit_stack: AsyncExitStack | None = None
+        self.invoking_timeout_default = invoking_timeout
+        self.background_invoked = background_invoked
+        self.max_pending_invoked = max_pending_invoked
+        self._invoked_queue: asyncio.Queue[tuple[Any, ...]] | None = None
+        self._invoked_worker: asyncio.Task[None] | None = None
+        self._duration_histogram: Histogram | None = None
 
     def add(self, context_provider: ContextProvider) -> None:
         """Add a new context provider.
@@ -238,17 +279,78 @@ class AggregateContextProvider(ContextProvider):
         """
         self.providers.append(context_provider)
 
+    def _get_duration_histogram(self) -> Histogram:
+        """Get the histogram for provider latency, or a no-op histogram if observability is disabled."""
+        if self._duration_histogram is None:
+            from .observability import OBSERVABILITY_SETTINGS  # local import to avoid circulars
+
+            if not OBSERVABILITY_SETTINGS.ENABLED:  # type: ignore[name-defined]
+                return _NOOP_HISTOGRAM  # type: ignore[return-value]
+            meter = get_meter()
+            try:
+                self._duration_histogram = meter.create_histogram(
+                    name=OtelAttr.MEASUREMENT_CONTEXT_PROVIDER_DURATION,
+                    unit=OtelAttr.DURATION_UNIT,
+                    description="Measures the duration of a context provider's invoking and invoked calls",
+                    explicit_bucket_boundaries_advisory=OPERATION_DURATION_BUCKET_BOUNDARIES,
+                )
+            except TypeError:
+                self._duration_histogram = meter.create_histogram(
+                    name=OtelAttr.MEASUREMENT_CONTEXT_PROVIDER_DURATION,
+                    unit=OtelAttr.DURATION_UNIT,
+                    description="Measures the duration of a context provider's invoking and invoked calls",
+                )
+        return self._duration_histogram
+
+    async def _measure(
+        self,
+        provider: ContextProvider,
+        operation: str,
+        call: Awaitable[TResult],
+        timeout: float | None = None,
+    ) -> TResult | None:
+        """Await a provider call, recording its latency and returning None if it misses the deadline."""
+        start = perf_counter()
+        timed_out = False
+        try:
+            if timeout is None:
+                return await call
+            return await asyncio.wait_for(call, timeout)
+        except asyncio.TimeoutError:
+            timed_out = True
+            logger.warning(f"Context provider {type(provider).__name__} missed its {operation} deadline of {timeout}s.")
+            return None
+        finally:
+            self._get_duration_histogram().record(
+                perf_counter() - start,
+                attributes={
+                    OtelAttr.MEASUREMENT_CONTEXT_PROVIDER_TAG_NAME: type(provider).__name__,
+                    OtelAttr.MEASUREMENT_CONTEXT_PROVIDER_OPERATION: operation,
+                    OtelAttr.MEASUREMENT_CONTEXT_PROVIDER_TIMED_OUT: timed_out,
+                },
+            )
+
     @override
     async def thread_created(self, thread_id: str | None = None) -> None:
         await asyncio.gather(*[x.thread_created(thread_id) for x in self.providers])
 
     @override
     async def invoking(self, messages: ChatMessage | MutableSequence[ChatMessage], **kwargs: Any) -> Context:
-        contexts = await asyncio.gather(*[provider.invoking(messages, **kwargs) for provider in self.providers])
+        contexts = await asyncio.gather(*[
+            self._measure(
+                provider,
+                "invoking",
+                provider.invoking(messages, **kwargs),
+                provider.invoking_timeout if provider.invoking_timeout is not None else self.invoking_timeout_default,
+            )
+            for provider in self.providers
+        ])
         instructions: str = ""
         return_messages: list[ChatMessage] = []
         tools: list[ToolProtocol] = []
         for ctx in contexts:
+            if ctx is None:
+                continue
             if ctx.instructions:
                 instructions += ctx.instructions
             if ctx.messages:
@@ -265,16 +367,65 @@ class AggregateContextProvider(ContextProvider):
         invoke_exception: Exception | None = None,
         **kwargs: Any,
     ) -> None:
+        if not self.background_invoked:
+            await self._invoked(request_messages, response_messages, invoke_exception, kwargs)
+            return
+        if self._invoked_queue is None:
+            self._invoked_queue = asyncio.Queue(maxsize=self.max_pending_invoked)
+        if self._invoked_worker is None or self._invoked_worker.done():
+            self._invoked_worker = asyncio.create_task(self._process_invoked_queue(self._invoked_queue))
+        await self._invoked_queue.put((request_messages, response_messages, invoke_exception, kwargs))
+
+    async def _invoked(
+        self,
+        request_messages: ChatMessage | Sequence[ChatMessage],
+        response_messages: ChatMessage | Sequence[ChatMessage] | None,
+        invoke_exception: Exception | None,
+        kwargs: dict[str, Any],
+    ) -> None:
+        """Notify all providers of an invocation, recording each provider's latency."""
         await asyncio.gather(*[
-            x.invoked(
-                request_messages=request_messages,
-                response_messages=response_messages,
-                invoke_exception=invoke_exception,
-                **kwargs,
+            self._measure(
+                x,
+                "invoked",
+                x.invoked(
+                    request_messages=request_messages,
+                    response_messages=response_messages,
+                    invoke_exception=invoke_exception,
+                    **kwargs,
+                ),
             )
             for x in self.providers
         ])
 
+    async def _process_invoked_queue(self, queue: "asyncio.Queue[tuple[Any, ...]]") -> None:
+        """Background worker delivering queued ``invoked`` notifications in order."""
+        while True:
+            request_messages, response_messages, invoke_exception, kwargs = await queue.get()
+            try:
+                await self._invoked(request_messages, response_messages, invoke_exception, kwargs)
+            except Exception as ex:
+                logger.warning(f"A context provider failed to process invoked in the background: {ex}")
+            finally:
+                queue.task_done()
+
+    async def flush(self) -> None:
+        """Wait until all queued ``invoked`` notifications have been delivered."""
+        if self._invoked_queue is not None and self._invoked_worker is not None and not self._invoked_worker.done():
+            await self._invoked_queue.join()
+
+    async def aclose(self) -> None:
+        """Flush queued ``invoked`` notifications, stop the background worker and close the providers.
+
+        Providers that buffer writes of their own, such as the Mem0 and Redis providers in write-behind
+        mode, expose an ``aclose()`` that is awaited here.
+        """
+        await self.flush()
+        if self._invoked_worker is not None:
+            self._invoked_worker.cancel()
+            self._invoked_worker = None
+        await asyncio.gather(*[provider.aclose() for provider in self.providers if hasattr(provider, "aclose")])
+
     @override
     async def __aenter__(self) -> "Self":
         """Enter the async context manager and set up all providers.
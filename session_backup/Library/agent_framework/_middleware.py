@@ -40,6 +40,7 @@ __all__ = [
 TAgent = TypeVar("TAgent", bound="AgentProtocol")
 TChatClient = TypeVar("TChatClient", bound="ChatClientProtocol")
 TContext = TypeVar("TContext")
+TBuilt = TypeVar("TBuilt")
 
 
 class MiddlewareType(str, Enum):
@@ -601,15 +602,29 @@ class MiddlewareWrapper(Generic[TContext]):
         await self.func(context, next)
 
 
+class _PipelineCall:
+    """Per-invocation state of a compiled middleware pipeline."""
+
+    __slots__ = ("final_handler", "result", "streaming")
+
+    def __init__(self, final_handler: Callable[[Any], Any], streaming: bool) -> None:
+        self.final_handler = final_handler
+        self.result: Any = None
+        self.streaming = streaming
+
+
 class BaseMiddlewarePipeline(ABC):
     """Base class for middleware pipeline execution.
 
     Provides common functionality for building and executing middleware chains.
+    The chain of ``next`` handlers is compiled once when middleware is registered and reused by every
+    invocation; the per-invocation final handler and result travel on the context object.
     """
 
     def __init__(self) -> None:
         """Initialize the base middleware pipeline."""
         self._middlewares: list[Any] = []
+        self._chain: Callable[[Any], Awaitable[None]] = self._invoke_final_handler
 
     @abstractmethod
     def _register_middleware(self, middleware: Any) -> None:
@@ -648,94 +663,64 @@ class BaseMiddlewarePipeline(ABC):
             self._middlewares.append(middleware)
         elif callable(middleware):
             self._middlewares.append(MiddlewareWrapper(middleware))  # type: ignore[arg-type]
-
-    def _create_handler_chain(
-        self,
-        final_handler: Callable[[Any], Awaitable[Any]],
-        result_container: dict[str, Any],
-        result_key: str = "result",
+        else:
+            return
+        self._compile()
+
+    def _compile(self) -> None:
+        """Link the registered middleware into a reusable chain of handlers."""
+        chain: Callable[[Any], Awaitable[None]] = self._invoke_final_handler
+        for middleware in reversed(self._middlewares):
+            chain = self._link(middleware.process, chain)
+        self._chain = chain
+
+    @staticmethod
+    def _link(
+        process: Callable[[Any, Callable[[Any], Awaitable[None]]], Awaitable[None]],
+        next_handler: Callable[[Any], Awaitable[None]],
     ) -> Callable[[Any], Awaitable[None]]:
-        """Create a chain of middleware handlers.
-
-        Args:
-            final_handler: The final handler to execute.
-            result_container: Container to store the result.
-            result_key: Key to use in the result container.
+        async def handler(c: Any) -> None:
+            await process(c, next_handler)
 
-        Returns:
-            The first handler in the chain.
-        """
-
-        def create_next_handler(index: int) -> Callable[[Any], Awaitable[None]]:
-            if index >= len(self._middlewares):
-
-                async def final_wrapper(c: Any) -> None:
-                    # Execute actual handler and populate context for observability
-                    result = await final_handler(c)
-                    result_container[result_key] = result
-                    c.result = result
-
-                return final_wrapper
+        return handler
 
-            middleware = self._middlewares[index]
-            next_handler = create_next_handler(index + 1)
+    def _terminated_result(self, context: Any) -> Any:
+        """Get the result of a non-streaming invocation that was terminated before the final handler."""
+        return context.result
 
-            async def current_handler(c: Any) -> None:
-                await middleware.process(c, next_handler)
-
-            return current_handler
+    async def _invoke_final_handler(self, c: Any) -> None:
+        """Run the final handler of the current invocation and populate the context for observability."""
+        call: _PipelineCall = c._pipeline_call
+        if call.streaming:
+            # If terminate was set, skip execution
+            if c.terminate:
+                return
+            # The final handler of a streaming invocation usually returns an async iterable directly
+            result = call.final_handler(c)
+            if inspect.isawaitable(result):
+                result = await result
+        elif c.terminate:
+            result = self._terminated_result(c)
+        else:
+            result = await call.final_handler(c)
+        call.result = result
+        c.result = result
 
-        return create_next_handler(0)
-
-    def _create_streaming_handler_chain(
-        self,
-        final_handler: Callable[[Any], Any],
-        result_container: dict[str, Any],
-        result_key: str = "result_stream",
-    ) -> Callable[[Any], Awaitable[None]]:
-        """Create a chain of middleware handlers for streaming operations.
+    async def _run_chain(self, context: Any, final_handler: Callable[[Any], Any], streaming: bool = False) -> Any:
+        """Run the compiled chain for one invocation.
 
         Args:
-            final_handler: The final handler to execute.
-            result_container: Container to store the result.
-            result_key: Key to use in the result container.
+            context: The invocation context.
+            final_handler: The final handler to execute after all middleware.
+            streaming: Whether the final handler produces a stream.
 
         Returns:
-            The first handler in the chain.
+            The result produced by the final handler, or None if it was not reached.
         """
-
-        def create_next_handler(index: int) -> Callable[[Any], Awaitable[None]]:
-            if index >= len(self._middlewares):
-
-                async def final_wrapper(c: Any) -> None:
-                    # If terminate was set, skip execution
-                    if c.terminate:
-                        return
-
-                    # Execute actual handler and populate context for observability
-                    # Note: final_handler might not be awaitable for streaming cases
-                    try:
-                        result = await final_handler(c)
-                    except TypeError:
-                        # Handle non-awaitable case (e.g., generator functions)
-                        result = final_handler(c)
-                    result_container[result_key] = result
-                    c.result = result
-
-                return final_wrapper
-
-            middleware = self._middlewares[index]
-            next_handler = create_next_handler(index + 1)
-
-            async def current_handler(c: Any) -> None:
-                await middleware.process(c, next_handler)
-                # If terminate is set, don't continue the pipeline
-                if c.terminate:
-                    return
-
-            return current_handler
-
-        return create_next_handler(0)
+        call = _PipelineCall(final_handler, streaming)
+        context._pipeline_call = call
+        await self._chain(context)
+        return call.result
 
 
 class AgentMiddlewarePipeline(BaseMiddlewarePipeline):
@@ -766,6 +751,12 @@ class AgentMiddlewarePipeline(BaseMiddlewarePipeline):
         """
         self._register_middleware_with_wrapper(middleware, AgentMiddleware)
 
+    def _terminated_result(self, context: AgentRunContext) -> AgentRunResponse:
+        # If terminate was set, return the result (which might be None)
+        if context.result is not None and isinstance(context.result, AgentRunResponse):
+            return context.result
+        return AgentRunResponse()
+
     async def execute(
         self,
         agent: "AgentProtocol",
@@ -792,31 +783,16 @@ class AgentMiddlewarePipeline(BaseMiddlewarePipeline):
         if not self._middlewares:
             return await final_handler(context)
 
-        # Store the final result
-        result_container: dict[str, AgentRunResponse | None] = {"result": None}
+        response = await self._run_chain(context, final_handler)
 
-        # Custom final handler that handles termination and result override
-        async def agent_final_handler(c: AgentRunContext) -> AgentRunResponse:
-            # If terminate was set, return the result (which might be None)
-            if c.terminate:
-                if c.result is not None and isinstance(c.result, AgentRunResponse):
-                    return c.result
-                return AgentRunResponse()
-            # Execute actual handler and populate context for observability
-            return await final_handler(c)
-
-        first_handler = self._create_handler_chain(agent_final_handler, result_container, "result")
-        await first_handler(context)
-
-        # Return the result from result container or overridden result
+        # Return the overridden result or the result of the final handler
         if context.result is not None and isinstance(context.result, AgentRunResponse):
             return context.result
 
         # If no result was set (next() not called), return empty AgentRunResponse
-        response = result_container.get("result")
         if response is None:
             return AgentRunResponse()
-        return response
+        return response  # type: ignore[no-any-return]
 
     async def execute_stream(
         self,
@@ -846,11 +822,7 @@ class AgentMiddlewarePipeline(BaseMiddlewarePipeline):
                 yield update
             return
 
-        # Store the final result
-        result_container: dict[str, AsyncIterable[AgentRunResponseUpdate] | None] = {"result_stream": None}
-
-        first_handler = self._create_streaming_handler_chain(final_handler, result_container, "result_stream")
-        await first_handler(context)
+        result_stream = await self._run_chain(context, final_handler, streaming=True)
 
         # Yield from the result stream in result container or overridden result
         if context.result is not None and hasattr(context.result, "__aiter__"):
@@ -858,7 +830,6 @@ class AgentMiddlewarePipeline(BaseMiddlewarePipeline):
                 yield update
             return
 
-        result_stream = result_container["result_stream"]
         if result_stream is None:
             # If no result stream was set (next() not called), yield nothing
             return
@@ -920,24 +891,12 @@ class FunctionMiddlewarePipeline(BaseMiddlewarePipeline):
         if not self._middlewares:
             return await final_handler(context)
 
-        # Store the final result
-        result_container: dict[str, Any] = {"result": None}
-
-        # Custom final handler that handles pre-existing results
-        async def function_final_handler(c: FunctionInvocationContext) -> Any:
-            # If terminate was set, skip execution and return the result (which might be None)
-            if c.terminate:
-                return c.result
-            # Execute actual handler and populate context for observability
-            return await final_handler(c)
-
-        first_handler = self._create_handler_chain(function_final_handler, result_container, "result")
-        await first_handler(context)
+        result = await self._run_chain(context, final_handler)
 
-        # Return the result from result container or overridden result
+        # Return the overridden result or the result of the final handler
         if context.result is not None:
             return context.result
-        return result_container["result"]
+        return result
 
 
 class ChatMiddlewarePipeline(BaseMiddlewarePipeline):
@@ -998,24 +957,12 @@ class ChatMiddlewarePipeline(BaseMiddlewarePipeline):
         if not self._middlewares:
             return await final_handler(context)
 
-        # Store the final result
-        result_container: dict[str, Any] = {"result": None}
-
-        # Custom final handler that handles pre-existing results
-        async def chat_final_handler(c: ChatContext) -> "ChatResponse":
-            # If terminate was set, skip execution and return the result (which might be None)
-            if c.terminate:
-                return c.result  # type: ignore
-            # Execute actual handler and populate context for observability
-            return await final_handler(c)
-
-        first_handler = self._create_handler_chain(chat_final_handler, result_container, "result")
-        await first_handler(context)
+        result = await self._run_chain(context, final_handler)
 
-        # Return the result from result container or overridden result
+        # Return the overridden result or the result of the final handler
         if context.result is not None:
             return context.result  # type: ignore
-        return result_container["result"]  # type: ignore
+        return result  # type: ignore[no-any-return]
 
     async def execute_stream(
         self,
@@ -1050,11 +997,7 @@ class ChatMiddlewarePipeline(BaseMiddlewarePipeline):
                 yield update
             return
 
-        # Store the final result stream
-        result_container: dict[str, Any] = {"result_stream": None}
-
-        first_handler = self._create_streaming_handler_chain(final_handler, result_container, "result_stream")
-        await first_handler(context)
+        result_stream = await self._run_chain(context, final_handler, streaming=True)
 
         # Yield from the result stream in result container or overridden result
         if context.result is not None and hasattr(context.result, "__aiter__"):
@@ -1062,7 +1005,6 @@ class ChatMiddlewarePipeline(BaseMiddlewarePipeline):
                 yield update
             return
 
-        result_stream = result_container["result_stream"]
         if result_stream is None:
             # If no result stream was set (next() not called), yield nothing
             return
@@ -1140,6 +1082,43 @@ def _determine_middleware_type(middleware: Any) -> MiddlewareType:
     )
 
 
+def _flatten_middleware(*middleware_sources: Any | list[Any] | None) -> tuple[Any, ...]:
+    """Flatten middleware sources into a tuple, in the order categorize_middleware merges them."""
+    return tuple(
+        item
+        for source in middleware_sources
+        if source
+        for item in (source if isinstance(source, list) else [source])  # type: ignore[union-attr]
+    )
+
+
+def _cached_for_middleware(
+    owner: Any, attribute: str, middleware_sources: tuple[Any, ...], build: Callable[[], TBuilt]
+) -> TBuilt:
+    """Get a value built from middleware sources, building it only when the middleware changed.
+
+    The value is cached on the owner together with the middleware it was built from. Middleware is compared
+    by identity, so appending to or replacing an owner's middleware list invalidates the cached value.
+
+    Args:
+        owner: The agent or chat client to cache the value on.
+        attribute: The attribute name to cache the value under.
+        middleware_sources: The middleware the value is built from.
+        build: Builds the value from the middleware sources.
+    """
+    key = _flatten_middleware(*middleware_sources)
+    cached = getattr(owner, attribute, None)
+    if cached is not None and len(cached[0]) == len(key) and all(a is b for a, b in zip(cached[0], key)):
+        return cached[1]  # type: ignore[no-any-return]
+    value = build()
+    try:
+        setattr(owner, attribute, (key, value))
+    except (AttributeError, TypeError, ValueError):
+        # The owner does not accept new attributes (e.g. slots or a validating model)
+        pass
+    return value
+
+
 # Decorator for adding middleware support to agent classes
 def use_agent_middleware(agent_class: type[TAgent]) -> type[TAgent]:
     """Class decorator that adds middleware support to an agent class.
@@ -1185,7 +1164,7 @@ def use_agent_middleware(agent_class: type[TAgent]) -> type[TAgent]:
         agent_level_middlewares: Middleware | list[Middleware] | None,
         run_level_middlewares: Middleware | list[Middleware] | None = None,
     ) -> tuple[AgentMiddlewarePipeline, FunctionMiddlewarePipeline, list[ChatMiddleware | ChatMiddlewareCallable]]:
-        """Build fresh agent and function middleware pipelines from the provided middleware lists.
+        """Build agent and function middleware pipelines from the provided middleware lists.
 
         Args:
             agent_level_middlewares: Agent-level middleware (executed first)
@@ -1199,6 +1178,18 @@ def use_agent_middleware(agent_class: type[TAgent]) -> type[TAgent]:
             middleware["chat"],  # type: ignore[return-value]
         )
 
+    def _get_middleware_pipelines(
+        agent: Any, run_level_middlewares: Middleware | list[Middleware] | None
+    ) -> tuple[AgentMiddlewarePipeline, FunctionMiddlewarePipeline, list[ChatMiddleware | ChatMiddlewareCallable]]:
+        """Get the compiled pipelines for an agent run, reusing them while the middleware is unchanged."""
+        agent_middleware = getattr(agent, "middleware", None)
+        return _cached_for_middleware(
+            agent,
+            "_middleware_pipelines",
+            (agent_middleware, run_level_middlewares),
+            lambda: _build_middleware_pipelines(agent_middleware, run_level_middlewares),
+        )
+
     async def middleware_enabled_run(
         self: Any,
         messages: str | ChatMessage | list[str] | list[ChatMessage] | None = None,
@@ -1208,10 +1199,8 @@ def use_agent_middleware(agent_class: type[TAgent]) -> type[TAgent]:
         **kwargs: Any,
     ) -> AgentRunResponse:
         """Middleware-enabled run method."""
-        # Build fresh middleware pipelines from current middleware collection and run-level middleware
-        agent_middleware = getattr(self, "middleware", None)
-
-        agent_pipeline, function_pipeline, chat_middlewares = _build_middleware_pipelines(agent_middleware, middleware)
+        # Get the middleware pipelines for the current middleware collection and run-level middleware
+        agent_pipeline, function_pipeline, chat_middlewares = _get_middleware_pipelines(self, middleware)
 
         # Add function middleware pipeline to kwargs if available
         if function_pipeline.has_middlewares:
@@ -1257,9 +1246,8 @@ def use_agent_middleware(agent_class: type[TAgent]) -> type[TAgent]:
         **kwargs: Any,
     ) -> AsyncIterable[AgentRunResponseUpdate]:
         """Middleware-enabled run_stream method."""
-        # Build fresh middleware pipelines from current middleware collection and run-level middleware
-        agent_middleware = getattr(self, "middleware", None)
-        agent_pipeline, function_pipeline, chat_middlewares = _build_middleware_pipelines(agent_middleware, middleware)
+        # Get the middleware pipelines for the current middleware collection and run-level middleware
+        agent_pipeline, function_pipeline, chat_middlewares = _get_middleware_pipelines(self, middleware)
 
         # Add function middleware pipeline to kwargs if available
         if function_pipeline.has_middlewares:
@@ -1341,6 +1329,22 @@ def use_chat_middleware(chat_client_class: type[TChatClient]) -> type[TChatClien
     original_get_response = chat_client_class.get_response
     original_get_streaming_response = chat_client_class.get_streaming_response
 
+    def _get_middleware_pipelines(
+        chat_client: Any, instance_middleware: Any, call_middleware: Any
+    ) -> tuple[ChatMiddlewarePipeline | None, FunctionMiddlewarePipeline | None]:
+        """Get the compiled chat and function pipelines, reusing them while the middleware is unchanged."""
+
+        def build() -> tuple[ChatMiddlewarePipeline | None, FunctionMiddlewarePipeline | None]:
+            middleware = categorize_middleware(instance_middleware, call_middleware)
+            return (
+                ChatMiddlewarePipeline(middleware["chat"]) if middleware["chat"] else None,  # type: ignore[arg-type]
+                FunctionMiddlewarePipeline(middleware["function"]) if middleware["function"] else None,  # type: ignore[arg-type]
+            )
+
+        return _cached_for_middleware(
+            chat_client, "_middleware_pipelines", (instance_middleware, call_middleware), build
+        )
+
     async def middleware_enabled_get_response(
         self: Any,
         messages: Any,
@@ -1350,20 +1354,18 @@ def use_chat_middleware(chat_client_class: type[TChatClient]) -> type[TChatClien
         # Check if middleware is provided at call level or instance level
         call_middleware = kwargs.pop("middleware", None)
         instance_middleware = getattr(self, "middleware", None)
+        if not call_middleware and not instance_middleware:
+            return await original_get_response(self, messages, **kwargs)
 
         # Merge all middleware and separate by type
-        middleware = categorize_middleware(instance_middleware, call_middleware)
-        chat_middleware_list = middleware["chat"]  # type: ignore[assignment]
-
-        # Extract function middleware for the function invocation pipeline
-        function_middleware_list = middleware["function"]
+        pipeline, function_pipeline = _get_middleware_pipelines(self, instance_middleware, call_middleware)
 
         # Pass function middleware to function invocation system if present
-        if function_middleware_list:
-            kwargs["_function_middleware_pipeline"] = FunctionMiddlewarePipeline(function_middleware_list)  # type: ignore[arg-type]
+        if function_pipeline is not None:
+            kwargs["_function_middleware_pipeline"] = function_pipeline
 
         # If no chat middleware, use original method
-        if not chat_middleware_list:
+        if pipeline is None:
             return await original_get_response(self, messages, **kwargs)
 
         # Create pipeline and execute with middleware
@@ -1372,7 +1374,6 @@ def use_chat_middleware(chat_client_class: type[TChatClient]) -> type[TChatClien
         # Extract chat_options or create default
         chat_options = kwargs.pop("chat_options", ChatOptions())
 
-        pipeline = ChatMiddlewarePipeline(chat_middleware_list)  # type: ignore[arg-type]
         context = ChatContext(
             chat_client=self,
             messages=prepare_messages(messages),
@@ -1405,13 +1406,13 @@ def use_chat_middleware(chat_client_class: type[TChatClient]) -> type[TChatClien
             call_middleware = kwargs.pop("middleware", None)
             instance_middleware = getattr(self, "middleware", None)
 
-            # Merge middleware from both sources, filtering for chat middleware only
-            all_middleware: list[ChatMiddleware | ChatMiddlewareCallable] = _merge_and_filter_chat_middleware(
-                instance_middleware, call_middleware
-            )
+            # Merge middleware from both sources, using the chat middleware only
+            pipeline: ChatMiddlewarePipeline | None = None
+            if call_middleware or instance_middleware:
+                pipeline, _ = _get_middleware_pipelines(self, instance_middleware, call_middleware)
 
             # If no middleware, use original method
-            if not all_middleware:
+            if pipeline is None:
                 async for update in original_get_streaming_response(self, messages, **kwargs):
                     yield update
                 return
@@ -1422,7 +1423,6 @@ def use_chat_middleware(chat_client_class: type[TChatClient]) -> type[TChatClien
             # Extract chat_options or create default
             chat_options = kwargs.pop("chat_options", ChatOptions())
 
-            pipeline = ChatMiddlewarePipeline(all_middleware)  # type: ignore[arg-type]
             context = ChatContext(
                 chat_client=self,
                 messages=prepare_messages(messages),
@@ -1519,43 +1519,32 @@ def create_function_middleware_pipeline(
     return FunctionMiddlewarePipeline(function_middlewares) if function_middlewares else None  # type: ignore[arg-type]
 
 
-def _merge_and_filter_chat_middleware(
-    instance_middleware: Any | list[Any] | None,
-    call_middleware: Any | list[Any] | None,
-) -> list[ChatMiddleware | ChatMiddlewareCallable]:
-    """Merge instance-level and call-level middleware, filtering for chat middleware only.
-
-    Args:
-        instance_middleware: Middleware defined at the instance level.
-        call_middleware: Middleware provided at the call level.
-
-    Returns:
-        A merged list of chat middleware only.
-    """
-    middleware = categorize_middleware(instance_middleware, call_middleware)
-    return middleware["chat"]  # type: ignore[return-value]
-
-
-def extract_and_merge_function_middleware(chat_client: Any, **kwargs: Any) -> None:
+def extract_and_merge_function_middleware(chat_client: Any, kwargs: dict[str, Any]) -> None:
     """Extract function middleware from chat client and merge with existing pipeline in kwargs.
 
+    The merged pipeline is cached on the chat client and rebuilt only when one of its sources changes.
+
     Args:
         chat_client: The chat client instance to extract middleware from.
-
-    Keyword Args:
-        **kwargs: Dictionary containing middleware and pipeline information.
+        kwargs: Dictionary containing middleware and pipeline information, updated in place.
     """
     # Get middleware sources
-    client_middleware = getattr(chat_client, "middleware", None) if hasattr(chat_client, "middleware") else None
+    client_middleware = getattr(chat_client, "middleware", None)
     run_level_middleware = kwargs.get("middleware")
+    if not client_middleware and not run_level_middleware:
+        # Nothing to merge, the existing pipeline (if any) is used as is
+        return
     existing_pipeline = kwargs.get("_function_middleware_pipeline")
 
     # Extract existing pipeline middlewares if present
     existing_middlewares = existing_pipeline._middlewares if existing_pipeline else None
 
     # Create combined pipeline from all sources using existing helper
-    combined_pipeline = create_function_middleware_pipeline(
-        client_middleware, run_level_middleware, existing_middlewares
+    combined_pipeline = _cached_for_middleware(
+        chat_client,
+        "_function_middleware_pipeline",
+        (client_middleware, run_level_middleware, existing_middlewares),
+        lambda: create_function_middleware_pipeline(client_middleware, run_level_middleware, existing_middlewares),
     )
 
     if combined_pipeline:
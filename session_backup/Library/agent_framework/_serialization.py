@@ -3,10 +3,17 @@
 import json
 import re
 from collections.abc import Mapping, MutableMapping
+from contextlib import suppress
 from typing import Any, ClassVar, Protocol, TypeVar, runtime_checkable
+from weakref import WeakKeyDictionary
 
 from ._logging import get_logger
 
+try:
+    import orjson as _orjson  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - orjson is an optional accelerator
+    _orjson = None
+
 logger = get_logger()
 
 TClass = TypeVar("TClass", bound="SerializationMixin")
@@ -130,6 +137,125 @@ def is_serializable(value: Any) -> bool:
     return isinstance(value, (str, int, float, bool, type(None), list, dict))
 
 
+_JSON_SCALAR_TYPES: frozenset[type] = frozenset({str, int, float, bool, type(None)})
+
+# Sentinel returned by ``_encode_value`` for values that are skipped
+_SKIP: Any = object()
+
+# Memoized per-type answer to ``isinstance(value, SerializationProtocol)``.
+# The runtime-checkable protocol check inspects every protocol member on every call,
+# which dominates deep serialization of large message histories.
+# Keyed weakly, so classes created at runtime do not stay alive through the memo.
+_PROTOCOL_TYPES: WeakKeyDictionary[type, bool] = WeakKeyDictionary()
+
+
+def _supports_serialization_protocol(value_type: type) -> bool:
+    """Check (and memoize) whether instances of a type satisfy ``SerializationProtocol``."""
+    supported = _PROTOCOL_TYPES.get(value_type)
+    if supported is None:
+        supported = callable(getattr(value_type, "to_dict", None)) and callable(getattr(value_type, "from_dict", None))
+        _PROTOCOL_TYPES[value_type] = supported
+    return supported
+
+
+def _encode_item(item: Any, exclude: set[str] | None, exclude_none: bool) -> Any:
+    """Encode a single list item or dict value, returning ``_SKIP`` when it is not serializable."""
+    item_type = type(item)
+    if item_type in _JSON_SCALAR_TYPES:
+        return item
+    if _supports_serialization_protocol(item_type):
+        return item.to_dict(exclude=exclude, exclude_none=exclude_none)
+    if is_serializable(item):
+        return item
+    return _SKIP
+
+
+def _encode_value(value: Any, key: str, exclude: set[str] | None, exclude_none: bool) -> Any:
+    """Encode a single attribute value of a ``SerializationMixin`` instance.
+
+    Mirrors the generic rules of ``SerializationMixin.to_dict``: nested ``SerializationProtocol``
+    objects are converted with ``to_dict``, lists and dicts are converted one level deep and
+    non-serializable values are skipped with debug logging.
+    """
+    value_type = type(value)
+    if value_type in _JSON_SCALAR_TYPES:
+        return value
+    # Recursively serialize SerializationProtocol objects
+    if _supports_serialization_protocol(value_type):
+        return value.to_dict(exclude=exclude, exclude_none=exclude_none)
+    # Handle lists containing SerializationProtocol objects
+    if isinstance(value, list):
+        value_as_list: list[Any] = []
+        for item in value:
+            encoded = _encode_item(item, exclude, exclude_none)
+            if encoded is _SKIP:
+                logger.debug(f"Skipping non-serializable item in list attribute '{key}' of type {type(item).__name__}")
+                continue
+            value_as_list.append(encoded)
+        return value_as_list
+    # Handle dicts containing SerializationProtocol values
+    if isinstance(value, dict):
+        serialized_dict: dict[str, Any] = {}
+        for k, v in value.items():
+            encoded = _encode_item(v, exclude, exclude_none)
+            if encoded is _SKIP:
+                logger.debug(
+                    f"Skipping non-serializable value for key '{k}' in dict attribute '{key}' "
+                    f"of type {type(v).__name__}"
+                )
+                continue
+            serialized_dict[k] = encoded
+        return serialized_dict
+    # Directly include JSON serializable values
+    if is_serializable(value):
+        return value
+    logger.debug(f"Skipping non-serializable attribute '{key}' of type {value_type.__name__}")
+    return _SKIP
+
+
+class _SerializationPlan:
+    """Serialization plan compiled once per ``SerializationMixin`` subclass.
+
+    Holds everything ``to_dict`` and ``from_dict`` would otherwise recompute on every call:
+    the combined ``DEFAULT_EXCLUDE``/``INJECTABLE`` set, the type identifier and a memo of
+    which attribute names are emitted.
+    """
+
+    __slots__ = ("_included", "exclude", "type_identifier")
+
+    # Attribute names are bounded by the class, but instances may carry arbitrary extra attributes.
+    _MAX_INCLUDED = 256
+
+    def __init__(self, cls: type["SerializationMixin"]) -> None:
+        self.exclude: frozenset[str] = frozenset(cls.DEFAULT_EXCLUDE) | frozenset(cls.INJECTABLE)
+        self.type_identifier: str = cls._get_type_identifier()
+        self._included: dict[str, bool] = {}
+
+    def includes(self, key: str) -> bool:
+        """Whether an attribute is emitted when no additional exclusions are requested."""
+        included = self._included.get(key)
+        if included is None:
+            included = key not in self.exclude and not key.startswith("_")
+            if len(self._included) < self._MAX_INCLUDED:
+                self._included[key] = included
+        return included
+
+
+_SERIALIZATION_PLANS: WeakKeyDictionary[type, _SerializationPlan] = WeakKeyDictionary()
+
+
+def _get_serialization_plan(cls: type["SerializationMixin"]) -> _SerializationPlan:
+    """Get the compiled serialization plan for a class, building it on first use.
+
+    Plans capture ``DEFAULT_EXCLUDE`` and ``INJECTABLE`` at first use, classes that modify
+    these sets at runtime should call ``_SERIALIZATION_PLANS.pop(cls, None)`` afterwards.
+    """
+    plan = _SERIALIZATION_PLANS.get(cls)
+    if plan is None:
+        plan = _SERIALIZATION_PLANS[cls] = _SerializationPlan(cls)
+    return plan
+
+
 class SerializationMixin:
     """Mixin class providing comprehensive serialization and deserialization capabilities.
 
@@ -306,63 +432,27 @@ class SerializationMixin:
             Dictionary representation of the instance including a 'type' field
             for type identification during deserialization (unless 'type' is excluded).
         """
-        # Combine exclude sets
-        combined_exclude = set(self.DEFAULT_EXCLUDE)
-        if exclude:
-            combined_exclude.update(exclude)
-        combined_exclude.update(self.INJECTABLE)
+        plan = _get_serialization_plan(type(self))
+        exclude_type = "type" in plan.exclude or (exclude is not None and "type" in exclude)
 
         # Get all instance attributes
-        result: dict[str, Any] = {} if "type" in combined_exclude else {"type": self._get_type_identifier()}
+        result: dict[str, Any] = {} if exclude_type else {"type": plan.type_identifier}
         for key, value in self.__dict__.items():
-            if key not in combined_exclude and not key.startswith("_"):
-                if exclude_none and value is None:
-                    continue
-                # Recursively serialize SerializationProtocol objects
-                if isinstance(value, SerializationProtocol):
-                    result[key] = value.to_dict(exclude=exclude, exclude_none=exclude_none)
-                    continue
-                # Handle lists containing SerializationProtocol objects
-                if isinstance(value, list):
-                    value_as_list: list[Any] = []
-                    for item in value:
-                        if isinstance(item, SerializationProtocol):
-                            value_as_list.append(item.to_dict(exclude=exclude, exclude_none=exclude_none))
-                            continue
-                        if is_serializable(item):
-                            value_as_list.append(item)
-                            continue
-                        logger.debug(
-                            f"Skipping non-serializable item in list attribute '{key}' of type {type(item).__name__}"
-                        )
-                    result[key] = value_as_list
-                    continue
-                # Handle dicts containing SerializationProtocol values
-                if isinstance(value, dict):
-                    serialized_dict: dict[str, Any] = {}
-                    for k, v in value.items():
-                        if isinstance(v, SerializationProtocol):
-                            serialized_dict[k] = v.to_dict(exclude=exclude, exclude_none=exclude_none)
-                            continue
-                        # Check if the value is JSON serializable
-                        if is_serializable(v):
-                            serialized_dict[k] = v
-                            continue
-                        logger.debug(
-                            f"Skipping non-serializable value for key '{k}' in dict attribute '{key}' "
-                            f"of type {type(v).__name__}"
-                        )
-                    result[key] = serialized_dict
-                    continue
-                # Directly include JSON serializable values
-                if is_serializable(value):
-                    result[key] = value
-                    continue
-                logger.debug(f"Skipping non-serializable attribute '{key}' of type {type(value).__name__}")
+            if not plan.includes(key) or (exclude and key in exclude):
+                continue
+            if value is None:
+                if not exclude_none:
+                    result[key] = None
+                continue
+            encoded = _encode_value(value, key, exclude, exclude_none)
+            if encoded is not _SKIP:
+                result[key] = encoded
 
         return result
 
-    def to_json(self, *, exclude: set[str] | None = None, exclude_none: bool = True, **kwargs: Any) -> str:
+    def to_json(
+        self, *, exclude: set[str] | None = None, exclude_none: bool = True, fast: bool = False, **kwargs: Any
+    ) -> str:
         """Convert the instance to a JSON string.
 
         This is a convenience method that calls ``to_dict()`` and then serializes
@@ -373,6 +463,9 @@ class SerializationMixin:
         Keyword Args:
             exclude: Additional field names to exclude from serialization.
             exclude_none: Whether to exclude None values from the output. Defaults to True.
+            fast: Serialize with ``orjson`` when it is installed. The output is not byte-identical to the
+                default: it uses compact separators, keeps non-ASCII characters unescaped and writes NaN
+                and infinity as ``null``. Ignored when ``kwargs`` are given. Defaults to False.
             **kwargs: Additional keyword arguments passed through to ``json.dumps()``.
                      Common options include ``indent`` for pretty-printing and
                      ``ensure_ascii`` for Unicode handling.
@@ -380,7 +473,12 @@ class SerializationMixin:
         Returns:
             JSON string representation of the instance.
         """
-        return json.dumps(self.to_dict(exclude=exclude, exclude_none=exclude_none), **kwargs)
+        data = self.to_dict(exclude=exclude, exclude_none=exclude_none)
+        if fast and _orjson is not None and not kwargs:
+            # orjson rejects a few inputs json accepts (non-str keys, >64-bit ints), fall back for those.
+            with suppress(TypeError):
+                return _orjson.dumps(data).decode("utf-8")  # type: ignore[no-any-return]
+        return json.dumps(data, **kwargs)
 
     @classmethod
     def from_dict(
@@ -500,20 +598,24 @@ class SerializationMixin:
             between serializable configuration and runtime dependencies like API clients,
             functions, and execution contexts that cannot or should not be persisted.
         """
-        if dependencies is None:
-            dependencies = {}
+        plan = _get_serialization_plan(cls)
 
         # Get the type identifier
-        type_id = cls._get_type_identifier(value)
+        supplied_type = value.get("type")
+        type_id = supplied_type if supplied_type and isinstance(supplied_type, str) else plan.type_identifier
 
-        if (supplied_type := value.get("type")) and supplied_type != type_id:
+        if supplied_type and supplied_type != type_id:
             raise ValueError(f"Type mismatch: expected '{type_id}', got '{supplied_type}'")
 
+        # Fast path: nothing to inject
+        type_deps = dependencies.get(type_id) if dependencies else None
+        if not type_deps:
+            return cls(**{k: v for k, v in value.items() if k != "type"})
+
         # Create a copy of the value dict to work with, filtering out the 'type' key
         kwargs = {k: v for k, v in value.items() if k != "type"}
 
         # Process dependencies using dict-based structure
-        type_deps = dependencies.get(type_id, {})
         for dep_key, dep_value in type_deps.items():
             # Check if this is an instance-specific dependency (field:name format)
             if ":" in dep_key:
@@ -555,8 +657,9 @@ class SerializationMixin:
     def from_json(cls: type[TClass], value: str, /, *, dependencies: MutableMapping[str, Any] | None = None) -> TClass:
         """Create an instance from a JSON string.
 
-        This is a convenience method that parses the JSON string using ``json.loads()``
-        and then calls ``from_dict()`` to reconstruct the object. All dependency injection
+        This is a convenience method that parses the JSON string, using ``orjson`` when it is
+        installed and ``json.loads()`` otherwise or for input ``orjson`` rejects (such as ``NaN``
+        literals), and then calls ``from_dict()`` to reconstruct the object. All dependency injection
         capabilities are available through the ``dependencies`` parameter.
 
         Args:
@@ -575,7 +678,12 @@ class SerializationMixin:
             json.JSONDecodeError: If the JSON string is malformed.
             ValueError: If the parsed data doesn't contain a valid 'type' field.
         """
-        data = json.loads(value)
+        data: Any = None
+        if _orjson is not None:
+            with suppress(_orjson.JSONDecodeError):
+                data = _orjson.loads(value)
+        if data is None:
+            data = json.loads(value)
         return cls.from_dict(data, dependencies=dependencies)
 
     @classmethod
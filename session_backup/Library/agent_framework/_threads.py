@@ -1,14 +1,33 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from collections.abc import MutableMapping, Sequence
-from typing import Any, Protocol, TypeVar
-
+import asyncio
+import json
+from collections import deque
+from collections.abc import Callable, MutableMapping, Sequence
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar, runtime_checkable
+from uuid import uuid4
+from weakref import WeakKeyDictionary
+
+from ._logging import get_logger
 from ._memory import AggregateContextProvider
 from ._serialization import SerializationMixin
-from ._types import ChatMessage
+from ._types import ChatMessage, Role, TextContent
 from .exceptions import AgentThreadException
 
-__all__ = ["AgentThread", "ChatMessageStore", "ChatMessageStoreProtocol"]
+if TYPE_CHECKING:
+    from ._clients import ChatClientProtocol
+
+logger = get_logger()
+
+__all__ = [
+    "AgentThread",
+    "ChatHistoryCompactor",
+    "ChatMessageStore",
+    "ChatMessageStoreProtocol",
+    "CompactableChatMessageStoreProtocol",
+    "TokenBudgetChatMessageStore",
+]
 
 
 class ChatMessageStoreProtocol(Protocol):
@@ -117,6 +136,30 @@ class ChatMessageStoreProtocol(Protocol):
         ...
 
 
+@runtime_checkable
+class CompactableChatMessageStoreProtocol(Protocol):
+    """A chat message store that can atomically replace a span of messages, used for compaction."""
+
+    async def list_messages(self) -> list[ChatMessage]:
+        """Gets the messages from the store that should be used for the next agent invocation."""
+        ...
+
+    async def replace_messages(self, original: Sequence[ChatMessage], replacement: Sequence[ChatMessage]) -> bool:
+        """Replace a contiguous span of stored messages.
+
+        Implementations must only perform the replacement if ``original`` is still stored unchanged,
+        so that messages added or edited concurrently are never lost.
+
+        Args:
+            original: The contiguous span of messages, as returned by ``list_messages``, to replace.
+            replacement: The messages to store in place of the span.
+
+        Returns:
+            True if the span was replaced, False if it is no longer stored as-is.
+        """
+        ...
+
+
 class ChatMessageStoreState(SerializationMixin):
     """State model for serializing and deserializing chat message store data.
 
@@ -238,6 +281,30 @@ class ChatMessageStore:
         """
         return self.messages
 
+    async def replace_messages(self, original: Sequence[ChatMessage], replacement: Sequence[ChatMessage]) -> bool:
+        """Replace a contiguous span of stored messages.
+
+        The span is matched by identity, so it is only replaced if none of its messages
+        were removed or swapped out in the meantime.
+
+        Args:
+            original: The contiguous span of messages to replace.
+            replacement: The messages to store in place of the span.
+
+        Returns:
+            True if the span was replaced, False if it is no longer stored as-is.
+        """
+        if not original:
+            return False
+        start = next((i for i, message in enumerate(self.messages) if message is original[0]), None)
+        if start is None:
+            return False
+        end = start + len(original)
+        if end > len(self.messages) or any(a is not b for a, b in zip(self.messages[start:end], original, strict=True)):
+            return False
+        self.messages[start:end] = replacement
+        return True
+
     @classmethod
     async def deserialize(
         cls: type[TChatMessageStore], serialized_store_state: MutableMapping[str, Any], **kwargs: Any
@@ -286,6 +353,471 @@ class ChatMessageStore:
         return state.to_dict()
 
 
+# Tokens added per message (and for the system message) for role and formatting.
+_MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def _estimate_text_tokens(text: str) -> int:
+    """Default tokenizer: a rough estimate of about four characters per token."""
+    return (len(text) + 3) // 4
+
+
+def _count_object_tokens(obj: Any, tokenizer: Callable[[str], int]) -> int:
+    """Count the tokens of the JSON (or string) representation of an object."""
+    try:
+        serialized = json.dumps(obj)
+    except Exception:
+        serialized = str(obj)
+    return tokenizer(serialized)
+
+
+def _count_message_tokens(message: ChatMessage, tokenizer: Callable[[str], int]) -> int:
+    """Count the tokens a message contributes to a prompt."""
+    total = _MESSAGE_OVERHEAD_TOKENS
+    for content in message.contents:
+        if content.type == "text":
+            total += tokenizer(content.text)  # type: ignore[attr-defined]
+        elif content.type == "function_call":
+            total += _MESSAGE_OVERHEAD_TOKENS + _count_object_tokens(
+                {"name": content.name, "arguments": content.arguments},  # type: ignore[attr-defined]
+                tokenizer,
+            )
+        elif content.type == "function_result":
+            total += _MESSAGE_OVERHEAD_TOKENS + _count_object_tokens(
+                {"call_id": content.call_id, "result": content.result},  # type: ignore[attr-defined]
+                tokenizer,
+            )
+        else:
+            total += _count_object_tokens(content.to_dict(), tokenizer)
+    return total
+
+
+class TokenBudgetChatMessageStoreState(ChatMessageStoreState):
+    """State model for serializing and deserializing a token budgeted chat message store."""
+
+    def __init__(
+        self,
+        messages: Sequence[ChatMessage] | Sequence[MutableMapping[str, Any]] | None = None,
+        max_tokens: int | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Create the store state.
+
+        Args:
+            messages: a list of messages or a list of the dict representation of messages.
+            max_tokens: the token budget of the store.
+
+        Keyword Args:
+            **kwargs: not used for this, but might be used by subclasses.
+        """
+        super().__init__(messages=messages if messages is not None else [], **kwargs)
+        self.max_tokens = max_tokens
+
+
+TTokenBudgetChatMessageStore = TypeVar("TTokenBudgetChatMessageStore", bound="TokenBudgetChatMessageStore")
+
+
+class TokenBudgetChatMessageStore(ChatMessageStore):
+    """An in-memory ChatMessageStore that only returns the most recent messages fitting a token budget.
+
+    The full history is kept in ``messages``, while ``list_messages`` returns a sliding window of the
+    newest messages whose tokens, together with the system message and tool definitions, fit into
+    ``max_tokens``. Token counts are computed once per message when it is added and a running total
+    is maintained, so adding messages costs O(added + removed) regardless of the history length.
+
+    Leading tool messages are dropped from the window, because a tool result cannot be the first message.
+
+    Examples:
+        .. code-block:: python
+
+            import tiktoken
+
+            from agent_framework import ChatAgent, TokenBudgetChatMessageStore
+
+            encoding = tiktoken.get_encoding("o200k_base")
+
+            agent = ChatAgent(
+                chat_client=client,
+                instructions=instructions,
+                tools=tools,
+                chat_message_store_factory=lambda: TokenBudgetChatMessageStore(
+                    max_tokens=8000,
+                    tokenizer=lambda text: len(encoding.encode(text)),
+                    system_message=instructions,
+                    tool_definitions=[tool.to_json_schema_spec() for tool in tools],
+                ),
+            )
+    """
+
+    def __init__(
+        self,
+        messages: Sequence[ChatMessage] | None = None,
+        *,
+        max_tokens: int,
+        tokenizer: Callable[[str], int] | None = None,
+        system_message: str | None = None,
+        tool_definitions: Any | None = None,
+    ) -> None:
+        """Create a TokenBudgetChatMessageStore for use in a thread.
+
+        Args:
+            messages: The messages to store.
+
+        Keyword Args:
+            max_tokens: The token budget for the messages returned by ``list_messages``,
+                including the system message and tool definitions.
+            tokenizer: Callable returning the number of tokens of a string.
+                Defaults to an estimate of about four characters per token.
+            system_message: The system message sent with every request, counted against the budget.
+            tool_definitions: The tool definitions sent with every request, counted against the budget.
+        """
+        super().__init__()
+        self.max_tokens = max_tokens
+        self.tokenizer = tokenizer or _estimate_text_tokens
+        self.system_message = system_message
+        self.tool_definitions = tool_definitions
+        self.overhead_tokens = 0
+        if system_message:
+            self.overhead_tokens += self.tokenizer(system_message) + _MESSAGE_OVERHEAD_TOKENS
+        if tool_definitions:
+            self.overhead_tokens += _count_object_tokens(tool_definitions, self.tokenizer)
+        self._window: deque[tuple[ChatMessage, int]] = deque()
+        self._window_tokens = 0
+        if messages:
+            self._append(messages)
+
+    @property
+    def token_count(self) -> int:
+        """The number of tokens of the current window, including the system message and tool definitions."""
+        return self.overhead_tokens + self._window_tokens
+
+    def _append(self, messages: Sequence[ChatMessage]) -> None:
+        """Add messages to the history and the window, then trim the window to the budget."""
+        self.messages.extend(messages)
+        for message in messages:
+            tokens = _count_message_tokens(message, self.tokenizer)
+            self._window.append((message, tokens))
+            self._window_tokens += tokens
+        self._trim()
+
+    def _trim(self) -> None:
+        """Drop the oldest messages until the window fits the budget and does not start with a tool message."""
+        while self._window and self.overhead_tokens + self._window_tokens > self.max_tokens:
+            _, tokens = self._window.popleft()
+            self._window_tokens -= tokens
+        while self._window and self._window[0][0].role == Role.TOOL:
+            _, tokens = self._window.popleft()
+            self._window_tokens -= tokens
+
+    def _reset(self, messages: Sequence[ChatMessage]) -> None:
+        """Replace the history and rebuild the window."""
+        self.messages = []
+        self._window.clear()
+        self._window_tokens = 0
+        self._append(messages)
+
+    async def add_messages(self, messages: Sequence[ChatMessage]) -> None:
+        """Add messages to the store.
+
+        Args:
+            messages: Sequence of ChatMessage objects to add to the store.
+        """
+        self._append(messages)
+
+    async def list_messages(self) -> list[ChatMessage]:
+        """Get the most recent messages that fit into the token budget in chronological order.
+
+        Returns:
+            List of ChatMessage objects, ordered from oldest to newest.
+        """
+        return [message for message, _ in self._window]
+
+    async def list_all_messages(self) -> list[ChatMessage]:
+        """Get all messages from the store, including the ones outside of the window.
+
+        Returns:
+            List of ChatMessage objects, ordered from oldest to newest.
+        """
+        return self.messages
+
+    async def replace_messages(self, original: Sequence[ChatMessage], replacement: Sequence[ChatMessage]) -> bool:
+        """Replace a contiguous span of stored messages and rebuild the window.
+
+        Args:
+            original: The contiguous span of messages to replace.
+            replacement: The messages to store in place of the span.
+
+        Returns:
+            True if the span was replaced, False if it is no longer stored as-is.
+        """
+        if not await super().replace_messages(original, replacement):
+            return False
+        self._reset(list(self.messages))
+        return True
+
+    @classmethod
+    async def deserialize(
+        cls: type[TTokenBudgetChatMessageStore], serialized_store_state: MutableMapping[str, Any], **kwargs: Any
+    ) -> TTokenBudgetChatMessageStore:
+        """Create a new TokenBudgetChatMessageStore instance from serialized state data.
+
+        Args:
+            serialized_store_state: Previously serialized state data containing messages and the budget.
+
+        Keyword Args:
+            **kwargs: Store options (``tokenizer``, ``system_message``, ``tool_definitions``)
+                that are not part of the serialized state.
+
+        Returns:
+            A new TokenBudgetChatMessageStore instance populated with messages from the serialized state.
+        """
+        state = TokenBudgetChatMessageStoreState.from_dict(serialized_store_state)
+        if state.max_tokens is None:
+            raise ValueError("max_tokens is required to deserialize a TokenBudgetChatMessageStore")
+        return cls(messages=state.messages, max_tokens=state.max_tokens, **kwargs)
+
+    async def update_from_state(self, serialized_store_state: MutableMapping[str, Any], **kwargs: Any) -> None:
+        """Update the current TokenBudgetChatMessageStore instance from serialized state data.
+
+        Args:
+            serialized_store_state: Previously serialized state data containing messages.
+
+        Keyword Args:
+            **kwargs: Additional arguments for deserialization.
+        """
+        if not serialized_store_state:
+            return
+        state = TokenBudgetChatMessageStoreState.from_dict(serialized_store_state, **kwargs)
+        if state.max_tokens is not None:
+            self.max_tokens = state.max_tokens
+        self._reset(state.messages or list(self.messages))
+
+    async def serialize(self, **kwargs: Any) -> dict[str, Any]:
+        """Serialize the current store state for persistence.
+
+        Keyword Args:
+            **kwargs: Additional arguments for serialization.
+
+        Returns:
+            Serialized state data that can be used with deserialize_state.
+        """
+        state = TokenBudgetChatMessageStoreState(messages=self.messages, max_tokens=self.max_tokens)
+        return state.to_dict()
+
+
+DEFAULT_COMPACTION_INSTRUCTIONS = (
+    "You compress the earlier part of a conversation between a user and an AI assistant. "
+    "Write a concise summary that preserves every fact, decision, open question, user preference, "
+    "tool result and identifier that later turns may depend on. Do not add anything that is not in the transcript."
+)
+
+
+class ChatHistoryCompactor:
+    """Summarizes the oldest part of a thread's history once it grows past a token threshold.
+
+    When the messages returned by the thread's message store exceed ``max_tokens``, the oldest span is
+    summarized with ``chat_client`` (usually a small, cheap model) and replaced in the store by a single
+    summary message, so that the prompt size of every turn stays bounded. The most recent
+    ``keep_last_messages`` messages are never summarized and spans never end between a function call
+    and its result.
+
+    The summary message keeps provenance metadata on its text content under the ``"compaction"``
+    additional property (compaction id, time, number and ids of the summarized messages). The original
+    messages are embedded there as well, or, when an ``archive`` mapping is supplied, stored in the archive
+    under the compaction id. Use :meth:`get_original_messages` to retrieve them.
+
+    The message store must implement ``CompactableChatMessageStoreProtocol``.
+
+    Examples:
+        .. code-block:: python
+
+            from agent_framework import AgentThread, ChatHistoryCompactor, ChatMessageStore
+            from agent_framework.openai import OpenAIChatClient
+
+            compactor = ChatHistoryCompactor(OpenAIChatClient(model_id="gpt-4o-mini"), max_tokens=16000)
+            thread = agent.get_new_thread(compactor=compactor)
+            # Compaction runs in the background after each turn that crosses the threshold
+            await agent.run("Hello", thread=thread)
+    """
+
+    def __init__(
+        self,
+        chat_client: "ChatClientProtocol",
+        *,
+        max_tokens: int,
+        target_tokens: int | None = None,
+        keep_last_messages: int = 4,
+        tokenizer: Callable[[str], int] | None = None,
+        instructions: str = DEFAULT_COMPACTION_INSTRUCTIONS,
+        archive: MutableMapping[str, list[dict[str, Any]]] | None = None,
+    ) -> None:
+        """Create a ChatHistoryCompactor.
+
+        Args:
+            chat_client: The chat client used to write the summaries.
+
+        Keyword Args:
+            max_tokens: Compaction starts once the thread's messages exceed this many tokens.
+            target_tokens: The number of tokens to leave unsummarized after compaction,
+                defaults to half of ``max_tokens``.
+            keep_last_messages: The number of most recent messages that are never summarized.
+            tokenizer: Callable returning the number of tokens of a string.
+                Defaults to an estimate of about four characters per token.
+            instructions: The system instructions for the summarization request.
+            archive: Optional mapping to store the original messages in, keyed by compaction id.
+                When not set, the originals are embedded in the summary message's metadata.
+        """
+        if target_tokens is not None and target_tokens >= max_tokens:
+            raise ValueError("target_tokens must be smaller than max_tokens.")
+        self.chat_client = chat_client
+        self.max_tokens = max_tokens
+        self.target_tokens = target_tokens if target_tokens is not None else max_tokens // 2
+        self.keep_last_messages = keep_last_messages
+        self.tokenizer = tokenizer or _estimate_text_tokens
+        self.instructions = instructions
+        self.archive = archive
+        self._token_counts: "WeakKeyDictionary[ChatMessage, int]" = WeakKeyDictionary()
+
+    def _count_tokens(self, message: ChatMessage) -> int:
+        """Count the tokens of a message, cached per message instance."""
+        tokens = self._token_counts.get(message)
+        if tokens is None:
+            tokens = self._token_counts[message] = _count_message_tokens(message, self.tokenizer)
+        return tokens
+
+    def select_span(self, messages: Sequence[ChatMessage]) -> int:
+        """Get the number of oldest messages that should be summarized.
+
+        Args:
+            messages: The thread's messages in chronological order.
+
+        Returns:
+            The length of the span to summarize, 0 if no compaction is needed.
+        """
+        token_counts = [self._count_tokens(message) for message in messages]
+        remaining = sum(token_counts)
+        if remaining <= self.max_tokens:
+            return 0
+        limit = len(messages) - self.keep_last_messages
+        end = 0
+        while end < limit and remaining > self.target_tokens:
+            remaining -= token_counts[end]
+            end += 1
+        # Never separate function results from the call that produced them
+        while 0 < end < limit and messages[end].role == Role.TOOL:
+            end += 1
+        return end if end > 1 else 0
+
+    @staticmethod
+    def _format_transcript(messages: Sequence[ChatMessage]) -> str:
+        """Render messages as a plain text transcript for the summarization request."""
+        lines: list[str] = []
+        for message in messages:
+            parts: list[str] = []
+            for content in message.contents:
+                if content.type == "text":
+                    parts.append(content.text)  # type: ignore[attr-defined]
+                elif content.type == "function_call":
+                    parts.append(f"[called {content.name}({content.arguments})]")  # type: ignore[attr-defined]
+                elif content.type == "function_result":
+                    parts.append(f"[result: {content.result}]")  # type: ignore[attr-defined]
+            if parts:
+                lines.append(f"{message.author_name or message.role.value}: {' '.join(str(p) for p in parts)}")
+        return "\n".join(lines)
+
+    async def summarize(self, messages: Sequence[ChatMessage]) -> ChatMessage:
+        """Summarize messages into a single message carrying provenance metadata.
+
+        Args:
+            messages: The span of messages to summarize.
+
+        Returns:
+            The summary message.
+        """
+        response = await self.chat_client.get_response([
+            ChatMessage(role=Role.SYSTEM, text=self.instructions),
+            ChatMessage(role=Role.USER, text=self._format_transcript(messages)),
+        ])
+        compaction_id = f"compaction_{uuid4().hex}"
+        originals = [message.to_dict() for message in messages]
+        provenance: dict[str, Any] = {
+            "id": compaction_id,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "message_count": len(messages),
+            "message_ids": [message.message_id for message in messages],
+            "token_count": sum(self._count_tokens(message) for message in messages),
+        }
+        if self.archive is not None:
+            self.archive[compaction_id] = originals
+        else:
+            provenance["messages"] = originals
+        return ChatMessage(
+            role=Role.ASSISTANT,
+            contents=[
+                TextContent(
+                    text=f"Summary of the earlier conversation:\n{response.text}",
+                    additional_properties={"compaction": provenance},
+                )
+            ],
+            message_id=compaction_id,
+        )
+
+    async def compact(self, message_store: ChatMessageStoreProtocol) -> bool:
+        """Compact the message store if it exceeds the token threshold.
+
+        Args:
+            message_store: The message store to compact.
+
+        Returns:
+            True if a span was replaced by a summary, False otherwise.
+        """
+        if not isinstance(message_store, CompactableChatMessageStoreProtocol):
+            logger.debug(f"Message store {type(message_store).__name__} does not support compaction.")
+            return False
+        messages = await message_store.list_messages()
+        span_length = self.select_span(messages)
+        if span_length == 0:
+            return False
+        span = list(messages[:span_length])
+        summary = await self.summarize(span)
+        if not await message_store.replace_messages(span, [summary]):
+            logger.debug("Skipping compaction, the summarized messages changed while summarizing.")
+            return False
+        return True
+
+    def get_original_messages(self, summary: ChatMessage, *, recursive: bool = True) -> list[ChatMessage]:
+        """Retrieve the original messages that a summary message replaced.
+
+        Args:
+            summary: A summary message created by this compactor.
+
+        Keyword Args:
+            recursive: Also expand summaries of earlier compactions among the originals.
+
+        Returns:
+            The original messages, or ``[summary]`` if the message is not a compaction summary.
+        """
+        provenance = next(
+            (
+                content.additional_properties["compaction"]
+                for content in summary.contents
+                if content.additional_properties and "compaction" in content.additional_properties
+            ),
+            None,
+        )
+        if provenance is None:
+            return [summary]
+        originals = provenance.get("messages")
+        if originals is None and self.archive is not None:
+            originals = self.archive.get(provenance["id"])
+        if originals is None:
+            raise KeyError(f"The original messages of compaction {provenance['id']} are not available.")
+        messages = [ChatMessage.from_dict(message) for message in originals]
+        if not recursive:
+            return messages
+        return [original for message in messages for original in self.get_original_messages(message)]
+
+
 TAgentThread = TypeVar("TAgentThread", bound="AgentThread")
 
 
@@ -327,6 +859,7 @@ class AgentThread:
         service_thread_id: str | None = None,
         message_store: ChatMessageStoreProtocol | None = None,
         context_provider: AggregateContextProvider | None = None,
+        compactor: ChatHistoryCompactor | None = None,
     ) -> None:
         """Initialize an AgentThread, do not use this method manually, always use: ``agent.get_new_thread()``.
 
@@ -334,6 +867,8 @@ class AgentThread:
             service_thread_id: The optional ID of the thread managed by the agent service.
             message_store: The optional ChatMessageStore implementation for managing chat messages.
             context_provider: The optional ContextProvider for the thread.
+            compactor: The optional ChatHistoryCompactor that summarizes old messages in the background
+                once the locally stored history grows past its token threshold.
 
         Note:
             Either ``service_thread_id`` or ``message_store`` may be set, but not both.
@@ -344,6 +879,8 @@ class AgentThread:
         self._service_thread_id = service_thread_id
         self._message_store = message_store
         self.context_provider = context_provider
+        self.compactor = compactor
+        self._compaction_task: asyncio.Task[bool] | None = None
 
     @property
     def is_initialized(self) -> bool:
@@ -416,6 +953,27 @@ class AgentThread:
         if isinstance(new_messages, ChatMessage):
             new_messages = [new_messages]
         await self._message_store.add_messages(new_messages)
+        if self.compactor is not None and (self._compaction_task is None or self._compaction_task.done()):
+            # Compact in the background so the current turn is never blocked by summarization
+            self._compaction_task = asyncio.create_task(self._compact(self.compactor, self._message_store))
+
+    async def _compact(self, compactor: ChatHistoryCompactor, message_store: ChatMessageStoreProtocol) -> bool:
+        """Run a compaction, logging instead of raising failures since nobody awaits the task."""
+        try:
+            return await compactor.compact(message_store)
+        except Exception as ex:
+            logger.warning(f"Compaction of the thread's messages failed: {ex}")
+            return False
+
+    async def wait_for_compaction(self) -> bool:
+        """Wait for a running background compaction to finish.
+
+        Returns:
+            True if the running compaction replaced messages, False if there was nothing to compact.
+        """
+        if self._compaction_task is None:
+            return False
+        return await self._compaction_task
 
     async def serialize(self, **kwargs: Any) -> dict[str, Any]:
         """Serializes the current object's state.
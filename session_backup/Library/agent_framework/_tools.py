@@ -1,12 +1,29 @@
 # Copyright (c) Microsoft. All rights reserved.
 
 import asyncio
+import contextvars
+import copy
+import hashlib
+import importlib
 import inspect
 import json
 import sys
-from collections.abc import AsyncIterable, Awaitable, Callable, Collection, Mapping, MutableMapping, Sequence
-from functools import wraps
-from time import perf_counter, time_ns
+import threading
+from collections import OrderedDict
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Collection,
+    Mapping,
+    MutableMapping,
+    Sequence,
+)
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import AbstractAsyncContextManager, AsyncExitStack, asynccontextmanager, nullcontext
+from functools import partial, wraps
+from time import monotonic, perf_counter, time_ns
 from typing import (
     TYPE_CHECKING,
     Annotated,
@@ -22,6 +39,7 @@ from typing import (
     get_origin,
     runtime_checkable,
 )
+from weakref import WeakKeyDictionary
 
 from opentelemetry.metrics import Histogram
 from pydantic import AnyUrl, BaseModel, Field, ValidationError, create_model
@@ -77,7 +95,9 @@ __all__ = [
     "HostedMCPSpecificApproval",
     "HostedMCPTool",
     "HostedWebSearchTool",
+    "InMemoryToolResultCache",
     "ToolProtocol",
+    "ToolResultCacheProtocol",
     "ai_function",
     "use_function_invocation",
 ]
@@ -92,6 +112,9 @@ TChatClient = TypeVar("TChatClient", bound="ChatClientProtocol")
 
 ArgsT = TypeVar("ArgsT", bound=BaseModel)
 ReturnT = TypeVar("ReturnT")
+SpeculativeFunctionCalls = (
+    Mapping[str, Mapping[str, Any]] | Callable[[Sequence["ChatMessage"]], Mapping[str, Mapping[str, Any]]]
+)
 
 
 class _NoOpHistogram:
@@ -155,6 +178,110 @@ def _parse_inputs(
     return parsed_inputs
 
 
+# region Tool Result Cache
+
+
+@runtime_checkable
+class ToolResultCacheProtocol(Protocol):
+    """Protocol for caches that store the results of cacheable AIFunctions.
+
+    Keys are computed by the function from its name and canonicalized, validated arguments,
+    so a single cache instance can be shared across tools, conversations and users.
+    """
+
+    async def get(self, key: str) -> tuple[bool, Any]:
+        """Look up a cached result.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            A tuple of whether the key was found and the cached value.
+        """
+        ...
+
+    async def set(self, key: str, value: Any, *, ttl: float | None = None) -> None:
+        """Store a result.
+
+        Args:
+            key: The cache key.
+            value: The function result to store.
+
+        Keyword Args:
+            ttl: Time to live in seconds, None means the entry does not expire.
+        """
+        ...
+
+
+class InMemoryToolResultCache:
+    """In-process LRU cache for tool results, with optional per-entry time to live.
+
+    This is the default cache used by AIFunctions created with ``cacheable=True``.
+
+    Examples:
+        .. code-block:: python
+
+            from agent_framework import InMemoryToolResultCache, ai_function
+
+            cache = InMemoryToolResultCache(max_size=256)
+
+
+            @ai_function(cacheable=True, cache_ttl=300, cache=cache)
+            def get_crypto_data(coin: str) -> str:
+                return fetch_price(coin)
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        """Initialize the InMemoryToolResultCache.
+
+        Args:
+            max_size: The maximum number of entries, the least recently used entry is evicted beyond this.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1.")
+        self.max_size = max_size
+        self._entries: OrderedDict[str, tuple[float | None, Any]] = OrderedDict()
+
+    async def get(self, key: str) -> tuple[bool, Any]:
+        """Look up a cached result, expired entries are dropped."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= monotonic():
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    async def set(self, key: str, value: Any, *, ttl: float | None = None) -> None:
+        """Store a result, evicting the least recently used entry when full."""
+        self._entries[key] = (monotonic() + ttl if ttl is not None else None, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of entries, including expired ones that were not yet evicted."""
+        return len(self._entries)
+
+
+_DEFAULT_TOOL_RESULT_CACHE = InMemoryToolResultCache()
+
+
+def _copy_result(value: Any) -> Any:
+    """Copy a shared result, so a caller that mutates it does not change what other callers get."""
+    try:
+        return copy.deepcopy(value)
+    except Exception:
+        # results that cannot be copied (locks, clients, ...) are shared as they are
+        return value
+
+
 # region Tools
 @runtime_checkable
 class ToolProtocol(Protocol):
@@ -524,6 +651,33 @@ def _default_histogram() -> Histogram:
         )
 
 
+def _default_queue_wait_histogram() -> Histogram:
+    """Get the default histogram for the time function calls wait for a concurrency slot.
+
+    Returns:
+        A Histogram instance for recording queue wait duration,
+        or a no-op histogram if observability is disabled.
+    """
+    from .observability import OBSERVABILITY_SETTINGS  # local import to avoid circulars
+
+    if not OBSERVABILITY_SETTINGS.ENABLED:  # type: ignore[name-defined]
+        return _NOOP_HISTOGRAM  # type: ignore[return-value]
+    meter = get_meter()
+    try:
+        return meter.create_histogram(
+            name=OtelAttr.MEASUREMENT_FUNCTION_QUEUE_WAIT_DURATION,
+            unit=OtelAttr.DURATION_UNIT,
+            description="Measures the time a function call waits for a concurrency slot before executing",
+            explicit_bucket_boundaries_advisory=OPERATION_DURATION_BUCKET_BOUNDARIES,
+        )
+    except TypeError:
+        return meter.create_histogram(
+            name=OtelAttr.MEASUREMENT_FUNCTION_QUEUE_WAIT_DURATION,
+            unit=OtelAttr.DURATION_UNIT,
+            description="Measures the time a function call waits for a concurrency slot before executing",
+        )
+
+
 TClass = TypeVar("TClass", bound="SerializationMixin")
 
 
@@ -573,8 +727,14 @@ class AIFunction(BaseTool, Generic[ArgsT, ReturnT]):
             result = await weather_func.invoke(arguments=WeatherArgs(location="Seattle"))
     """
 
-    INJECTABLE: ClassVar[set[str]] = {"func"}
-    DEFAULT_EXCLUDE: ClassVar[set[str]] = {"input_model", "_invocation_duration_histogram"}
+    INJECTABLE: ClassVar[set[str]] = {"func", "cache"}
+    DEFAULT_EXCLUDE: ClassVar[set[str]] = {
+        "input_model",
+        "_invocation_duration_histogram",
+        "_queue_wait_duration_histogram",
+        "_concurrency_semaphores",
+        "_inflight_calls",
+    }
 
     def __init__(
         self,
@@ -584,6 +744,11 @@ class AIFunction(BaseTool, Generic[ArgsT, ReturnT]):
         approval_mode: Literal["always_require", "never_require"] | None = None,
         max_invocations: int | None = None,
         max_invocation_exceptions: int | None = None,
+        max_concurrency: int | None = None,
+        cacheable: bool = False,
+        cache_ttl: float | None = None,
+        cache: ToolResultCacheProtocol | None = None,
+        side_effect_free: bool = False,
         additional_properties: dict[str, Any] | None = None,
         func: Callable[..., Awaitable[ReturnT] | ReturnT] | None = None,
         input_model: type[ArgsT] | Mapping[str, Any] | None = None,
@@ -600,6 +765,17 @@ class AIFunction(BaseTool, Generic[ArgsT, ReturnT]):
                 If None, there is no limit. Should be at least 1.
             max_invocation_exceptions: The maximum number of exceptions allowed during invocations.
                 If None, there is no limit. Should be at least 1.
+            max_concurrency: The maximum number of concurrent invocations of this function
+                through the auto-invocation flow, shared across all requests in the process.
+                Calls beyond the limit wait for a free slot. If None, there is no limit. Should be at least 1.
+            cacheable: Whether results can be reused for calls with the same arguments.
+                Only set this for idempotent functions. Concurrent calls with the same arguments
+                share a single execution. Failed calls are not cached. Every caller gets a deep copy of
+                the result, results that cannot be copied are shared.
+            cache_ttl: Time to live of cached results in seconds. If None, results do not expire.
+            cache: The cache to store results in, defaults to a process-wide ``InMemoryToolResultCache``.
+            side_effect_free: Whether the function only reads data and has no side effects.
+                Only side-effect-free functions are started as speculative function calls.
             additional_properties: Additional properties to set on the function.
             func: The function to wrap.
             input_model: The Pydantic model that defines the input parameters for the function.
@@ -624,7 +800,21 @@ class AIFunction(BaseTool, Generic[ArgsT, ReturnT]):
         self.invocation_count = 0
         self.max_invocation_exceptions = max_invocation_exceptions
         self.invocation_exception_count = 0
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1 or None.")
+        self.max_concurrency = max_concurrency
+        self._concurrency_semaphores: WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+            WeakKeyDictionary()
+        )
+        if cache_ttl is not None and cache_ttl <= 0:
+            raise ValueError("cache_ttl must be greater than 0 or None.")
+        self.cacheable = cacheable
+        self.cache_ttl = cache_ttl
+        self.cache = cache
+        self.side_effect_free = side_effect_free
+        self._inflight_calls: dict[str, asyncio.Task[Any]] = {}
         self._invocation_duration_histogram = _default_histogram()
+        self._queue_wait_duration_histogram = _default_queue_wait_histogram()
         self.type: Literal["ai_function"] = "ai_function"
 
     @property
@@ -644,8 +834,8 @@ class AIFunction(BaseTool, Generic[ArgsT, ReturnT]):
             return cast(type[ArgsT], _create_model_from_json_schema(self.name, input_model))
         raise TypeError("input_model must be a Pydantic BaseModel subclass or a JSON schema dict.")
 
-    def __call__(self, *args: Any, **kwargs: Any) -> ReturnT | Awaitable[ReturnT]:
-        """Call the wrapped function with the provided arguments."""
+    def _check_invocation_limits(self) -> None:
+        """Raise a ToolException when the function cannot be invoked (anymore)."""
         if self.func is None:
             raise ToolException(f"Function '{self.name}' is declaration only and cannot be invoked.")
         if self.max_invocations is not None and self.invocation_count >= self.max_invocations:
@@ -660,23 +850,121 @@ class AIFunction(BaseTool, Generic[ArgsT, ReturnT]):
                 f"Function '{self.name}' has reached its maximum exception limit, "
                 f"you tried to use this tool too many times and it kept failing."
             )
+
+    def __call__(self, *args: Any, **kwargs: Any) -> ReturnT | Awaitable[ReturnT]:
+        """Call the wrapped function with the provided arguments."""
+        self._check_invocation_limits()
         self.invocation_count += 1
         try:
-            return self.func(*args, **kwargs)
+            return self.func(*args, **kwargs)  # type: ignore[misc]
         except Exception:
             self.invocation_exception_count += 1
             raise
 
+    async def _call(self, kwargs: dict[str, Any], sync_executor: Executor | None) -> ReturnT:
+        """Call the wrapped function, offloading synchronous functions to ``sync_executor`` when given."""
+        if sync_executor is None or inspect.iscoroutinefunction(self.func):
+            res = self.__call__(**kwargs)
+            return await res if inspect.isawaitable(res) else res  # type: ignore[return-value]
+        self._check_invocation_limits()
+        self.invocation_count += 1
+        if isinstance(sync_executor, ProcessPoolExecutor):
+            # only the bare function is submitted, so it can be pickled; context variables do not cross processes
+            call = _picklable_call(self.func, kwargs)  # type: ignore[arg-type]
+        else:
+            # unlike asyncio.to_thread, run_in_executor does not propagate context variables by itself
+            call = partial(contextvars.copy_context().run, self.func, **kwargs)  # type: ignore[arg-type]
+        try:
+            res = await asyncio.get_running_loop().run_in_executor(sync_executor, call)
+            return await res if inspect.isawaitable(res) else res  # type: ignore[no-any-return]
+        except Exception:
+            self.invocation_exception_count += 1
+            raise
+
+    def _get_cache_key(self, kwargs: Mapping[str, Any]) -> str:
+        """Compute the cache key from the function name and identity and the canonicalized arguments."""
+        canonical_args = json.dumps(kwargs, sort_keys=True, separators=(",", ":"), default=str)
+        # the qualified name keeps functions that share a tool name from reading each other's results
+        identity = f"{getattr(self.func, '__module__', '')}.{getattr(self.func, '__qualname__', '')}"
+        return f"{self.name}:{identity}:{hashlib.sha256(canonical_args.encode('utf-8')).hexdigest()}"
+
+    async def _call_cached(
+        self,
+        kwargs: dict[str, Any],
+        sync_executor: Executor | None,
+        invocation_slot: Callable[[], AbstractAsyncContextManager[Any]] | None = None,
+    ) -> tuple[ReturnT, bool]:
+        """Call the function through the result cache.
+
+        The execution runs in ``invocation_slot``; cache hits and calls that join a running identical call skip it.
+        Cached results are shared, so every caller gets a deep copy of the result when it can be copied.
+
+        Returns:
+            The result and whether it was served from the cache (or from a concurrent identical call).
+        """
+        slot = invocation_slot or nullcontext
+        if not self.cacheable:
+            async with slot():
+                return await self._call(kwargs, sync_executor), False
+        cache = self.cache or _DEFAULT_TOOL_RESULT_CACHE
+        key = self._get_cache_key(kwargs)
+        found, cached = await cache.get(key)
+        if found:
+            return _copy_result(cached), True
+        loop = asyncio.get_running_loop()
+        inflight = self._inflight_calls.get(key)
+        if inflight is not None and not inflight.done() and inflight.get_loop() is loop:
+            return _copy_result(await asyncio.shield(inflight)), True
+
+        async def execute() -> Any:
+            async with slot():
+                result = await self._call(kwargs, sync_executor)
+            await cache.set(key, result, ttl=self.cache_ttl)
+            return result
+
+        # The execution is a task of its own, so a cancelled caller does not cancel the calls that joined it.
+        task = loop.create_task(execute())
+        self._inflight_calls[key] = task
+        task.add_done_callback(partial(self._finish_inflight_call, key))
+        return _copy_result(await asyncio.shield(task)), False
+
+    def _finish_inflight_call(self, key: str, task: "asyncio.Task[Any]") -> None:
+        """Forget a finished shared call and retrieve its exception, which its callers may not all await."""
+        if self._inflight_calls.get(key) is task:
+            del self._inflight_calls[key]
+        if not task.cancelled():
+            task.exception()
+
+    def _get_concurrency_semaphore(self) -> asyncio.Semaphore | None:
+        """Get the semaphore enforcing ``max_concurrency`` for the running event loop, created on first use.
+
+        Semaphores cannot be shared across event loops, so the limit applies per loop.
+        """
+        if self.max_concurrency is None:
+            return None
+        loop = asyncio.get_running_loop()
+        semaphore = self._concurrency_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._concurrency_semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
     async def invoke(
         self,
         *,
         arguments: ArgsT | None = None,
+        sync_executor: Executor | None = None,
+        invocation_slot: Callable[[], AbstractAsyncContextManager[Any]] | None = None,
         **kwargs: Any,
     ) -> ReturnT:
         """Run the AI function with the provided arguments as a Pydantic model.
 
         Keyword Args:
             arguments: A Pydantic model instance containing the arguments for the function.
+            sync_executor: Executor to run a synchronous function in, so it does not block the event loop.
+                When using a process pool the wrapped function must be picklable.
+                Coroutine functions always run on the event loop.
+            invocation_slot: Factory of an async context manager the function runs in, for example to wait
+                for a concurrency slot. Results served from the cache skip it.
             kwargs: Keyword arguments to pass to the function, will not be used if ``arguments`` is provided.
 
         Returns:
@@ -698,11 +986,27 @@ class AIFunction(BaseTool, Generic[ArgsT, ReturnT]):
         if not OBSERVABILITY_SETTINGS.ENABLED:  # type: ignore[name-defined]
             logger.info(f"Function name: {self.name}")
             logger.debug(f"Function arguments: {kwargs}")
-            res = self.__call__(**kwargs)
-            result = await res if inspect.isawaitable(res) else res
+            result, _ = await self._call_cached(kwargs, sync_executor, invocation_slot)
             logger.info(f"Function {self.name} succeeded.")
             logger.debug(f"Function result: {result or 'None'}")
             return result  # type: ignore[reportReturnType]
+        if not OBSERVABILITY_SETTINGS.TRACING_ENABLED:  # type: ignore[name-defined]
+            logger.info(f"Function name: {self.name}")
+            metric_attributes: dict[str, Any] = {OtelAttr.MEASUREMENT_FUNCTION_TAG_NAME: self.name}
+            start_time_stamp = perf_counter()
+            try:
+                result, cache_hit = await self._call_cached(kwargs, sync_executor, invocation_slot)
+            except Exception as exception:
+                metric_attributes[OtelAttr.ERROR_TYPE] = type(exception).__name__
+                logger.error(f"Function failed. Error: {exception}")
+                raise
+            else:
+                if self.cacheable:
+                    metric_attributes[OtelAttr.MEASUREMENT_FUNCTION_CACHE_HIT] = cache_hit
+                logger.info(f"Function {self.name} succeeded.")
+                return result  # type: ignore[reportReturnType]
+            finally:
+                self._invocation_duration_histogram.record(perf_counter() - start_time_stamp, metric_attributes)
 
         attributes = get_function_span_attributes(self, tool_call_id=tool_call_id)
         if OBSERVABILITY_SETTINGS.SENSITIVE_DATA_ENABLED:  # type: ignore[name-defined]
@@ -721,9 +1025,10 @@ class AIFunction(BaseTool, Generic[ArgsT, ReturnT]):
             start_time_stamp = perf_counter()
             end_time_stamp: float | None = None
             try:
-                res = self.__call__(**kwargs)
-                result = await res if inspect.isawaitable(res) else res
+                result, cache_hit = await self._call_cached(kwargs, sync_executor, invocation_slot)
                 end_time_stamp = perf_counter()
+                if self.cacheable:
+                    attributes[OtelAttr.MEASUREMENT_FUNCTION_CACHE_HIT] = cache_hit
             except Exception as exception:
                 end_time_stamp = perf_counter()
                 attributes[OtelAttr.ERROR_TYPE] = type(exception).__name__
@@ -932,6 +1237,11 @@ def ai_function(
     approval_mode: Literal["always_require", "never_require"] | None = None,
     max_invocations: int | None = None,
     max_invocation_exceptions: int | None = None,
+    max_concurrency: int | None = None,
+    cacheable: bool = False,
+    cache_ttl: float | None = None,
+    cache: ToolResultCacheProtocol | None = None,
+    side_effect_free: bool = False,
     additional_properties: dict[str, Any] | None = None,
 ) -> AIFunction[Any, ReturnT]: ...
 
@@ -945,6 +1255,11 @@ def ai_function(
     approval_mode: Literal["always_require", "never_require"] | None = None,
     max_invocations: int | None = None,
     max_invocation_exceptions: int | None = None,
+    max_concurrency: int | None = None,
+    cacheable: bool = False,
+    cache_ttl: float | None = None,
+    cache: ToolResultCacheProtocol | None = None,
+    side_effect_free: bool = False,
     additional_properties: dict[str, Any] | None = None,
 ) -> Callable[[Callable[..., ReturnT | Awaitable[ReturnT]]], AIFunction[Any, ReturnT]]: ...
 
@@ -957,6 +1272,11 @@ def ai_function(
     approval_mode: Literal["always_require", "never_require"] | None = None,
     max_invocations: int | None = None,
     max_invocation_exceptions: int | None = None,
+    max_concurrency: int | None = None,
+    cacheable: bool = False,
+    cache_ttl: float | None = None,
+    cache: ToolResultCacheProtocol | None = None,
+    side_effect_free: bool = False,
     additional_properties: dict[str, Any] | None = None,
 ) -> AIFunction[Any, ReturnT] | Callable[[Callable[..., ReturnT | Awaitable[ReturnT]]], AIFunction[Any, ReturnT]]:
     """Decorate a function to turn it into a AIFunction that can be passed to models and executed automatically.
@@ -983,6 +1303,14 @@ def ai_function(
             If None, there is no limit, should be at least 1.
         max_invocation_exceptions: The maximum number of exceptions allowed during invocations.
             If None, there is no limit, should be at least 1.
+        max_concurrency: The maximum number of concurrent invocations of this function.
+            If None, there is no limit, should be at least 1.
+        cacheable: Whether results can be reused for calls with the same arguments,
+            only use this for idempotent functions.
+        cache_ttl: Time to live of cached results in seconds. If None, results do not expire.
+        cache: The cache to store results in, defaults to a process-wide ``InMemoryToolResultCache``.
+        side_effect_free: Whether the function only reads data and has no side effects,
+            required for speculative function calls.
         additional_properties: Additional properties to set on the function.
 
     Note:
@@ -1024,6 +1352,12 @@ def ai_function(
                 return f"Weather in {location}"
 
 
+            # Reuse results of identical calls for 5 minutes
+            @ai_function(cacheable=True, cache_ttl=300)
+            def get_news(category: str) -> str:
+                return f"Headlines for {category}"
+
+
             # Async functions are also supported
             @ai_function
             async def async_get_weather(location: str) -> str:
@@ -1044,6 +1378,11 @@ def ai_function(
                 approval_mode=approval_mode,
                 max_invocations=max_invocations,
                 max_invocation_exceptions=max_invocation_exceptions,
+                max_concurrency=max_concurrency,
+                cacheable=cacheable,
+                cache_ttl=cache_ttl,
+                cache=cache,
+                side_effect_free=side_effect_free,
                 additional_properties=additional_properties or {},
                 func=f,
             )
@@ -1084,6 +1423,19 @@ class FunctionInvocationConfiguration(SerializationMixin):
             # Enable detailed error information in function results
             client.function_invocation_config.include_detailed_errors = True
 
+            # Run at most 4 function calls of a single model response at the same time
+            client.function_invocation_config.max_parallel_function_calls = 4
+
+            # Run synchronous tools in a thread pool instead of on the event loop
+            client.function_invocation_config.sync_function_executor = "thread"
+
+            # Start function calls while the model is still streaming the rest of its response
+            client.function_invocation_config.eager_function_invocation = True
+
+            # Start get_bbc_news while the first model request is running,
+            # the result is used if the model requests the same call
+            client.function_invocation_config.speculative_function_calls = {"get_bbc_news": {"category": "latest"}}
+
             # You can also create a new configuration instance if needed
             new_config = FunctionInvocationConfiguration(
                 enabled=True,
@@ -1133,6 +1485,33 @@ class FunctionInvocationConfiguration(SerializationMixin):
             When set to True, detailed error information such as exception type and message
             will be included in the function result content when a function invocation fails.
             When False, only a generic error message will be included.
+        max_parallel_function_calls: Maximum number of function calls from a single model response
+            that are executed at the same time. The remaining calls wait for a free slot.
+            Use ``max_concurrency`` on ``AIFunction`` to limit a single tool across requests.
+            The default is None, which runs all function calls concurrently.
+        sync_function_executor: Where synchronous (non-async) functions are executed.
+            None runs them inline on the event loop, "thread" runs them in a thread pool and "process"
+            runs them in a process pool (the functions must be picklable). A ``concurrent.futures.Executor``
+            instance can also be supplied. The "thread" and "process" pools are shared by all configurations
+            in the process and shut down when the interpreter exits. Async functions always run on the event loop.
+            The default is None.
+        eager_function_invocation: Whether streaming responses start executing a function call as soon as
+            its arguments are complete, while the model is still generating the rest of the response.
+            The results are still sent back to the model at the end of the turn.
+            Eager invocation is skipped for turns where a tool requires approval, is declaration only, or
+            when ``additional_tools`` or ``terminate_on_unknown_calls`` are set, because those can stop the
+            calls from being executed at all. Only applies to streaming responses.
+            The default is False.
+        speculative_function_calls: Function calls to start concurrently with the first model request,
+            as a mapping of function name to arguments, or a callable that predicts that mapping from
+            the request messages. When the model then requests a function with the same (validated) arguments,
+            the speculative result is used, all other speculative calls are cancelled or discarded after the first
+            model response. Only functions marked ``side_effect_free`` are started speculatively, and never when they
+            require approval or are declaration only. Speculative calls count as invocations and share the
+            ``max_parallel_function_calls`` limit of the first model response. When the callable raises,
+            no calls are started.
+            Can also be passed per request as the ``speculative_function_calls`` keyword argument.
+            The default is None.
 
 
     """
@@ -1145,6 +1524,10 @@ class FunctionInvocationConfiguration(SerializationMixin):
         terminate_on_unknown_calls: bool = False,
         additional_tools: Sequence[ToolProtocol] | None = None,
         include_detailed_errors: bool = False,
+        max_parallel_function_calls: int | None = None,
+        sync_function_executor: Literal["thread", "process"] | Executor | None = None,
+        eager_function_invocation: bool = False,
+        speculative_function_calls: "SpeculativeFunctionCalls | None" = None,
     ) -> None:
         """Initialize FunctionInvocationConfiguration.
 
@@ -1155,6 +1538,10 @@ class FunctionInvocationConfiguration(SerializationMixin):
             terminate_on_unknown_calls: Whether to terminate on unknown function calls.
             additional_tools: Additional tools to include for function execution.
             include_detailed_errors: Whether to include detailed error information in function results.
+            max_parallel_function_calls: Maximum number of function calls executed at the same time per response.
+            sync_function_executor: Where synchronous functions are executed: "thread", "process" or an executor.
+            eager_function_invocation: Whether streaming responses start function calls as soon as they are complete.
+            speculative_function_calls: Function calls to start concurrently with the first model request.
         """
         self.enabled = enabled
         if max_iterations < 1:
@@ -1166,6 +1553,93 @@ class FunctionInvocationConfiguration(SerializationMixin):
         self.terminate_on_unknown_calls = terminate_on_unknown_calls
         self.additional_tools = additional_tools or []
         self.include_detailed_errors = include_detailed_errors
+        if max_parallel_function_calls is not None and max_parallel_function_calls < 1:
+            raise ValueError("max_parallel_function_calls must be at least 1 or None.")
+        self.max_parallel_function_calls = max_parallel_function_calls
+        self.sync_function_executor = sync_function_executor
+        self.eager_function_invocation = eager_function_invocation
+        self.speculative_function_calls = speculative_function_calls
+
+    def _get_sync_executor(self) -> Executor | None:
+        """Resolve ``sync_function_executor`` to an executor, the shared pools are created on first use."""
+        if self.sync_function_executor is None or isinstance(self.sync_function_executor, Executor):
+            return self.sync_function_executor
+        if self.sync_function_executor not in ("thread", "process"):
+            raise ValueError(
+                f"Unsupported sync_function_executor: {self.sync_function_executor!r}, "
+                "use 'thread', 'process' or an Executor."
+            )
+        return _get_shared_sync_executor(self.sync_function_executor)
+
+
+# The pools behind sync_function_executor="thread"/"process". concurrent.futures joins their workers at exit.
+_SHARED_SYNC_EXECUTORS: dict[str, Executor] = {}
+_SHARED_SYNC_EXECUTORS_LOCK = threading.Lock()
+
+
+def _get_shared_sync_executor(kind: Literal["thread", "process"]) -> Executor:
+    """Get the process-wide pool of the given kind, created on first use."""
+    with _SHARED_SYNC_EXECUTORS_LOCK:
+        executor = _SHARED_SYNC_EXECUTORS.get(kind)
+        if executor is None:
+            executor = _SHARED_SYNC_EXECUTORS[kind] = (
+                ThreadPoolExecutor(thread_name_prefix="agent_framework_tool")
+                if kind == "thread"
+                else ProcessPoolExecutor()
+            )
+        return executor
+
+
+def _resolve_qualname(module: str, qualname: str) -> Any:
+    """Resolve a module-level object by its qualified name."""
+    target: Any = importlib.import_module(module)
+    for part in qualname.split("."):
+        target = getattr(target, part)
+    return target
+
+
+def _call_by_reference(module: str, qualname: str, kwargs: dict[str, Any]) -> Any:
+    """Call the function wrapped by a module-level ``@ai_function`` in a worker process."""
+    return _resolve_qualname(module, qualname).func(**kwargs)
+
+
+def _picklable_call(func: Callable[..., Any], kwargs: dict[str, Any]) -> Callable[[], Any]:
+    """Build a call of ``func`` that can be sent to a process pool.
+
+    ``@ai_function`` replaces the module attribute with the AIFunction, so pickle cannot find the decorated
+    function by its name anymore. Those functions are sent by reference and resolved in the worker instead.
+    """
+    module, qualname = getattr(func, "__module__", None), getattr(func, "__qualname__", "")
+    if module and "<locals>" not in qualname:
+        try:
+            target = _resolve_qualname(module, qualname)
+        except (ImportError, AttributeError):
+            target = None
+        if isinstance(target, AIFunction) and target.func is func:
+            return partial(_call_by_reference, module, qualname, kwargs)
+    return partial(func, **kwargs)
+
+
+@asynccontextmanager
+async def _invocation_slot(
+    tool: AIFunction[Any, Any],
+    parallel_limiter: asyncio.Semaphore | None,
+) -> AsyncIterator[None]:
+    """Wait for the per-tool and per-response concurrency slots and record the time spent waiting."""
+    semaphores = [sem for sem in (tool._get_concurrency_semaphore(), parallel_limiter) if sem is not None]
+    if not semaphores:
+        yield
+        return
+    start_time_stamp = perf_counter()
+    async with AsyncExitStack() as stack:
+        # the per-tool slot is acquired first, so a waiting call does not hold on to a response slot
+        for semaphore in semaphores:
+            await stack.enter_async_context(semaphore)
+        tool._queue_wait_duration_histogram.record(
+            perf_counter() - start_time_stamp,
+            attributes={OtelAttr.MEASUREMENT_FUNCTION_TAG_NAME: tool.name},
+        )
+        yield
 
 
 async def _auto_invoke_function(
@@ -1177,6 +1651,7 @@ async def _auto_invoke_function(
     sequence_index: int | None = None,
     request_index: int | None = None,
     middleware_pipeline: Any = None,  # Optional MiddlewarePipeline
+    parallel_limiter: asyncio.Semaphore | None = None,
 ) -> "Contents":
     """Invoke a function call requested by the agent, applying middleware that is defined.
 
@@ -1190,6 +1665,7 @@ async def _auto_invoke_function(
         sequence_index: The index of the function call in the sequence.
         request_index: The index of the request iteration.
         middleware_pipeline: Optional middleware pipeline to apply during execution.
+        parallel_limiter: Optional semaphore limiting the number of concurrent function calls.
 
     Returns:
         A FunctionResultContent containing the result or exception.
@@ -1237,13 +1713,39 @@ async def _auto_invoke_function(
         if config.include_detailed_errors:
             message = f"{message} Exception: {exc}"
         return FunctionResultContent(call_id=function_call_content.call_id, result=message, exception=exc)
-    if not middleware_pipeline or (
-        not hasattr(middleware_pipeline, "has_middlewares") and not middleware_pipeline.has_middlewares
-    ):
+    return await _invoke_validated_function(
+        function_call_content,
+        tool,
+        args,
+        custom_args,
+        config=config,
+        middleware_pipeline=middleware_pipeline,
+        parallel_limiter=parallel_limiter,
+    )
+
+
+async def _invoke_validated_function(
+    function_call_content: "FunctionCallContent",
+    tool: AIFunction[BaseModel, Any],
+    args: BaseModel,
+    custom_args: dict[str, Any] | None,
+    *,
+    config: FunctionInvocationConfiguration,
+    middleware_pipeline: Any,
+    parallel_limiter: asyncio.Semaphore | None = None,
+) -> "Contents":
+    """Execute a function call with validated arguments, through the middleware pipeline if there is one."""
+    from ._types import FunctionResultContent
+
+    sync_executor = config._get_sync_executor()
+    invocation_slot = partial(_invocation_slot, tool, parallel_limiter)
+    if not middleware_pipeline or not getattr(middleware_pipeline, "has_middlewares", True):
         # No middleware - execute directly
         try:
             function_result = await tool.invoke(
                 arguments=args,
+                sync_executor=sync_executor,
+                invocation_slot=invocation_slot,
                 tool_call_id=function_call_content.call_id,
             )  # type: ignore[arg-type]
             return FunctionResultContent(
@@ -1267,6 +1769,8 @@ async def _auto_invoke_function(
     async def final_function_handler(context_obj: Any) -> Any:
         return await tool.invoke(
             arguments=context_obj.arguments,
+            sync_executor=sync_executor,
+            invocation_slot=invocation_slot,
             tool_call_id=function_call_content.call_id,
         )
 
@@ -1316,6 +1820,7 @@ async def _try_execute_function_calls(
     | Sequence[ToolProtocol | Callable[..., Any] | MutableMapping[str, Any]]",
     config: FunctionInvocationConfiguration,
     middleware_pipeline: Any = None,  # Optional MiddlewarePipeline to avoid circular imports
+    speculative_calls: "_SpeculativeFunctionCalls | None" = None,
 ) -> Sequence["Contents"]:
     """Execute multiple function calls concurrently.
 
@@ -1326,6 +1831,7 @@ async def _try_execute_function_calls(
         tools: The tools available for execution.
         config: Configuration for function invocation.
         middleware_pipeline: Optional middleware pipeline to apply during execution.
+        speculative_calls: Optional speculative calls, whose results are used for matching function calls.
 
     Returns:
         A list of Contents containing the results of each function call,
@@ -1362,21 +1868,324 @@ async def _try_execute_function_calls(
         # return the declaration only tools to the user, since we cannot execute them.
         return [fcc for fcc in function_calls if isinstance(fcc, FunctionCallContent)]
 
-    # Run all function calls concurrently
+    # Run all function calls concurrently, bounded by max_parallel_function_calls if set
+    parallel_limiter = (
+        speculative_calls.parallel_limiter
+        if speculative_calls is not None
+        else asyncio.Semaphore(config.max_parallel_function_calls)
+        if config.max_parallel_function_calls
+        else None
+    )
     return await asyncio.gather(*[
-        _auto_invoke_function(
+        (
+            speculative_calls is not None
+            and isinstance(function_call, FunctionCallContent)
+            and speculative_calls.claim(function_call)
+        )
+        or _auto_invoke_function(
             function_call_content=function_call,  # type: ignore[arg-type]
             custom_args=custom_args,
             tool_map=tool_map,
             sequence_index=seq_idx,
             request_index=attempt_idx,
             middleware_pipeline=middleware_pipeline,
+            parallel_limiter=parallel_limiter,
             config=config,
         )
         for seq_idx, function_call in enumerate(function_calls)
     ])
 
 
+class _SpeculativeFunctionCalls:
+    """Function calls started before the model requested them.
+
+    Started concurrently with the first model request, a speculative call is claimed by a requested
+    call to the same function with the same validated arguments, unclaimed calls are cancelled.
+    """
+
+    def __init__(
+        self,
+        *,
+        custom_args: dict[str, Any],
+        tool_map: dict[str, AIFunction[Any, Any]],
+        parallel_limiter: asyncio.Semaphore | None = None,
+    ) -> None:
+        self._custom_args = custom_args
+        self._tool_map = tool_map
+        # shared with the calls of the first model response, so together they stay within the limit
+        self.parallel_limiter = parallel_limiter
+        self._calls: dict[str, list[tuple[BaseModel, asyncio.Task["Contents"]]]] = {}
+
+    @classmethod
+    def start(
+        cls,
+        speculative_function_calls: SpeculativeFunctionCalls | None,
+        *,
+        messages: Sequence["ChatMessage"],
+        custom_args: dict[str, Any],
+        tools: Any,
+        config: FunctionInvocationConfiguration,
+        middleware_pipeline: Any,
+    ) -> "_SpeculativeFunctionCalls | None":
+        """Start the speculative function calls, returns None when there is nothing to start."""
+        from ._types import FunctionCallContent
+
+        if not speculative_function_calls or not tools:
+            return None
+        if callable(speculative_function_calls):
+            try:
+                predicted = speculative_function_calls(messages)
+            except Exception as exc:
+                logger.warning(f"Speculative function call prediction failed, no calls are started: {exc}")
+                return None
+        else:
+            predicted = speculative_function_calls
+        tool_map = _get_tool_map(tools)
+        speculation = cls(
+            custom_args=custom_args,
+            tool_map=tool_map,
+            parallel_limiter=(
+                asyncio.Semaphore(config.max_parallel_function_calls) if config.max_parallel_function_calls else None
+            ),
+        )
+        for name, arguments in (predicted or {}).items():
+            tool = tool_map.get(name)
+            if (
+                tool is None
+                or not tool.side_effect_free
+                or tool.declaration_only
+                or tool.approval_mode == "always_require"
+            ):
+                logger.debug(f"Skipping speculative call of function '{name}', it cannot run speculatively")
+                continue
+            validated = speculation._validate(tool, arguments)
+            if validated is None:
+                logger.debug(f"Skipping speculative call of function '{name}' with invalid arguments")
+                continue
+            task = asyncio.create_task(
+                _auto_invoke_function(
+                    FunctionCallContent(call_id=f"speculative_{name}", name=name, arguments=dict(arguments)),
+                    custom_args=custom_args,
+                    config=config,
+                    tool_map=tool_map,
+                    middleware_pipeline=middleware_pipeline,
+                    parallel_limiter=speculation.parallel_limiter,
+                )
+            )
+            speculation._calls.setdefault(name, []).append((validated, task))
+        return speculation if speculation._calls else None
+
+    def _validate(self, tool: AIFunction[Any, Any], arguments: Mapping[str, Any]) -> BaseModel | None:
+        try:
+            return tool.input_model.model_validate(self._custom_args | dict(arguments))
+        except ValidationError:
+            return None
+
+    def claim(self, function_call: "FunctionCallContent") -> Awaitable["Contents"] | None:
+        """Claim the speculative call matching a requested function call, if any.
+
+        Returns:
+            An awaitable with the result for ``function_call``, or None when there is no matching speculative call.
+        """
+        candidates = self._calls.get(function_call.name)
+        if not candidates:
+            return None
+        validated = self._validate(self._tool_map[function_call.name], function_call.parse_arguments() or {})
+        if validated is None:
+            return None
+        for idx, (speculative_args, task) in enumerate(candidates):
+            if speculative_args == validated:
+                del candidates[idx]
+                return self._result_for(task, function_call.call_id)
+        return None
+
+    @staticmethod
+    async def _result_for(task: asyncio.Task["Contents"], call_id: str) -> "Contents":
+        from ._types import FunctionResultContent
+
+        result = await task
+        if isinstance(result, FunctionResultContent):
+            result = copy.copy(result)
+            result.call_id = call_id
+        return result
+
+    def cancel(self) -> None:
+        """Cancel or discard all unclaimed speculative calls."""
+        for candidates in self._calls.values():
+            for _, task in candidates:
+                task.cancel()
+        self._calls.clear()
+
+
+def _is_function_call_complete(function_call: "FunctionCallContent") -> bool:
+    """Check whether a (partially) streamed function call has its name, id and complete JSON arguments."""
+    if not function_call.name or not function_call.call_id or function_call.arguments is None:
+        return False
+    if isinstance(function_call.arguments, str):
+        # a JSON object only parses once its closing brace has been streamed
+        try:
+            return isinstance(json.loads(function_call.arguments), dict)
+        except json.JSONDecodeError:
+            return False
+    return True
+
+
+class _EagerFunctionCallScheduler:
+    """Schedules function calls from a streamed response as soon as their arguments are complete.
+
+    Streamed function calls arrive as fragments, the first one carries the ``call_id`` and name
+    and the following ones (without ``call_id``) append to the arguments. Once a call is complete
+    it is started in a task, :meth:`collect` joins those tasks with any remaining calls at the end of the turn.
+    Calls are only started while the tools are the ones the turn started with, chat middleware can replace them.
+    """
+
+    def __init__(
+        self,
+        *,
+        custom_args: dict[str, Any],
+        attempt_idx: int,
+        tools: Any,
+        config: FunctionInvocationConfiguration,
+        middleware_pipeline: Any,
+        speculative_calls: _SpeculativeFunctionCalls | None = None,
+    ) -> None:
+        self._custom_args = custom_args
+        self._attempt_idx = attempt_idx
+        self._tools = tools
+        self._tool_map = _get_tool_map(tools)
+        self._config = config
+        self._middleware_pipeline = middleware_pipeline
+        # speculative calls share the parallel limit of the first model response
+        self._parallel_limiter = (
+            speculative_calls.parallel_limiter
+            if speculative_calls is not None
+            else asyncio.Semaphore(config.max_parallel_function_calls)
+            if config.max_parallel_function_calls
+            else None
+        )
+        self._current_call: "FunctionCallContent | None" = None
+        self._tasks: dict[str, asyncio.Task["Contents"]] = {}
+        self._started: set[asyncio.Task["Contents"]] = set()
+        self.speculative_calls = speculative_calls
+
+    @classmethod
+    def create(
+        cls,
+        *,
+        custom_args: dict[str, Any],
+        attempt_idx: int,
+        tools: Any,
+        config: FunctionInvocationConfiguration,
+        middleware_pipeline: Any,
+        speculative_calls: _SpeculativeFunctionCalls | None = None,
+    ) -> "_EagerFunctionCallScheduler | None":
+        """Create a scheduler, or return None when the calls of this turn cannot be executed eagerly."""
+        if not config.eager_function_invocation or not tools:
+            return None
+        if config.additional_tools or config.terminate_on_unknown_calls:
+            return None
+        return cls(
+            custom_args=custom_args,
+            attempt_idx=attempt_idx,
+            tools=tools,
+            config=config,
+            middleware_pipeline=middleware_pipeline,
+            speculative_calls=speculative_calls,
+        )
+
+    def _tools_unchanged(self, tools: Any) -> bool:
+        """Check that ``tools`` are the tools the scheduler was created with and can all be executed eagerly."""
+        current = tools if isinstance(tools, list) else [tools]
+        initial = self._tools if isinstance(self._tools, list) else [self._tools]
+        if len(current) != len(initial) or any(new is not old for new, old in zip(current, initial)):
+            return False
+        # these tools change the outcome for all calls of the turn, so nothing can be started early
+        return not any(
+            tool.approval_mode == "always_require" or tool.declaration_only for tool in self._tool_map.values()
+        )
+
+    def _start(self, function_call: "FunctionCallContent", sequence_index: int) -> asyncio.Task["Contents"]:
+        if self.speculative_calls is not None and (claimed := self.speculative_calls.claim(function_call)):
+            task = asyncio.ensure_future(claimed)
+        else:
+            task = asyncio.create_task(
+                _auto_invoke_function(
+                    function_call_content=function_call,
+                    custom_args=self._custom_args,
+                    config=self._config,
+                    tool_map=self._tool_map,
+                    sequence_index=sequence_index,
+                    request_index=self._attempt_idx,
+                    middleware_pipeline=self._middleware_pipeline,
+                    parallel_limiter=self._parallel_limiter,
+                )
+            )
+        self._started.add(task)
+        return task
+
+    def process_update(self, update: "ChatResponseUpdate") -> None:
+        """Accumulate the function call fragments of an update and start the call once it is complete."""
+        from ._types import FunctionCallContent
+
+        for content in update.contents:
+            if not isinstance(content, FunctionCallContent):
+                continue
+            current = self._current_call
+            if current is not None and (not content.call_id or content.call_id == current.call_id):
+                current = current + content
+            else:
+                current = content
+            self._current_call = current
+            if (
+                current.call_id not in self._tasks
+                and current.name in self._tool_map
+                and (not isinstance(current.arguments, str) or current.arguments.rstrip().endswith("}"))
+                and _is_function_call_complete(current)
+                # the tools are read again, as chat middleware may have replaced them after the turn started
+                and self._tools_unchanged(_extract_tools(self._custom_args))
+            ):
+                self._tasks[current.call_id] = self._start(current, len(self._tasks))
+
+    async def collect(self, function_calls: Sequence["FunctionCallContent"], tools: Any) -> list["Contents"]:
+        """Join the eagerly started calls with the remaining calls, in the order of ``function_calls``.
+
+        When ``tools``, the tools after the middleware ran, differ from the tools the calls were started with,
+        the started calls are cancelled and all calls are executed with ``tools`` instead.
+        """
+        try:
+            if not self._tools_unchanged(tools):
+                await self.close()
+                return list(
+                    await _try_execute_function_calls(
+                        custom_args=self._custom_args,
+                        attempt_idx=self._attempt_idx,
+                        function_calls=function_calls,
+                        tools=tools,
+                        middleware_pipeline=self._middleware_pipeline,
+                        config=self._config,
+                        speculative_calls=self.speculative_calls,
+                    )
+                )
+            tasks = [
+                self._tasks.pop(fcc.call_id, None) or self._start(fcc, seq_idx)
+                for seq_idx, fcc in enumerate(function_calls)
+            ]
+            return list(await asyncio.gather(*tasks))
+        finally:
+            # anything left was started for a call that is not executed in this turn
+            await self.close()
+
+    async def close(self) -> None:
+        """Cancel the calls that were started but not joined, and wait for them to finish."""
+        pending = [task for task in self._started if not task.done()]
+        for task in pending:
+            task.cancel()
+        self._tasks.clear()
+        self._started.clear()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
 def _update_conversation_id(kwargs: dict[str, Any], conversation_id: str | None) -> None:
     """Update kwargs with conversation id.
 
@@ -1509,7 +2318,7 @@ def _handle_function_calls_response(
             )
 
             # Extract and merge function middleware from chat client with kwargs pipeline
-            extract_and_merge_function_middleware(self, **kwargs)
+            extract_and_merge_function_middleware(self, kwargs)
 
             # Extract the middleware pipeline before calling the underlying function
             # because the underlying function may not preserve it in kwargs
@@ -1525,125 +2334,143 @@ def _handle_function_calls_response(
             prepped_messages = prepare_messages(messages)
             response: "ChatResponse | None" = None
             fcc_messages: "list[ChatMessage]" = []
-            for attempt_idx in range(config.max_iterations if config.enabled else 0):
-                fcc_todo = _collect_approval_responses(prepped_messages)
-                if fcc_todo:
+            speculative_calls = _SpeculativeFunctionCalls.start(
+                kwargs.pop("speculative_function_calls", None) or config.speculative_function_calls,
+                messages=prepped_messages,
+                custom_args=kwargs,
+                tools=_extract_tools(kwargs) if config.enabled else None,
+                config=config,
+                middleware_pipeline=stored_middleware_pipeline,
+            )
+            try:
+                for attempt_idx in range(config.max_iterations if config.enabled else 0):
+                    fcc_todo = _collect_approval_responses(prepped_messages)
+                    if fcc_todo:
+                        tools = _extract_tools(kwargs)
+                        # Only execute APPROVED function calls, not rejected ones
+                        approved_responses = [resp for resp in fcc_todo.values() if resp.approved]
+                        approved_function_results: list[Contents] = []
+                        if approved_responses:
+                            approved_function_results = await _try_execute_function_calls(
+                                custom_args=kwargs,
+                                attempt_idx=attempt_idx,
+                                function_calls=approved_responses,
+                                tools=tools,  # type: ignore
+                                middleware_pipeline=stored_middleware_pipeline,
+                                config=config,
+                            )
+                            if any(
+                                fcr.exception is not None
+                                for fcr in approved_function_results
+                                if isinstance(fcr, FunctionResultContent)
+                            ):
+                                errors_in_a_row += 1
+                                # no need to reset the counter here, since this is the start of a new attempt.
+                            if errors_in_a_row >= config.max_consecutive_errors_per_request:
+                                logger.warning(
+                                    "Maximum consecutive function call errors reached (%d). "
+                                    "Stopping further function calls for this request.",
+                                    config.max_consecutive_errors_per_request,
+                                )
+                                # break out of the loop and do the fallback response
+                                break
+                        _replace_approval_contents_with_results(prepped_messages, fcc_todo, approved_function_results)
+
+                    response = await func(self, messages=prepped_messages, **kwargs)
+                    # if there are function calls, we will handle them first
+                    function_results = {
+                        it.call_id for it in response.messages[0].contents if isinstance(it, FunctionResultContent)
+                    }
+                    function_calls = [
+                        it
+                        for it in response.messages[0].contents
+                        if isinstance(it, FunctionCallContent) and it.call_id not in function_results
+                    ]
+
+                    if response.conversation_id is not None:
+                        _update_conversation_id(kwargs, response.conversation_id)
+                        prepped_messages = []
+
+                    # we load the tools here, since middleware might have changed them compared to before calling func.
                     tools = _extract_tools(kwargs)
-                    # Only execute APPROVED function calls, not rejected ones
-                    approved_responses = [resp for resp in fcc_todo.values() if resp.approved]
-                    approved_function_results: list[Contents] = []
-                    if approved_responses:
-                        approved_function_results = await _try_execute_function_calls(
+                    if function_calls and tools:
+                        # Use the stored middleware pipeline instead of extracting from kwargs
+                        # because kwargs may have been modified by the underlying function
+                        function_call_results: list[Contents] = await _try_execute_function_calls(
                             custom_args=kwargs,
                             attempt_idx=attempt_idx,
-                            function_calls=approved_responses,
+                            function_calls=function_calls,
                             tools=tools,  # type: ignore
                             middleware_pipeline=stored_middleware_pipeline,
                             config=config,
+                            speculative_calls=speculative_calls,
                         )
+                        if speculative_calls is not None:
+                            # speculation only covers the first model response
+                            speculative_calls.cancel()
+                            speculative_calls = None
+                        # Check if we have approval requests or function calls (not results) in the results
+                        if any(isinstance(fccr, FunctionApprovalRequestContent) for fccr in function_call_results):
+                            # Add approval requests to the existing assistant message (with tool_calls)
+                            # instead of creating a separate tool message
+                            from ._types import Role
+
+                            if response.messages and response.messages[0].role == Role.ASSISTANT:
+                                response.messages[0].contents.extend(function_call_results)
+                            else:
+                                # Fallback: create new assistant message (shouldn't normally happen)
+                                result_message = ChatMessage(role="assistant", contents=function_call_results)
+                                response.messages.append(result_message)
+                            return response
+                        if any(isinstance(fccr, FunctionCallContent) for fccr in function_call_results):
+                            # the function calls are already in the response, so we just continue
+                            return response
+
                         if any(
                             fcr.exception is not None
-                            for fcr in approved_function_results
+                            for fcr in function_call_results
                             if isinstance(fcr, FunctionResultContent)
                         ):
                             errors_in_a_row += 1
-                            # no need to reset the counter here, since this is the start of a new attempt.
-                        if errors_in_a_row >= config.max_consecutive_errors_per_request:
-                            logger.warning(
-                                "Maximum consecutive function call errors reached (%d). "
-                                "Stopping further function calls for this request.",
-                                config.max_consecutive_errors_per_request,
-                            )
-                            # break out of the loop and do the fallback response
-                            break
-                    _replace_approval_contents_with_results(prepped_messages, fcc_todo, approved_function_results)
-
-                response = await func(self, messages=prepped_messages, **kwargs)
-                # if there are function calls, we will handle them first
-                function_results = {
-                    it.call_id for it in response.messages[0].contents if isinstance(it, FunctionResultContent)
-                }
-                function_calls = [
-                    it
-                    for it in response.messages[0].contents
-                    if isinstance(it, FunctionCallContent) and it.call_id not in function_results
-                ]
-
-                if response.conversation_id is not None:
-                    _update_conversation_id(kwargs, response.conversation_id)
-                    prepped_messages = []
-
-                # we load the tools here, since middleware might have changed them compared to before calling func.
-                tools = _extract_tools(kwargs)
-                if function_calls and tools:
-                    # Use the stored middleware pipeline instead of extracting from kwargs
-                    # because kwargs may have been modified by the underlying function
-                    function_call_results: list[Contents] = await _try_execute_function_calls(
-                        custom_args=kwargs,
-                        attempt_idx=attempt_idx,
-                        function_calls=function_calls,
-                        tools=tools,  # type: ignore
-                        middleware_pipeline=stored_middleware_pipeline,
-                        config=config,
-                    )
-                    # Check if we have approval requests or function calls (not results) in the results
-                    if any(isinstance(fccr, FunctionApprovalRequestContent) for fccr in function_call_results):
-                        # Add approval requests to the existing assistant message (with tool_calls)
-                        # instead of creating a separate tool message
-                        from ._types import Role
-
-                        if response.messages and response.messages[0].role == Role.ASSISTANT:
-                            response.messages[0].contents.extend(function_call_results)
+                            if errors_in_a_row >= config.max_consecutive_errors_per_request:
+                                logger.warning(
+                                    "Maximum consecutive function call errors reached (%d). "
+                                    "Stopping further function calls for this request.",
+                                    config.max_consecutive_errors_per_request,
+                                )
+                                # break out of the loop and do the fallback response
+                                break
                         else:
-                            # Fallback: create new assistant message (shouldn't normally happen)
-                            result_message = ChatMessage(role="assistant", contents=function_call_results)
-                            response.messages.append(result_message)
-                        return response
-                    if any(isinstance(fccr, FunctionCallContent) for fccr in function_call_results):
-                        # the function calls are already in the response, so we just continue
-                        return response
-
-                    if any(
-                        fcr.exception is not None
-                        for fcr in function_call_results
-                        if isinstance(fcr, FunctionResultContent)
-                    ):
-                        errors_in_a_row += 1
-                        if errors_in_a_row >= config.max_consecutive_errors_per_request:
-                            logger.warning(
-                                "Maximum consecutive function call errors reached (%d). "
-                                "Stopping further function calls for this request.",
-                                config.max_consecutive_errors_per_request,
-                            )
-                            # break out of the loop and do the fallback response
-                            break
-                    else:
-                        errors_in_a_row = 0
-
-                    # add a single ChatMessage to the response with the results
-                    result_message = ChatMessage(role="tool", contents=function_call_results)
-                    response.messages.append(result_message)
-                    # response should contain 2 messages after this,
-                    # one with function call contents
-                    # and one with function result contents
-                    # the amount and call_id's should match
-                    # this runs in every but the first run
-                    # we need to keep track of all function call messages
-                    fcc_messages.extend(response.messages)
-                    if getattr(kwargs.get("chat_options"), "store", False):
-                        prepped_messages.clear()
-                        prepped_messages.append(result_message)
-                    else:
-                        prepped_messages.extend(response.messages)
-                    continue
-                # If we reach this point, it means there were no function calls to handle,
-                # we'll add the previous function call and responses
-                # to the front of the list, so that the final response is the last one
-                # TODO (eavanvalkenburg): control this behavior?
-                if fcc_messages:
-                    for msg in reversed(fcc_messages):
-                        response.messages.insert(0, msg)
-                return response
+                            errors_in_a_row = 0
+
+                        # add a single ChatMessage to the response with the results
+                        result_message = ChatMessage(role="tool", contents=function_call_results)
+                        response.messages.append(result_message)
+                        # response should contain 2 messages after this,
+                        # one with function call contents
+                        # and one with function result contents
+                        # the amount and call_id's should match
+                        # this runs in every but the first run
+                        # we need to keep track of all function call messages
+                        fcc_messages.extend(response.messages)
+                        if getattr(kwargs.get("chat_options"), "store", False):
+                            prepped_messages.clear()
+                            prepped_messages.append(result_message)
+                        else:
+                            prepped_messages.extend(response.messages)
+                        continue
+                    # If we reach this point, it means there were no function calls to handle,
+                    # we'll add the previous function call and responses
+                    # to the front of the list, so that the final response is the last one
+                    # TODO (eavanvalkenburg): control this behavior?
+                    if fcc_messages:
+                        for msg in reversed(fcc_messages):
+                            response.messages.insert(0, msg)
+                    return response
+
+            finally:
+                if speculative_calls is not None:
+                    speculative_calls.cancel()
 
             # Failsafe: give up on tools, ask model for plain answer
             kwargs["tool_choice"] = "none"
@@ -1693,7 +2520,7 @@ def _handle_function_calls_streaming_response(
             )
 
             # Extract and merge function middleware from chat client with kwargs pipeline
-            extract_and_merge_function_middleware(self, **kwargs)
+            extract_and_merge_function_middleware(self, kwargs)
 
             # Extract the middleware pipeline before calling the underlying function
             # because the underlying function may not preserve it in kwargs
@@ -1708,140 +2535,177 @@ def _handle_function_calls_streaming_response(
             errors_in_a_row: int = 0
             prepped_messages = prepare_messages(messages)
             fcc_messages: "list[ChatMessage]" = []
-            for attempt_idx in range(config.max_iterations if config.enabled else 0):
-                fcc_todo = _collect_approval_responses(prepped_messages)
-                if fcc_todo:
-                    tools = _extract_tools(kwargs)
-                    # Only execute APPROVED function calls, not rejected ones
-                    approved_responses = [resp for resp in fcc_todo.values() if resp.approved]
-                    approved_function_results: list[Contents] = []
-                    if approved_responses:
-                        approved_function_results = await _try_execute_function_calls(
-                            custom_args=kwargs,
-                            attempt_idx=attempt_idx,
-                            function_calls=approved_responses,
-                            tools=tools,  # type: ignore
-                            middleware_pipeline=stored_middleware_pipeline,
-                            config=config,
-                        )
-                        if any(
-                            fcr.exception is not None
-                            for fcr in approved_function_results
-                            if isinstance(fcr, FunctionResultContent)
-                        ):
-                            errors_in_a_row += 1
-                            # no need to reset the counter here, since this is the start of a new attempt.
-                    _replace_approval_contents_with_results(prepped_messages, fcc_todo, approved_function_results)
-
-                all_updates: list["ChatResponseUpdate"] = []
-                async for update in func(self, messages=prepped_messages, **kwargs):
-                    all_updates.append(update)
-                    yield update
-
-                # efficient check for FunctionCallContent in the updates
-                # if there is at least one, this stops and continuous
-                # if there are no FCC's then it returns
-                from ._types import FunctionApprovalRequestContent
-
-                if not any(
-                    isinstance(item, (FunctionCallContent, FunctionApprovalRequestContent))
-                    for upd in all_updates
-                    for item in upd.contents
-                ):
-                    return
-
-                # Now combining the updates to create the full response.
-                # Depending on the prompt, the message may contain both function call
-                # content and others
-
-                response: "ChatResponse" = ChatResponse.from_chat_response_updates(all_updates)
-                # get the function calls (excluding ones that already have results)
-                function_results = {
-                    it.call_id for it in response.messages[0].contents if isinstance(it, FunctionResultContent)
-                }
-                function_calls = [
-                    it
-                    for it in response.messages[0].contents
-                    if isinstance(it, FunctionCallContent) and it.call_id not in function_results
-                ]
-
-                # When conversation id is present, it means that messages are hosted on the server.
-                # In this case, we need to update kwargs with conversation id and also clear messages
-                if response.conversation_id is not None:
-                    _update_conversation_id(kwargs, response.conversation_id)
-                    prepped_messages = []
-
-                # we load the tools here, since middleware might have changed them compared to before calling func.
-                tools = _extract_tools(kwargs)
-                if function_calls and tools:
-                    # Use the stored middleware pipeline instead of extracting from kwargs
-                    # because kwargs may have been modified by the underlying function
-                    function_call_results: list[Contents] = await _try_execute_function_calls(
+            speculative_calls = _SpeculativeFunctionCalls.start(
+                kwargs.pop("speculative_function_calls", None) or config.speculative_function_calls,
+                messages=prepped_messages,
+                custom_args=kwargs,
+                tools=_extract_tools(kwargs) if config.enabled else None,
+                config=config,
+                middleware_pipeline=stored_middleware_pipeline,
+            )
+            eager_scheduler: _EagerFunctionCallScheduler | None = None
+            try:
+                for attempt_idx in range(config.max_iterations if config.enabled else 0):
+                    fcc_todo = _collect_approval_responses(prepped_messages)
+                    if fcc_todo:
+                        tools = _extract_tools(kwargs)
+                        # Only execute APPROVED function calls, not rejected ones
+                        approved_responses = [resp for resp in fcc_todo.values() if resp.approved]
+                        approved_function_results: list[Contents] = []
+                        if approved_responses:
+                            approved_function_results = await _try_execute_function_calls(
+                                custom_args=kwargs,
+                                attempt_idx=attempt_idx,
+                                function_calls=approved_responses,
+                                tools=tools,  # type: ignore
+                                middleware_pipeline=stored_middleware_pipeline,
+                                config=config,
+                            )
+                            if any(
+                                fcr.exception is not None
+                                for fcr in approved_function_results
+                                if isinstance(fcr, FunctionResultContent)
+                            ):
+                                errors_in_a_row += 1
+                                # no need to reset the counter here, since this is the start of a new attempt.
+                        _replace_approval_contents_with_results(prepped_messages, fcc_todo, approved_function_results)
+
+                    eager_scheduler = _EagerFunctionCallScheduler.create(
                         custom_args=kwargs,
                         attempt_idx=attempt_idx,
-                        function_calls=function_calls,
-                        tools=tools,  # type: ignore
-                        middleware_pipeline=stored_middleware_pipeline,
+                        tools=_extract_tools(kwargs),
                         config=config,
+                        middleware_pipeline=stored_middleware_pipeline,
+                        speculative_calls=speculative_calls,
                     )
+                    all_updates: list["ChatResponseUpdate"] = []
+                    async for update in func(self, messages=prepped_messages, **kwargs):
+                        all_updates.append(update)
+                        if eager_scheduler is not None:
+                            eager_scheduler.process_update(update)
+                        yield update
+
+                    # efficient check for FunctionCallContent in the updates
+                    # if there is at least one, this stops and continuous
+                    # if there are no FCC's then it returns
+                    from ._types import FunctionApprovalRequestContent
+
+                    if not any(
+                        isinstance(item, (FunctionCallContent, FunctionApprovalRequestContent))
+                        for upd in all_updates
+                        for item in upd.contents
+                    ):
+                        return
 
-                    # Check if we have approval requests or function calls (not results) in the results
-                    if any(isinstance(fccr, FunctionApprovalRequestContent) for fccr in function_call_results):
-                        # Add approval requests to the existing assistant message (with tool_calls)
-                        # instead of creating a separate tool message
-                        from ._types import Role
+                    # Now combining the updates to create the full response.
+                    # Depending on the prompt, the message may contain both function call
+                    # content and others
+
+                    response: "ChatResponse" = ChatResponse.from_chat_response_updates(all_updates)
+                    # get the function calls (excluding ones that already have results)
+                    function_results = {
+                        it.call_id for it in response.messages[0].contents if isinstance(it, FunctionResultContent)
+                    }
+                    function_calls = [
+                        it
+                        for it in response.messages[0].contents
+                        if isinstance(it, FunctionCallContent) and it.call_id not in function_results
+                    ]
+
+                    # When conversation id is present, it means that messages are hosted on the server.
+                    # In this case, we need to update kwargs with conversation id and also clear messages
+                    if response.conversation_id is not None:
+                        _update_conversation_id(kwargs, response.conversation_id)
+                        prepped_messages = []
+
+                    # we load the tools here, since middleware might have changed them compared to before calling func.
+                    tools = _extract_tools(kwargs)
+                    if function_calls and tools:
+                        # Use the stored middleware pipeline instead of extracting from kwargs
+                        # because kwargs may have been modified by the underlying function
+                        function_call_results: list[Contents]
+                        if eager_scheduler is not None:
+                            # join the calls started while streaming with the remaining ones
+                            function_call_results = await eager_scheduler.collect(function_calls, tools)
+                        else:
+                            function_call_results = await _try_execute_function_calls(
+                                custom_args=kwargs,
+                                attempt_idx=attempt_idx,
+                                function_calls=function_calls,
+                                tools=tools,  # type: ignore
+                                middleware_pipeline=stored_middleware_pipeline,
+                                config=config,
+                                speculative_calls=speculative_calls,
+                            )
+                        if speculative_calls is not None:
+                            # speculation only covers the first model response
+                            speculative_calls.cancel()
+                            speculative_calls = None
+
+                        # Check if we have approval requests or function calls (not results) in the results
+                        if any(isinstance(fccr, FunctionApprovalRequestContent) for fccr in function_call_results):
+                            # Add approval requests to the existing assistant message (with tool_calls)
+                            # instead of creating a separate tool message
+                            from ._types import Role
+
+                            if response.messages and response.messages[0].role == Role.ASSISTANT:
+                                response.messages[0].contents.extend(function_call_results)
+                                # Yield the approval requests as part of the assistant message
+                                yield ChatResponseUpdate(contents=function_call_results, role="assistant")
+                            else:
+                                # Fallback: create new assistant message (shouldn't normally happen)
+                                result_message = ChatMessage(role="assistant", contents=function_call_results)
+                                yield ChatResponseUpdate(contents=function_call_results, role="assistant")
+                                response.messages.append(result_message)
+                            return
+                        if any(isinstance(fccr, FunctionCallContent) for fccr in function_call_results):
+                            # the function calls were already yielded.
+                            return
 
-                        if response.messages and response.messages[0].role == Role.ASSISTANT:
-                            response.messages[0].contents.extend(function_call_results)
-                            # Yield the approval requests as part of the assistant message
-                            yield ChatResponseUpdate(contents=function_call_results, role="assistant")
+                        if any(
+                            fcr.exception is not None
+                            for fcr in function_call_results
+                            if isinstance(fcr, FunctionResultContent)
+                        ):
+                            errors_in_a_row += 1
+                            if errors_in_a_row >= config.max_consecutive_errors_per_request:
+                                logger.warning(
+                                    "Maximum consecutive function call errors reached (%d). "
+                                    "Stopping further function calls for this request.",
+                                    config.max_consecutive_errors_per_request,
+                                )
+                                # break out of the loop and do the fallback response
+                                break
                         else:
-                            # Fallback: create new assistant message (shouldn't normally happen)
-                            result_message = ChatMessage(role="assistant", contents=function_call_results)
-                            yield ChatResponseUpdate(contents=function_call_results, role="assistant")
-                            response.messages.append(result_message)
-                        return
-                    if any(isinstance(fccr, FunctionCallContent) for fccr in function_call_results):
-                        # the function calls were already yielded.
-                        return
+                            errors_in_a_row = 0
+
+                        # add a single ChatMessage to the response with the results
+                        result_message = ChatMessage(role="tool", contents=function_call_results)
+                        yield ChatResponseUpdate(contents=function_call_results, role="tool")
+                        response.messages.append(result_message)
+                        # response should contain 2 messages after this,
+                        # one with function call contents
+                        # and one with function result contents
+                        # the amount and call_id's should match
+                        # this runs in every but the first run
+                        # we need to keep track of all function call messages
+                        fcc_messages.extend(response.messages)
+                        if getattr(kwargs.get("chat_options"), "store", False):
+                            prepped_messages.clear()
+                            prepped_messages.append(result_message)
+                        else:
+                            prepped_messages.extend(response.messages)
+                        continue
+                    # If we reach this point, it means there were no function calls to handle,
+                    # so we're done
+                    return
 
-                    if any(
-                        fcr.exception is not None
-                        for fcr in function_call_results
-                        if isinstance(fcr, FunctionResultContent)
-                    ):
-                        errors_in_a_row += 1
-                        if errors_in_a_row >= config.max_consecutive_errors_per_request:
-                            logger.warning(
-                                "Maximum consecutive function call errors reached (%d). "
-                                "Stopping further function calls for this request.",
-                                config.max_consecutive_errors_per_request,
-                            )
-                            # break out of the loop and do the fallback response
-                            break
-                    else:
-                        errors_in_a_row = 0
-
-                    # add a single ChatMessage to the response with the results
-                    result_message = ChatMessage(role="tool", contents=function_call_results)
-                    yield ChatResponseUpdate(contents=function_call_results, role="tool")
-                    response.messages.append(result_message)
-                    # response should contain 2 messages after this,
-                    # one with function call contents
-                    # and one with function result contents
-                    # the amount and call_id's should match
-                    # this runs in every but the first run
-                    # we need to keep track of all function call messages
-                    fcc_messages.extend(response.messages)
-                    if getattr(kwargs.get("chat_options"), "store", False):
-                        prepped_messages.clear()
-                        prepped_messages.append(result_message)
-                    else:
-                        prepped_messages.extend(response.messages)
-                    continue
-                # If we reach this point, it means there were no function calls to handle,
-                # so we're done
-                return
+            finally:
+                # cancel started calls when the stream is closed or fails before they are joined
+                if eager_scheduler is not None:
+                    await eager_scheduler.close()
+                if speculative_calls is not None:
+                    speculative_calls.cancel()
 
             # Failsafe: give up on tools, ask model for plain answer
             kwargs["tool_choice"] = "none"
@@ -12,8 +12,10 @@ from collections.abc import (
     MutableSequence,
     Sequence,
 )
-from copy import deepcopy
+from copy import copy, deepcopy
+from types import FunctionType
 from typing import Any, ClassVar, Literal, TypeVar, cast, overload
+from weakref import WeakKeyDictionary
 
 from pydantic import BaseModel, ValidationError
 
@@ -2965,6 +2967,39 @@ class ToolMode(SerializationMixin, metaclass=EnumLike):
         return f"ToolMode(mode={self.mode!r})"
 
 
+# Attribute under which a function's AIFunction wrappers are cached, per owning agent
+_AI_FUNCTION_ATTRIBUTE = "__af_ai_function__"
+
+# ChatOptions fields that ``&`` merges instead of overriding
+_MERGED_CHAT_OPTIONS_FIELDS = frozenset({
+    "additional_properties",
+    "instructions",
+    "logit_bias",
+    "metadata",
+    "response_format",
+    "tool_choice",
+})
+
+
+def _as_ai_function(func: Callable[..., Any], owner: object) -> ToolProtocol:
+    """Wrap a callable into an AIFunction, reusing the wrapper made for the same function and owner before.
+
+    An AIFunction keeps state of its own, such as its invocation count and concurrency limits, so every
+    owner (agent) gets its own wrapper. The wrappers are kept on the function object itself, weakly keyed
+    by owner, so they live no longer than either of them. Other callables (bound methods, callable
+    objects) are wrapped on every use.
+    """
+    if not isinstance(func, FunctionType):
+        return ai_function(func)
+    wrappers: WeakKeyDictionary[object, ToolProtocol] | None = func.__dict__.get(_AI_FUNCTION_ATTRIBUTE)
+    if wrappers is None:
+        wrappers = func.__dict__[_AI_FUNCTION_ATTRIBUTE] = WeakKeyDictionary()
+    tool = wrappers.get(owner)
+    if tool is None:
+        tool = wrappers[owner] = ai_function(func)
+    return tool
+
+
 class ChatOptions(SerializationMixin):
     """Common request settings for AI services.
 
@@ -3164,52 +3199,51 @@ class ChatOptions(SerializationMixin):
             return ToolMode.from_dict(tool_choice)  # type: ignore
         return tool_choice
 
+    def __copy__(self) -> "ChatOptions":
+        """Return a shallow copy whose tool list and mappings can be changed without affecting this instance.
+
+        This is what makes options copy-on-write: a shared (e.g. agent level) ChatOptions is only
+        copied by the code that needs to change it, and the copy does not alias its containers.
+        """
+        copied = object.__new__(type(self))
+        copied.__dict__.update(self.__dict__)
+        copied._tools = list(self._tools) if self._tools else None
+        copied.logit_bias = dict(self.logit_bias) if self.logit_bias else None
+        copied.metadata = dict(self.metadata) if self.metadata else None
+        copied.additional_properties = dict(self.additional_properties)
+        return copied
+
     def __and__(self, other: object) -> "ChatOptions":
         """Combines two ChatOptions instances.
 
         The values from the other ChatOptions take precedence.
-        List and dicts are combined.
+        List and dicts are combined, instructions are appended.
         """
         if not isinstance(other, ChatOptions):
             return self
-        other_tools = other.tools
-        # tool_choice has a specialized serialize method. Save it here so we can fix it later.
-        tool_choice = other.tool_choice or self.tool_choice
-        # response_format is a class type that can't be serialized. Save it here so we can restore it later.
-        response_format = self.response_format
         # Start with a shallow copy of self that preserves tool objects
-        combined = ChatOptions.from_dict(self.to_dict())
-        combined.tool_choice = self.tool_choice
-        combined.tools = list(self.tools) if self.tools else None
-        combined.logit_bias = dict(self.logit_bias) if self.logit_bias else None
-        combined.metadata = dict(self.metadata) if self.metadata else None
-        combined.response_format = response_format
-
-        # Apply scalar and mapping updates from the other options
-        updated_data = other.to_dict(exclude_none=True, exclude={"tools"})
-        logit_bias = updated_data.pop("logit_bias", {})
-        metadata = updated_data.pop("metadata", {})
-        additional_properties: dict[str, Any] = updated_data.pop("additional_properties", {})
-
-        for key, value in updated_data.items():
-            setattr(combined, key, value)
-
-        combined.tool_choice = tool_choice
+        combined = copy(self)
+
+        # Apply scalar updates from the other options, the merged fields are handled below
+        for key, value in other.__dict__.items():
+            if value is not None and not key.startswith("_") and key not in _MERGED_CHAT_OPTIONS_FIELDS:
+                setattr(combined, key, value)
+
+        combined.tool_choice = other.tool_choice or self.tool_choice
         # Preserve response_format from other if it exists, otherwise keep self's
         if other.response_format is not None:
             combined.response_format = other.response_format
         if other.instructions:
-            combined.instructions = "\n".join([combined.instructions or "", other.instructions or ""])
+            combined.instructions = (
+                f"{self.instructions}\n{other.instructions}" if self.instructions else other.instructions
+            )
 
-        combined.logit_bias = (
-            {**(combined.logit_bias or {}), **logit_bias} if logit_bias or combined.logit_bias else None
-        )
-        combined.metadata = {**(combined.metadata or {}), **metadata} if metadata or combined.metadata else None
-        if combined.additional_properties and additional_properties:
-            combined.additional_properties.update(additional_properties)
-        else:
-            if additional_properties:
-                combined.additional_properties = additional_properties
+        if other.logit_bias:
+            combined.logit_bias = {**(combined.logit_bias or {}), **other.logit_bias}
+        if other.metadata:
+            combined.metadata = {**(combined.metadata or {}), **other.metadata}
+        combined.additional_properties.update(other.additional_properties)
+        other_tools = other.tools
         if other_tools:
             if combined.tools is None:
                 combined.tools = list(other_tools)
@@ -14,6 +14,7 @@ from ._checkpoint import (
 )
 from ._checkpoint_summary import WorkflowCheckpointSummary, get_checkpoint_summary
 from ._concurrent import ConcurrentBuilder
+from ._conversation_state import SharedConversation
 from ._const import (
     DEFAULT_MAX_ITERATIONS,
 )
@@ -75,6 +76,7 @@ from ._magentic import (
     StandardMagenticManager,
 )
 from ._orchestration_state import OrchestrationState
+from ._profiler import WorkflowProfiler
 from ._request_info_mixin import response_handler
 from ._runner import Runner
 from ._runner_context import (
@@ -147,6 +149,7 @@ __all__ = [
     "Runner",
     "RunnerContext",
     "SequentialBuilder",
+    "SharedConversation",
     "SharedState",
     "SingleEdgeGroup",
     "StandardMagenticManager",
@@ -170,6 +173,7 @@ __all__ = [
     "WorkflowFailedEvent",
     "WorkflowLifecycleEvent",
     "WorkflowOutputEvent",
+    "WorkflowProfiler",
     "WorkflowRunResult",
     "WorkflowRunState",
     "WorkflowStartedEvent",
@@ -14,6 +14,7 @@ from ._checkpoint import (
 )
 from ._checkpoint_summary import WorkflowCheckpointSummary, get_checkpoint_summary
 from ._concurrent import ConcurrentBuilder
+from ._conversation_state import SharedConversation
 from ._const import DEFAULT_MAX_ITERATIONS
 from ._edge import (
     Case,
@@ -72,6 +73,7 @@ from ._magentic import (
     StandardMagenticManager,
 )
 from ._orchestration_state import OrchestrationState
+from ._profiler import WorkflowProfiler
 from ._request_info_mixin import response_handler
 from ._runner import Runner
 from ._runner_context import (
@@ -143,6 +145,7 @@ __all__ = [
     "Runner",
     "RunnerContext",
     "SequentialBuilder",
+    "SharedConversation",
     "SharedState",
     "SingleEdgeGroup",
     "StandardMagenticManager",
@@ -166,6 +169,7 @@ __all__ = [
     "WorkflowFailedEvent",
     "WorkflowLifecycleEvent",
     "WorkflowOutputEvent",
+    "WorkflowProfiler",
     "WorkflowRunResult",
     "WorkflowRunState",
     "WorkflowStartedEvent",
@@ -1,13 +1,14 @@
 # Copyright (c) Microsoft. All rights reserved.
 
 import logging
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
 from .._agents import AgentProtocol, ChatAgent
-from .._threads import AgentThread
+from .._threads import AgentThread, ChatMessageStore
 from .._types import AgentRunResponse, AgentRunResponseUpdate, ChatMessage
-from ._conversation_state import encode_chat_messages
+from ._conversation_state import SharedConversation, current_chat_message_table, encode_chat_messages
 from ._events import (
     AgentRunEvent,
     AgentRunUpdateEvent,  # type: ignore[reportPrivateUsage]
@@ -43,11 +44,13 @@ class AgentExecutorResponse:
         full_conversation: The full conversation context (prior inputs + all assistant/tool outputs) that
             should be used when chaining to another AgentExecutor. This prevents downstream agents losing
             user prompts while keeping the emitted AgentRunEvent text faithful to the raw agent output.
+            AgentExecutor populates it with an immutable SharedConversation that shares its prefix with
+            the executor's input, so chaining does not copy the conversation.
     """
 
     executor_id: str
     agent_run_response: AgentRunResponse
-    full_conversation: list[ChatMessage] | None = None
+    full_conversation: Sequence[ChatMessage] | None = None
 
 
 class AgentExecutor(Executor):
@@ -84,7 +87,7 @@ class AgentExecutor(Executor):
         self._agent = agent
         self._agent_thread = agent_thread or self._agent.get_new_thread()
         self._output_response = output_response
-        self._cache: list[ChatMessage] = []
+        self._cache = SharedConversation()
 
     @property
     def workflow_output_types(self) -> list[type[Any]]:
@@ -103,7 +106,7 @@ class AgentExecutor(Executor):
             # Streaming mode: emit incremental updates
             updates: list[AgentRunResponseUpdate] = []
             async for update in self._agent.run_stream(
-                self._cache,
+                list(self._cache),
                 thread=self._agent_thread,
             ):
                 updates.append(update)
@@ -120,7 +123,7 @@ class AgentExecutor(Executor):
         else:
             # Non-streaming mode: use run() and emit single event
             response = await self._agent.run(
-                self._cache,
+                list(self._cache),
                 thread=self._agent_thread,
             )
             await ctx.add_event(AgentRunEvent(self.id, response))
@@ -131,11 +134,12 @@ class AgentExecutor(Executor):
         # Always construct a full conversation snapshot from inputs (cache)
         # plus agent outputs (agent_run_response.messages). Do not mutate
         # response.messages so AgentRunEvent remains faithful to the raw output.
-        full_conversation: list[ChatMessage] = list(self._cache) + list(response.messages)
+        # The snapshot shares the cache's messages rather than copying them.
+        full_conversation = self._cache.extend(response.messages)
 
         agent_response = AgentExecutorResponse(self.id, response, full_conversation=full_conversation)
         await ctx.send_message(agent_response)
-        self._cache.clear()
+        self._cache = SharedConversation()
 
     @handler
     async def run(
@@ -146,7 +150,7 @@ class AgentExecutor(Executor):
         This is the standard path: extend cache with provided messages; if should_respond
         run the agent and emit an AgentExecutorResponse downstream.
         """
-        self._cache.extend(request.messages)
+        self._cache = self._cache.extend(request.messages)
         if request.should_respond:
             await self._run_agent_and_emit(ctx)
 
@@ -161,15 +165,15 @@ class AgentExecutor(Executor):
         """
         # Replace cache with full conversation if available, else fall back to agent_run_response messages.
         if prior.full_conversation is not None:
-            self._cache = list(prior.full_conversation)
+            self._cache = SharedConversation.of(prior.full_conversation)
         else:
-            self._cache = list(prior.agent_run_response.messages)
+            self._cache = SharedConversation(prior.agent_run_response.messages)
         await self._run_agent_and_emit(ctx)
 
     @handler
     async def from_str(self, text: str, ctx: WorkflowContext[AgentExecutorResponse, AgentRunResponse]) -> None:
         """Accept a raw user prompt string and run the agent (one-shot)."""
-        self._cache = normalize_messages_input(text)
+        self._cache = SharedConversation(normalize_messages_input(text))
         await self._run_agent_and_emit(ctx)
 
     @handler
@@ -179,7 +183,7 @@ class AgentExecutor(Executor):
         ctx: WorkflowContext[AgentExecutorResponse, AgentRunResponse],
     ) -> None:
         """Accept a single ChatMessage as input."""
-        self._cache = normalize_messages_input(message)
+        self._cache = SharedConversation(normalize_messages_input(message))
         await self._run_agent_and_emit(ctx)
 
     @handler
@@ -189,7 +193,7 @@ class AgentExecutor(Executor):
         ctx: WorkflowContext[AgentExecutorResponse, AgentRunResponse],
     ) -> None:
         """Accept a list of chat inputs (strings or ChatMessage) as conversation context."""
-        self._cache = normalize_messages_input(messages)
+        self._cache = SharedConversation(normalize_messages_input(messages))
         await self._run_agent_and_emit(ctx)
 
     async def snapshot_state(self) -> dict[str, Any]:
@@ -200,6 +204,10 @@ class AgentExecutor(Executor):
         to ensure the thread state is preserved and immutable across checkpoints.
         This is not the case for AzureAI Agents, but works for the Responses API.
 
+        When the runner provides a ChatMessageTable for the checkpoint, the cache and the
+        messages of a plain ChatMessageStore are stored as references into the table, so
+        messages shared with other executors are written to the checkpoint once.
+
         Returns:
             Dict containing serialized cache and thread state
         """
@@ -221,10 +229,23 @@ class AgentExecutor(Executor):
                     self._agent_thread.service_thread_id,
                 )
 
-        serialized_thread = await self._agent_thread.serialize()
-
+        table = current_chat_message_table.get()
+        if table is None:
+            return {
+                "cache": encode_chat_messages(self._cache),
+                "agent_thread": await self._agent_thread.serialize(),
+            }
+
+        message_store = self._agent_thread.message_store
+        if type(message_store) is ChatMessageStore:
+            serialized_thread = {
+                "service_thread_id": self._agent_thread.service_thread_id,
+                "message_refs": table.encode(message_store.messages),
+            }
+        else:
+            serialized_thread = await self._agent_thread.serialize()
         return {
-            "cache": encode_chat_messages(self._cache),
+            "cache_refs": table.encode(self._cache),
             "agent_thread": serialized_thread,
         }
 
@@ -236,18 +257,38 @@ class AgentExecutor(Executor):
         """
         from ._conversation_state import decode_chat_messages
 
+        table = current_chat_message_table.get()
         cache_payload = state.get("cache")
-        if cache_payload:
-            try:
-                self._cache = decode_chat_messages(cache_payload)
-            except Exception as exc:
-                logger.warning("Failed to restore cache: %s", exc)
-                self._cache = []
-        else:
-            self._cache = []
+        cache_refs = state.get("cache_refs")
+        try:
+            if cache_refs:
+                if table is None:
+                    raise ValueError("the checkpoint references messages, but no message table is available")
+                self._cache = SharedConversation(table.decode(cache_refs))
+            elif cache_payload:
+                self._cache = SharedConversation(decode_chat_messages(cache_payload))
+            else:
+                self._cache = SharedConversation()
+        except Exception as exc:
+            logger.warning("Failed to restore cache: %s", exc)
+            self._cache = SharedConversation()
 
         thread_payload = state.get("agent_thread")
-        if thread_payload:
+        if thread_payload and "message_refs" in thread_payload:
+            try:
+                if table is None:
+                    raise ValueError("the checkpoint references messages, but no message table is available")
+                messages = table.decode(thread_payload["message_refs"])
+                service_thread_id = thread_payload.get("service_thread_id")
+                self._agent_thread = (
+                    AgentThread(service_thread_id=service_thread_id)
+                    if service_thread_id is not None
+                    else AgentThread(message_store=ChatMessageStore(messages))
+                )
+            except Exception as exc:
+                logger.warning("Failed to restore agent thread: %s", exc)
+                self._agent_thread = self._agent.get_new_thread()
+        elif thread_payload:
             try:
                 # Deserialize the thread state directly
                 self._agent_thread = await AgentThread.deserialize(thread_payload)
@@ -261,4 +302,4 @@ class AgentExecutor(Executor):
     def reset(self) -> None:
         """Reset the internal cache of the executor."""
         logger.debug("AgentExecutor %s: Resetting cache", self.id)
-        self._cache.clear()
+        self._cache = SharedConversation()
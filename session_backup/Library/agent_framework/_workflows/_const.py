@@ -6,6 +6,9 @@ DEFAULT_MAX_ITERATIONS = 100
 # Key used to store executor state in shared state.
 EXECUTOR_STATE_KEY = "_executor_state"
 
+# Key used to store chat messages shared by executor states in shared state.
+CONVERSATION_MESSAGES_KEY = "_conversation_messages"
+
 # Source identifier for internal workflow messages.
 INTERNAL_SOURCE_PREFIX = "internal"
 
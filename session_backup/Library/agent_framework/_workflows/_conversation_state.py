@@ -1,7 +1,8 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from collections.abc import Iterable
-from typing import Any, cast
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from contextvars import ContextVar
+from typing import Any, cast, overload
 
 from agent_framework import ChatMessage, Role
 
@@ -75,3 +76,155 @@ def decode_chat_messages(payload: Iterable[dict[str, Any]]) -> list[ChatMessage]
             )
         )
     return restored
+
+
+# Conversations deeper than this are flattened on extend, bounding the cost of indexing and iteration.
+_MAX_SHARED_CONVERSATION_DEPTH = 32
+
+
+class SharedConversation(Sequence[ChatMessage]):
+    """An immutable conversation that shares its prefix with the conversation it was extended from.
+
+    ``extend`` returns a new conversation that references this one instead of copying it, so
+    executors handing a conversation to each other only pay for the messages they append.
+    """
+
+    __slots__ = ("_depth", "_length", "_parent", "_segment")
+
+    def __init__(self, messages: Iterable[ChatMessage] = ()) -> None:
+        self._parent: SharedConversation | None = None
+        self._segment: tuple[ChatMessage, ...] = tuple(messages)
+        self._length = len(self._segment)
+        self._depth = 0
+
+    @classmethod
+    def of(cls, messages: Iterable[ChatMessage]) -> "SharedConversation":
+        """Return ``messages`` if it already is a SharedConversation, otherwise wrap it in one."""
+        return messages if isinstance(messages, SharedConversation) else cls(messages)
+
+    def extend(self, messages: Iterable[ChatMessage]) -> "SharedConversation":
+        """Return a new conversation of this conversation's messages followed by ``messages``."""
+        segment = tuple(messages)
+        if not segment:
+            return self
+        if not self._length or self._depth >= _MAX_SHARED_CONVERSATION_DEPTH:
+            return SharedConversation((*self, *segment))
+        extended = SharedConversation(segment)
+        extended._parent = self
+        extended._length = self._length + len(segment)
+        extended._depth = self._depth + 1
+        return extended
+
+    def _segments(self) -> list[tuple[ChatMessage, ...]]:
+        segments: list[tuple[ChatMessage, ...]] = []
+        node: SharedConversation | None = self
+        while node is not None:
+            segments.append(node._segment)
+            node = node._parent
+        segments.reverse()
+        return segments
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[ChatMessage]:
+        for segment in self._segments():
+            yield from segment
+
+    def __reversed__(self) -> Iterator[ChatMessage]:
+        node: SharedConversation | None = self
+        while node is not None:
+            yield from reversed(node._segment)
+            node = node._parent
+
+    @overload
+    def __getitem__(self, index: int) -> ChatMessage: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[ChatMessage]: ...
+
+    def __getitem__(self, index: int | slice) -> ChatMessage | list[ChatMessage]:
+        if isinstance(index, slice):
+            return list(self)[index]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("conversation index out of range")
+        node = self
+        while index < node._length - len(node._segment):
+            node = node._parent  # type: ignore[assignment]
+        return node._segment[index - (node._length - len(node._segment))]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, SharedConversation | list | tuple):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other, strict=True))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"SharedConversation({list(self)!r})"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the conversation into a checkpoint-safe payload."""
+        return {"messages": encode_chat_messages(self)}
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, Any]) -> "SharedConversation":
+        """Restore a conversation serialized with ``to_dict``."""
+        return cls(decode_chat_messages(payload.get("messages", [])))
+
+
+class ChatMessageTable:
+    """Encoded chat messages shared by the executor snapshots of one checkpoint, keyed by message id.
+
+    Executors store references into the table instead of their own copy of the conversation,
+    so a message that is held by several executors is written to the checkpoint once.
+    Messages are matched by identity first and by message id second; a message whose id is
+    already taken by different content gets a suffixed key.
+    """
+
+    def __init__(self, encoded: Mapping[str, dict[str, Any]] | None = None) -> None:
+        self.encoded: dict[str, dict[str, Any]] = dict(encoded or {})
+        self._messages: dict[str, ChatMessage] = {}
+        self._keys: dict[int, str] = {}
+        # Keeps every message seen alive, so the ids in _keys cannot be reused by other objects
+        self._held: list[ChatMessage] = []
+
+    def encode(self, messages: Iterable[ChatMessage]) -> list[str]:
+        """Add the messages to the table and return their keys."""
+        keys: list[str] = []
+        for message in messages:
+            key = self._keys.get(id(message))
+            if key is None:
+                payload = encode_chat_messages((message,))[0]
+                base = message.message_id or f"#{len(self.encoded)}"
+                key, suffix = base, 0
+                while key in self.encoded and self.encoded[key] != payload:
+                    suffix += 1
+                    key = f"{base}#{suffix}"
+                self.encoded[key] = payload
+                self._messages.setdefault(key, message)
+                self._keys[id(message)] = key
+                self._held.append(message)
+            keys.append(key)
+        return keys
+
+    def decode(self, keys: Iterable[str]) -> list[ChatMessage]:
+        """Return the messages for the keys, decoding each message only once."""
+        messages: list[ChatMessage] = []
+        for key in keys:
+            message = self._messages.get(key)
+            if message is None:
+                message = decode_chat_messages((self.encoded[key],))[0]
+                self._messages[key] = message
+                self._keys[id(message)] = key
+                self._held.append(message)
+            messages.append(message)
+        return messages
+
+
+# Table of the checkpoint currently being created or restored, set by the runner around executor snapshots
+current_chat_message_table: ContextVar[ChatMessageTable | None] = ContextVar(
+    "current_chat_message_table", default=None
+)
@@ -5,9 +5,9 @@ import logging
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from collections.abc import Callable
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
-from ..observability import EdgeGroupDeliveryStatus, OtelAttr, create_edge_group_processing_span
+from ..observability import EdgeGroupDeliveryStatus, create_edge_group_processing_span, record_edge_group_delivery
 from ._edge import (
     Edge,
     EdgeGroup,
@@ -18,9 +18,13 @@ from ._edge import (
     SwitchCaseEdgeGroup,
 )
 from ._executor import Executor
+from ._profiler import current_workflow_profiler
 from ._runner_context import Message, RunnerContext
 from ._shared_state import SharedState
 
+if TYPE_CHECKING:
+    from opentelemetry.trace import Span
+
 logger = logging.getLogger(__name__)
 
 
@@ -52,6 +56,10 @@ class EdgeRunner(ABC):
         """
         raise NotImplementedError
 
+    def _record_delivery(self, span: "Span", status: EdgeGroupDeliveryStatus) -> None:
+        """Record the delivery outcome of a message on the edge group span and in the delivery metrics."""
+        record_edge_group_delivery(span, self._edge_group.__class__.__name__, status)
+
     def _can_handle(self, executor_id: str, message: Message) -> bool:
         """Check if an executor can handle the given message data."""
         if executor_id not in self._executors:
@@ -71,6 +79,8 @@ class EdgeRunner(ABC):
             raise RuntimeError(f"Target executor {target_id} not found.")
 
         target_executor = self._executors[target_id]
+        if profiler := current_workflow_profiler.get():
+            profiler.edge_delivered(self._edge_group, source_ids, target_id, message)
 
         # Execute with trace context parameters
         await target_executor.execute(
@@ -105,39 +115,24 @@ class SingleEdgeRunner(EdgeRunner):
         ) as span:
             try:
                 if message.target_id and message.target_id != self._edge.target_id:
-                    span.set_attributes({
-                        OtelAttr.EDGE_GROUP_DELIVERED: False,
-                        OtelAttr.EDGE_GROUP_DELIVERY_STATUS: EdgeGroupDeliveryStatus.DROPPED_TARGET_MISMATCH.value,
-                    })
+                    self._record_delivery(span, EdgeGroupDeliveryStatus.DROPPED_TARGET_MISMATCH)
                     return False
 
                 if self._can_handle(self._edge.target_id, message):
                     if self._edge.should_route(message.data):
-                        span.set_attributes({
-                            OtelAttr.EDGE_GROUP_DELIVERED: True,
-                            OtelAttr.EDGE_GROUP_DELIVERY_STATUS: EdgeGroupDeliveryStatus.DELIVERED.value,
-                        })
+                        self._record_delivery(span, EdgeGroupDeliveryStatus.DELIVERED)
                         should_execute = True
                         target_id = self._edge.target_id
                         source_id = self._edge.source_id
                     else:
-                        span.set_attributes({
-                            OtelAttr.EDGE_GROUP_DELIVERED: False,
-                            OtelAttr.EDGE_GROUP_DELIVERY_STATUS: EdgeGroupDeliveryStatus.DROPPED_CONDITION_FALSE.value,
-                        })
+                        self._record_delivery(span, EdgeGroupDeliveryStatus.DROPPED_CONDITION_FALSE)
                         # Return True here because message was processed, just condition failed
                         return True
                 else:
-                    span.set_attributes({
-                        OtelAttr.EDGE_GROUP_DELIVERED: False,
-                        OtelAttr.EDGE_GROUP_DELIVERY_STATUS: EdgeGroupDeliveryStatus.DROPPED_TYPE_MISMATCH.value,
-                    })
+                    self._record_delivery(span, EdgeGroupDeliveryStatus.DROPPED_TYPE_MISMATCH)
                     return False
             except Exception as e:
-                span.set_attributes({
-                    OtelAttr.EDGE_GROUP_DELIVERED: False,
-                    OtelAttr.EDGE_GROUP_DELIVERY_STATUS: EdgeGroupDeliveryStatus.EXCEPTION.value,
-                })
+                self._record_delivery(span, EdgeGroupDeliveryStatus.EXCEPTION)
                 raise e
 
         # Execute outside the span
@@ -178,10 +173,7 @@ class FanOutEdgeRunner(EdgeRunner):
                     self._selection_func(message.data, self._target_ids) if self._selection_func else self._target_ids
                 )
                 if not self._validate_selection_result(selection_results):
-                    span.set_attributes({
-                        OtelAttr.EDGE_GROUP_DELIVERED: False,
-                        OtelAttr.EDGE_GROUP_DELIVERY_STATUS: EdgeGroupDeliveryStatus.EXCEPTION.value,
-                    })
+                    self._record_delivery(span, EdgeGroupDeliveryStatus.EXCEPTION)
                     raise RuntimeError(
                         f"Invalid selection result: {selection_results}. "
                         f"Expected selections to be a subset of valid target executor IDs: {self._target_ids}."
@@ -193,30 +185,18 @@ class FanOutEdgeRunner(EdgeRunner):
                         edge = self._target_map.get(message.target_id)
                         if edge and self._can_handle(edge.target_id, message):
                             if edge.should_route(message.data):
-                                span.set_attributes({
-                                    OtelAttr.EDGE_GROUP_DELIVERED: True,
-                                    OtelAttr.EDGE_GROUP_DELIVERY_STATUS: EdgeGroupDeliveryStatus.DELIVERED.value,
-                                })
+                                self._record_delivery(span, EdgeGroupDeliveryStatus.DELIVERED)
                                 single_target_edge = edge
                             else:
-                                span.set_attributes({
-                                    OtelAttr.EDGE_GROUP_DELIVERED: False,
-                                    OtelAttr.EDGE_GROUP_DELIVERY_STATUS: EdgeGroupDeliveryStatus.DROPPED_CONDITION_FALSE.value,  # noqa: E501
-                                })
+                                self._record_delivery(span, EdgeGroupDeliveryStatus.DROPPED_CONDITION_FALSE)
                                 # For targeted messages with condition failure, return True (message was processed)
                                 return True
                         else:
-                            span.set_attributes({
-                                OtelAttr.EDGE_GROUP_DELIVERED: False,
-                                OtelAttr.EDGE_GROUP_DELIVERY_STATUS: EdgeGroupDeliveryStatus.DROPPED_TYPE_MISMATCH.value,  # noqa: E501
-                            })
+                            self._record_delivery(span, EdgeGroupDeliveryStatus.DROPPED_TYPE_MISMATCH)
                             # For targeted messages that can't be handled, return False
                             return False
                     else:
-                        span.set_attributes({
-                            OtelAttr.EDGE_GROUP_DELIVERED: False,
-                            OtelAttr.EDGE_GROUP_DELIVERY_STATUS: EdgeGroupDeliveryStatus.DROPPED_TARGET_MISMATCH.value,
-                        })
+                        self._record_delivery(span, EdgeGroupDeliveryStatus.DROPPED_TARGET_MISMATCH)
                         # For targeted messages not in selection, return False
                         return False
                 else:
@@ -227,21 +207,12 @@ class FanOutEdgeRunner(EdgeRunner):
                             deliverable_edges.append(edge)
 
                     if len(deliverable_edges) > 0:
-                        span.set_attributes({
-                            OtelAttr.EDGE_GROUP_DELIVERED: True,
-                            OtelAttr.EDGE_GROUP_DELIVERY_STATUS: EdgeGroupDeliveryStatus.DELIVERED.value,
-                        })
+                        self._record_delivery(span, EdgeGroupDeliveryStatus.DELIVERED)
                     else:
-                        span.set_attributes({
-                            OtelAttr.EDGE_GROUP_DELIVERED: False,
-                            OtelAttr.EDGE_GROUP_DELIVERY_STATUS: EdgeGroupDeliveryStatus.DROPPED_TYPE_MISMATCH.value,
-                        })
+                        self._record_delivery(span, EdgeGroupDeliveryStatus.DROPPED_TYPE_MISMATCH)
 
             except Exception as e:
-                span.set_attributes({
-                    OtelAttr.EDGE_GROUP_DELIVERED: False,
-                    OtelAttr.EDGE_GROUP_DELIVERY_STATUS: EdgeGroupDeliveryStatus.EXCEPTION.value,
-                })
+                self._record_delivery(span, EdgeGroupDeliveryStatus.EXCEPTION)
                 raise e
 
         # Execute outside the span
@@ -292,10 +263,7 @@ class FanInEdgeRunner(EdgeRunner):
         ) as span:
             try:
                 if message.target_id and message.target_id != self._edges[0].target_id:
-                    span.set_attributes({
-                        OtelAttr.EDGE_GROUP_DELIVERED: False,
-                        OtelAttr.EDGE_GROUP_DELIVERY_STATUS: EdgeGroupDeliveryStatus.DROPPED_TARGET_MISMATCH.value,
-                    })
+                    self._record_delivery(span, EdgeGroupDeliveryStatus.DROPPED_TARGET_MISMATCH)
                     return False
 
                 # Check if target can handle list of message data (fan-in aggregates multiple messages)
@@ -304,16 +272,10 @@ class FanInEdgeRunner(EdgeRunner):
                 ):
                     # If the edge can handle the data, buffer the message
                     self._buffer[message.source_id].append(message)
-                    span.set_attributes({
-                        OtelAttr.EDGE_GROUP_DELIVERED: True,
-                        OtelAttr.EDGE_GROUP_DELIVERY_STATUS: EdgeGroupDeliveryStatus.BUFFERED.value,
-                    })
+                    self._record_delivery(span, EdgeGroupDeliveryStatus.BUFFERED)
                 else:
                     # If the edge cannot handle the data, return False
-                    span.set_attributes({
-                        OtelAttr.EDGE_GROUP_DELIVERED: False,
-                        OtelAttr.EDGE_GROUP_DELIVERY_STATUS: EdgeGroupDeliveryStatus.DROPPED_TYPE_MISMATCH.value,
-                    })
+                    self._record_delivery(span, EdgeGroupDeliveryStatus.DROPPED_TYPE_MISMATCH)
                     return False
 
                 if self._is_ready_to_send():
@@ -334,10 +296,9 @@ class FanInEdgeRunner(EdgeRunner):
                         trace_contexts=trace_contexts,
                         source_span_ids=source_span_ids,
                     )
-                    span.set_attributes({
-                        OtelAttr.EDGE_GROUP_DELIVERED: True,
-                        OtelAttr.EDGE_GROUP_DELIVERY_STATUS: EdgeGroupDeliveryStatus.DELIVERED.value,
-                    })
+                    if profiler := current_workflow_profiler.get():
+                        profiler.message_aggregated(aggregated_message, messages_to_send)
+                    self._record_delivery(span, EdgeGroupDeliveryStatus.DELIVERED)
 
                     # Store execution data for later
                     execution_data = {
@@ -347,10 +308,7 @@ class FanInEdgeRunner(EdgeRunner):
                     }
 
             except Exception as e:
-                span.set_attributes({
-                    OtelAttr.EDGE_GROUP_DELIVERED: False,
-                    OtelAttr.EDGE_GROUP_DELIVERY_STATUS: EdgeGroupDeliveryStatus.EXCEPTION.value,
-                })
+                self._record_delivery(span, EdgeGroupDeliveryStatus.EXCEPTION)
                 raise e
 
         # Execute outside the span if needed
@@ -5,9 +5,10 @@ import functools
 import inspect
 import logging
 from collections.abc import Awaitable, Callable
+from time import perf_counter
 from typing import Any, TypeVar
 
-from ..observability import create_processing_span
+from ..observability import create_processing_span, workflow_metrics
 from ._events import (
     ExecutorCompletedEvent,
     ExecutorFailedEvent,
@@ -16,6 +17,7 @@ from ._events import (
     _framework_event_origin,  # type: ignore[reportPrivateUsage]
 )
 from ._model_utils import DictConvertible
+from ._profiler import current_workflow_profiler
 from ._request_info_mixin import RequestInfoMixin
 from ._runner_context import Message, MessageType, RunnerContext
 from ._shared_state import SharedState
@@ -261,14 +263,26 @@ class Executor(RequestInfoMixin, DictConvertible):
             with _framework_event_origin():
                 invoke_event = ExecutorInvokedEvent(self.id)
             await context.add_event(invoke_event)
+            instruments = workflow_metrics()
+            profiler = current_workflow_profiler.get()
+            start_time = perf_counter()
             try:
-                await handler(message, context)
+                if profiler is None:
+                    await handler(message, context)
+                else:
+                    await profiler.profile_handler(self.id, handler(message, context))
             except Exception as exc:
+                if instruments:
+                    instruments.record_executor_duration(
+                        self.id, self.__class__.__name__, perf_counter() - start_time, error=exc
+                    )
                 # Surface structured executor failure before propagating
                 with _framework_event_origin():
                     failure_event = ExecutorFailedEvent(self.id, WorkflowErrorDetails.from_exception(exc))
                 await context.add_event(failure_event)
                 raise
+            if instruments:
+                instruments.record_executor_duration(self.id, self.__class__.__name__, perf_counter() - start_time)
             with _framework_event_origin():
                 completed_event = ExecutorCompletedEvent(self.id)
             await context.add_event(completed_event)
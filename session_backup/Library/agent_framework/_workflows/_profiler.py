@@ -0,0 +1,634 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import json
+import logging
+import time
+from collections.abc import Awaitable, Generator, Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Literal
+
+from ._events import (
+    ExecutorCompletedEvent,
+    ExecutorEvent,
+    ExecutorFailedEvent,
+    ExecutorInvokedEvent,
+    WorkflowEvent,
+)
+
+if TYPE_CHECKING:
+    from ._edge import EdgeGroup
+    from ._runner_context import Message
+
+logger = logging.getLogger(__name__)
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+
+@dataclass
+class ExecutorInvocationProfile:
+    """Timing of one executor invocation, from its ExecutorInvokedEvent to its completed or failed event.
+
+    Times are in seconds; ``start`` and ``end`` are relative to the creation of the profiler.
+    """
+
+    executor_id: str
+    start: float
+    superstep: int | None = None
+    end: float | None = None
+    cpu_time: float = 0.0
+    failed: bool = False
+
+    @property
+    def wall_time(self) -> float:
+        """Elapsed time of the invocation."""
+        return (self.end if self.end is not None else self.start) - self.start
+
+    @property
+    def await_time(self) -> float:
+        """Time the invocation spent suspended, waiting for I/O, other tasks or the event loop."""
+        return max(self.wall_time - self.cpu_time, 0.0)
+
+
+@dataclass
+class SuperstepProfile:
+    """Timing of one superstep; superstep 0 of a run is the delivery of the initial message."""
+
+    index: int
+    run: int
+    iteration: int
+    start: float
+    queue_depth: int = 0
+    end: float | None = None
+
+    @property
+    def duration(self) -> float:
+        """Elapsed time of the superstep."""
+        return (self.end if self.end is not None else self.start) - self.start
+
+
+@dataclass
+class EdgeDeliveryProfile:
+    """Latency of a message from being sent by its source executors to the start of its target executor.
+
+    ``queue_wait`` is the time the message waited for the superstep barrier, ``routing_time`` the time spent
+    in the edge group (conditions, selection functions and concurrent deliveries) before the target started.
+    """
+
+    edge_group_id: str
+    edge_group_type: str
+    source_ids: list[str]
+    target_id: str
+    superstep: int | None
+    sent: float
+    drained: float
+    delivered: float
+
+    @property
+    def latency(self) -> float:
+        """Time from sending the message to starting the target executor."""
+        return self.delivered - self.sent
+
+    @property
+    def queue_wait(self) -> float:
+        """Time from sending the message to the start of the superstep that delivered it."""
+        return self.drained - self.sent
+
+    @property
+    def routing_time(self) -> float:
+        """Time from the start of the superstep to starting the target executor."""
+        return self.delivered - self.drained
+
+
+@dataclass
+class CheckpointProfile:
+    """Time spent creating a checkpoint, split into executor snapshots, encoding and storage."""
+
+    superstep: int | None
+    start: float
+    end: float | None = None
+    snapshot_time: float = 0.0
+    encode_time: float = 0.0
+    storage_time: float = 0.0
+
+    @property
+    def duration(self) -> float:
+        """Elapsed time of the checkpoint."""
+        return (self.end if self.end is not None else self.start) - self.start
+
+
+@dataclass
+class EventLagProfile:
+    """Lag between events being produced by executors and being yielded to the consumer of the run."""
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        """Mean lag."""
+        return self.total / self.count if self.count else 0.0
+
+
+class _CpuTimedAwaitable:
+    """Awaitable that drives another awaitable and sums the thread CPU time of each of its steps.
+
+    Every step of a coroutine runs synchronously on the event loop thread, so the CPU time spent inside
+    the steps is the CPU time of the coroutine; the rest of its wall time is spent awaiting.
+    """
+
+    __slots__ = ("_awaitable", "cpu_time")
+
+    def __init__(self, awaitable: Awaitable[Any]) -> None:
+        self._awaitable = awaitable
+        self.cpu_time = 0.0
+
+    def __await__(self) -> Generator[Any, Any, Any]:
+        iterator = self._awaitable.__await__()
+        value: Any = None
+        error: BaseException | None = None
+        while True:
+            start = time.thread_time()
+            try:
+                yielded = iterator.send(value) if error is None else iterator.throw(error)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                self.cpu_time += time.thread_time() - start
+            value, error = None, None
+            try:
+                value = yield yielded
+            except BaseException as exc:  # forwarded into the awaitable, e.g. cancellation
+                error = exc
+
+
+class WorkflowProfiler:
+    """Profiler for workflow runs.
+
+    Attach a profiler to ``Workflow.run``/``run_stream`` (or ``send_responses``) to record, per run:
+
+    - wall, CPU and await time of every executor invocation, based on the executor lifecycle events,
+    - the duration and queue depth of every superstep, and how long each invocation waited at the
+      superstep barrier for the slowest invocation of the same superstep,
+    - the latency of every edge delivery, from the source sending the message to the target starting,
+    - the time spent snapshotting, encoding and storing checkpoints,
+    - the lag between executors producing events and the run yielding them.
+
+    The recording can be exported as a speedscope or Chrome trace JSON file, and summarized as text.
+    A profiler can be passed to several runs; their recordings accumulate until ``reset`` is called.
+    Profiling wraps every executor handler, so only attach a profiler while diagnosing a workflow.
+
+    Examples:
+        .. code-block:: python
+
+            from agent_framework import WorkflowProfiler
+
+            profiler = WorkflowProfiler()
+            result = await workflow.run("start", profiler=profiler)
+
+            print(profiler.summary())
+            profiler.save("workflow.speedscope.json")  # open in https://www.speedscope.app
+            profiler.save("workflow.trace.json", format="chrome")  # open in chrome://tracing or Perfetto
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty profiler."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard everything recorded so far."""
+        self._origin = perf_counter()
+        self.runs: list[tuple[float, float | None]] = []
+        self.invocations: list[ExecutorInvocationProfile] = []
+        self.supersteps: list[SuperstepProfile] = []
+        self.edge_deliveries: list[EdgeDeliveryProfile] = []
+        self.checkpoints: list[CheckpointProfile] = []
+        self.event_lag: dict[str, EventLagProfile] = {}
+        self._current_superstep: SuperstepProfile | None = None
+        self._current_checkpoint: CheckpointProfile | None = None
+        self._open_invocations: dict[tuple[str, int], ExecutorInvocationProfile] = {}
+        # Keyed by id(); the objects are kept in the values so their ids are not reused while tracked
+        self._sent_messages: dict[int, tuple["Message", float]] = {}
+        self._drained_messages: dict[int, float] = {}
+        self._produced_events: dict[int, tuple[WorkflowEvent, float]] = {}
+
+    def _now(self) -> float:
+        return perf_counter() - self._origin
+
+    # region Recording, called by the workflow runtime
+
+    def run_started(self) -> None:
+        """Record the start of a workflow run."""
+        self.runs.append((self._now(), None))
+
+    def run_completed(self) -> None:
+        """Record the end of a workflow run."""
+        if self.runs and self.runs[-1][1] is None:
+            self.runs[-1] = (self.runs[-1][0], self._now())
+        self._current_superstep = None
+        self._open_invocations.clear()
+        self._sent_messages.clear()
+        self._drained_messages.clear()
+        self._produced_events.clear()
+
+    def superstep_started(self, iteration: int, messages: dict[str, list["Message"]] | None = None) -> None:
+        """Record the start of a superstep and the messages it delivers."""
+        now = self._now()
+        queue_depth = 0
+        for source_messages in (messages or {}).values():
+            queue_depth += len(source_messages)
+            for message in source_messages:
+                self._drained_messages[id(message)] = now
+        self._current_superstep = SuperstepProfile(
+            index=len(self.supersteps),
+            run=max(len(self.runs) - 1, 0),
+            iteration=iteration,
+            start=now,
+            queue_depth=queue_depth,
+        )
+        self.supersteps.append(self._current_superstep)
+
+    def superstep_completed(self) -> None:
+        """Record the end of the current superstep."""
+        if self._current_superstep is not None:
+            self._current_superstep.end = self._now()
+            self._current_superstep = None
+        # Messages delivered in this superstep have been routed to all their edge groups
+        for message_id in self._drained_messages:
+            self._sent_messages.pop(message_id, None)
+        self._drained_messages.clear()
+
+    def message_sent(self, message: "Message") -> None:
+        """Record that an executor sent a message."""
+        self._sent_messages[id(message)] = (message, self._now())
+
+    def message_aggregated(self, aggregated: "Message", messages: Sequence["Message"]) -> None:
+        """Record a fan-in message as sent and drained when the last of the aggregated messages was."""
+        sent = [entry[1] for message in messages if (entry := self._sent_messages.get(id(message)))]
+        drained = [self._drained_messages[id(message)] for message in messages if id(message) in self._drained_messages]
+        if sent:
+            self._sent_messages[id(aggregated)] = (aggregated, max(sent))
+        if drained:
+            self._drained_messages[id(aggregated)] = max(drained)
+
+    def edge_delivered(self, edge_group: "EdgeGroup", source_ids: list[str], target_id: str, message: "Message") -> None:
+        """Record that an edge group started the target executor of a message."""
+        now = self._now()
+        entry = self._sent_messages.get(id(message))
+        if entry is None:
+            # Messages restored from a checkpoint or sent before the profiler was attached
+            return
+        self.edge_deliveries.append(
+            EdgeDeliveryProfile(
+                edge_group_id=edge_group.id,
+                edge_group_type=edge_group.__class__.__name__,
+                source_ids=list(source_ids),
+                target_id=target_id,
+                superstep=self._current_superstep.index if self._current_superstep else None,
+                sent=entry[1],
+                drained=self._drained_messages.get(id(message), entry[1]),
+                delivered=now,
+            )
+        )
+
+    def event_produced(self, event: WorkflowEvent) -> None:
+        """Record an event when it is added to the run, tracking executor invocations from lifecycle events."""
+        now = self._now()
+        if isinstance(event, ExecutorEvent):
+            key = (event.executor_id, id(asyncio.current_task()))
+            if isinstance(event, ExecutorInvokedEvent):
+                invocation = ExecutorInvocationProfile(
+                    executor_id=event.executor_id,
+                    start=now,
+                    superstep=self._current_superstep.index if self._current_superstep else None,
+                )
+                self._open_invocations[key] = invocation
+                self.invocations.append(invocation)
+            elif isinstance(event, (ExecutorCompletedEvent, ExecutorFailedEvent)):
+                invocation = self._open_invocations.pop(key, None)
+                if invocation is not None:
+                    invocation.end = now
+                    invocation.failed = isinstance(event, ExecutorFailedEvent)
+        self._produced_events[id(event)] = (event, now)
+
+    def event_consumed(self, event: WorkflowEvent) -> None:
+        """Record that the run yielded an event to its consumer."""
+        entry = self._produced_events.pop(id(event), None)
+        if entry is None:
+            return
+        lag = self._now() - entry[1]
+        stats = self.event_lag.setdefault(type(event).__name__, EventLagProfile())
+        stats.count += 1
+        stats.total += lag
+        stats.max = max(stats.max, lag)
+
+    async def profile_handler(self, executor_id: str, awaitable: Awaitable[Any]) -> Any:
+        """Await an executor handler, adding the CPU time of its steps to the open invocation."""
+        measured = _CpuTimedAwaitable(awaitable)
+        try:
+            return await measured
+        finally:
+            invocation = self._open_invocations.get((executor_id, id(asyncio.current_task())))
+            if invocation is not None:
+                invocation.cpu_time += measured.cpu_time
+
+    @contextmanager
+    def checkpoint(self) -> Iterator[None]:
+        """Record the creation of a checkpoint."""
+        record = CheckpointProfile(
+            superstep=self.supersteps[-1].index if self.supersteps else None,
+            start=self._now(),
+        )
+        self._current_checkpoint = record
+        try:
+            yield
+        finally:
+            record.end = self._now()
+            self._current_checkpoint = None
+            self.checkpoints.append(record)
+
+    @contextmanager
+    def checkpoint_phase(self, phase: Literal["snapshot", "encode", "storage"]) -> Iterator[None]:
+        """Add the time spent in a phase to the checkpoint being created."""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            if self._current_checkpoint is not None:
+                name = f"{phase}_time"
+                setattr(self._current_checkpoint, name, getattr(self._current_checkpoint, name) + perf_counter() - start)
+
+    # endregion
+
+    # region Analysis and export
+
+    def barrier_wait(self, invocation: ExecutorInvocationProfile) -> float:
+        """Time an invocation waited at the end of its superstep for the other invocations to finish."""
+        if invocation.superstep is None or invocation.end is None:
+            return 0.0
+        superstep = self.supersteps[invocation.superstep]
+        if superstep.end is None:
+            return 0.0
+        return max(superstep.end - invocation.end, 0.0)
+
+    def _timeline(self) -> list[tuple[str, list[tuple[str, float, float, dict[str, Any]]]]]:
+        """Group the recording into named lanes of non-overlapping spans."""
+        lanes: list[tuple[str, list[tuple[str, float, float, dict[str, Any]]]]] = []
+
+        def assign(prefix: str, spans: list[tuple[str, float, float, dict[str, Any]]]) -> None:
+            # Greedily place every span in the first lane it does not overlap, so concurrent spans get their own lane
+            group: list[list[tuple[str, float, float, dict[str, Any]]]] = []
+            for span in sorted(spans, key=lambda span: (span[1], -span[2])):
+                for lane in group:
+                    if lane[-1][2] <= span[1]:
+                        lane.append(span)
+                        break
+                else:
+                    group.append([span])
+            for index, lane in enumerate(group):
+                lanes.append((prefix if index == 0 else f"{prefix} ({index + 1})", lane))
+
+        assign("workflow runs", [(f"run {index}", start, end, {}) for index, (start, end) in enumerate(self.runs) if end])
+        assign(
+            "supersteps",
+            [
+                (
+                    f"superstep {superstep.iteration}",
+                    superstep.start,
+                    superstep.end,
+                    {"run": superstep.run, "queue_depth": superstep.queue_depth},
+                )
+                for superstep in self.supersteps
+                if superstep.end is not None
+            ],
+        )
+        checkpoint_spans: list[tuple[str, float, float, dict[str, Any]]] = []
+        for checkpoint in self.checkpoints:
+            offset = checkpoint.start
+            for phase, duration in (
+                ("snapshot", checkpoint.snapshot_time),
+                ("encode", checkpoint.encode_time),
+                ("storage", checkpoint.storage_time),
+            ):
+                if duration:
+                    checkpoint_spans.append((f"checkpoint {phase}", offset, offset + duration, {}))
+                    offset += duration
+        assign("checkpoints", checkpoint_spans)
+
+        by_executor: dict[str, list[tuple[str, float, float, dict[str, Any]]]] = {}
+        for invocation in self.invocations:
+            if invocation.end is None:
+                continue
+            by_executor.setdefault(invocation.executor_id, []).append((
+                invocation.executor_id,
+                invocation.start,
+                invocation.end,
+                {
+                    "cpu_time": invocation.cpu_time,
+                    "await_time": invocation.await_time,
+                    "barrier_wait": self.barrier_wait(invocation),
+                    "failed": invocation.failed,
+                },
+            ))
+        for executor_id, spans in by_executor.items():
+            assign(f"executor {executor_id}", spans)
+
+        assign(
+            "edge deliveries",
+            [
+                (
+                    f"{', '.join(delivery.source_ids)} -> {delivery.target_id}",
+                    delivery.drained,
+                    delivery.delivered,
+                    {"edge_group_id": delivery.edge_group_id, "queue_wait": delivery.queue_wait},
+                )
+                for delivery in self.edge_deliveries
+            ],
+        )
+        return lanes
+
+    def to_speedscope(self, name: str = "workflow") -> dict[str, Any]:
+        """Export the recording in the speedscope file format, with one evented profile per lane."""
+        frames: list[dict[str, str]] = []
+        frame_index: dict[str, int] = {}
+        profiles: list[dict[str, Any]] = []
+        end_value = max((span[2] for _, spans in self._timeline() for span in spans), default=0.0)
+        for lane_name, spans in self._timeline():
+            events: list[dict[str, Any]] = []
+            for span_name, start, end, _ in spans:
+                frame = frame_index.get(span_name)
+                if frame is None:
+                    frame = frame_index[span_name] = len(frames)
+                    frames.append({"name": span_name})
+                events.append({"type": "O", "frame": frame, "at": start})
+                events.append({"type": "C", "frame": frame, "at": end})
+            profiles.append({
+                "type": "evented",
+                "name": lane_name,
+                "unit": "seconds",
+                "startValue": 0.0,
+                "endValue": end_value,
+                "events": events,
+            })
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": name,
+            "exporter": "agent_framework.WorkflowProfiler",
+            "shared": {"frames": frames},
+            "profiles": profiles,
+        }
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Export the recording in the Chrome trace event format, with one thread per lane."""
+        trace_events: list[dict[str, Any]] = []
+        for tid, (lane_name, spans) in enumerate(self._timeline()):
+            trace_events.append({"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": lane_name}})
+            trace_events.extend(
+                {
+                    "name": span_name,
+                    "cat": lane_name.split(" ")[0],
+                    "ph": "X",
+                    "ts": start * 1e6,
+                    "dur": (end - start) * 1e6,
+                    "pid": 1,
+                    "tid": tid,
+                    "args": args,
+                }
+                for span_name, start, end, args in spans
+            )
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def save(self, path: str | Path, format: Literal["speedscope", "chrome"] = "speedscope") -> Path:
+        """Write the recording to a JSON file.
+
+        Args:
+            path: The file to write.
+            format: 'speedscope' for https://www.speedscope.app, 'chrome' for chrome://tracing and Perfetto.
+
+        Returns:
+            The path of the written file.
+        """
+        if format not in ("speedscope", "chrome"):
+            raise ValueError(f"Unsupported profile format: {format}. Supported formats are 'speedscope' and 'chrome'.")
+        path = Path(path)
+        data = self.to_speedscope(name=path.stem) if format == "speedscope" else self.to_chrome_trace()
+        path.write_text(json.dumps(data), encoding="utf-8")
+        return path
+
+    def summary(self) -> str:
+        """Summarize the recording as text, with the most expensive executors and edges first."""
+        lines: list[str] = []
+        wall_time = sum(end - start for start, end in self.runs if end is not None)
+        lines.append(
+            f"Workflow profile: {len(self.runs)} run(s), {len(self.supersteps)} superstep(s), "
+            f"{len(self.invocations)} executor invocation(s), {wall_time:.3f}s wall time"
+        )
+
+        executors: dict[str, list[ExecutorInvocationProfile]] = {}
+        for invocation in self.invocations:
+            executors.setdefault(invocation.executor_id, []).append(invocation)
+        if executors:
+            lines.append("")
+            lines.append(
+                f"{'Executor':<32} {'calls':>6} {'wall(s)':>9} {'cpu(s)':>9} {'await(s)':>9} "
+                f"{'barrier(s)':>10} {'max(s)':>9} {'failed':>6}"
+            )
+            for executor_id, invocations in sorted(
+                executors.items(), key=lambda item: -sum(invocation.wall_time for invocation in item[1])
+            ):
+                lines.append(
+                    f"{executor_id[:32]:<32} {len(invocations):>6} "
+                    f"{sum(invocation.wall_time for invocation in invocations):>9.3f} "
+                    f"{sum(invocation.cpu_time for invocation in invocations):>9.3f} "
+                    f"{sum(invocation.await_time for invocation in invocations):>9.3f} "
+                    f"{sum(self.barrier_wait(invocation) for invocation in invocations):>10.3f} "
+                    f"{max(invocation.wall_time for invocation in invocations):>9.3f} "
+                    f"{sum(invocation.failed for invocation in invocations):>6}"
+                )
+
+        if self.supersteps:
+            lines.append("")
+            lines.append(
+                f"{'Superstep':<12} {'duration(s)':>11} {'queue':>6} {'barrier(s)':>10}  slowest executor"
+            )
+            for superstep in self.supersteps:
+                members = [invocation for invocation in self.invocations if invocation.superstep == superstep.index]
+                slowest = max(members, key=lambda invocation: invocation.wall_time, default=None)
+                lines.append(
+                    f"{f'{superstep.run}.{superstep.iteration}':<12} {superstep.duration:>11.3f} "
+                    f"{superstep.queue_depth:>6} {sum(self.barrier_wait(invocation) for invocation in members):>10.3f}  "
+                    + (f"{slowest.executor_id} ({slowest.wall_time:.3f}s)" if slowest else "-")
+                )
+
+        if self.edge_deliveries:
+            edges: dict[tuple[str, str], list[EdgeDeliveryProfile]] = {}
+            for delivery in self.edge_deliveries:
+                edges.setdefault((delivery.edge_group_id, delivery.target_id), []).append(delivery)
+            lines.append("")
+            lines.append(
+                f"{'Edge delivery':<48} {'count':>6} {'mean(s)':>9} {'max(s)':>9} {'queue(s)':>9} {'routing(s)':>10}"
+            )
+            for (_, target_id), deliveries in sorted(
+                edges.items(), key=lambda item: -sum(delivery.latency for delivery in item[1])
+            ):
+                sources = ", ".join(sorted({source for delivery in deliveries for source in delivery.source_ids}))
+                lines.append(
+                    f"{f'{sources} -> {target_id}'[:48]:<48} {len(deliveries):>6} "
+                    f"{sum(delivery.latency for delivery in deliveries) / len(deliveries):>9.3f} "
+                    f"{max(delivery.latency for delivery in deliveries):>9.3f} "
+                    f"{sum(delivery.queue_wait for delivery in deliveries) / len(deliveries):>9.3f} "
+                    f"{sum(delivery.routing_time for delivery in deliveries) / len(deliveries):>10.3f}"
+                )
+
+        if self.checkpoints:
+            lines.append("")
+            lines.append(
+                f"Checkpoints: {len(self.checkpoints)}, "
+                f"{sum(checkpoint.duration for checkpoint in self.checkpoints):.3f}s total "
+                f"(snapshot {sum(checkpoint.snapshot_time for checkpoint in self.checkpoints):.3f}s, "
+                f"encode {sum(checkpoint.encode_time for checkpoint in self.checkpoints):.3f}s, "
+                f"storage {sum(checkpoint.storage_time for checkpoint in self.checkpoints):.3f}s)"
+            )
+
+        if self.event_lag:
+            lines.append("")
+            lines.append(f"{'Event queue lag':<32} {'count':>6} {'mean(s)':>9} {'max(s)':>9}")
+            for event_type, stats in sorted(self.event_lag.items(), key=lambda item: -item[1].max):
+                lines.append(f"{event_type[:32]:<32} {stats.count:>6} {stats.mean:>9.4f} {stats.max:>9.4f}")
+
+        return "\n".join(lines)
+
+    # endregion
+
+
+# Profiler of the workflow run in progress, set by the runner around the work it profiles
+current_workflow_profiler: ContextVar[WorkflowProfiler | None] = ContextVar("current_workflow_profiler", default=None)
+
+
+@contextmanager
+def use_workflow_profiler(profiler: WorkflowProfiler | None) -> Iterator[None]:
+    """Make a profiler current; a None profiler keeps the current one, e.g. for nested workflows."""
+    if profiler is None:
+        yield
+        return
+    token = current_workflow_profiler.set(profiler)
+    try:
+        yield
+    finally:
+        current_workflow_profiler.reset(token)
+
+
+@contextmanager
+def profile_checkpoint_phase(phase: Literal["snapshot", "encode", "storage"]) -> Iterator[None]:
+    """Add the time spent in a checkpoint phase to the current profiler, if any."""
+    profiler = current_workflow_profiler.get()
+    if profiler is None:
+        yield
+        return
+    with profiler.checkpoint_phase(phase):
+        yield
@@ -1,18 +1,23 @@
 # Copyright (c) Microsoft. All rights reserved.
 
 import asyncio
+import contextlib
 import logging
 from collections import defaultdict
 from collections.abc import AsyncGenerator, Sequence
+from time import perf_counter
 from typing import Any
 
+from ..observability import workflow_metrics
 from ._checkpoint import CheckpointStorage, WorkflowCheckpoint
 from ._checkpoint_encoding import DATACLASS_MARKER, MODEL_MARKER, decode_checkpoint_value
-from ._const import EXECUTOR_STATE_KEY
+from ._const import CONVERSATION_MESSAGES_KEY, EXECUTOR_STATE_KEY
+from ._conversation_state import ChatMessageTable, current_chat_message_table
 from ._edge import EdgeGroup
 from ._edge_runner import EdgeRunner, create_edge_runner
 from ._events import WorkflowEvent
 from ._executor import Executor
+from ._profiler import WorkflowProfiler, profile_checkpoint_phase, use_workflow_profiler
 from ._runner_context import (
     Message,
     RunnerContext,
@@ -55,6 +60,8 @@ class Runner:
         self._running = False
         self._resumed_from_checkpoint = False  # Track whether we resumed
         self.graph_signature_hash: str | None = None
+        # Profiler of the current run, set by the workflow
+        self.profiler: WorkflowProfiler | None = None
 
         # Set workflow ID in context if provided
         if workflow_id:
@@ -173,9 +180,25 @@ class Runner:
                 tasks = [_deliver_message_inner(edge_runner, message) for edge_runner in associated_edge_runners]
                 await asyncio.gather(*tasks)
 
+        instruments = workflow_metrics()
+        start_time = perf_counter()
         messages = await self._ctx.drain_messages()
-        tasks = [_deliver_messages(source_executor_id, messages) for source_executor_id, messages in messages.items()]
-        await asyncio.gather(*tasks)
+        if instruments:
+            instruments.queue_depth.record(sum(len(source_messages) for source_messages in messages.values()))
+        if self.profiler:
+            self.profiler.superstep_started(self._iteration + 1, messages)
+        try:
+            tasks = [
+                _deliver_messages(source_executor_id, messages) for source_executor_id, messages in messages.items()
+            ]
+            # The iteration runs in its own task, so the profiler does not leak into the caller's context
+            with use_workflow_profiler(self.profiler):
+                await asyncio.gather(*tasks)
+        finally:
+            if instruments:
+                instruments.superstep_duration.record(perf_counter() - start_time)
+            if self.profiler:
+                self.profiler.superstep_completed()
 
     async def _create_checkpoint_if_enabled(self, checkpoint_type: str) -> str | None:
         """Create a checkpoint if checkpointing is enabled and attach a label and metadata."""
@@ -183,20 +206,25 @@ class Runner:
             return None
 
         try:
-            # Auto-snapshot executor states
-            await self._auto_snapshot_executor_states()
-            checkpoint_category = "initial" if checkpoint_type == "after_initial_execution" else "superstep"
-            metadata = {
-                "superstep": self._iteration,
-                "checkpoint_type": checkpoint_category,
-            }
-            if self.graph_signature_hash:
-                metadata["graph_signature"] = self.graph_signature_hash
-            checkpoint_id = await self._ctx.create_checkpoint(
-                self._shared_state,
-                self._iteration,
-                metadata=metadata,
-            )
+            with (
+                self.profiler.checkpoint() if self.profiler else contextlib.nullcontext(),
+                use_workflow_profiler(self.profiler),
+            ):
+                # Auto-snapshot executor states
+                with profile_checkpoint_phase("snapshot"):
+                    await self._auto_snapshot_executor_states()
+                checkpoint_category = "initial" if checkpoint_type == "after_initial_execution" else "superstep"
+                metadata = {
+                    "superstep": self._iteration,
+                    "checkpoint_type": checkpoint_category,
+                }
+                if self.graph_signature_hash:
+                    metadata["graph_signature"] = self.graph_signature_hash
+                checkpoint_id = await self._ctx.create_checkpoint(
+                    self._shared_state,
+                    self._iteration,
+                    metadata=metadata,
+                )
             logger.info(f"Created {checkpoint_type} checkpoint: {checkpoint_id}")
             return checkpoint_id
         except Exception as e:
@@ -214,7 +242,23 @@ class Runner:
           - If an executor defines an async or sync method `snapshot_state(self) -> dict`, use it.
           - Else if it has a plain attribute `state` that is a dict, use that.
         Only JSON-serializable dicts should be provided by executors.
+
+        Chat messages that executors add to the current ChatMessageTable are stored once,
+        under a reserved key, instead of once per executor state.
         """
+        table = ChatMessageTable()
+        token = current_chat_message_table.set(table)
+        try:
+            await self._snapshot_executor_states()
+        finally:
+            current_chat_message_table.reset(token)
+
+        if table.encoded:
+            await self._shared_state.set(CONVERSATION_MESSAGES_KEY, table.encoded)
+        elif await self._shared_state.has(CONVERSATION_MESSAGES_KEY):
+            await self._shared_state.delete(CONVERSATION_MESSAGES_KEY)
+
+    async def _snapshot_executor_states(self) -> None:
         for exec_id, executor in self._executors.items():
             state_dict: dict[str, Any] | None = None
             snapshot = getattr(executor, "snapshot_state", None)
@@ -309,6 +353,16 @@ class Runner:
         if not isinstance(executor_states, dict):
             raise ValueError("Executor states in shared state is not a dictionary. Unable to restore.")
 
+        encoded_messages: dict[str, Any] = {}
+        if await self._shared_state.has(CONVERSATION_MESSAGES_KEY):
+            encoded_messages = await self._shared_state.get(CONVERSATION_MESSAGES_KEY)
+        token = current_chat_message_table.set(ChatMessageTable(encoded_messages))
+        try:
+            await self._restore_executor_states_from(executor_states)
+        finally:
+            current_chat_message_table.reset(token)
+
+    async def _restore_executor_states_from(self, executor_states: dict[Any, Any]) -> None:
         for executor_id, state in executor_states.items():
             if not isinstance(executor_id, str):
                 raise ValueError("Executor ID in executor states is not a string. Unable to restore.")
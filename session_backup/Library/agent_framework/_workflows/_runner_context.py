@@ -12,6 +12,7 @@ from ._checkpoint import CheckpointStorage, WorkflowCheckpoint
 from ._checkpoint_encoding import decode_checkpoint_value, encode_checkpoint_value
 from ._const import INTERNAL_SOURCE_ID
 from ._events import RequestInfoEvent, WorkflowEvent
+from ._profiler import current_workflow_profiler, profile_checkpoint_phase
 from ._shared_state import SharedState
 
 logger = logging.getLogger(__name__)
@@ -316,6 +317,8 @@ class InProcRunnerContext:
         Events are enqueued so runners can stream them in real time instead of
         waiting for superstep boundaries.
         """
+        if profiler := current_workflow_profiler.get():
+            profiler.event_produced(event)
         await self._event_queue.put(event)
 
     async def drain_events(self) -> list[WorkflowEvent]:
@@ -376,7 +379,8 @@ class InProcRunnerContext:
             raise ValueError("Checkpoint storage not configured")
 
         self._workflow_id = self._workflow_id or str(uuid.uuid4())
-        state = await self._get_serialized_workflow_state(shared_state, iteration_count)
+        with profile_checkpoint_phase("encode"):
+            state = await self._get_serialized_workflow_state(shared_state, iteration_count)
 
         checkpoint = WorkflowCheckpoint(
             workflow_id=self._workflow_id,
@@ -386,7 +390,8 @@ class InProcRunnerContext:
             iteration_count=state["iteration_count"],
             metadata=metadata or {},
         )
-        checkpoint_id = await storage.save_checkpoint(checkpoint)
+        with profile_checkpoint_phase("storage"):
+            checkpoint_id = await storage.save_checkpoint(checkpoint)
         logger.info(f"Created checkpoint {checkpoint_id} for workflow {self._workflow_id}")
         return checkpoint_id
 
@@ -31,6 +31,7 @@ from ._events import (
 )
 from ._executor import Executor
 from ._model_utils import DictConvertible
+from ._profiler import WorkflowProfiler, use_workflow_profiler
 from ._runner import Runner
 from ._runner_context import RunnerContext
 from ._shared_state import SharedState
@@ -339,13 +340,16 @@ class Workflow(DictConvertible):
 
                 # Execute initial setup if provided
                 if initial_executor_fn:
-                    await initial_executor_fn()
+                    await self._run_initial_executor(initial_executor_fn)
 
                 # All executor executions happen within workflow span
+                profiler = self._runner.profiler
                 async for event in self._runner.run_until_convergence():
                     # Track request events for final status determination
                     if isinstance(event, RequestInfoEvent):
                         saw_request = True
+                    if profiler:
+                        profiler.event_consumed(event)
                     yield event
 
                     if isinstance(event, RequestInfoEvent) and not emitted_in_progress_pending:
@@ -384,6 +388,31 @@ class Workflow(DictConvertible):
                 capture_exception(span, exception=exc)
                 raise
 
+    async def _run_initial_executor(self, initial_executor_fn: Callable[[], Awaitable[None]]) -> None:
+        """Run the initial executor, profiled as superstep 0 when a profiler is attached."""
+        profiler = self._runner.profiler
+        if profiler is None:
+            await initial_executor_fn()
+            return
+        profiler.superstep_started(0)
+        try:
+            with use_workflow_profiler(profiler):
+                await initial_executor_fn()
+        finally:
+            profiler.superstep_completed()
+
+    def _attach_profiler(self, profiler: WorkflowProfiler | None) -> None:
+        """Attach a profiler to the run that is starting."""
+        self._runner.profiler = profiler
+        if profiler:
+            profiler.run_started()
+
+    def _detach_profiler(self) -> None:
+        """Detach the profiler of the run that ended."""
+        if self._runner.profiler:
+            self._runner.profiler.run_completed()
+        self._runner.profiler = None
+
     async def _execute_with_message_or_checkpoint(
         self,
         message: Any | None,
@@ -437,6 +466,7 @@ class Workflow(DictConvertible):
         *,
         checkpoint_id: str | None = None,
         checkpoint_storage: CheckpointStorage | None = None,
+        profiler: WorkflowProfiler | None = None,
     ) -> AsyncIterable[WorkflowEvent]:
         """Run the workflow and stream events.
 
@@ -452,6 +482,7 @@ class Workflow(DictConvertible):
                                - With checkpoint_id: Used to load and restore the specified checkpoint
                                - Without checkpoint_id: Enables checkpointing for this run, overriding
                                  build-time configuration
+            profiler: Optional WorkflowProfiler that records the timing of this run.
 
         Yields:
             WorkflowEvent: Events generated during workflow execution.
@@ -508,6 +539,7 @@ class Workflow(DictConvertible):
         # 2. checkpoint_storage without checkpoint_id: Enable checkpointing for this run
         if checkpoint_storage is not None:
             self._runner.context.set_runtime_checkpoint_storage(checkpoint_storage)
+        self._attach_profiler(profiler)
 
         try:
             # Reset context only for new runs (not checkpoint restoration)
@@ -524,19 +556,26 @@ class Workflow(DictConvertible):
         finally:
             if checkpoint_storage is not None:
                 self._runner.context.clear_runtime_checkpoint_storage()
+            self._detach_profiler()
             self._reset_running_flag()
 
-    async def send_responses_streaming(self, responses: dict[str, Any]) -> AsyncIterable[WorkflowEvent]:
+    async def send_responses_streaming(
+        self, responses: dict[str, Any], *, profiler: WorkflowProfiler | None = None
+    ) -> AsyncIterable[WorkflowEvent]:
         """Send responses back to the workflow and stream the events generated by the workflow.
 
         Args:
             responses: The responses to be sent back to the workflow, where keys are request IDs
                        and values are the corresponding response data.
 
+        Keyword Args:
+            profiler: Optional WorkflowProfiler that records the timing of this run.
+
         Yields:
             WorkflowEvent: The events generated during the workflow execution after sending the responses.
         """
         self._ensure_not_running()
+        self._attach_profiler(profiler)
         try:
             async for event in self._run_workflow_with_tracing(
                 initial_executor_fn=functools.partial(self._send_responses_internal, responses),
@@ -545,6 +584,7 @@ class Workflow(DictConvertible):
             ):
                 yield event
         finally:
+            self._detach_profiler()
             self._reset_running_flag()
 
     async def run(
@@ -554,6 +594,7 @@ class Workflow(DictConvertible):
         checkpoint_id: str | None = None,
         checkpoint_storage: CheckpointStorage | None = None,
         include_status_events: bool = False,
+        profiler: WorkflowProfiler | None = None,
     ) -> WorkflowRunResult:
         """Run the workflow to completion and return all events.
 
@@ -570,6 +611,7 @@ class Workflow(DictConvertible):
                                - Without checkpoint_id: Enables checkpointing for this run, overriding
                                  build-time configuration
             include_status_events: Whether to include WorkflowStatusEvent instances in the result list.
+            profiler: Optional WorkflowProfiler that records the timing of this run.
 
         Returns:
             A WorkflowRunResult instance containing events generated during workflow execution.
@@ -620,6 +662,7 @@ class Workflow(DictConvertible):
         # Enable runtime checkpointing if storage provided
         if checkpoint_storage is not None:
             self._runner.context.set_runtime_checkpoint_storage(checkpoint_storage)
+        self._attach_profiler(profiler)
 
         try:
             # Reset context only for new runs (not checkpoint restoration)
@@ -637,6 +680,7 @@ class Workflow(DictConvertible):
         finally:
             if checkpoint_storage is not None:
                 self._runner.context.clear_runtime_checkpoint_storage()
+            self._detach_profiler()
             self._reset_running_flag()
 
         # Filter events for non-streaming mode
@@ -657,16 +701,22 @@ class Workflow(DictConvertible):
 
         return WorkflowRunResult(filtered, status_events)
 
-    async def send_responses(self, responses: dict[str, Any]) -> WorkflowRunResult:
+    async def send_responses(
+        self, responses: dict[str, Any], *, profiler: WorkflowProfiler | None = None
+    ) -> WorkflowRunResult:
         """Send responses back to the workflow.
 
         Args:
             responses: A dictionary where keys are request IDs and values are the corresponding response data.
 
+        Keyword Args:
+            profiler: Optional WorkflowProfiler that records the timing of this run.
+
         Returns:
             A WorkflowRunResult instance containing a list of events generated during the workflow execution.
         """
         self._ensure_not_running()
+        self._attach_profiler(profiler)
         try:
             events = [
                 event
@@ -679,6 +729,7 @@ class Workflow(DictConvertible):
             filtered_events = [e for e in events if not isinstance(e, (WorkflowStatusEvent, WorkflowStartedEvent))]
             return WorkflowRunResult(filtered_events, status_events)
         finally:
+            self._detach_profiler()
             self._reset_running_flag()
 
     async def _send_responses_internal(self, responses: dict[str, Any]) -> None:
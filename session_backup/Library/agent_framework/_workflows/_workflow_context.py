@@ -24,6 +24,7 @@ from ._events import (
     WorkflowWarningEvent,
     _framework_event_origin,  # type: ignore
 )
+from ._profiler import current_workflow_profiler
 from ._runner_context import Message, RunnerContext
 from ._shared_state import SharedState
 
@@ -305,16 +306,22 @@ class WorkflowContext(Generic[T_Out, T_W_Out]):
         global OBSERVABILITY_SETTINGS
         from ..observability import OBSERVABILITY_SETTINGS
 
+        # Create Message wrapper
+        msg = Message(data=message, source_id=self._executor_id, target_id=target_id)
+        if profiler := current_workflow_profiler.get():
+            profiler.message_sent(msg)
+        if not OBSERVABILITY_SETTINGS.TRACING_ENABLED:  # type: ignore[name-defined]
+            # No publishing span and no trace context to propagate
+            await self._runner_context.send_message(msg)
+            return
+
         # Create publishing span (inherits current trace context automatically)
         attributes: dict[str, str] = {OtelAttr.MESSAGE_TYPE: type(message).__name__}
         if target_id:
             attributes[OtelAttr.MESSAGE_DESTINATION_EXECUTOR_ID] = target_id
         with create_workflow_span(OtelAttr.MESSAGE_SEND_SPAN, attributes, kind=SpanKind.PRODUCER) as span:
-            # Create Message wrapper
-            msg = Message(data=message, source_id=self._executor_id, target_id=target_id)
-
-            # Inject current trace context if tracing enabled
-            if OBSERVABILITY_SETTINGS.ENABLED and span and span.is_recording():  # type: ignore[name-defined]
+            # Inject current trace context if the span is recorded
+            if span and span.is_recording():
                 trace_context: dict[str, str] = {}
                 inject(trace_context)  # Inject current trace context for message propagation
 
@@ -6,6 +6,7 @@ from typing import Any
 
 _IMPORTS: dict[str, tuple[str, str]] = {
     "AzureAIAgentClient": ("agent_framework_azure_ai", "azure-ai"),
+    "AzureAIAgentRegistry": ("agent_framework_azure_ai", "azure-ai"),
     "AzureOpenAIAssistantsClient": ("agent_framework.azure._assistants_client", "core"),
     "AzureOpenAIChatClient": ("agent_framework.azure._chat_client", "core"),
     "AzureAISettings": ("agent_framework_azure_ai", "azure-ai"),
@@ -3,11 +3,16 @@
 import contextlib
 import json
 import logging
-from collections.abc import AsyncIterable, Awaitable, Callable, Generator, Mapping
+import random
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterable, Awaitable, Callable, Generator, Mapping, Sequence
 from enum import Enum
 from functools import wraps
 from time import perf_counter, time_ns
-from typing import TYPE_CHECKING, Any, ClassVar, Final, TypeVar
+from typing import TYPE_CHECKING, Any, ClassVar, Final, Literal, TypeVar
+from weakref import WeakKeyDictionary, ref
 
 from opentelemetry import metrics, trace
 from opentelemetry.semconv_ai import GenAISystem, Meters, SpanAttributes
@@ -23,7 +28,8 @@ if TYPE_CHECKING:  # pragma: no cover
     from opentelemetry.sdk._logs._internal.export import LogExporter
     from opentelemetry.sdk.metrics.export import MetricExporter
     from opentelemetry.sdk.resources import Resource
-    from opentelemetry.sdk.trace.export import SpanExporter
+    from opentelemetry.sdk.trace import ReadableSpan
+    from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
     from opentelemetry.trace import Tracer
     from opentelemetry.util._decorator import _AgnosticContextManager  # type: ignore[reportPrivateUsage]
 
@@ -177,6 +183,9 @@ class OtelAttr(str, Enum):
     INPUT_MESSAGES = "gen_ai.input.messages"
     OUTPUT_MESSAGES = "gen_ai.output.messages"
     SYSTEM_INSTRUCTIONS = "gen_ai.system_instructions"
+    INPUT_MESSAGES_OFFSET = "agent_framework.input.messages.offset"
+    INPUT_MESSAGES_OMITTED = "agent_framework.input.messages.omitted"
+    OUTPUT_MESSAGES_OMITTED = "agent_framework.output.messages.omitted"
 
     # Workflow attributes
     WORKFLOW_ID = "workflow.id"
@@ -231,6 +240,17 @@ class OtelAttr(str, Enum):
     # Agent Framework specific attributes
     MEASUREMENT_FUNCTION_TAG_NAME = "agent_framework.function.name"
     MEASUREMENT_FUNCTION_INVOCATION_DURATION = "agent_framework.function.invocation.duration"
+    MEASUREMENT_FUNCTION_QUEUE_WAIT_DURATION = "agent_framework.function.queue_wait.duration"
+    MEASUREMENT_FUNCTION_CACHE_HIT = "agent_framework.function.cache_hit"
+    MEASUREMENT_CONTEXT_PROVIDER_DURATION = "agent_framework.context_provider.duration"
+    MEASUREMENT_CONTEXT_PROVIDER_TAG_NAME = "agent_framework.context_provider.name"
+    MEASUREMENT_CONTEXT_PROVIDER_OPERATION = "agent_framework.context_provider.operation"
+    MEASUREMENT_CONTEXT_PROVIDER_TIMED_OUT = "agent_framework.context_provider.timed_out"
+    MEASUREMENT_WORKFLOW_SUPERSTEP_DURATION = "agent_framework.workflow.superstep.duration"
+    MEASUREMENT_WORKFLOW_QUEUE_DEPTH = "agent_framework.workflow.queue.depth"
+    MEASUREMENT_EDGE_GROUP_DELIVERIES = "agent_framework.workflow.edge_group.deliveries"
+    MEASUREMENT_EXECUTOR_DURATION = "agent_framework.workflow.executor.duration"
+    MESSAGE_UNIT = "{message}"
     AGENT_FRAMEWORK_GEN_AI_SYSTEM = "microsoft.agent_framework"
 
     def __repr__(self) -> str:
@@ -368,6 +388,29 @@ class ObservabilitySettings(AFBaseSettings):
         vs_code_extension_port: The port the AI Toolkit or Azure AI Foundry VS Code extensions are listening on.
             Default is None.
             Can be set via environment variable VS_CODE_EXTENSION_PORT.
+        sensitive_data_capture_mode: Which input messages are captured when sensitive data is enabled.
+            "full" captures the whole conversation on every call, "delta" only the messages that are new since
+            the previous call on the same conversation; the index of the first captured message is recorded
+            as agent_framework.input.messages.offset. Default is "full".
+            Can be set via environment variable SENSITIVE_DATA_CAPTURE_MODE.
+        sensitive_data_head_messages: Number of leading messages to keep when truncating captured messages.
+            Truncation applies when either this or sensitive_data_tail_messages is set. Default is None.
+            Can be set via environment variable SENSITIVE_DATA_HEAD_MESSAGES.
+        sensitive_data_tail_messages: Number of trailing messages to keep when truncating captured messages.
+            Default is None. Can be set via environment variable SENSITIVE_DATA_TAIL_MESSAGES.
+        sensitive_data_max_content_length: Maximum length of text and tool results in captured span messages.
+            Default is None. Can be set via environment variable SENSITIVE_DATA_MAX_CONTENT_LENGTH.
+        sensitive_data_sample_rate: Fraction of spans that capture messages. Default is 1.0.
+            Can be set via environment variable SENSITIVE_DATA_SAMPLE_RATE.
+        sensitive_data_capture_errors: Whether spans that were not sampled still capture their messages
+            when they fail. Default is True. Can be set via environment variable SENSITIVE_DATA_CAPTURE_ERRORS.
+        sensitive_data_capture_slower_than: Spans that were not sampled still capture their messages when
+            they take longer than this many seconds. Default is None.
+            Can be set via environment variable SENSITIVE_DATA_CAPTURE_SLOWER_THAN.
+        metrics_only: Record metrics without creating spans or propagating trace context between
+            workflow executors. This keeps the per-message overhead of continuous production telemetry low.
+            The setting is read on every call, so it can be switched at runtime. Default is False.
+            Can be set via environment variable METRICS_ONLY.
 
     Examples:
         .. code-block:: python
@@ -392,6 +435,14 @@ class ObservabilitySettings(AFBaseSettings):
     applicationinsights_connection_string: str | list[str] | None = None
     otlp_endpoint: str | list[str] | None = None
     vs_code_extension_port: int | None = None
+    sensitive_data_capture_mode: Literal["full", "delta"] = "full"
+    sensitive_data_head_messages: int | None = None
+    sensitive_data_tail_messages: int | None = None
+    sensitive_data_max_content_length: int | None = None
+    sensitive_data_sample_rate: float = 1.0
+    sensitive_data_capture_errors: bool = True
+    sensitive_data_capture_slower_than: float | None = None
+    metrics_only: bool = False
     _resource: "Resource" = PrivateAttr(default_factory=_create_resource)
     _executed_setup: bool = PrivateAttr(default=False)
 
@@ -403,6 +454,14 @@ class ObservabilitySettings(AFBaseSettings):
         """
         return self.enable_otel or self.enable_sensitive_data
 
+    @property
+    def TRACING_ENABLED(self) -> bool:
+        """Check if spans are created.
+
+        Tracing is enabled if observability is enabled and not restricted to metrics.
+        """
+        return self.ENABLED and not self.metrics_only
+
     @property
     def SENSITIVE_DATA_ENABLED(self) -> bool:
         """Check if sensitive events are enabled.
@@ -505,14 +564,15 @@ class ObservabilitySettings(AFBaseSettings):
         tracer_provider = TracerProvider(resource=self.resource)
         trace.set_tracer_provider(tracer_provider)
         should_add_console_exporter = True
+        # Captured messages are serialized by the exporters, on the batch processor threads
         for exporter in exporters:
             if isinstance(exporter, SpanExporter):
-                tracer_provider.add_span_processor(BatchSpanProcessor(exporter))
+                tracer_provider.add_span_processor(BatchSpanProcessor(_MessageCaptureSpanExporter(exporter)))
                 should_add_console_exporter = False
         if should_add_console_exporter:
             from opentelemetry.sdk.trace.export import ConsoleSpanExporter
 
-            tracer_provider.add_span_processor(BatchSpanProcessor(ConsoleSpanExporter()))
+            tracer_provider.add_span_processor(BatchSpanProcessor(_MessageCaptureSpanExporter(ConsoleSpanExporter())))
 
         # Logging
         logger_provider = LoggerProvider(resource=self.resource)
@@ -669,6 +729,7 @@ def setup_observability(
     credential: "TokenCredential | None" = None,
     exporters: list["LogExporter | SpanExporter | MetricExporter"] | None = None,
     vs_code_extension_port: int | None = None,
+    metrics_only: bool | None = None,
 ) -> None:
     """Setup observability for the application with OpenTelemetry.
 
@@ -699,6 +760,9 @@ def setup_observability(
             extensions are listening on. When set, additional OTEL exporters will be
             created with endpoint `http://localhost:{vs_code_extension_port}` unless
             already configured. Overrides the environment variable if set. Default is None.
+        metrics_only: Record metrics only, without spans or trace context propagation.
+            Overrides the environment variable if set. Can be changed later through
+            ``OBSERVABILITY_SETTINGS.metrics_only``. Default is None.
 
     Examples:
         .. code-block:: python
@@ -739,6 +803,12 @@ def setup_observability(
             setup_observability(
                 vs_code_extension_port=4317,  # Connects to AI Toolkit
             )
+
+            # Production telemetry: counters and histograms only, switchable at runtime
+            from agent_framework.observability import OBSERVABILITY_SETTINGS
+
+            setup_observability(otlp_endpoint="http://localhost:4317", metrics_only=True)
+            OBSERVABILITY_SETTINGS.metrics_only = False  # start tracing, e.g. while investigating an incident
     """
     global OBSERVABILITY_SETTINGS
     # Update the observability settings with the provided values
@@ -747,6 +817,8 @@ def setup_observability(
         OBSERVABILITY_SETTINGS.enable_sensitive_data = enable_sensitive_data
     if vs_code_extension_port is not None:
         OBSERVABILITY_SETTINGS.vs_code_extension_port = vs_code_extension_port
+    if metrics_only is not None:
+        OBSERVABILITY_SETTINGS.metrics_only = metrics_only
 
     # Create exporters, after checking if they are already configured through the env.
     new_exporters: list["LogExporter | SpanExporter | MetricExporter"] = exporters or []
@@ -852,6 +924,21 @@ def _trace_get_response(
                 if (service_url_func := getattr(self, "service_url", None)) and callable(service_url_func)
                 else "unknown"
             )
+            if not OBSERVABILITY_SETTINGS.TRACING_ENABLED:
+                attributes = _get_metric_attributes(
+                    OtelAttr.CHAT_COMPLETION_OPERATION, provider_name, model_id, service_url
+                )
+                start_time_stamp = perf_counter()
+                try:
+                    response = await func(self, messages=messages, **kwargs)
+                except Exception as exception:
+                    attributes[OtelAttr.ERROR_TYPE] = type(exception).__name__
+                    _record_chat_metrics(self, attributes, perf_counter() - start_time_stamp)
+                    raise
+                _record_chat_metrics(
+                    self, _get_response_attributes(attributes, response), perf_counter() - start_time_stamp
+                )
+                return response
             attributes = _get_span_attributes(
                 operation_name=OtelAttr.CHAT_COMPLETION_OPERATION,
                 provider_name=provider_name,
@@ -860,8 +947,9 @@ def _trace_get_response(
                 **kwargs,
             )
             with _get_span(attributes=attributes, span_name_attribute=SpanAttributes.LLM_REQUEST_MODEL) as span:
-                if OBSERVABILITY_SETTINGS.SENSITIVE_DATA_ENABLED and messages:
-                    _capture_messages(span=span, provider_name=provider_name, messages=messages)
+                capture = _MessageCapture.start(span, provider_name, OtelAttr.CHAT_COMPLETION_OPERATION)
+                if capture and messages:
+                    capture.add(messages)
                 start_time_stamp = perf_counter()
                 end_time_stamp: float | None = None
                 try:
@@ -870,6 +958,8 @@ def _trace_get_response(
                 except Exception as exception:
                     end_time_stamp = perf_counter()
                     capture_exception(span=span, exception=exception, timestamp=time_ns())
+                    if capture:
+                        capture.finish(error=True, duration=end_time_stamp - start_time_stamp)
                     raise
                 else:
                     duration = (end_time_stamp or perf_counter()) - start_time_stamp
@@ -880,14 +970,10 @@ def _trace_get_response(
                         token_usage_histogram=self.additional_properties["token_usage_histogram"],
                         operation_duration_histogram=self.additional_properties["operation_duration_histogram"],
                     )
-                    if OBSERVABILITY_SETTINGS.SENSITIVE_DATA_ENABLED and response.messages:
-                        _capture_messages(
-                            span=span,
-                            provider_name=provider_name,
-                            messages=response.messages,
-                            finish_reason=response.finish_reason,
-                            output=True,
-                        )
+                    if capture:
+                        if response.messages:
+                            capture.add(response.messages, finish_reason=response.finish_reason, output=True)
+                        capture.finish(duration=duration)
                     return response
 
         return trace_get_response
@@ -939,6 +1025,33 @@ def _trace_get_streaming_response(
                 if (service_url_func := getattr(self, "service_url", None)) and callable(service_url_func)
                 else "unknown"
             )
+            if not OBSERVABILITY_SETTINGS.TRACING_ENABLED:
+                from ._types import ChatResponse, UsageContent, UsageDetails
+
+                attributes = _get_metric_attributes(
+                    OtelAttr.CHAT_COMPLETION_OPERATION, provider_name, model_id, service_url
+                )
+                # Only the usage and model of the stream are needed, so the updates are not kept.
+                usage: UsageDetails | None = None
+                response_model_id: str | None = None
+                start_time_stamp = perf_counter()
+                try:
+                    async for update in func(self, messages=messages, **kwargs):
+                        for content in update.contents:
+                            if isinstance(content, UsageContent):
+                                usage = content.details if usage is None else usage + content.details
+                        if update.model_id is not None:
+                            response_model_id = update.model_id
+                        yield update
+                except Exception as exception:
+                    attributes[OtelAttr.ERROR_TYPE] = type(exception).__name__
+                    _record_chat_metrics(self, attributes, perf_counter() - start_time_stamp)
+                    raise
+                response = ChatResponse(model_id=response_model_id, usage_details=usage)
+                _record_chat_metrics(
+                    self, _get_response_attributes(attributes, response), perf_counter() - start_time_stamp
+                )
+                return
             attributes = _get_span_attributes(
                 operation_name=OtelAttr.CHAT_COMPLETION_OPERATION,
                 provider_name=provider_name,
@@ -948,12 +1061,9 @@ def _trace_get_streaming_response(
             )
             all_updates: list["ChatResponseUpdate"] = []
             with _get_span(attributes=attributes, span_name_attribute=SpanAttributes.LLM_REQUEST_MODEL) as span:
-                if OBSERVABILITY_SETTINGS.SENSITIVE_DATA_ENABLED and messages:
-                    _capture_messages(
-                        span=span,
-                        provider_name=provider_name,
-                        messages=messages,
-                    )
+                capture = _MessageCapture.start(span, provider_name, OtelAttr.CHAT_COMPLETION_OPERATION)
+                if capture and messages:
+                    capture.add(messages)
                 start_time_stamp = perf_counter()
                 end_time_stamp: float | None = None
                 try:
@@ -964,6 +1074,8 @@ def _trace_get_streaming_response(
                 except Exception as exception:
                     end_time_stamp = perf_counter()
                     capture_exception(span=span, exception=exception, timestamp=time_ns())
+                    if capture:
+                        capture.finish(error=True, duration=end_time_stamp - start_time_stamp)
                     raise
                 else:
                     duration = (end_time_stamp or perf_counter()) - start_time_stamp
@@ -978,14 +1090,10 @@ def _trace_get_streaming_response(
                         operation_duration_histogram=self.additional_properties["operation_duration_histogram"],
                     )
 
-                    if OBSERVABILITY_SETTINGS.SENSITIVE_DATA_ENABLED and response.messages:
-                        _capture_messages(
-                            span=span,
-                            provider_name=provider_name,
-                            messages=response.messages,
-                            finish_reason=response.finish_reason,
-                            output=True,
-                        )
+                    if capture:
+                        if response.messages:
+                            capture.add(response.messages, finish_reason=response.finish_reason, output=True)
+                        capture.finish(duration=duration)
 
         return trace_get_streaming_response
 
@@ -1099,8 +1207,8 @@ def _trace_agent_run(
     ) -> "AgentRunResponse":
         global OBSERVABILITY_SETTINGS
 
-        if not OBSERVABILITY_SETTINGS.ENABLED:
-            # If model diagnostics are not enabled, just return the completion
+        if not OBSERVABILITY_SETTINGS.TRACING_ENABLED:
+            # Agent runs only produce spans; their chat clients record the metrics
             return await run_func(self, messages=messages, thread=thread, **kwargs)
         attributes = _get_span_attributes(
             operation_name=OtelAttr.AGENT_INVOKE_OPERATION,
@@ -1113,28 +1221,24 @@ def _trace_agent_run(
             **kwargs,
         )
         with _get_span(attributes=attributes, span_name_attribute=OtelAttr.AGENT_NAME) as span:
-            if OBSERVABILITY_SETTINGS.SENSITIVE_DATA_ENABLED and messages:
-                _capture_messages(
-                    span=span,
-                    provider_name=provider_name,
-                    messages=messages,
-                    system_instructions=getattr(self, "instructions", None),
-                )
+            capture = _MessageCapture.start(span, provider_name, OtelAttr.AGENT_INVOKE_OPERATION)
+            if capture and messages:
+                capture.add(messages, system_instructions=getattr(self, "instructions", None))
+            start_time_stamp = perf_counter()
             try:
                 response = await run_func(self, messages=messages, thread=thread, **kwargs)
             except Exception as exception:
                 capture_exception(span=span, exception=exception, timestamp=time_ns())
+                if capture:
+                    capture.finish(error=True, duration=perf_counter() - start_time_stamp)
                 raise
             else:
                 attributes = _get_response_attributes(attributes, response)
                 _capture_response(span=span, attributes=attributes)
-                if OBSERVABILITY_SETTINGS.SENSITIVE_DATA_ENABLED and response.messages:
-                    _capture_messages(
-                        span=span,
-                        provider_name=provider_name,
-                        messages=response.messages,
-                        output=True,
-                    )
+                if capture:
+                    if response.messages:
+                        capture.add(response.messages, output=True)
+                    capture.finish(duration=perf_counter() - start_time_stamp)
                 return response
 
     return trace_run
@@ -1161,8 +1265,8 @@ def _trace_agent_run_stream(
     ) -> AsyncIterable["AgentRunResponseUpdate"]:
         global OBSERVABILITY_SETTINGS
 
-        if not OBSERVABILITY_SETTINGS.ENABLED:
-            # If model diagnostics are not enabled, just return the completion
+        if not OBSERVABILITY_SETTINGS.TRACING_ENABLED:
+            # Agent runs only produce spans; their chat clients record the metrics
             async for streaming_agent_response in run_streaming_func(self, messages=messages, thread=thread, **kwargs):
                 yield streaming_agent_response
             return
@@ -1182,31 +1286,27 @@ def _trace_agent_run_stream(
             **kwargs,
         )
         with _get_span(attributes=attributes, span_name_attribute=OtelAttr.AGENT_NAME) as span:
-            if OBSERVABILITY_SETTINGS.SENSITIVE_DATA_ENABLED and messages:
-                _capture_messages(
-                    span=span,
-                    provider_name=provider_name,
-                    messages=messages,
-                    system_instructions=getattr(self, "instructions", None),
-                )
+            capture = _MessageCapture.start(span, provider_name, OtelAttr.AGENT_INVOKE_OPERATION)
+            if capture and messages:
+                capture.add(messages, system_instructions=getattr(self, "instructions", None))
+            start_time_stamp = perf_counter()
             try:
                 async for update in run_streaming_func(self, messages=messages, thread=thread, **kwargs):
                     all_updates.append(update)
                     yield update
             except Exception as exception:
                 capture_exception(span=span, exception=exception, timestamp=time_ns())
+                if capture:
+                    capture.finish(error=True, duration=perf_counter() - start_time_stamp)
                 raise
             else:
                 response = AgentRunResponse.from_agent_run_response_updates(all_updates)
                 attributes = _get_response_attributes(attributes, response)
                 _capture_response(span=span, attributes=attributes)
-                if OBSERVABILITY_SETTINGS.SENSITIVE_DATA_ENABLED and response.messages:
-                    _capture_messages(
-                        span=span,
-                        provider_name=provider_name,
-                        messages=response.messages,
-                        output=True,
-                    )
+                if capture:
+                    if response.messages:
+                        capture.add(response.messages, output=True)
+                    capture.finish(duration=perf_counter() - start_time_stamp)
 
     return trace_run_streaming
 
@@ -1404,53 +1504,361 @@ def capture_exception(span: trace.Span, exception: Exception, timestamp: int | N
     span.set_status(status=trace.StatusCode.ERROR, description=repr(exception))
 
 
-def _capture_messages(
-    span: trace.Span,
-    provider_name: str,
-    messages: "str | ChatMessage | list[str] | list[ChatMessage]",
-    system_instructions: str | list[str] | None = None,
-    output: bool = False,
-    finish_reason: "FinishReason | None" = None,
-) -> None:
-    """Log messages with extra information."""
-    from ._types import prepare_messages
+class _MessageCapturePayload:
+    """Messages captured for a span, snapshotted when captured and JSON encoded into span attributes on demand."""
 
-    prepped = prepare_messages(messages)
-    otel_messages: list[dict[str, Any]] = []
-    for index, message in enumerate(prepped):
-        otel_messages.append(_to_otel_message(message))
-        try:
-            message_data = message.to_dict(exclude_none=True)
-        except Exception:
-            message_data = {"role": message.role.value, "contents": message.contents}
-        logger.info(
-            message_data,
-            extra={
-                OtelAttr.EVENT_NAME: OtelAttr.CHOICE if output else ROLE_EVENT_MAP.get(message.role.value),
-                OtelAttr.PROVIDER_NAME: provider_name,
-                ChatMessageListTimestampFilter.INDEX_KEY: index,
-            },
+    __slots__ = (
+        "created",
+        "log_records",
+        "offset",
+        "omitted",
+        "otel_messages",
+        "output",
+        "provider_name",
+        "system_instructions",
+    )
+
+    def __init__(
+        self,
+        *,
+        provider_name: str,
+        messages: "Sequence[ChatMessage]",
+        system_instructions: str | list[str] | None = None,
+        output: bool = False,
+        finish_reason: "FinishReason | None" = None,
+        offset: int = 0,
+        omitted: int = 0,
+        max_content_length: int | None = None,
+    ) -> None:
+        self.created = time.time()
+        self.provider_name = provider_name
+        self.system_instructions = (
+            list(system_instructions) if isinstance(system_instructions, list) else system_instructions
         )
-    if finish_reason:
-        otel_messages[-1]["finish_reason"] = FINISH_REASON_MAP[finish_reason.value]
-    span.set_attribute(OtelAttr.OUTPUT_MESSAGES if output else OtelAttr.INPUT_MESSAGES, json.dumps(otel_messages))
-    if system_instructions:
-        if not isinstance(system_instructions, list):
-            system_instructions = [system_instructions]
-        otel_sys_instructions = [{"type": "text", "content": instruction} for instruction in system_instructions]
-        span.set_attribute(OtelAttr.SYSTEM_INSTRUCTIONS, json.dumps(otel_sys_instructions))
+        self.output = output
+        self.offset = offset
+        self.omitted = omitted
+        # Snapshot the messages, they can still be changed after the capture and before the export
+        self.otel_messages = [_to_otel_message(message, max_content_length) for message in messages]
+        if finish_reason and self.otel_messages:
+            self.otel_messages[-1]["finish_reason"] = FINISH_REASON_MAP[finish_reason.value]
+        self.log_records: list[tuple[str | None, dict[str, Any]]] = []
+        if logger.isEnabledFor(logging.INFO):
+            for message in messages:
+                try:
+                    message_data = message.to_dict(exclude_none=True)
+                except Exception:
+                    message_data = {"role": message.role.value, "contents": list(message.contents)}
+                event_name = OtelAttr.CHOICE if output else ROLE_EVENT_MAP.get(message.role.value)
+                self.log_records.append((event_name, message_data))
+
+    def emit_logs(self) -> None:
+        """Emit the log events of the messages."""
+        for index, (event_name, message_data) in enumerate(self.log_records):
+            record = logger.makeRecord(
+                logger.name,
+                logging.INFO,
+                __file__,
+                0,
+                message_data,
+                None,
+                None,
+                extra={
+                    OtelAttr.EVENT_NAME: event_name,
+                    OtelAttr.PROVIDER_NAME: self.provider_name,
+                    ChatMessageListTimestampFilter.INDEX_KEY: self.offset + index,
+                },
+            )
+            # Keep the time of the capture, tail sampled messages are emitted when their span ends
+            record.created = self.created
+            record.msecs = (self.created - int(self.created)) * 1000
+            logger.handle(record)
+
+    def attributes(self) -> dict[str, Any]:
+        """Get the span attributes for the messages."""
+        attributes: dict[str, Any] = {
+            OtelAttr.OUTPUT_MESSAGES if self.output else OtelAttr.INPUT_MESSAGES: json.dumps(self.otel_messages)
+        }
+        if self.offset:
+            attributes[OtelAttr.INPUT_MESSAGES_OFFSET] = self.offset
+        if self.omitted:
+            attributes[OtelAttr.OUTPUT_MESSAGES_OMITTED if self.output else OtelAttr.INPUT_MESSAGES_OMITTED] = (
+                self.omitted
+            )
+        if self.system_instructions:
+            system_instructions = (
+                self.system_instructions if isinstance(self.system_instructions, list) else [self.system_instructions]
+            )
+            otel_sys_instructions = [{"type": "text", "content": instruction} for instruction in system_instructions]
+            attributes[OtelAttr.SYSTEM_INSTRUCTIONS] = json.dumps(otel_sys_instructions)
+        return attributes
+
+
+class _PendingMessageCaptures:
+    """Captured messages of an ended span, waiting to be encoded by the exporters."""
+
+    __slots__ = ("attributes", "lock", "payloads", "remaining")
+
+    def __init__(self, remaining: int) -> None:
+        self.payloads: list[_MessageCapturePayload] = []
+        self.attributes: dict[str, Any] | None = None
+        self.remaining = remaining
+        self.lock = threading.Lock()
+
+
+class _DeferredMessageCaptures:
+    """Hands captured messages from the request path to the span exporters.
+
+    Every exporter configured by ``setup_observability`` is wrapped in a ``_MessageCaptureSpanExporter``, which
+    encodes the captured messages of a span (once, whichever exporter gets there first) on its batch processor
+    thread and adds them to the exported span. Messages are only deferred when every span processor of the
+    tracer provider exports through a wrapped exporter, otherwise they are set on the span immediately.
+    """
+
+    def __init__(self, max_pending: int = 10_000) -> None:
+        self.max_pending = max_pending
+        self._pending: OrderedDict[int, _PendingMessageCaptures] = OrderedDict()
+        self._lock = threading.Lock()
+        self._processors: tuple[Any, ...] | None = None
+        self._exporters = 0
+
+    def exporters(self) -> int:
+        """Get the number of exporters that will claim the messages of a span, 0 to set them immediately."""
+        active = getattr(trace.get_tracer_provider(), "_active_span_processor", None)
+        processors = getattr(active, "_span_processors", None)
+        if not processors:
+            return 0
+        if processors is not self._processors:
+            # Processors are only ever added by replacing the tuple
+            self._exporters = self._wrapped_exporters(processors)
+            self._processors = processors
+        return self._exporters
+
+    def invalidate(self) -> None:
+        """Check the span processors again on the next capture."""
+        self._processors = None
+
+    @staticmethod
+    def _wrapped_exporters(processors: tuple[Any, ...]) -> int:
+        for processor in processors:
+            exporter = getattr(processor, "span_exporter", None)
+            if exporter is None:
+                exporter = getattr(getattr(processor, "_batch_processor", None), "_exporter", None)
+            if not isinstance(exporter, _MessageCaptureSpanExporter) or exporter.is_shutdown:
+                return 0
+        return len(processors)
+
+    def add(self, span: trace.Span, payload: _MessageCapturePayload, exporters: int) -> None:
+        span_id = span.get_span_context().span_id
+        with self._lock:
+            pending = self._pending.get(span_id)
+            if pending is None:
+                pending = self._pending[span_id] = _PendingMessageCaptures(exporters)
+                if len(self._pending) > self.max_pending:
+                    # Spans that were dropped before export never claim their messages
+                    self._pending.popitem(last=False)
+            pending.payloads.append(payload)
+
+    def claim(self, span_id: int) -> dict[str, Any] | None:
+        """Get the encoded message attributes of a span, encoding them on first use."""
+        if not self._pending:
+            return None
+        with self._lock:
+            pending = self._pending.get(span_id)
+            if pending is None:
+                return None
+            pending.remaining -= 1
+            if pending.remaining <= 0:
+                del self._pending[span_id]
+        with pending.lock:
+            if pending.attributes is None:
+                attributes: dict[str, Any] = {}
+                for payload in pending.payloads:
+                    attributes.update(payload.attributes())
+                pending.attributes = attributes
+            return pending.attributes
+
+
+_DEFERRED_MESSAGE_CAPTURES = _DeferredMessageCaptures()
+
+
+class _MessageCaptureSpanExporter:
+    """Span exporter wrapper that adds the deferred message captures to the exported spans."""
+
+    def __init__(self, exporter: "SpanExporter") -> None:
+        self._exporter = exporter
+        self.is_shutdown = False
+
+    def export(self, spans: "Sequence[ReadableSpan]") -> "SpanExportResult":
+        from opentelemetry.sdk.trace import ReadableSpan
+
+        enriched: list[ReadableSpan] = []
+        for span in spans:
+            attributes = _DEFERRED_MESSAGE_CAPTURES.claim(span.context.span_id) if span.context else None
+            if attributes:
+                span = ReadableSpan(
+                    name=span.name,
+                    context=span.context,
+                    parent=span.parent,
+                    resource=span.resource,
+                    attributes={**(span.attributes or {}), **attributes},
+                    events=span.events,
+                    links=span.links,
+                    kind=span.kind,
+                    status=span.status,
+                    start_time=span.start_time,
+                    end_time=span.end_time,
+                    instrumentation_scope=span.instrumentation_scope,
+                )
+            enriched.append(span)
+        return self._exporter.export(enriched)
+
+    def shutdown(self) -> None:
+        self.is_shutdown = True
+        _DEFERRED_MESSAGE_CAPTURES.invalidate()
+        self._exporter.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self._exporter.force_flush(timeout_millis)
 
 
-def _to_otel_message(message: "ChatMessage") -> dict[str, Any]:
+class _MessageCapture:
+    """Captures the sensitive messages of one span according to the observability settings.
+
+    Messages are selected (delta and head/tail truncation) and snapshotted on the request path, their log events
+    are emitted right away. Spans are sampled when they start; spans that were not sampled keep their messages
+    until they end and capture them anyway if they failed or were slow. JSON encoding of the span attributes is
+    left to the exporters when possible.
+    """
+
+    __slots__ = ("operation", "pending", "provider_name", "sampled", "span")
+
+    # Last captured input per operation and conversation, keyed by the first non-system message of the conversation
+    _conversations: ClassVar["dict[str, WeakKeyDictionary[ChatMessage, tuple[int, ref[ChatMessage]]]]"] = {}
+
+    def __init__(self, span: trace.Span, provider_name: str, operation: str, sampled: bool) -> None:
+        self.span = span
+        self.provider_name = provider_name
+        self.operation = operation
+        self.sampled = sampled
+        self.pending: list[_MessageCapturePayload] = []
+
+    @classmethod
+    def start(cls, span: trace.Span, provider_name: str, operation: str) -> "_MessageCapture | None":
+        """Start capturing messages for a span, returns None when nothing will be captured."""
+        settings = OBSERVABILITY_SETTINGS
+        if not settings.SENSITIVE_DATA_ENABLED or not span.is_recording():
+            return None
+        sample_rate = settings.sensitive_data_sample_rate
+        sampled = sample_rate >= 1.0 or random.random() < sample_rate  # noqa: S311
+        tail_sampled = settings.sensitive_data_capture_errors or settings.sensitive_data_capture_slower_than is not None
+        if not sampled and not tail_sampled:
+            return None
+        return cls(span, provider_name, operation, sampled)
+
+    def add(
+        self,
+        messages: "str | ChatMessage | list[str] | list[ChatMessage]",
+        *,
+        system_instructions: str | list[str] | None = None,
+        output: bool = False,
+        finish_reason: "FinishReason | None" = None,
+    ) -> None:
+        """Capture input or output messages."""
+        from ._types import prepare_messages
+
+        settings = OBSERVABILITY_SETTINGS
+        prepped = prepare_messages(messages)
+        offset = 0
+        if not output and settings.sensitive_data_capture_mode == "delta":
+            offset = self._delta_offset(prepped)
+        selected: Sequence[ChatMessage] = prepped[offset:] if offset else prepped
+        omitted = 0
+        head = settings.sensitive_data_head_messages
+        tail = settings.sensitive_data_tail_messages
+        if (head is not None or tail is not None) and len(selected) > (head or 0) + (tail or 0):
+            omitted = len(selected) - (head or 0) - (tail or 0)
+            selected = [*selected[: head or 0], *(selected[-tail:] if tail else [])]
+        payload = _MessageCapturePayload(
+            provider_name=self.provider_name,
+            messages=selected,
+            system_instructions=system_instructions,
+            output=output,
+            finish_reason=finish_reason,
+            offset=offset,
+            omitted=omitted,
+            max_content_length=settings.sensitive_data_max_content_length,
+        )
+        if self.sampled:
+            self._emit(payload)
+        else:
+            self.pending.append(payload)
+
+    def finish(self, *, error: bool = False, duration: float | None = None) -> None:
+        """Tail-sample the messages of a span that was not sampled when it started."""
+        if not self.pending:
+            return
+        settings = OBSERVABILITY_SETTINGS
+        slower_than = settings.sensitive_data_capture_slower_than
+        if (error and settings.sensitive_data_capture_errors) or (
+            slower_than is not None and duration is not None and duration > slower_than
+        ):
+            for payload in self.pending:
+                self._emit(payload)
+        self.pending.clear()
+
+    def _emit(self, payload: _MessageCapturePayload) -> None:
+        payload.emit_logs()
+        exporters = _DEFERRED_MESSAGE_CAPTURES.exporters()
+        if exporters:
+            _DEFERRED_MESSAGE_CAPTURES.add(self.span, payload, exporters)
+        else:
+            self.span.set_attributes(payload.attributes())
+
+    def _delta_offset(self, messages: "list[ChatMessage]") -> int:
+        """Get the number of leading messages that were captured by the previous call on the same conversation.
+
+        Agent and chat spans of the same run see different message lists, so each operation keeps its own state.
+        """
+        first = next((message for message in messages if message.role.value != "system"), None)
+        if first is None:
+            return 0
+        conversations = self._conversations.setdefault(self.operation, WeakKeyDictionary())
+        try:
+            previous = conversations.get(first)
+            conversations[first] = (len(messages), ref(messages[-1]))
+        except TypeError:
+            # Not weak referenceable, always capture the full conversation
+            return 0
+        if previous is None:
+            return 0
+        count, last = previous
+        # Only skip the prefix if the conversation was extended, not rewritten
+        if count <= len(messages) and messages[count - 1] is last():
+            return count
+        return 0
+
+
+def _to_otel_message(message: "ChatMessage", max_content_length: int | None = None) -> dict[str, Any]:
     """Create a otel representation of a message."""
-    return {"role": message.role.value, "parts": [_to_otel_part(content) for content in message.contents]}
+    return {
+        "role": message.role.value,
+        "parts": [_to_otel_part(content, max_content_length) for content in message.contents],
+    }
 
 
-def _to_otel_part(content: "Contents") -> dict[str, Any] | None:
+def _truncate(value: Any, max_length: int | None) -> Any:
+    """Truncate a string value to the maximum content length."""
+    if max_length is None or not isinstance(value, str) or len(value) <= max_length:
+        return value
+    return f"{value[:max_length]}...[{len(value) - max_length} characters truncated]"
+
+
+def _to_otel_part(content: "Contents", max_content_length: int | None = None) -> dict[str, Any] | None:
     """Create a otel representation of a Content."""
     match content.type:
         case "text":
-            return {"type": "text", "content": content.text}
+            return {"type": "text", "content": _truncate(content.text, max_content_length)}
         case "function_call":
             return {"type": "tool_call", "id": content.call_id, "name": content.name, "arguments": content.arguments}
         case "function_result":
@@ -1470,7 +1878,11 @@ def _to_otel_part(content: "Contents") -> dict[str, Any] | None:
                     response = json.dumps(res)
                 else:
                     response = json.dumps(content.result)
-            return {"type": "tool_call_response", "id": content.call_id, "response": response}
+            return {
+                "type": "tool_call_response",
+                "id": content.call_id,
+                "response": _truncate(response, max_content_length),
+            }
         case _:
             # GenericPart in otel output messages json spec.
             # just required type, and arbitrary other fields.
@@ -1515,6 +1927,29 @@ GEN_AI_METRIC_ATTRIBUTES = (
 )
 
 
+def _get_metric_attributes(
+    operation_name: str, provider_name: str, model_id: str | None, service_url: str
+) -> dict[str, Any]:
+    """Get the metric attributes of an operation, without the span-only attributes."""
+    return {
+        OtelAttr.OPERATION: operation_name,
+        OtelAttr.PROVIDER_NAME: provider_name,
+        SpanAttributes.LLM_REQUEST_MODEL: model_id or "unknown",
+        OtelAttr.ADDRESS: service_url,
+    }
+
+
+def _record_chat_metrics(chat_client: "ChatClientProtocol", attributes: dict[str, Any], duration: float) -> None:
+    """Record the operation duration and token usage of a chat call that has no span."""
+    attributes[Meters.LLM_OPERATION_DURATION] = duration
+    _capture_response(
+        span=trace.INVALID_SPAN,
+        attributes=attributes,
+        token_usage_histogram=chat_client.additional_properties["token_usage_histogram"],
+        operation_duration_histogram=chat_client.additional_properties["operation_duration_histogram"],
+    )
+
+
 def _capture_response(
     span: trace.Span,
     attributes: dict[str, Any],
@@ -1555,10 +1990,137 @@ class EdgeGroupDeliveryStatus(Enum):
         return self.value
 
 
+_EDGE_GROUP_DELIVERY_SPAN_ATTRIBUTES: Final[dict[EdgeGroupDeliveryStatus, dict[str, str | bool]]] = {
+    status: {
+        OtelAttr.EDGE_GROUP_DELIVERED: status in (EdgeGroupDeliveryStatus.DELIVERED, EdgeGroupDeliveryStatus.BUFFERED),
+        OtelAttr.EDGE_GROUP_DELIVERY_STATUS: status.value,
+    }
+    for status in EdgeGroupDeliveryStatus
+}
+
+# Returned instead of a span when tracing is off, so callers can keep using ``with ... as span``
+# without allocating a tracer, links or attributes per message.
+_NON_RECORDING_SPAN: Final["contextlib.nullcontext[trace.Span]"] = contextlib.nullcontext(trace.INVALID_SPAN)
+
+
+def _create_histogram(
+    meter: "metrics.Meter",
+    name: str,
+    unit: str,
+    description: str,
+    bucket_boundaries: Sequence[float] | None = None,
+) -> "metrics.Histogram":
+    """Create a histogram, ignoring the bucket boundaries on OpenTelemetry releases that do not support them."""
+    if bucket_boundaries is None:
+        return meter.create_histogram(name=name, unit=unit, description=description)
+    try:
+        return meter.create_histogram(
+            name=name,
+            unit=unit,
+            description=description,
+            explicit_bucket_boundaries_advisory=bucket_boundaries,
+        )
+    except TypeError:
+        return meter.create_histogram(name=name, unit=unit, description=description)
+
+
+class _WorkflowMetrics:
+    """Preallocated instruments for the workflow hot path.
+
+    The instruments are created once per process and the attribute sets are cached per executor and
+    edge group, so recording a measurement does not allocate. The instruments are recorded whether or
+    not spans are created.
+    """
+
+    __slots__ = (
+        "_edge_group_attributes",
+        "_executor_attributes",
+        "edge_group_deliveries",
+        "executor_duration",
+        "queue_depth",
+        "superstep_duration",
+    )
+
+    def __init__(self, meter: "metrics.Meter") -> None:
+        self.superstep_duration = _create_histogram(
+            meter,
+            name=OtelAttr.MEASUREMENT_WORKFLOW_SUPERSTEP_DURATION,
+            unit=OtelAttr.DURATION_UNIT,
+            description="Measures the duration of a workflow superstep",
+            bucket_boundaries=OPERATION_DURATION_BUCKET_BOUNDARIES,
+        )
+        self.queue_depth = _create_histogram(
+            meter,
+            name=OtelAttr.MEASUREMENT_WORKFLOW_QUEUE_DEPTH,
+            unit=OtelAttr.MESSAGE_UNIT,
+            description="Number of messages pending delivery at the start of a workflow superstep",
+        )
+        self.edge_group_deliveries = meter.create_counter(
+            name=OtelAttr.MEASUREMENT_EDGE_GROUP_DELIVERIES,
+            unit=OtelAttr.MESSAGE_UNIT,
+            description="Number of messages routed by workflow edge groups, by delivery status",
+        )
+        self.executor_duration = _create_histogram(
+            meter,
+            name=OtelAttr.MEASUREMENT_EXECUTOR_DURATION,
+            unit=OtelAttr.DURATION_UNIT,
+            description="Measures the duration of a workflow executor handling a message",
+            bucket_boundaries=OPERATION_DURATION_BUCKET_BOUNDARIES,
+        )
+        self._edge_group_attributes: dict[tuple[str, EdgeGroupDeliveryStatus], dict[str, str]] = {}
+        self._executor_attributes: dict[tuple[str, str], dict[str, str]] = {}
+
+    def record_edge_group_delivery(self, edge_group_type: str, status: EdgeGroupDeliveryStatus) -> None:
+        """Count a message routed by an edge group."""
+        key = (edge_group_type, status)
+        attributes = self._edge_group_attributes.get(key)
+        if attributes is None:
+            attributes = self._edge_group_attributes[key] = {
+                OtelAttr.EDGE_GROUP_TYPE: edge_group_type,
+                OtelAttr.EDGE_GROUP_DELIVERY_STATUS: status.value,
+            }
+        self.edge_group_deliveries.add(1, attributes)
+
+    def record_executor_duration(
+        self, executor_id: str, executor_type: str, duration: float, error: BaseException | None = None
+    ) -> None:
+        """Record how long an executor took to handle a message."""
+        key = (executor_id, executor_type)
+        attributes = self._executor_attributes.get(key)
+        if attributes is None:
+            attributes = self._executor_attributes[key] = {
+                OtelAttr.EXECUTOR_ID: executor_id,
+                OtelAttr.EXECUTOR_TYPE: executor_type,
+            }
+        if error is not None:
+            attributes = {**attributes, OtelAttr.ERROR_TYPE: type(error).__name__}
+        self.executor_duration.record(duration, attributes)
+
+
+_WORKFLOW_METRICS: _WorkflowMetrics | None = None
+
+
+def workflow_metrics() -> _WorkflowMetrics | None:
+    """Get the preallocated workflow instruments, or None if observability is not enabled."""
+    global OBSERVABILITY_SETTINGS, _WORKFLOW_METRICS
+    if not OBSERVABILITY_SETTINGS.ENABLED:
+        return None
+    if _WORKFLOW_METRICS is None:
+        _WORKFLOW_METRICS = _WorkflowMetrics(get_meter())
+    return _WORKFLOW_METRICS
+
+
+def record_edge_group_delivery(span: trace.Span, edge_group_type: str, status: EdgeGroupDeliveryStatus) -> None:
+    """Record the delivery outcome of a message on the edge group span and in the delivery counter."""
+    span.set_attributes(_EDGE_GROUP_DELIVERY_SPAN_ATTRIBUTES[status])
+    if instruments := workflow_metrics():
+        instruments.record_edge_group_delivery(edge_group_type, status)
+
+
 def workflow_tracer() -> "Tracer":
-    """Get a workflow tracer or a no-op tracer if not enabled."""
+    """Get a workflow tracer or a no-op tracer if tracing is not enabled."""
     global OBSERVABILITY_SETTINGS
-    return get_tracer() if OBSERVABILITY_SETTINGS.ENABLED else trace.NoOpTracer()
+    return get_tracer() if OBSERVABILITY_SETTINGS.TRACING_ENABLED else trace.NoOpTracer()
 
 
 def create_workflow_span(
@@ -1592,6 +2154,10 @@ def create_processing_span(
         source_trace_contexts: Optional trace contexts from source spans for linking.
         source_span_ids: Optional source span IDs for linking.
     """
+    global OBSERVABILITY_SETTINGS
+    if not OBSERVABILITY_SETTINGS.TRACING_ENABLED:
+        return _NON_RECORDING_SPAN  # type: ignore[return-value]
+
     # Create links to source spans for causality without nesting
     links: list[trace.Link] = []
     if source_trace_contexts and source_span_ids:
@@ -1652,6 +2218,10 @@ def create_edge_group_processing_span(
         source_trace_contexts: Optional trace contexts from source spans for linking.
         source_span_ids: Optional source span IDs for linking.
     """
+    global OBSERVABILITY_SETTINGS
+    if not OBSERVABILITY_SETTINGS.TRACING_ENABLED:
+        return _NON_RECORDING_SPAN  # type: ignore[return-value]
+
     attributes: dict[str, str] = {
         OtelAttr.EDGE_GROUP_TYPE: edge_group_type,
     }
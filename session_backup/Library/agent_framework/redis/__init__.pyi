@@ -1,5 +1,5 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from agent_framework_redis import RedisChatMessageStore, RedisProvider, __version__
+from agent_framework_redis import RedisChatMessageStore, RedisProvider, RedisToolResultCache, __version__
 
-__all__ = ["RedisChatMessageStore", "RedisProvider", "__version__"]
+__all__ = ["RedisChatMessageStore", "RedisProvider", "RedisToolResultCache", "__version__"]
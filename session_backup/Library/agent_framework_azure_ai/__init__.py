@@ -2,6 +2,7 @@
 
 import importlib.metadata
 
+from ._agent_registry import AzureAIAgentRegistry
 from ._chat_client import AzureAIAgentClient
 from ._shared import AzureAISettings
 
@@ -12,6 +13,7 @@ except importlib.metadata.PackageNotFoundError:
 
 __all__ = [
     "AzureAIAgentClient",
+    "AzureAIAgentRegistry",
     "AzureAISettings",
     "__version__",
 ]
@@ -0,0 +1,204 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import hashlib
+import json
+from collections import OrderedDict
+from collections.abc import Mapping
+from datetime import datetime, timedelta, timezone
+from typing import Any, ClassVar
+from weakref import WeakKeyDictionary
+
+from agent_framework import get_logger
+from azure.ai.agents.aio import AgentsClient
+from azure.ai.agents.models import Agent
+
+logger = get_logger("agent_framework.azure")
+
+AGENT_DEFINITION_HASH_KEY = "af_definition_hash"
+"""Metadata key under which the registry stores the definition hash of the agents it creates."""
+
+
+def _json_default(value: Any) -> Any:
+    """Encode Azure SDK models and other non-JSON values for hashing."""
+    as_dict = getattr(value, "as_dict", None)
+    if callable(as_dict):
+        return as_dict()
+    if isinstance(value, Mapping):
+        return dict(value)  # type: ignore[arg-type]
+    return str(value)
+
+
+class AzureAIAgentRegistry:
+    """Content-addressed registry of server-side agents for one Azure AI project.
+
+    Instead of creating an agent for every client and deleting it again on exit, the registry hashes
+    the agent definition (model, name, instructions, tools, tool resources, response format and sampling
+    settings) and reuses the server-side agent that was created for the same hash. The hash is stored in
+    the agent metadata, so agents created by other processes are found as well: the registry lists the
+    project's agents once, after which resolving a known definition is a dictionary lookup.
+
+    Agents created by the registry are never deleted by the client. Instead, the first time a definition is
+    resolved the registry schedules a background sweep that deletes registry-managed agents with the same
+    name whose definition has been superseded and that are older than ``stale_after``. ``stale_after`` should
+    therefore exceed the lifetime of any deployment that may still run an older definition. A sweep uses the
+    client that resolved the definition, and is cancelled when that client is closed; the next client that
+    resolves the name sweeps again.
+
+    Examples:
+        .. code-block:: python
+
+            from datetime import timedelta
+
+            from agent_framework.azure import AzureAIAgentClient, AzureAIAgentRegistry
+
+            # Share one registry per project endpoint across all clients in the process
+            client = AzureAIAgentClient(async_credential=credential, agent_registry=True)
+
+            # Or configure the sweep explicitly
+            registry = AzureAIAgentRegistry(stale_after=timedelta(days=1))
+            client = AzureAIAgentClient(async_credential=credential, agent_registry=registry)
+    """
+
+    _registries: ClassVar[OrderedDict[str, "AzureAIAgentRegistry"]] = OrderedDict()
+    max_registries: ClassVar[int] = 16
+    """Number of endpoint registries kept by ``for_endpoint``; the least recently used ones are dropped."""
+
+    def __init__(self, *, stale_after: timedelta | None = timedelta(days=7)) -> None:
+        """Initialize the registry.
+
+        Keyword Args:
+            stale_after: Minimum age of a superseded agent before it is deleted.
+                Set to None to disable garbage collection.
+        """
+        self.stale_after = stale_after
+        self._agents: dict[str, Agent] = {}
+        self._resolved: set[str] = set()
+        self._loaded = False
+        self._swept_names: set[str] = set()
+        self._locks: WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = WeakKeyDictionary()
+        # Running sweeps with the client and agent name they sweep
+        self._sweeps: dict[asyncio.Task[None], tuple[AgentsClient, str]] = {}
+
+    @classmethod
+    def for_endpoint(cls, endpoint: str) -> "AzureAIAgentRegistry":
+        """Get the process-wide registry for a project endpoint, creating it on first use."""
+        registry = cls._registries.get(endpoint)
+        if registry is None:
+            registry = cls._registries[endpoint] = cls()
+            while len(cls._registries) > cls.max_registries:
+                cls._registries.popitem(last=False)
+        else:
+            cls._registries.move_to_end(endpoint)
+        return registry
+
+    @staticmethod
+    def definition_hash(definition: Mapping[str, Any]) -> str:
+        """Compute the content hash of an agent definition.
+
+        Args:
+            definition: The keyword arguments that would be passed to ``AgentsClient.create_agent``.
+        """
+        payload = json.dumps(
+            {key: value for key, value in definition.items() if key != "metadata"},
+            sort_keys=True,
+            separators=(",", ":"),
+            default=_json_default,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def get_or_create(self, agents_client: AgentsClient, definition: Mapping[str, Any]) -> Agent:
+        """Resolve the server-side agent for a definition, creating it if no agent with the same hash exists.
+
+        Args:
+            agents_client: The client used to list and create agents.
+            definition: The keyword arguments that would be passed to ``AgentsClient.create_agent``.
+        """
+        key = self.definition_hash(definition)
+        agent = self._agents.get(key)
+        if agent is not None:
+            return agent
+
+        async with self._lock():
+            if not self._loaded:
+                await self._load(agents_client)
+            agent = self._agents.get(key)
+            if agent is None:
+                metadata = {**(definition.get("metadata") or {}), AGENT_DEFINITION_HASH_KEY: key}
+                agent = await agents_client.create_agent(**{**definition, "metadata": metadata})
+                self._agents[key] = agent
+                logger.debug(f"Created agent {agent.id} for definition {key}")
+            self._resolved.add(agent.id)
+
+        name = definition.get("name")
+        if self.stale_after is not None and name and name not in self._swept_names:
+            self._swept_names.add(name)
+            task = asyncio.create_task(self._sweep(agents_client, name))
+            self._sweeps[task] = (agents_client, name)
+            task.add_done_callback(self._sweep_done)
+        return agent
+
+    def _sweep_done(self, task: "asyncio.Task[None]") -> None:
+        _, name = self._sweeps.pop(task)
+        if task.cancelled():
+            # Let the next client that resolves the name sweep it
+            self._swept_names.discard(name)
+
+    async def cancel_sweeps(self, agents_client: AgentsClient) -> None:
+        """Cancel and wait for the sweeps that use a client, before the client is closed.
+
+        Args:
+            agents_client: The client that is about to be closed.
+        """
+        tasks = [task for task, (client, _) in self._sweeps.items() if client is agents_client]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def invalidate(self, agent_id: str) -> None:
+        """Forget a cached agent, e.g. after it was deleted on the service."""
+        for key, agent in list(self._agents.items()):
+            if agent.id == agent_id:
+                del self._agents[key]
+        self._resolved.discard(agent_id)
+
+    def _lock(self) -> asyncio.Lock:
+        """Get the lock for the running event loop; locks cannot be shared across loops."""
+        loop = asyncio.get_running_loop()
+        lock = self._locks.get(loop)
+        if lock is None:
+            lock = self._locks[loop] = asyncio.Lock()
+        return lock
+
+    async def _load(self, agents_client: AgentsClient) -> None:
+        """Index the registry-managed agents that already exist on the service."""
+        async for agent in agents_client.list_agents():  # type: ignore[reportUnknownMemberType]
+            key = (agent.metadata or {}).get(AGENT_DEFINITION_HASH_KEY)
+            # Agents are listed newest first; keep the newest agent for duplicated definitions.
+            if key and key not in self._agents:
+                self._agents[key] = agent
+        self._loaded = True
+
+    async def _sweep(self, agents_client: AgentsClient, name: str) -> None:
+        """Delete superseded registry-managed agents with the given name."""
+        if self.stale_after is None:
+            return
+        cutoff = datetime.now(timezone.utc) - self.stale_after
+        try:
+            stale = [
+                agent.id
+                async for agent in agents_client.list_agents()  # type: ignore[reportUnknownMemberType]
+                if agent.name == name
+                and AGENT_DEFINITION_HASH_KEY in (agent.metadata or {})
+                and agent.id not in self._resolved
+                and agent.created_at.replace(tzinfo=agent.created_at.tzinfo or timezone.utc) < cutoff
+            ]
+            for agent_id in stale:
+                if agent_id in self._resolved:
+                    continue
+                self.invalidate(agent_id)
+                await agents_client.delete_agent(agent_id)
+                logger.debug(f"Deleted stale agent {agent_id}")
+        except Exception as ex:
+            logger.warning(f"Failed to delete stale agents named '{name}': {ex}")
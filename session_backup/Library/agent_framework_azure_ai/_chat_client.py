@@ -3,6 +3,7 @@
 import json
 import os
 import sys
+from collections import OrderedDict
 from collections.abc import AsyncIterable, MutableMapping, MutableSequence, Sequence
 from typing import Any, ClassVar, TypeVar
 
@@ -86,8 +87,10 @@ from azure.ai.agents.models import (
     ToolOutput,
 )
 from azure.core.credentials_async import AsyncTokenCredential
+from azure.core.exceptions import HttpResponseError, ResourceNotFoundError
 from pydantic import ValidationError
 
+from ._agent_registry import AzureAIAgentRegistry
 from ._shared import AzureAISettings
 
 if sys.version_info >= (3, 11):
@@ -109,6 +112,8 @@ class AzureAIAgentClient(BaseChatClient):
     """Azure AI Agent Chat client."""
 
     OTEL_PROVIDER_NAME: ClassVar[str] = "azure.ai"  # type: ignore[reportIncompatibleVariableOverride, misc]
+    MAX_TRACKED_THREADS: ClassVar[int] = 1024
+    """Number of created threads whose run state is tracked; older threads fall back to querying the service."""
 
     def __init__(
         self,
@@ -121,6 +126,7 @@ class AzureAIAgentClient(BaseChatClient):
         model_deployment_name: str | None = None,
         async_credential: AsyncTokenCredential | None = None,
         should_cleanup_agent: bool = True,
+        agent_registry: AzureAIAgentRegistry | bool = False,
         env_file_path: str | None = None,
         env_file_encoding: str | None = None,
         **kwargs: Any,
@@ -144,6 +150,10 @@ class AzureAIAgentClient(BaseChatClient):
             should_cleanup_agent: Whether to cleanup (delete) agents created by this client when
                 the client is closed or context is exited. Defaults to True. Only affects agents
                 created by this client instance; existing agents passed via agent_id are never deleted.
+            agent_registry: Reuse server-side agents by definition instead of creating an agent per client
+                and deleting it on close. Pass True to use the shared registry of the project endpoint,
+                or an AzureAIAgentRegistry instance. Agents resolved through the registry are never deleted
+                by the client; the registry garbage-collects superseded agents in the background.
             env_file_path: Path to environment file for loading settings.
             env_file_encoding: Encoding of the environment file.
             kwargs: Additional keyword arguments passed to the parent class.
@@ -219,6 +229,15 @@ class AzureAIAgentClient(BaseChatClient):
         self._agent_created = False  # Track whether agent was created inside this class
         self._should_close_client = should_close_client  # Track whether we should close client connection
         self._agent_definition: Agent | None = None  # Cached definition for existing agent
+        # Run state of the threads this client created: the run awaiting tool outputs, or None when idle.
+        # A thread is missing from _thread_runs while its state is uncertain, e.g. while a run is in flight,
+        # in which case the service is queried.
+        # Both are bounded by MAX_TRACKED_THREADS, least recently used threads are forgotten first.
+        self._owned_threads: OrderedDict[str, None] = OrderedDict()
+        self._thread_runs: dict[str, ThreadRun | None] = {}
+        self.agent_registry: AzureAIAgentRegistry | None = (
+            AzureAIAgentRegistry.for_endpoint(self.service_url()) if agent_registry is True else agent_registry or None
+        )
 
     async def __aenter__(self) -> "Self":
         """Async context manager entry."""
@@ -230,6 +249,8 @@ class AzureAIAgentClient(BaseChatClient):
 
     async def close(self) -> None:
         """Close the agents_client and clean up any agents we created."""
+        if self.agent_registry is not None:
+            await self.agent_registry.cancel_sweeps(self.agents_client)
         await self._cleanup_agent_if_needed()
         await self._close_client_if_needed()
 
@@ -250,6 +271,7 @@ class AzureAIAgentClient(BaseChatClient):
             credential=settings.get("credential"),
             env_file_path=settings.get("env_file_path"),
             should_cleanup_agent=settings.get("should_cleanup_agent", True),
+            agent_registry=settings.get("agent_registry", False),
         )
 
     async def _inner_get_response(
@@ -324,6 +346,11 @@ class AzureAIAgentClient(BaseChatClient):
             if "top_p" in run_options:
                 args["top_p"] = run_options["top_p"]
 
+            if self.agent_registry is not None:
+                # Registry agents are shared by definition, so they are resolved per request
+                # (a dictionary lookup once known) and never pinned to or deleted by this client.
+                return str((await self.agent_registry.get_or_create(self.agents_client, args)).id)
+
             created_agent = await self.agents_client.create_agent(**args)
 
             self.agent_id = str(created_agent.id)
@@ -345,10 +372,10 @@ class AzureAIAgentClient(BaseChatClient):
             tuple: (stream, final_thread_id)
         """
         # Get any active run for this thread
+        cached_run = thread_id is not None and thread_id in self._thread_runs
         thread_run = await self._get_active_thread_run(thread_id)
 
-        stream: AsyncAgentRunStream[AsyncAgentEventHandler[Any]] | AsyncAgentEventHandler[Any]
-        handler: AsyncAgentEventHandler[Any] = AsyncAgentEventHandler()
+        stream: AsyncAgentRunStream[AsyncAgentEventHandler[Any]] | AsyncAgentEventHandler[Any] | None = None
         tool_run_id, tool_outputs, tool_approvals = self._convert_required_action_to_tool_output(
             required_action_results
         )
@@ -360,18 +387,17 @@ class AzureAIAgentClient(BaseChatClient):
             and (tool_outputs or tool_approvals)
         ):  # type: ignore[reportUnknownMemberType]
             # There's an active run and we have tool results to submit, so submit the results.
-            args: dict[str, Any] = {
-                "thread_id": thread_run.thread_id,
-                "run_id": tool_run_id,
-                "event_handler": handler,
-            }
-            if tool_outputs:
-                args["tool_outputs"] = tool_outputs
-            if tool_approvals:
-                args["tool_approvals"] = tool_approvals
-            await self.agents_client.runs.submit_tool_outputs_stream(**args)  # type: ignore[reportUnknownMemberType]
-            # Pass the handler to the stream to continue processing
-            stream = handler  # type: ignore
+            try:
+                stream = await self._submit_tool_outputs(thread_run, tool_run_id, tool_outputs, tool_approvals)
+            except HttpResponseError:
+                if not cached_run:
+                    raise
+                # The cached run may have expired or been cancelled since, ask the service for the active run
+                logger.debug(f"Tool outputs for cached run {tool_run_id} were rejected, listing the active runs")
+                thread_run = await self._get_active_thread_run(thread_id)
+                if thread_run is not None and thread_run.id == tool_run_id:
+                    stream = await self._submit_tool_outputs(thread_run, tool_run_id, tool_outputs, tool_approvals)
+        if stream is not None and thread_run is not None:
             final_thread_id = thread_run.thread_id
         else:
             # Handle thread creation or cancellation
@@ -379,16 +405,60 @@ class AzureAIAgentClient(BaseChatClient):
 
             # Now create a new run and stream the results.
             run_options.pop("conversation_id", None)
-            stream = await self.agents_client.runs.stream(  # type: ignore[reportUnknownMemberType]
-                final_thread_id, agent_id=agent_id, **run_options
-            )
+            self._thread_runs.pop(final_thread_id, None)
+            try:
+                stream = await self.agents_client.runs.stream(  # type: ignore[reportUnknownMemberType]
+                    final_thread_id, agent_id=agent_id, **run_options
+                )
+            except ResourceNotFoundError:
+                if self.agent_registry is None or not await self._registry_agent_was_deleted(agent_id):
+                    raise
+                # The registry's agent was deleted on the service, e.g. by another process: create it again
+                self.agent_registry.invalidate(agent_id)
+                agent_id = await self._get_agent_id_or_create(run_options)
+                stream = await self.agents_client.runs.stream(  # type: ignore[reportUnknownMemberType]
+                    final_thread_id, agent_id=agent_id, **run_options
+                )
 
         return stream, final_thread_id
 
+    async def _submit_tool_outputs(
+        self,
+        thread_run: ThreadRun,
+        tool_run_id: str,
+        tool_outputs: list[ToolOutput] | None,
+        tool_approvals: list[ToolApproval] | None,
+    ) -> AsyncAgentEventHandler[Any]:
+        """Submit tool outputs or approvals to a run awaiting them and return the handler of its stream."""
+        handler: AsyncAgentEventHandler[Any] = AsyncAgentEventHandler()
+        args: dict[str, Any] = {
+            "thread_id": thread_run.thread_id,
+            "run_id": tool_run_id,
+            "event_handler": handler,
+        }
+        if tool_outputs:
+            args["tool_outputs"] = tool_outputs
+        if tool_approvals:
+            args["tool_approvals"] = tool_approvals
+        self._thread_runs.pop(thread_run.thread_id, None)
+        await self.agents_client.runs.submit_tool_outputs_stream(**args)  # type: ignore[reportUnknownMemberType]
+        # Pass the handler to the stream to continue processing
+        return handler
+
+    async def _registry_agent_was_deleted(self, agent_id: str) -> bool:
+        """Check whether a missing resource is the agent, rather than e.g. the thread."""
+        try:
+            await self.agents_client.get_agent(agent_id)
+        except ResourceNotFoundError:
+            return True
+        return False
+
     async def _get_active_thread_run(self, thread_id: str | None) -> ThreadRun | None:
         """Get any active run for the given thread."""
         if thread_id is None:
             return None
+        if thread_id in self._thread_runs:
+            return self._thread_runs[thread_id]
 
         async for run in self.agents_client.runs.list(thread_id=thread_id, limit=1, order=ListSortOrder.DESCENDING):  # type: ignore[reportUnknownMemberType]
             if run.status not in [
@@ -415,17 +485,16 @@ class AzureAIAgentClient(BaseChatClient):
         thread = await self.agents_client.threads.create(
             tool_resources=run_options.get("tool_resources"), metadata=run_options.get("metadata")
         )
-        thread_id = thread.id
-        # workaround for: https://github.com/Azure/azure-sdk-for-python/issues/42805
-        # this occurs when otel is enabled
-        # once fixed, in the function above, readd:
-        # `messages=run_options.pop("additional_messages")`
-        for msg in run_options.pop("additional_messages", []):
-            await self.agents_client.messages.create(
-                thread_id=thread_id, role=msg.role, content=msg.content, metadata=msg.metadata
-            )
-        # and remove until here.
-        return thread_id
+        # The messages are not passed to the thread creation because of
+        # https://github.com/Azure/azure-sdk-for-python/issues/42805 (this occurs when otel is enabled).
+        # They stay in run_options instead and are posted, in order, as additional_messages of the run,
+        # the same way they are for existing threads; this saves a round-trip per message.
+        self._owned_threads[thread.id] = None
+        self._thread_runs[thread.id] = None
+        while len(self._owned_threads) > self.MAX_TRACKED_THREADS:
+            forgotten, _ = self._owned_threads.popitem(last=False)
+            self._thread_runs.pop(forgotten, None)
+        return thread.id
 
     def _extract_url_citations(self, message_delta_chunk: MessageDeltaChunk) -> list[CitationAnnotation]:
         """Extract URL citations from MessageDeltaChunk."""
@@ -502,6 +571,7 @@ class AzureAIAgentClient(BaseChatClient):
                         # AgentStreamEvent.THREAD_RUN_CANCELLING
                         # AgentStreamEvent.THREAD_RUN_CANCELLED
                         # AgentStreamEvent.THREAD_RUN_EXPIRED
+                        self._track_thread_run(thread_id, event_type, event_data)
                         match event_type:
                             case AgentStreamEvent.THREAD_RUN_REQUIRES_ACTION:
                                 if event_data.required_action and event_data.required_action.type in [
@@ -618,11 +688,30 @@ class AzureAIAgentClient(BaseChatClient):
                         )
         except Exception as ex:
             logger.error(f"Error processing stream: {ex}")
+            self._thread_runs.pop(thread_id, None)
             raise
         finally:
             if isinstance(stream, AsyncAgentRunStream):
                 await stream.__aexit__(None, None, None)  # type: ignore[no-untyped-call]
 
+    def _track_thread_run(self, thread_id: str, event_type: Any, run: ThreadRun) -> None:
+        """Record the run state of a thread this client created from a run event."""
+        if thread_id not in self._owned_threads:
+            return
+        self._owned_threads.move_to_end(thread_id)
+        match event_type:
+            case AgentStreamEvent.THREAD_RUN_REQUIRES_ACTION:
+                self._thread_runs[thread_id] = run
+            case (
+                AgentStreamEvent.THREAD_RUN_COMPLETED
+                | AgentStreamEvent.THREAD_RUN_CANCELLED
+                | AgentStreamEvent.THREAD_RUN_FAILED
+                | AgentStreamEvent.THREAD_RUN_EXPIRED
+            ):
+                self._thread_runs[thread_id] = None
+            case _:
+                self._thread_runs.pop(thread_id, None)
+
     def _create_function_call_contents(self, event_data: ThreadRun, response_id: str | None) -> list[Contents]:
         """Create function call contents from a tool action event."""
         if isinstance(event_data, ThreadRun) and event_data.required_action is not None:
@@ -8,8 +8,9 @@ import webbrowser
 from collections.abc import Callable
 from typing import Any
 
-from ._conversations import CheckpointConversationManager
+from ._conversations import CheckpointConversationManager, ConversationStore, InMemoryConversationStore
 from ._server import DevServer
+from ._sqlite_conversations import SQLiteCheckpointStorage, SQLiteConversationStore
 from .models import AgentFrameworkRequest, OpenAIError, OpenAIResponse, ResponseStreamEvent
 from .models._discovery_models import DiscoveryResponse, EntityInfo, EnvVarRequirement
 
@@ -98,6 +99,7 @@ def serve(
     mode: str = "developer",
     auth_enabled: bool = False,
     auth_token: str | None = None,
+    conversation_store: ConversationStore | None = None,
 ) -> None:
     """Launch Agent Framework DevUI with simple API.
 
@@ -113,6 +115,8 @@ def serve(
         mode: Server mode - 'developer' (full access, verbose errors) or 'user' (restricted APIs, generic errors)
         auth_enabled: Whether to enable Bearer token authentication
         auth_token: Custom authentication token (auto-generated if not provided with auth_enabled=True)
+        conversation_store: Conversation store to use (defaults to in-memory), e.g. a SQLiteConversationStore
+            to keep conversations across restarts with bounded memory
     """
     import re
 
@@ -197,6 +201,7 @@ def serve(
         cors_origins=cors_origins,
         ui_enabled=ui_enabled,
         mode=mode,
+        conversation_store=conversation_store,
     )
 
     # Register in-memory entities if provided
@@ -264,13 +269,17 @@ def main() -> None:
 __all__ = [
     "AgentFrameworkRequest",
     "CheckpointConversationManager",
+    "ConversationStore",
     "DevServer",
     "DiscoveryResponse",
     "EntityInfo",
     "EnvVarRequirement",
+    "InMemoryConversationStore",
     "OpenAIError",
     "OpenAIResponse",
     "ResponseStreamEvent",
+    "SQLiteCheckpointStorage",
+    "SQLiteConversationStore",
     "main",
     "register_cleanup",
     "serve",
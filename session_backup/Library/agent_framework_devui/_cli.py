@@ -90,6 +90,12 @@ Examples:
         help="Custom authentication token (auto-generated if not provided with --auth)",
     )
 
+    parser.add_argument(
+        "--conversation-db",
+        type=str,
+        help="Persist conversations and checkpoints in this SQLite database file (default: in-memory)",
+    )
+
     parser.add_argument("--version", action="version", version=f"Agent Framework DevUI {get_version()}")
 
     return parser
@@ -174,7 +180,9 @@ def main() -> None:
 
     # Import and start server
     try:
-        from . import serve
+        from . import SQLiteConversationStore, serve
+
+        conversation_store = SQLiteConversationStore(args.conversation_db) if args.conversation_db else None
 
         serve(
             entities_dir=entities_dir,
@@ -186,6 +194,7 @@ def main() -> None:
             mode=mode,
             auth_enabled=args.auth,
             auth_token=args.auth_token,  # Pass through explicit token only
+            conversation_store=conversation_store,
         )
 
     except KeyboardInterrupt:
@@ -12,7 +12,7 @@ from abc import ABC, abstractmethod
 from typing import Any, Literal, cast
 
 from agent_framework import AgentThread, ChatMessage
-from agent_framework._workflows._checkpoint import InMemoryCheckpointStorage
+from agent_framework._workflows._checkpoint import CheckpointStorage, InMemoryCheckpointStorage
 from openai.types.conversations import Conversation, ConversationDeletedResource
 from openai.types.conversations.conversation_item import ConversationItem
 from openai.types.conversations.message import Message
@@ -174,6 +174,142 @@ class ConversationStore(ABC):
         pass
 
 
+def _convert_message(msg: ChatMessage, item_id: str) -> list[ConversationItem]:
+    """Convert an AgentFramework ChatMessage to OpenAI ConversationItem types.
+
+    - Messages with text/images/files → Message
+    - Function calls → ResponseFunctionToolCallItem
+    - Function results → ResponseFunctionToolCallOutputItem
+
+    A single ChatMessage may produce multiple ConversationItems
+    (e.g., a message with both text and a function call).
+    """
+    items: list[ConversationItem] = []
+    role_str = msg.role.value if hasattr(msg.role, "value") else str(msg.role)
+    role = cast(MessageRole, role_str)  # Safe: Agent Framework roles match OpenAI roles
+
+    message_contents: list[TextContent | ResponseInputImage | ResponseInputFile] = []
+    function_calls = []
+    function_results = []
+
+    for content in msg.contents:
+        content_type = getattr(content, "type", None)
+
+        if content_type == "text":
+            # Text content for Message
+            text_value = getattr(content, "text", "")
+            message_contents.append(TextContent(type="text", text=text_value))
+
+        elif content_type == "data":
+            # Data content (images, files, PDFs)
+            uri = getattr(content, "uri", "")
+            media_type = getattr(content, "media_type", None)
+
+            if media_type and media_type.startswith("image/"):
+                # Convert to ResponseInputImage
+                message_contents.append(ResponseInputImage(type="input_image", image_url=uri, detail="auto"))
+            else:
+                # Convert to ResponseInputFile
+                # Extract filename from URI if possible
+                filename = None
+                if media_type == "application/pdf":
+                    filename = "document.pdf"
+
+                message_contents.append(ResponseInputFile(type="input_file", file_url=uri, filename=filename))
+
+        elif content_type == "function_call":
+            # Function call - create separate ConversationItem
+            call_id = getattr(content, "call_id", None)
+            name = getattr(content, "name", "")
+            arguments = getattr(content, "arguments", "")
+
+            if call_id and name:
+                function_calls.append(
+                    ResponseFunctionToolCallItem(
+                        id=f"{item_id}_call_{call_id}",
+                        call_id=call_id,
+                        name=name,
+                        arguments=arguments,
+                        type="function_call",
+                        status="completed",
+                    )
+                )
+
+        elif content_type == "function_result":
+            # Function result - create separate ConversationItem
+            call_id = getattr(content, "call_id", None)
+            # Output is stored in additional_properties
+            output = ""
+            if hasattr(content, "additional_properties"):
+                output = content.additional_properties.get("output", "")
+
+            if call_id:
+                function_results.append(
+                    ResponseFunctionToolCallOutputItem(
+                        id=f"{item_id}_result_{call_id}",
+                        call_id=call_id,
+                        output=output,
+                        type="function_call_output",
+                        status="completed",
+                    )
+                )
+
+    # Create ConversationItems based on what we found
+    # If message has text/images/files, create a Message item
+    if message_contents:
+        message = Message(
+            id=item_id,
+            type="message",
+            role=role,  # type: ignore
+            content=message_contents,  # type: ignore
+            status="completed",
+        )
+        items.append(message)
+
+    # Add function call items
+    items.extend(function_calls)
+
+    # Add function result items
+    items.extend(function_results)
+    return items
+
+
+class _ConversationItemIndex:
+    """Converted ConversationItems of a conversation's messages, built incrementally.
+
+    Messages are converted once, when they are first seen, and items are addressable by
+    position and id so pagination only touches the requested slice. The index is rebuilt
+    if the thread's messages were rewritten rather than appended to (e.g. by compaction,
+    which replaces the oldest messages), detected by the identity of the first and last
+    indexed message.
+    """
+
+    __slots__ = ("first_message", "items", "last_message", "message_count", "positions")
+
+    def __init__(self) -> None:
+        self.items: list[ConversationItem] = []
+        self.positions: dict[str, int] = {}
+        self.message_count = 0
+        self.first_message: ChatMessage | None = None
+        self.last_message: ChatMessage | None = None
+
+    def sync(self, messages: list[ChatMessage]) -> None:
+        """Convert the messages that were appended since the last sync."""
+        if len(messages) < self.message_count or (
+            self.message_count
+            and (messages[0] is not self.first_message or messages[self.message_count - 1] is not self.last_message)
+        ):
+            self.__init__()  # type: ignore[misc]
+        for i in range(self.message_count, len(messages)):
+            for item in _convert_message(messages[i], f"item_{i}"):
+                if item.id:
+                    self.positions[item.id] = len(self.items)
+                self.items.append(item)
+        self.message_count = len(messages)
+        self.first_message = messages[0] if messages else None
+        self.last_message = messages[-1] if messages else None
+
+
 class InMemoryConversationStore(ConversationStore):
     """In-memory conversation storage wrapping AgentThread.
 
@@ -192,6 +328,21 @@ class InMemoryConversationStore(ConversationStore):
         # Item index for O(1) lookup: {conversation_id: {item_id: ConversationItem}}
         self._item_index: dict[str, dict[str, ConversationItem]] = {}
 
+        # Secondary index on metadata: {(key, value): {conversation_id: None}} (dicts keep creation order)
+        self._metadata_index: dict[tuple[str, str], dict[str, None]] = {}
+
+    def _index_metadata(self, conversation_id: str, metadata: dict[str, str]) -> None:
+        for key, value in metadata.items():
+            self._metadata_index.setdefault((key, value), {})[conversation_id] = None
+
+    def _unindex_metadata(self, conversation_id: str, metadata: dict[str, str]) -> None:
+        for key, value in metadata.items():
+            conversation_ids = self._metadata_index.get((key, value))
+            if conversation_ids is not None:
+                conversation_ids.pop(conversation_id, None)
+                if not conversation_ids:
+                    del self._metadata_index[(key, value)]
+
     def create_conversation(
         self, metadata: dict[str, str] | None = None, conversation_id: str | None = None
     ) -> Conversation:
@@ -212,10 +363,12 @@ class InMemoryConversationStore(ConversationStore):
             "metadata": metadata or {},
             "created_at": created_at,
             "items": [],
+            "item_index": _ConversationItemIndex(),
         }
 
         # Initialize item index for this conversation
         self._item_index[conv_id] = {}
+        self._index_metadata(conv_id, metadata or {})
 
         return Conversation(id=conv_id, object="conversation", created_at=created_at, metadata=metadata)
 
@@ -238,7 +391,9 @@ class InMemoryConversationStore(ConversationStore):
         if not conv_data:
             raise ValueError(f"Conversation {conversation_id} not found")
 
+        self._unindex_metadata(conversation_id, conv_data["metadata"])
         conv_data["metadata"] = metadata
+        self._index_metadata(conversation_id, metadata)
 
         return Conversation(
             id=conv_data["id"],
@@ -252,7 +407,8 @@ class InMemoryConversationStore(ConversationStore):
         if conversation_id not in self._conversations:
             raise ValueError(f"Conversation {conversation_id} not found")
 
-        del self._conversations[conversation_id]
+        conv_data = self._conversations.pop(conversation_id)
+        self._unindex_metadata(conversation_id, conv_data["metadata"])
         # Cleanup item index
         self._item_index.pop(conversation_id, None)
 
@@ -318,6 +474,9 @@ class InMemoryConversationStore(ConversationStore):
             if conv_item.id:  # Guard against None
                 self._item_index[conversation_id][conv_item.id] = conv_item
 
+        # Convert the new messages once, so listing pages later does not have to
+        await self._sync_item_index(conv_data)
+
         return conv_items
 
     async def list_items(
@@ -329,116 +488,19 @@ class InMemoryConversationStore(ConversationStore):
         - Messages with text/images/files → Message
         - Function calls → ResponseFunctionToolCallItem
         - Function results → ResponseFunctionToolCallOutputItem
+
+        Messages are converted once and cached in a per-conversation index, so a page
+        only touches the requested slice of items.
         """
         conv_data = self._conversations.get(conversation_id)
         if not conv_data:
             raise ValueError(f"Conversation {conversation_id} not found")
 
-        thread: AgentThread = conv_data["thread"]
-
-        # Get messages from thread's message store
-        items: list[ConversationItem] = []
-        if thread.message_store:
-            af_messages = await thread.message_store.list_messages()
-
-            # Convert each AgentFramework ChatMessage to appropriate ConversationItem type(s)
-            for i, msg in enumerate(af_messages):
-                item_id = f"item_{i}"
-                role_str = msg.role.value if hasattr(msg.role, "value") else str(msg.role)
-                role = cast(MessageRole, role_str)  # Safe: Agent Framework roles match OpenAI roles
-
-                # Process each content item in the message
-                # A single ChatMessage may produce multiple ConversationItems
-                # (e.g., a message with both text and a function call)
-                message_contents: list[TextContent | ResponseInputImage | ResponseInputFile] = []
-                function_calls = []
-                function_results = []
-
-                for content in msg.contents:
-                    content_type = getattr(content, "type", None)
-
-                    if content_type == "text":
-                        # Text content for Message
-                        text_value = getattr(content, "text", "")
-                        message_contents.append(TextContent(type="text", text=text_value))
-
-                    elif content_type == "data":
-                        # Data content (images, files, PDFs)
-                        uri = getattr(content, "uri", "")
-                        media_type = getattr(content, "media_type", None)
-
-                        if media_type and media_type.startswith("image/"):
-                            # Convert to ResponseInputImage
-                            message_contents.append(
-                                ResponseInputImage(type="input_image", image_url=uri, detail="auto")
-                            )
-                        else:
-                            # Convert to ResponseInputFile
-                            # Extract filename from URI if possible
-                            filename = None
-                            if media_type == "application/pdf":
-                                filename = "document.pdf"
-
-                            message_contents.append(
-                                ResponseInputFile(type="input_file", file_url=uri, filename=filename)
-                            )
-
-                    elif content_type == "function_call":
-                        # Function call - create separate ConversationItem
-                        call_id = getattr(content, "call_id", None)
-                        name = getattr(content, "name", "")
-                        arguments = getattr(content, "arguments", "")
-
-                        if call_id and name:
-                            function_calls.append(
-                                ResponseFunctionToolCallItem(
-                                    id=f"{item_id}_call_{call_id}",
-                                    call_id=call_id,
-                                    name=name,
-                                    arguments=arguments,
-                                    type="function_call",
-                                    status="completed",
-                                )
-                            )
-
-                    elif content_type == "function_result":
-                        # Function result - create separate ConversationItem
-                        call_id = getattr(content, "call_id", None)
-                        # Output is stored in additional_properties
-                        output = ""
-                        if hasattr(content, "additional_properties"):
-                            output = content.additional_properties.get("output", "")
-
-                        if call_id:
-                            function_results.append(
-                                ResponseFunctionToolCallOutputItem(
-                                    id=f"{item_id}_result_{call_id}",
-                                    call_id=call_id,
-                                    output=output,
-                                    type="function_call_output",
-                                    status="completed",
-                                )
-                            )
-
-                # Create ConversationItems based on what we found
-                # If message has text/images/files, create a Message item
-                if message_contents:
-                    message = Message(
-                        id=item_id,
-                        type="message",
-                        role=role,  # type: ignore
-                        content=message_contents,  # type: ignore
-                        status="completed",
-                    )
-                    items.append(message)
-
-                # Add function call items
-                items.extend(function_calls)
-
-                # Add function result items
-                items.extend(function_results)
+        # Convert only the messages added since the last call
+        index = await self._sync_item_index(conv_data)
 
         # Include checkpoints from checkpoint storage as conversation items
+        checkpoint_items: list[ConversationItem] = []
         checkpoint_storage = conv_data.get("checkpoint_storage")
         if checkpoint_storage:
             # Get all checkpoints for this conversation
@@ -453,88 +515,135 @@ class InMemoryConversationStore(ConversationStore):
                     "timestamp": checkpoint.timestamp,
                     "status": "completed",
                 }
-                items.append(cast(ConversationItem, checkpoint_item))
+                checkpoint_items.append(cast(ConversationItem, checkpoint_item))
 
-        # Apply pagination
-        if order == "desc":
-            items = items[::-1]
+        # Paginate over message items followed by checkpoint items without materializing the whole list
+        message_items = index.items
+        total = len(message_items) + len(checkpoint_items)
 
-        start_idx = 0
+        def item_at(position: int) -> ConversationItem:
+            if position < len(message_items):
+                return message_items[position]
+            return checkpoint_items[position - len(message_items)]
+
+        # Position (in ascending order) of the cursor item, None if unknown
+        cursor: int | None = None
         if after:
-            # Find the index after the cursor
-            for i, item in enumerate(items):
-                if item.id == after:
-                    start_idx = i + 1
-                    break
+            cursor = index.positions.get(after)
+            if cursor is None:
+                checkpoint_ids = [item["id"] for item in checkpoint_items]  # type: ignore[index]
+                if after in checkpoint_ids:
+                    cursor = len(message_items) + checkpoint_ids.index(after)
 
-        paginated_items = items[start_idx : start_idx + limit]
-        has_more = len(items) > start_idx + limit
+        if order == "desc":
+            start_idx = total - 1 if cursor is None else cursor - 1
+            stop_idx = max(start_idx - limit, -1)
+            paginated_items = [item_at(i) for i in range(start_idx, stop_idx, -1)]
+            has_more = stop_idx > -1
+        else:
+            start_idx = 0 if cursor is None else cursor + 1
+            stop_idx = min(start_idx + limit, total)
+            paginated_items = [item_at(i) for i in range(start_idx, stop_idx)]
+            has_more = total > start_idx + limit
 
         return paginated_items, has_more
 
+    async def _sync_item_index(self, conv_data: dict[str, Any]) -> _ConversationItemIndex:
+        """Bring the conversation's item index up to date with its thread's messages."""
+        index: _ConversationItemIndex = conv_data["item_index"]
+        thread: AgentThread = conv_data["thread"]
+        if thread.message_store:
+            index.sync(await thread.message_store.list_messages())
+        return index
+
     def get_item(self, conversation_id: str, item_id: str) -> ConversationItem | None:
         """Get a specific conversation item by ID."""
-        # Use the item index for O(1) lookup
-        conv_items = self._item_index.get(conversation_id, {})
-        return conv_items.get(item_id)
+        # Use the item indexes for O(1) lookup
+        item = self._item_index.get(conversation_id, {}).get(item_id)
+        if item is not None:
+            return item
+        conv_data = self._conversations.get(conversation_id)
+        if not conv_data:
+            return None
+        index: _ConversationItemIndex = conv_data["item_index"]
+        position = index.positions.get(item_id)
+        return index.items[position] if position is not None else None
 
     def get_thread(self, conversation_id: str) -> AgentThread | None:
         """Get AgentThread for execution - CRITICAL for agent.run_stream()."""
         conv_data = self._conversations.get(conversation_id)
         return conv_data["thread"] if conv_data else None
 
+    def get_checkpoint_storage(self, conversation_id: str) -> InMemoryCheckpointStorage:
+        """Get the checkpoint storage for a specific conversation.
+
+        Raises:
+            ValueError: If conversation not found
+        """
+        conv_data = self._conversations.get(conversation_id)
+        if not conv_data:
+            raise ValueError(f"Conversation {conversation_id} not found")
+
+        checkpoint_storage = conv_data["checkpoint_storage"]
+        if not isinstance(checkpoint_storage, InMemoryCheckpointStorage):
+            raise TypeError(f"Expected InMemoryCheckpointStorage but got {type(checkpoint_storage)}")
+        return checkpoint_storage
+
     def list_conversations_by_metadata(self, metadata_filter: dict[str, str]) -> list[Conversation]:
         """Filter conversations by metadata (e.g., agent_id)."""
+        if metadata_filter:
+            # Intersect the metadata index entries, starting from the most selective one
+            candidate_sets = sorted(
+                (self._metadata_index.get((k, v), {}) for k, v in metadata_filter.items()),
+                key=len,
+            )
+            candidates = [
+                conv_id for conv_id in candidate_sets[0] if all(conv_id in other for other in candidate_sets[1:])
+            ]
+        else:
+            candidates = list(self._conversations)
+
         results = []
-        for conv_data in self._conversations.values():
-            conv_meta = conv_data.get("metadata", {})
-            # Check if all filter items match
-            if all(conv_meta.get(k) == v for k, v in metadata_filter.items()):
-                results.append(
-                    Conversation(
-                        id=conv_data["id"],
-                        object="conversation",
-                        created_at=conv_data["created_at"],
-                        metadata=conv_meta,
-                    )
+        for conv_id in candidates:
+            conv_data = self._conversations[conv_id]
+            results.append(
+                Conversation(
+                    id=conv_data["id"],
+                    object="conversation",
+                    created_at=conv_data["created_at"],
+                    metadata=conv_data.get("metadata", {}),
                 )
+            )
         return results
 
 
 class CheckpointConversationManager:
     """Manages checkpoint storage for workflow sessions - SESSION-SCOPED.
 
-    Simplified architecture: Each conversation has its own InMemoryCheckpointStorage
-    stored in conv_data["checkpoint_storage"]. This manager just retrieves it.
-    Session isolation comes from each conversation having a separate storage instance.
+    Simplified architecture: Each conversation has its own checkpoint storage, owned by
+    the conversation store (e.g. an InMemoryCheckpointStorage in conv_data["checkpoint_storage"]).
+    This manager just retrieves it. Session isolation comes from each conversation having
+    a separate storage instance.
     """
 
     def __init__(self, conversation_store: ConversationStore):
-        # Runtime validation since we need specific implementation details
-        if not isinstance(conversation_store, InMemoryConversationStore):
-            raise TypeError("CheckpointConversationManager currently requires InMemoryConversationStore")
-        self._store: InMemoryConversationStore = conversation_store
+        # Runtime validation since the store has to own per-conversation checkpoint storage
+        if not callable(getattr(conversation_store, "get_checkpoint_storage", None)):
+            raise TypeError("CheckpointConversationManager requires a store that implements get_checkpoint_storage")
+        self._store = conversation_store
         # Keep public reference for backward compatibility with tests
         self.conversation_store = conversation_store
 
-    def get_checkpoint_storage(self, conversation_id: str) -> InMemoryCheckpointStorage:
+    def get_checkpoint_storage(self, conversation_id: str) -> CheckpointStorage:
         """Get the checkpoint storage for a specific conversation.
 
         Args:
             conversation_id: Conversation ID
 
         Returns:
-            InMemoryCheckpointStorage instance for this conversation
+            Checkpoint storage instance for this conversation
 
         Raises:
             ValueError: If conversation not found
         """
-        # Access internal conversations dict (we know it's InMemoryConversationStore)
-        conv_data = self._store._conversations.get(conversation_id)
-        if not conv_data:
-            raise ValueError(f"Conversation {conversation_id} not found")
-
-        checkpoint_storage = conv_data["checkpoint_storage"]
-        if not isinstance(checkpoint_storage, InMemoryCheckpointStorage):
-            raise TypeError(f"Expected InMemoryCheckpointStorage but got {type(checkpoint_storage)}")
-        return checkpoint_storage
+        return self._store.get_checkpoint_storage(conversation_id)  # type: ignore[attr-defined, no-any-return]
@@ -362,7 +362,7 @@ class AgentFrameworkExecutor:
                         conversation_id=conversation_id,
                     )
 
-            # Get session-scoped checkpoint storage (InMemoryCheckpointStorage from conv_data)
+            # Get session-scoped checkpoint storage (owned by the conversation store)
             # Each conversation has its own storage instance, providing automatic session isolation.
             # This storage is passed to workflow.run_stream() which sets it as runtime override,
             # ensuring all checkpoint operations (save/load) use THIS conversation's storage.
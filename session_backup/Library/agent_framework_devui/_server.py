@@ -16,6 +16,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 
+from ._conversations import ConversationStore
 from ._deployment import DeploymentManager
 from ._discovery import EntityDiscovery
 from ._executor import AgentFrameworkExecutor
@@ -41,6 +42,7 @@ class DevServer:
         cors_origins: list[str] | None = None,
         ui_enabled: bool = True,
         mode: str = "developer",
+        conversation_store: ConversationStore | None = None,
     ) -> None:
         """Initialize the development server.
 
@@ -51,6 +53,7 @@ class DevServer:
             cors_origins: List of allowed CORS origins
             ui_enabled: Whether to enable the UI
             mode: Server mode - 'developer' (full access, verbose errors) or 'user' (restricted APIs, generic errors)
+            conversation_store: Optional conversation store (defaults to in-memory)
         """
         self.entities_dir = entities_dir
         self.port = port
@@ -65,6 +68,7 @@ class DevServer:
         self.cors_origins = cors_origins
         self.ui_enabled = ui_enabled
         self.mode = mode
+        self.conversation_store = conversation_store
         self.executor: AgentFrameworkExecutor | None = None
         self.openai_executor: OpenAIExecutor | None = None
         self.deployment_manager = DeploymentManager()
@@ -131,7 +135,7 @@ class DevServer:
             # Create components directly
             entity_discovery = EntityDiscovery(self.entities_dir)
             message_mapper = MessageMapper()
-            self.executor = AgentFrameworkExecutor(entity_discovery, message_mapper)
+            self.executor = AgentFrameworkExecutor(entity_discovery, message_mapper, self.conversation_store)
 
             # Discover entities from directory
             discovered_entities = await self.executor.discover_entities()
@@ -0,0 +1,606 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+"""SQLite-backed conversation storage for OpenAI Conversations API.
+
+Conversations, their messages, the ConversationItems converted from those messages and
+the per-conversation workflow checkpoints are stored in a local SQLite database, so the
+server survives restarts. Only a bounded number of AgentThread instances is kept
+hydrated in memory; evicted threads are rebuilt from the database on next access.
+
+The async methods run their database access in worker threads, so that reading or writing
+long conversations does not block the event loop. The methods that the ConversationStore
+interface defines as synchronous only run single row lookups and updates.
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, cast
+from weakref import WeakValueDictionary
+
+from agent_framework import AgentThread, ChatMessage, ChatMessageStore
+from agent_framework._workflows._checkpoint import WorkflowCheckpoint
+from openai.types.conversations import Conversation, ConversationDeletedResource
+from openai.types.conversations.conversation_item import ConversationItem
+from openai.types.conversations.message import Message
+from openai.types.conversations.text_content import TextContent
+from pydantic import TypeAdapter
+
+from ._conversations import CONVERSATION_ITEM_TYPE_CHECKPOINT, ConversationStore, MessageRole, _convert_message
+
+logger = logging.getLogger(__name__)
+
+_ITEM_ADAPTER: TypeAdapter[ConversationItem] = TypeAdapter(ConversationItem)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS conversations (
+    id TEXT PRIMARY KEY,
+    created_at INTEGER NOT NULL,
+    metadata TEXT NOT NULL,
+    service_thread_id TEXT
+);
+CREATE TABLE IF NOT EXISTS conversation_metadata (
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    conversation_id TEXT NOT NULL,
+    PRIMARY KEY (key, value, conversation_id)
+);
+CREATE INDEX IF NOT EXISTS conversation_metadata_conversation ON conversation_metadata (conversation_id);
+CREATE TABLE IF NOT EXISTS messages (
+    conversation_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    message TEXT NOT NULL,
+    PRIMARY KEY (conversation_id, position)
+);
+CREATE TABLE IF NOT EXISTS items (
+    conversation_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    item_id TEXT NOT NULL,
+    item TEXT NOT NULL,
+    PRIMARY KEY (conversation_id, position)
+);
+CREATE INDEX IF NOT EXISTS items_item_id ON items (conversation_id, item_id);
+CREATE TABLE IF NOT EXISTS added_items (
+    conversation_id TEXT NOT NULL,
+    item_id TEXT NOT NULL,
+    item TEXT NOT NULL,
+    PRIMARY KEY (conversation_id, item_id)
+);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    conversation_id TEXT NOT NULL,
+    checkpoint_id TEXT NOT NULL,
+    workflow_id TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    checkpoint TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS checkpoints_checkpoint_id ON checkpoints (conversation_id, checkpoint_id);
+CREATE INDEX IF NOT EXISTS checkpoints_workflow_id ON checkpoints (conversation_id, workflow_id);
+"""
+
+
+class _Database:
+    """A single SQLite connection shared between the event loop and worker threads."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = str(path)
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        if self.path != ":memory:":
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+
+    def execute(self, sql: str, parameters: Sequence[Any] = ()) -> list[tuple[Any, ...]]:
+        with self._lock:
+            return self._connection.execute(sql, parameters).fetchall()
+
+    def execute_update(self, sql: str, parameters: Sequence[Any] = ()) -> int:
+        with self._lock:
+            return self._connection.execute(sql, parameters).rowcount
+
+    def executemany(self, sql: str, parameters: Sequence[Sequence[Any]]) -> None:
+        with self.transaction() as connection:
+            connection.executemany(sql, parameters)
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._connection
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class SQLiteCheckpointStorage:
+    """Checkpoint storage for a single conversation, kept in the conversation store's database."""
+
+    def __init__(self, database: _Database, conversation_id: str) -> None:
+        """Initialize the checkpoint storage.
+
+        Args:
+            database: The database of the owning SQLiteConversationStore
+            conversation_id: Conversation ID the checkpoints are scoped to
+        """
+        self._db = database
+        self.conversation_id = conversation_id
+
+    async def save_checkpoint(self, checkpoint: WorkflowCheckpoint) -> str:
+        """Save a checkpoint and return its ID."""
+        data = json.dumps(checkpoint.to_dict(), ensure_ascii=False)
+        await asyncio.to_thread(
+            self._db.execute,
+            "INSERT INTO checkpoints (conversation_id, checkpoint_id, workflow_id, timestamp, checkpoint) "
+            "VALUES (?, ?, ?, ?, ?) ON CONFLICT (conversation_id, checkpoint_id) DO UPDATE SET "
+            "workflow_id = excluded.workflow_id, timestamp = excluded.timestamp, checkpoint = excluded.checkpoint",
+            (self.conversation_id, checkpoint.checkpoint_id, checkpoint.workflow_id, checkpoint.timestamp, data),
+        )
+        logger.debug(f"Saved checkpoint {checkpoint.checkpoint_id} to {self._db.path}")
+        return checkpoint.checkpoint_id
+
+    async def load_checkpoint(self, checkpoint_id: str) -> WorkflowCheckpoint | None:
+        """Load a checkpoint by ID."""
+        rows = await asyncio.to_thread(
+            self._db.execute,
+            "SELECT checkpoint FROM checkpoints WHERE conversation_id = ? AND checkpoint_id = ?",
+            (self.conversation_id, checkpoint_id),
+        )
+        if not rows:
+            return None
+        logger.debug(f"Loaded checkpoint {checkpoint_id} from {self._db.path}")
+        return WorkflowCheckpoint.from_dict(json.loads(rows[0][0]))
+
+    async def list_checkpoint_ids(self, workflow_id: str | None = None) -> list[str]:
+        """List checkpoint IDs. If workflow_id is provided, filter by that workflow."""
+        summaries = await asyncio.to_thread(self.list_checkpoint_summaries, workflow_id)
+        return [row[0] for row in summaries]
+
+    async def list_checkpoints(self, workflow_id: str | None = None) -> list[WorkflowCheckpoint]:
+        """List checkpoint objects. If workflow_id is provided, filter by that workflow."""
+        sql = "SELECT checkpoint FROM checkpoints WHERE conversation_id = ?"
+        parameters: list[Any] = [self.conversation_id]
+        if workflow_id is not None:
+            sql += " AND workflow_id = ?"
+            parameters.append(workflow_id)
+        rows = await asyncio.to_thread(self._db.execute, sql + " ORDER BY id", parameters)
+        return [WorkflowCheckpoint.from_dict(json.loads(row[0])) for row in rows]
+
+    async def delete_checkpoint(self, checkpoint_id: str) -> bool:
+        """Delete a checkpoint by ID."""
+        deleted = await asyncio.to_thread(
+            self._db.execute_update,
+            "DELETE FROM checkpoints WHERE conversation_id = ? AND checkpoint_id = ?",
+            (self.conversation_id, checkpoint_id),
+        )
+        if deleted:
+            logger.debug(f"Deleted checkpoint {checkpoint_id} from {self._db.path}")
+        return bool(deleted)
+
+    def list_checkpoint_summaries(self, workflow_id: str | None = None) -> list[tuple[str, str, str]]:
+        """List (checkpoint_id, workflow_id, timestamp) without loading the checkpoint state."""
+        sql = "SELECT checkpoint_id, workflow_id, timestamp FROM checkpoints WHERE conversation_id = ?"
+        parameters: list[Any] = [self.conversation_id]
+        if workflow_id is not None:
+            sql += " AND workflow_id = ?"
+            parameters.append(workflow_id)
+        return cast(list[tuple[str, str, str]], self._db.execute(sql + " ORDER BY id", parameters))
+
+
+class _SQLiteAgentThread(AgentThread):
+    """AgentThread that writes new messages and its service thread ID through to the store."""
+
+    def __init__(
+        self,
+        store: "SQLiteConversationStore",
+        conversation_id: str,
+        *,
+        service_thread_id: str | None = None,
+        message_store: ChatMessageStore | None = None,
+    ) -> None:
+        super().__init__(service_thread_id=service_thread_id, message_store=message_store)
+        self._store = store
+        self._conversation_id = conversation_id
+        # What has been written to the database, to tell appended messages from rewritten ones
+        self._persisted_service_thread_id = service_thread_id
+        self._persisted_count = len(message_store.messages) if message_store else 0
+        self._persisted_first: ChatMessage | None = message_store.messages[0] if self._persisted_count else None
+        self._persisted_last: ChatMessage | None = message_store.messages[-1] if self._persisted_count else None
+        self._persist_lock: asyncio.Lock | None = None
+
+    async def on_new_messages(self, new_messages: ChatMessage | Sequence[ChatMessage]) -> None:
+        await super().on_new_messages(new_messages)
+        await self.persist()
+
+    async def persist(self) -> None:
+        """Write the thread's state that is not in the database yet."""
+        if self._persist_lock is None:
+            self._persist_lock = asyncio.Lock()
+        # Writes run in worker threads; the lock keeps them in the order the messages were added
+        async with self._persist_lock:
+            if self.service_thread_id != self._persisted_service_thread_id:
+                service_thread_id = self.service_thread_id
+                await asyncio.to_thread(self._store._save_service_thread_id, self._conversation_id, service_thread_id)
+                self._persisted_service_thread_id = service_thread_id
+            if self.message_store is None:
+                return
+            messages = list(await self.message_store.list_messages())
+            rewritten = len(messages) < self._persisted_count or (
+                self._persisted_count > 0
+                and (
+                    messages[0] is not self._persisted_first
+                    or messages[self._persisted_count - 1] is not self._persisted_last
+                )
+            )
+            if rewritten:
+                # The history was rewritten (e.g. compacted) rather than appended to
+                await asyncio.to_thread(self._store._save_messages, self._conversation_id, messages, start=0)
+            elif len(messages) > self._persisted_count:
+                await asyncio.to_thread(
+                    self._store._save_messages, self._conversation_id, messages, start=self._persisted_count
+                )
+            self._persisted_count = len(messages)
+            self._persisted_first = messages[0] if messages else None
+            self._persisted_last = messages[-1] if messages else None
+
+
+class SQLiteConversationStore(ConversationStore):
+    """Conversation storage backed by a local SQLite database.
+
+    Conversations, messages, converted items and workflow checkpoints are persisted, so
+    conversations survive server restarts. Hydrated AgentThread instances are kept in an
+    LRU cache of at most ``max_hydrated_threads`` entries, which bounds memory regardless
+    of how many conversations are stored; evicted threads are rebuilt lazily on access.
+    An evicted thread that is still in use, e.g. by a running agent, is returned as-is
+    instead of being rebuilt, so a conversation never has two diverging threads.
+    """
+
+    def __init__(self, path: str | Path = "devui_conversations.db", *, max_hydrated_threads: int = 256) -> None:
+        """Initialize SQLite conversation storage.
+
+        Args:
+            path: Path of the SQLite database file, created if it does not exist.
+                Use ":memory:" for a non-persistent database.
+            max_hydrated_threads: Maximum number of AgentThread instances kept in memory.
+        """
+        if max_hydrated_threads < 1:
+            raise ValueError("max_hydrated_threads must be at least 1")
+        self._db = _Database(path)
+        self.max_hydrated_threads = max_hydrated_threads
+        self._threads: OrderedDict[str, _SQLiteAgentThread] = OrderedDict()
+        # Evicted threads that are still referenced elsewhere
+        self._evicted_threads: WeakValueDictionary[str, _SQLiteAgentThread] = WeakValueDictionary()
+
+    def close(self) -> None:
+        """Close the database connection and drop all hydrated threads."""
+        self._threads.clear()
+        self._evicted_threads.clear()
+        self._db.close()
+
+    def _row_to_conversation(self, row: tuple[Any, ...]) -> Conversation:
+        return Conversation(id=row[0], object="conversation", created_at=row[1], metadata=json.loads(row[2]))
+
+    def _exists(self, conversation_id: str) -> bool:
+        return bool(self._db.execute("SELECT 1 FROM conversations WHERE id = ?", (conversation_id,)))
+
+    def create_conversation(
+        self, metadata: dict[str, str] | None = None, conversation_id: str | None = None
+    ) -> Conversation:
+        """Create a new conversation with underlying AgentThread and checkpoint storage."""
+        conv_id = conversation_id or f"conv_{uuid.uuid4().hex}"
+        created_at = int(time.time())
+
+        with self._db.transaction() as connection:
+            # Re-creating an existing conversation starts it over, like the in-memory store
+            self._delete_rows(connection, conv_id)
+            connection.execute(
+                "INSERT INTO conversations (id, created_at, metadata) VALUES (?, ?, ?)",
+                (conv_id, created_at, json.dumps(metadata or {})),
+            )
+            connection.executemany(
+                "INSERT INTO conversation_metadata (key, value, conversation_id) VALUES (?, ?, ?)",
+                [(key, value, conv_id) for key, value in (metadata or {}).items()],
+            )
+        self._threads.pop(conv_id, None)
+        self._evicted_threads.pop(conv_id, None)
+
+        return Conversation(id=conv_id, object="conversation", created_at=created_at, metadata=metadata)
+
+    def get_conversation(self, conversation_id: str) -> Conversation | None:
+        """Retrieve conversation metadata."""
+        rows = self._db.execute("SELECT id, created_at, metadata FROM conversations WHERE id = ?", (conversation_id,))
+        return self._row_to_conversation(rows[0]) if rows else None
+
+    def update_conversation(self, conversation_id: str, metadata: dict[str, str]) -> Conversation:
+        """Update conversation metadata."""
+        with self._db.transaction() as connection:
+            updated = connection.execute(
+                "UPDATE conversations SET metadata = ? WHERE id = ?", (json.dumps(metadata), conversation_id)
+            ).rowcount
+            if not updated:
+                raise ValueError(f"Conversation {conversation_id} not found")
+            connection.execute("DELETE FROM conversation_metadata WHERE conversation_id = ?", (conversation_id,))
+            connection.executemany(
+                "INSERT INTO conversation_metadata (key, value, conversation_id) VALUES (?, ?, ?)",
+                [(key, value, conversation_id) for key, value in metadata.items()],
+            )
+            created_at = connection.execute(
+                "SELECT created_at FROM conversations WHERE id = ?", (conversation_id,)
+            ).fetchone()[0]
+
+        return Conversation(id=conversation_id, object="conversation", created_at=created_at, metadata=metadata)
+
+    def delete_conversation(self, conversation_id: str) -> ConversationDeletedResource:
+        """Delete conversation, its messages, items, checkpoints and hydrated AgentThread."""
+        with self._db.transaction() as connection:
+            if not self._delete_rows(connection, conversation_id):
+                raise ValueError(f"Conversation {conversation_id} not found")
+        self._threads.pop(conversation_id, None)
+        self._evicted_threads.pop(conversation_id, None)
+
+        return ConversationDeletedResource(id=conversation_id, object="conversation.deleted", deleted=True)
+
+    def _delete_rows(self, connection: sqlite3.Connection, conversation_id: str) -> bool:
+        for table in ("conversation_metadata", "messages", "items", "added_items", "checkpoints"):
+            connection.execute(f"DELETE FROM {table} WHERE conversation_id = ?", (conversation_id,))  # noqa: S608
+        return bool(connection.execute("DELETE FROM conversations WHERE id = ?", (conversation_id,)).rowcount)
+
+    async def add_items(self, conversation_id: str, items: list[dict[str, Any]]) -> list[ConversationItem]:
+        """Add items to conversation and sync to AgentThread."""
+        thread = await self._aget_thread(conversation_id)
+        if thread is None:
+            raise ValueError(f"Conversation {conversation_id} not found")
+
+        # Convert items to ChatMessages and add to thread (which writes them through)
+        chat_messages = []
+        for item in items:
+            role = item.get("role", "user")
+            content = item.get("content", [])
+            text = content[0].get("text", "") if content else ""
+            chat_messages.append(ChatMessage(role=role, contents=[{"type": "text", "text": text}]))
+        await thread.on_new_messages(chat_messages)
+
+        conv_items: list[ConversationItem] = []
+        for msg in chat_messages:
+            role_str = msg.role.value if hasattr(msg.role, "value") else str(msg.role)
+            message_content = [
+                TextContent(type="text", text=getattr(content_item, "text", ""))
+                for content_item in msg.contents
+                if getattr(content_item, "type", None) == "text"
+            ]
+            conv_items.append(
+                Message(
+                    id=f"item_{uuid.uuid4().hex}",
+                    type="message",
+                    role=cast(MessageRole, role_str),
+                    content=message_content,  # type: ignore[arg-type]
+                    status="completed",
+                )
+            )
+
+        # Keep the returned items addressable by id through get_item
+        await asyncio.to_thread(
+            self._db.executemany,
+            "INSERT OR REPLACE INTO added_items (conversation_id, item_id, item) VALUES (?, ?, ?)",
+            [(conversation_id, item.id, item.model_dump_json()) for item in conv_items],
+        )
+
+        return conv_items
+
+    async def list_items(
+        self, conversation_id: str, limit: int = 100, after: str | None = None, order: str = "asc"
+    ) -> tuple[list[ConversationItem], bool]:
+        """List conversation items followed by the conversation's checkpoints.
+
+        Items are read from the indexed items table, so listing neither hydrates the
+        AgentThread nor converts messages; a page only reads the requested rows.
+        """
+        return await asyncio.to_thread(self._list_items, conversation_id, limit, after, order)
+
+    def _list_items(
+        self, conversation_id: str, limit: int, after: str | None, order: str
+    ) -> tuple[list[ConversationItem], bool]:
+        if not self._exists(conversation_id):
+            raise ValueError(f"Conversation {conversation_id} not found")
+
+        message_total = self._db.execute(
+            "SELECT COUNT(*) FROM items WHERE conversation_id = ?", (conversation_id,)
+        )[0][0]
+        checkpoint_items: list[ConversationItem] = [
+            cast(
+                ConversationItem,
+                {
+                    "id": f"checkpoint_{checkpoint_id}",
+                    "type": CONVERSATION_ITEM_TYPE_CHECKPOINT,
+                    "checkpoint_id": checkpoint_id,
+                    "workflow_id": workflow_id,
+                    "timestamp": timestamp,
+                    "status": "completed",
+                },
+            )
+            for checkpoint_id, workflow_id, timestamp in self.get_checkpoint_storage(
+                conversation_id
+            ).list_checkpoint_summaries()
+        ]
+        total = message_total + len(checkpoint_items)
+
+        # Position (in ascending order) of the cursor item, None if unknown
+        cursor: int | None = None
+        if after:
+            rows = self._db.execute(
+                "SELECT MIN(position) FROM items WHERE conversation_id = ? AND item_id = ?", (conversation_id, after)
+            )
+            cursor = rows[0][0]
+            if cursor is None:
+                checkpoint_ids = [item["id"] for item in checkpoint_items]  # type: ignore[index]
+                if after in checkpoint_ids:
+                    cursor = message_total + checkpoint_ids.index(after)
+
+        if order == "desc":
+            start_idx = total - 1 if cursor is None else cursor - 1
+            stop_idx = max(start_idx - limit, -1)
+            low, high = stop_idx + 1, start_idx + 1
+            has_more = stop_idx > -1
+        else:
+            low = 0 if cursor is None else cursor + 1
+            high = min(low + limit, total)
+            has_more = total > low + limit
+
+        page: list[ConversationItem] = []
+        if low < min(high, message_total):
+            rows = self._db.execute(
+                "SELECT item FROM items WHERE conversation_id = ? AND position >= ? AND position < ? "
+                "ORDER BY position",
+                (conversation_id, low, min(high, message_total)),
+            )
+            page.extend(_ITEM_ADAPTER.validate_json(row[0]) for row in rows)
+        page.extend(checkpoint_items[max(low - message_total, 0) : max(high - message_total, 0)])
+        if order == "desc":
+            page.reverse()
+
+        return page, has_more
+
+    def get_item(self, conversation_id: str, item_id: str) -> ConversationItem | None:
+        """Get a specific conversation item by ID."""
+        rows = self._db.execute(
+            "SELECT item FROM added_items WHERE conversation_id = ? AND item_id = ?", (conversation_id, item_id)
+        ) or self._db.execute(
+            "SELECT item FROM items WHERE conversation_id = ? AND item_id = ? ORDER BY position LIMIT 1",
+            (conversation_id, item_id),
+        )
+        return _ITEM_ADAPTER.validate_json(rows[0][0]) if rows else None
+
+    def get_thread(self, conversation_id: str) -> AgentThread | None:
+        """Get AgentThread for execution, rebuilding it from the database if it was evicted."""
+        thread = self._cached_thread(conversation_id)
+        if thread is not None:
+            return thread
+        state = self._load_thread_state(conversation_id)
+        return self._hydrate_thread(conversation_id, *state) if state is not None else None
+
+    async def _aget_thread(self, conversation_id: str) -> _SQLiteAgentThread | None:
+        """Get the conversation's thread, reading an evicted one from the database in a worker thread."""
+        thread = self._cached_thread(conversation_id)
+        if thread is not None:
+            return thread
+        state = await asyncio.to_thread(self._load_thread_state, conversation_id)
+        if state is None:
+            return None
+        # Another task may have hydrated the thread in the meantime
+        return self._cached_thread(conversation_id) or self._hydrate_thread(conversation_id, *state)
+
+    def _cached_thread(self, conversation_id: str) -> _SQLiteAgentThread | None:
+        thread = self._threads.get(conversation_id)
+        if thread is not None:
+            self._threads.move_to_end(conversation_id)
+            return thread
+        thread = self._evicted_threads.pop(conversation_id, None)
+        if thread is not None:
+            # Still in use since it was evicted: keep using it rather than a second copy
+            self._cache_thread(conversation_id, thread)
+        return thread
+
+    def _load_thread_state(self, conversation_id: str) -> tuple[str | None, list[ChatMessage]] | None:
+        """Read the service thread ID and, for local threads, the messages of a conversation."""
+        rows = self._db.execute("SELECT service_thread_id FROM conversations WHERE id = ?", (conversation_id,))
+        if not rows:
+            return None
+        service_thread_id = rows[0][0]
+        if service_thread_id is not None:
+            return service_thread_id, []
+        messages = [
+            ChatMessage.from_json(row[0])
+            for row in self._db.execute(
+                "SELECT message FROM messages WHERE conversation_id = ? ORDER BY position", (conversation_id,)
+            )
+        ]
+        return None, messages
+
+    def _hydrate_thread(
+        self, conversation_id: str, service_thread_id: str | None, messages: list[ChatMessage]
+    ) -> _SQLiteAgentThread:
+        thread = _SQLiteAgentThread(
+            self,
+            conversation_id,
+            service_thread_id=service_thread_id,
+            message_store=ChatMessageStore(messages) if messages else None,
+        )
+        self._cache_thread(conversation_id, thread)
+        return thread
+
+    def _cache_thread(self, conversation_id: str, thread: _SQLiteAgentThread) -> None:
+        self._threads[conversation_id] = thread
+        while len(self._threads) > self.max_hydrated_threads:
+            # Evicted threads have nothing left to write: their changes are written through
+            evicted_id, evicted = self._threads.popitem(last=False)
+            self._evicted_threads[evicted_id] = evicted
+            logger.debug(f"Evicted thread of conversation {evicted_id} from memory")
+
+    def list_conversations_by_metadata(self, metadata_filter: dict[str, str]) -> list[Conversation]:
+        """Filter conversations by metadata (e.g., agent_id)."""
+        sql = "SELECT id, created_at, metadata FROM conversations"
+        parameters: list[str] = []
+        if metadata_filter:
+            sql += " WHERE " + " AND ".join(
+                "id IN (SELECT conversation_id FROM conversation_metadata WHERE key = ? AND value = ?)"
+                for _ in metadata_filter
+            )
+            for key, value in metadata_filter.items():
+                parameters.extend((key, value))
+        rows = self._db.execute(sql + " ORDER BY rowid", parameters)
+        return [self._row_to_conversation(row) for row in rows]
+
+    def get_checkpoint_storage(self, conversation_id: str) -> SQLiteCheckpointStorage:
+        """Get the checkpoint storage for a specific conversation.
+
+        Raises:
+            ValueError: If conversation not found
+        """
+        if not self._exists(conversation_id):
+            raise ValueError(f"Conversation {conversation_id} not found")
+        return SQLiteCheckpointStorage(self._db, conversation_id)
+
+    def _save_service_thread_id(self, conversation_id: str, service_thread_id: str | None) -> None:
+        self._db.execute_update(
+            "UPDATE conversations SET service_thread_id = ? WHERE id = ?", (service_thread_id, conversation_id)
+        )
+
+    def _save_messages(self, conversation_id: str, messages: Sequence[ChatMessage], *, start: int) -> None:
+        """Write messages[start:] and their converted items, replacing whatever was stored from there on."""
+        with self._db.transaction() as connection:
+            connection.execute(
+                "DELETE FROM messages WHERE conversation_id = ? AND position >= ?", (conversation_id, start)
+            )
+            if start == 0:
+                connection.execute("DELETE FROM items WHERE conversation_id = ?", (conversation_id,))
+            item_position = connection.execute(
+                "SELECT COALESCE(MAX(position) + 1, 0) FROM items WHERE conversation_id = ?", (conversation_id,)
+            ).fetchone()[0]
+            message_rows = []
+            item_rows = []
+            for position in range(start, len(messages)):
+                message = messages[position]
+                message_rows.append((conversation_id, position, message.to_json()))
+                for item in _convert_message(message, f"item_{position}"):
+                    item_rows.append((conversation_id, item_position, item.id, item.model_dump_json()))
+                    item_position += 1
+            connection.executemany(
+                "INSERT INTO messages (conversation_id, position, message) VALUES (?, ?, ?)", message_rows
+            )
+            connection.executemany(
+                "INSERT INTO items (conversation_id, position, item_id, item) VALUES (?, ?, ?, ?)", item_rows
+            )
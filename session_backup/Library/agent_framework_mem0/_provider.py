@@ -1,11 +1,16 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
+import hashlib
 import sys
+import time
 from collections.abc import MutableSequence, Sequence
 from contextlib import AbstractAsyncContextManager
 from typing import Any
+from weakref import WeakKeyDictionary
 
 from agent_framework import ChatMessage, Context, ContextProvider
+from agent_framework._logging import get_logger
 from agent_framework.exceptions import ServiceInitializationError
 from mem0 import AsyncMemory, AsyncMemoryClient
 
@@ -28,6 +33,11 @@ class MemorySearchResponse_v1_1(TypedDict):
 
 MemorySearchResponse_v2 = list[dict[str, Any]]
 
+logger = get_logger()
+
+# Scope of a buffered add: (user_id, agent_id, run_id, application_id)
+_AddScope = tuple[str | None, str | None, str | None, str | None]
+
 
 class Mem0Provider(ContextProvider):
     """Mem0 Context Provider."""
@@ -42,6 +52,12 @@ class Mem0Provider(ContextProvider):
         user_id: str | None = None,
         scope_to_per_operation_thread_id: bool = False,
         context_prompt: str = ContextProvider.DEFAULT_CONTEXT_PROMPT,
+        *,
+        write_behind: bool = False,
+        write_batch_size: int = 20,
+        write_flush_interval: float = 1.0,
+        search_cache_ttl: float = 300.0,
+        prefetch_query: str | None = None,
     ) -> None:
         """Initializes a new instance of the Mem0Provider class.
 
@@ -55,6 +71,20 @@ class Mem0Provider(ContextProvider):
             user_id: The user ID for scoping memories or None.
             scope_to_per_operation_thread_id: Whether to scope memories to per-operation thread ID.
             context_prompt: The prompt to prepend to retrieved memories.
+
+        Keyword Args:
+            write_behind: Buffer the messages from ``invoked`` and add them in the background, batched per
+                user/agent/thread scope, instead of awaiting ``mem0_client.add`` after every run. The buffer
+                is flushed when it holds ``write_batch_size`` messages, ``write_flush_interval`` seconds
+                after the first buffered message, on ``flush()``, on ``aclose()``, when the outermost ``async with``
+                exits and when the event loop shuts down.
+            write_batch_size: Number of buffered messages that triggers a flush.
+            write_flush_interval: Seconds after which buffered messages are flushed.
+            search_cache_ttl: Seconds that search results are cached per thread and query; the cache of a
+                thread is cleared whenever memories are added for it. 0 disables the cache.
+            prefetch_query: When set, a speculative search with this query is started once per thread, when the
+                thread is created or the provider is entered, and an ``invoking`` of the thread with the same
+                query uses its results instead of a serial search of its own.
         """
         should_close_client = False
         if mem0_client is None:
@@ -71,18 +101,64 @@ class Mem0Provider(ContextProvider):
         self.mem0_client = mem0_client
         self._per_operation_thread_id: str | None = None
         self._should_close_client = should_close_client
+        self.write_behind = write_behind
+        self.write_batch_size = max(int(write_batch_size), 1)
+        self.write_flush_interval = write_flush_interval
+        self.search_cache_ttl = search_cache_ttl
+        self.prefetch_query = prefetch_query
+        self._pending_adds: dict[_AddScope, list[dict[str, str]]] = {}
+        self._pending_count = 0
+        self._flush_task: asyncio.Task[None] | None = None
+        self._flush_locks: WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = WeakKeyDictionary()
+        self._search_cache: dict[tuple[str | None, str], tuple[float, asyncio.Task[list[dict[str, Any]]]]] = {}
+        self._prefetch: tuple[tuple[str | None, str], asyncio.Task[list[dict[str, Any]]]] | None = None
+        self._prefetched_run_ids: set[str | None] = set()
+        self._context_depth = 0
 
     async def __aenter__(self) -> "Self":
-        """Async context manager entry."""
-        if self.mem0_client and isinstance(self.mem0_client, AbstractAsyncContextManager):
+        """Async context manager entry, the client is entered by the outermost entry only."""
+        if self._context_depth == 0 and self.mem0_client and isinstance(self.mem0_client, AbstractAsyncContextManager):
             await self.mem0_client.__aenter__()
+        self._context_depth += 1
+        self._start_prefetch()
         return self
 
     async def __aexit__(self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: Any) -> None:
-        """Async context manager exit."""
+        """Async context manager exit.
+
+        Only the outermost exit adds the memories buffered in write-behind mode and closes a client created
+        by the provider, see ``ContextProvider`` for how per-run exits are handled.
+        """
+        self._context_depth = max(self._context_depth - 1, 0)
+        if self._context_depth > 0:
+            return
+        if self.write_behind:
+            await self.aclose()
+            return
         if self._should_close_client and self.mem0_client and isinstance(self.mem0_client, AbstractAsyncContextManager):
             await self.mem0_client.__aexit__(exc_type, exc_val, exc_tb)
 
+    async def aclose(self) -> None:
+        """Adds the memories buffered in write-behind mode and stops the background flush.
+
+        In write-behind mode a client created by the provider is closed as well, unless the provider is still
+        entered, in which case the outermost exit closes it.
+        """
+        try:
+            await self.flush()
+        finally:
+            if self._flush_task is not None:
+                self._flush_task.cancel()
+                self._flush_task = None
+            if (
+                self.write_behind
+                and self._context_depth == 0
+                and self._should_close_client
+                and self.mem0_client
+                and isinstance(self.mem0_client, AbstractAsyncContextManager)
+            ):
+                await self.mem0_client.__aexit__(None, None, None)
+
     async def thread_created(self, thread_id: str | None = None) -> None:
         """Called when a new thread is created.
 
@@ -91,6 +167,151 @@ class Mem0Provider(ContextProvider):
         """
         self._validate_per_operation_thread_id(thread_id)
         self._per_operation_thread_id = self._per_operation_thread_id or thread_id
+        self._start_prefetch()
+
+    def _start_prefetch(self) -> None:
+        """Start the speculative search of ``prefetch_query``, once per thread."""
+        run_id = self._run_id
+        if not self.prefetch_query or run_id in self._prefetched_run_ids:
+            return
+        try:
+            self._validate_filters()
+        except ServiceInitializationError:
+            return
+        # Speculatively fetch memories so a turn asking the same query does not wait for a search
+        self._prefetched_run_ids.add(run_id)
+        prefetch = asyncio.create_task(self._search(self.prefetch_query, run_id))
+        # A prefetch that is never used must not log its failure as unretrieved
+        prefetch.add_done_callback(lambda task: task.cancelled() or task.exception())
+        self._prefetch = (self._search_key(run_id, self.prefetch_query), prefetch)
+
+    @staticmethod
+    def _search_key(run_id: str | None, query: str) -> tuple[str | None, str]:
+        """Key of cached and speculative searches: the thread and the hash of the query."""
+        return (run_id, hashlib.sha256(query.encode("utf-8")).hexdigest())
+
+    def _get_flush_lock(self) -> asyncio.Lock:
+        """Get the lock serializing flushes, created lazily for the running event loop."""
+        loop = asyncio.get_running_loop()
+        lock = self._flush_locks.get(loop)
+        if lock is None:
+            lock = self._flush_locks[loop] = asyncio.Lock()
+        return lock
+
+    @property
+    def _run_id(self) -> str | None:
+        """The Mem0 run id, the per-operation thread id when scoped to it, otherwise the thread id."""
+        return self._per_operation_thread_id if self.scope_to_per_operation_thread_id else self.thread_id
+
+    async def _search(self, query: str, run_id: str | None) -> list[dict[str, Any]]:
+        """Search memories and normalize the response of the different Mem0 API versions to a list."""
+        search_response: MemorySearchResponse_v1_1 | MemorySearchResponse_v2 = await self.mem0_client.search(  # type: ignore[misc]
+            query=query,
+            user_id=self.user_id,
+            agent_id=self.agent_id,
+            run_id=run_id,
+        )
+
+        # Depending on the API version, the response schema varies slightly
+        if isinstance(search_response, list):
+            return search_response
+        if isinstance(search_response, dict) and "results" in search_response:
+            return search_response["results"]
+        # Fallback for unexpected schema - return response as text as-is
+        return [search_response]
+
+    async def _cached_search(self, query: str) -> list[dict[str, Any]]:
+        """Search memories, sharing results (and in-flight searches) per thread and query hash."""
+        run_id = self._run_id
+        key = self._search_key(run_id, query)
+        if self._prefetch is not None and self._prefetch[0] == key:
+            # A turn asking the prefetched query uses the speculative search instead of starting its own
+            _, prefetch = self._prefetch
+            self._prefetch = None
+            try:
+                return await prefetch
+            except Exception as ex:
+                logger.debug(f"Speculative Mem0 search failed, searching again: {ex}")
+        if self.search_cache_ttl <= 0:
+            return await self._search(query, run_id)
+
+        now = time.monotonic()
+        entry = self._search_cache.get(key)
+        if entry is None or entry[0] <= now:
+            entry = (now + self.search_cache_ttl, asyncio.create_task(self._search(query, run_id)))
+            self._search_cache[key] = entry
+        try:
+            return await asyncio.shield(entry[1])
+        except Exception:
+            if self._search_cache.get(key) is entry:
+                del self._search_cache[key]
+            raise
+
+    def _invalidate_search_cache(self, run_id: str | None) -> None:
+        """Drop cached searches of a thread after memories were added to it."""
+        for key in [key for key in self._search_cache if key[0] == run_id]:
+            del self._search_cache[key]
+        if self._prefetch is not None and self._prefetch[0][0] == run_id:
+            self._prefetch[1].cancel()
+            self._prefetch = None
+
+    def _schedule_flush(self, delay: float) -> None:
+        """Start a background flush after the delay, unless one is already scheduled."""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_after(delay))
+
+    async def _flush_after(self, delay: float) -> None:
+        """Background flush, logging instead of raising failures since nobody awaits it."""
+        try:
+            while True:
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                try:
+                    await self._flush_pending()
+                except Exception as ex:
+                    logger.warning(f"Mem0Provider failed to add buffered memories: {ex}")
+                    return
+                if not self._pending_adds:
+                    return
+                # Messages were buffered while flushing
+                delay = 0 if self._pending_count >= self.write_batch_size else self.write_flush_interval
+        except asyncio.CancelledError:
+            # Cancelled by aclose() or ``invoked`` once the flush is taken over, or by the event loop shutting down
+            try:
+                await self._flush_pending()
+            except Exception as ex:
+                logger.warning(f"Mem0Provider failed to add buffered memories: {ex}")
+            raise
+
+    async def _flush_pending(self) -> None:
+        """Add all buffered messages, one ``add`` call per scope."""
+        async with self._get_flush_lock():
+            pending, self._pending_adds = self._pending_adds, {}
+            self._pending_count = 0
+            while pending:
+                scope, messages = next(iter(pending.items()))
+                user_id, agent_id, run_id, application_id = scope
+                try:
+                    await self.mem0_client.add(  # type: ignore[misc]
+                        messages=messages,
+                        user_id=user_id,
+                        agent_id=agent_id,
+                        run_id=run_id,
+                        metadata={"application_id": application_id},
+                    )
+                except BaseException:
+                    # Put the messages that were not added back in front of anything buffered meanwhile
+                    for buffered_scope, buffered in self._pending_adds.items():
+                        pending.setdefault(buffered_scope, []).extend(buffered)
+                    self._pending_adds = pending
+                    self._pending_count = sum(len(buffered) for buffered in pending.values())
+                    raise
+                del pending[scope]
+                self._invalidate_search_cache(run_id)
+
+    async def flush(self) -> None:
+        """Add all memories buffered in write-behind mode and wait for them to be stored."""
+        await self._flush_pending()
 
     @override
     async def invoked(
@@ -120,14 +341,30 @@ class Mem0Provider(ContextProvider):
             if message.role.value in {"user", "assistant", "system"} and message.text and message.text.strip()
         ]
 
-        if messages:
-            await self.mem0_client.add(  # type: ignore[misc]
-                messages=messages,
-                user_id=self.user_id,
-                agent_id=self.agent_id,
-                run_id=self._per_operation_thread_id if self.scope_to_per_operation_thread_id else self.thread_id,
-                metadata={"application_id": self.application_id},
-            )
+        if not messages:
+            return
+        run_id = self._run_id
+        if self.write_behind:
+            scope = (self.user_id, self.agent_id, run_id, self.application_id)
+            self._pending_adds.setdefault(scope, []).extend(messages)
+            self._pending_count += len(messages)
+            if self._pending_count >= self.write_batch_size:
+                if self._flush_task is not None and not self._flush_task.done() and not self._get_flush_lock().locked():
+                    # Replace the timed flush with an immediate one
+                    self._flush_task.cancel()
+                    self._flush_task = None
+                self._schedule_flush(0)
+            else:
+                self._schedule_flush(self.write_flush_interval)
+            return
+        await self.mem0_client.add(  # type: ignore[misc]
+            messages=messages,
+            user_id=self.user_id,
+            agent_id=self.agent_id,
+            run_id=run_id,
+            metadata={"application_id": self.application_id},
+        )
+        self._invalidate_search_cache(run_id)
 
     @override
     async def invoking(self, messages: ChatMessage | MutableSequence[ChatMessage], **kwargs: Any) -> Context:
@@ -146,21 +383,7 @@ class Mem0Provider(ContextProvider):
         messages_list = [messages] if isinstance(messages, ChatMessage) else list(messages)
         input_text = "\n".join(msg.text for msg in messages_list if msg and msg.text and msg.text.strip())
 
-        search_response: MemorySearchResponse_v1_1 | MemorySearchResponse_v2 = await self.mem0_client.search(  # type: ignore[misc]
-            query=input_text,
-            user_id=self.user_id,
-            agent_id=self.agent_id,
-            run_id=self._per_operation_thread_id if self.scope_to_per_operation_thread_id else self.thread_id,
-        )
-
-        # Depending on the API version, the response schema varies slightly
-        if isinstance(search_response, list):
-            memories = search_response
-        elif isinstance(search_response, dict) and "results" in search_response:
-            memories = search_response["results"]
-        else:
-            # Fallback for unexpected schema - return response as text as-is
-            memories = [search_response]
+        memories = await self._cached_search(input_text)
 
         line_separated_memories = "\n".join(memory.get("memory", "") for memory in memories)
 
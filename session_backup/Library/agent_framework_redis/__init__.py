@@ -3,6 +3,7 @@ import importlib.metadata
 
 from ._chat_message_store import RedisChatMessageStore
 from ._provider import RedisProvider
+from ._tool_result_cache import RedisToolResultCache
 
 try:
     __version__ = importlib.metadata.version(__name__)
@@ -12,5 +13,6 @@ except importlib.metadata.PackageNotFoundError:
 __all__ = [
     "RedisChatMessageStore",
     "RedisProvider",
+    "RedisToolResultCache",
     "__version__",
 ]
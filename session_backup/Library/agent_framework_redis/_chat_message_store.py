@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections import deque
+from collections.abc import Callable, Sequence
 from typing import Any
 from uuid import uuid4
 
 import redis.asyncio as redis
-from agent_framework import ChatMessage
+from agent_framework import ChatMessage, Role
 from agent_framework._serialization import SerializationMixin
 
 
@@ -20,12 +21,83 @@ class RedisStoreState(SerializationMixin):
         redis_url: str | None = None,
         key_prefix: str = "chat_messages",
         max_messages: int | None = None,
+        max_read_messages: int | None = None,
+        max_read_tokens: int | None = None,
+        cache_messages: bool = False,
     ) -> None:
         """State model for serializing and deserializing Redis chat message store data."""
         self.thread_id = thread_id
         self.redis_url = redis_url
         self.key_prefix = key_prefix
         self.max_messages = max_messages
+        self.max_read_messages = max_read_messages
+        self.max_read_tokens = max_read_tokens
+        self.cache_messages = cache_messages
+
+
+# Returns the list state and every message appended since the caller's cached sequence number in one
+# atomic round-trip. When the epoch changed (non-append mutation) or the caller's cache is too far behind,
+# the most recent `limit` messages are returned instead and `reset` is 1.
+_READ_TAIL_SCRIPT = """
+local meta = redis.call('HMGET', KEYS[2], 'seq', 'epoch')
+local seq = tonumber(meta[1]) or 0
+local epoch = tonumber(meta[2]) or 0
+local length = redis.call('LLEN', KEYS[1])
+local cached_seq = tonumber(ARGV[1])
+local cached_epoch = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+local count = length
+local reset = 1
+if cached_seq >= 0 and epoch == cached_epoch and seq >= cached_seq and seq - cached_seq <= length then
+    count = seq - cached_seq
+    reset = 0
+end
+if limit >= 0 and count > limit then
+    count = limit
+    reset = 1
+end
+local items = {}
+if count > 0 then
+    items = redis.call('LRANGE', KEYS[1], -count, -1)
+end
+return {seq, epoch, length, reset, items}
+"""
+
+# Replaces the contiguous span ARGV[3..] with ARGV[2] if it is still stored unchanged, using ARGV[1] as a
+# tombstone for the LREM of the surplus elements. Returns 1 on success and 0 if the span was not found.
+_REPLACE_SPAN_SCRIPT = """
+local span = #ARGV - 2
+local start = redis.call('LPOS', KEYS[1], ARGV[3])
+if not start then
+    return 0
+end
+local stored = redis.call('LRANGE', KEYS[1], start, start + span - 1)
+if #stored ~= span then
+    return 0
+end
+for i = 1, span do
+    if stored[i] ~= ARGV[i + 2] then
+        return 0
+    end
+end
+for i = 1, span - 1 do
+    redis.call('LSET', KEYS[1], start + i, ARGV[1])
+end
+redis.call('LSET', KEYS[1], start, ARGV[2])
+if span > 1 then
+    redis.call('LREM', KEYS[1], span - 1, ARGV[1])
+end
+redis.call('HINCRBY', KEYS[2], 'epoch', 1)
+return 1
+"""
+
+# Number of older messages fetched per round-trip when a token budget reaches past the cached tail.
+_BACKFILL_CHUNK_SIZE = 32
+
+
+def _estimate_tokens(serialized_message: str) -> int:
+    """Rough token estimate for a serialized message (about four characters per token)."""
+    return max(1, len(serialized_message) // 4)
 
 
 class RedisChatMessageStore:
@@ -50,6 +122,14 @@ class RedisChatMessageStore:
     - LRANGE: Retrieve messages in chronological order
     - LTRIM: Maintain message limits by trimming old messages
     - DELETE: Clear all messages for a thread
+
+    Windowed Reads:
+    Set ``max_read_messages`` and/or ``max_read_tokens`` to have ``list_messages`` return only the
+    most recent part of the conversation, and ``cache_messages=True`` to keep a decoded tail of the
+    list in process. Every write made through the store bumps a sequence/epoch pair kept in a
+    companion hash (see ``meta_key``), so a cached tail is validated and extended with only the
+    newly appended messages in a single round-trip. Writes made to the list directly (outside this
+    class) are not tracked and may leave a cached tail stale.
     """
 
     def __init__(
@@ -59,6 +139,11 @@ class RedisChatMessageStore:
         key_prefix: str = "chat_messages",
         max_messages: int | None = None,
         messages: Sequence[ChatMessage] | None = None,
+        *,
+        max_read_messages: int | None = None,
+        max_read_tokens: int | None = None,
+        token_counter: Callable[[ChatMessage], int] | None = None,
+        cache_messages: bool = False,
     ) -> None:
         """Initialize the Redis chat message store.
 
@@ -81,6 +166,16 @@ class RedisChatMessageStore:
                      These are added to Redis on first access if the Redis key is empty.
                      Useful for resuming conversations or seeding with context.
 
+        Keyword Args:
+            max_read_messages: Maximum number of (most recent) messages returned by ``list_messages``.
+                              None returns the full history.
+            max_read_tokens: Token budget for the messages returned by ``list_messages``; the most recent
+                            messages that fit are returned. None disables the budget.
+            token_counter: Callable returning the token count of a message. Defaults to a character based
+                          estimate. Counts are computed once per message and cached with the tail.
+            cache_messages: Keep a local decoded tail of the conversation so unchanged messages are
+                           neither re-fetched nor re-parsed on subsequent reads.
+
         Raises:
             ValueError: If redis_url is None (Redis connection is required).
             redis.ConnectionError: If unable to connect to Redis server.
@@ -96,6 +191,18 @@ class RedisChatMessageStore:
         self.thread_id = thread_id or f"thread_{uuid4()}"
         self.key_prefix = key_prefix
         self.max_messages = max_messages
+        self.max_read_messages = max_read_messages
+        self.max_read_tokens = max_read_tokens
+        self.token_counter = token_counter
+        self.cache_messages = cache_messages
+
+        # Decoded tail of the Redis list as (message, token count) pairs, valid for the
+        # sequence/epoch pair it was read at. A sequence of -1 means nothing is cached.
+        self._tail_cache: deque[tuple[ChatMessage, int]] = deque()
+        self._tail_cache_seq = -1
+        self._tail_cache_epoch = 0
+        self._read_tail_script: Any = None
+        self._replace_span_script: Any = None
 
         # Initialize Redis client with connection pooling and async support
         self._redis_client = redis.from_url(redis_url, decode_responses=True)  # type: ignore[no-untyped-call]
@@ -119,6 +226,33 @@ class RedisChatMessageStore:
         """
         return f"{self.key_prefix}:{self.thread_id}"
 
+    @property
+    def meta_key(self) -> str:
+        """Get the Redis key of the hash holding this thread's write sequence and epoch.
+
+        ``seq`` counts every message appended through the store and ``epoch`` is bumped by any
+        other mutation (set, remove, clear), which together let readers validate a cached tail.
+
+        The key is hash tagged so Redis Cluster stores it in the same slot as ``redis_key``; the
+        scripts and transactions that use both keys would otherwise fail with CROSSSLOT. A key
+        without a hash tag is hashed as a whole, so ``{redis_key}:meta`` hashes like ``redis_key``.
+
+        Example:
+            For redis_key="chat_messages:user_123" returns "{chat_messages:user_123}:meta"
+        """
+        key = self.redis_key
+        tag_start = key.find("{")
+        if tag_start != -1 and key.find("}", tag_start + 1) > tag_start + 1:
+            # The key has a (non-empty) hash tag of its own, which also applies to the meta key
+            return f"{key}:meta"
+        return f"{{{key}}}:meta"
+
+    def _invalidate_tail_cache(self) -> None:
+        """Drop the local decoded tail."""
+        self._tail_cache.clear()
+        self._tail_cache_seq = -1
+        self._tail_cache_epoch = 0
+
     async def _ensure_initial_messages_added(self) -> None:
         """Ensure initial messages are added to Redis if not already present.
 
@@ -141,8 +275,9 @@ class RedisChatMessageStore:
     async def _add_redis_messages(self, messages: Sequence[ChatMessage]) -> None:
         """Add multiple messages to Redis using atomic pipeline operation.
 
-        This internal method efficiently adds multiple messages to the Redis list
-        using a single atomic transaction to ensure consistency.
+        This internal method pushes the messages, applies the ``max_messages`` limit and
+        bumps the write sequence in a single atomic round-trip. When the local tail cache is
+        up to date, the new messages are appended to it without reading them back.
 
         Args:
             messages: Sequence of ChatMessage objects to add to Redis.
@@ -153,11 +288,184 @@ class RedisChatMessageStore:
         # Pre-serialize all messages for efficient pipeline operation
         serialized_messages = [self._serialize_message(message) for message in messages]
 
-        # Use Redis pipeline for atomic batch operation
+        # Push, trim and version bump in one atomic round-trip
         async with self._redis_client.pipeline(transaction=True) as pipe:
-            for serialized_message in serialized_messages:
-                await pipe.rpush(self.redis_key, serialized_message)  # type: ignore[misc]
-            await pipe.execute()
+            await pipe.rpush(self.redis_key, *serialized_messages)  # type: ignore[misc]
+            if self.max_messages is not None:
+                # Keep only the most recent max_messages using LTRIM
+                await pipe.ltrim(self.redis_key, -self.max_messages, -1)  # type: ignore[misc]
+            await pipe.hincrby(self.meta_key, "seq", len(serialized_messages))  # type: ignore[misc]
+            await pipe.hget(self.meta_key, "epoch")  # type: ignore[misc]
+            results = await pipe.execute()
+
+        seq, epoch = int(results[-2]), int(results[-1] or 0)
+        if (
+            self.cache_messages
+            and self._tail_cache_seq >= 0
+            and epoch == self._tail_cache_epoch
+            and seq == self._tail_cache_seq + len(serialized_messages)
+        ):
+            # No concurrent writer: the cached tail plus these messages is the current tail
+            for message, serialized_message in zip(messages, serialized_messages, strict=True):
+                self._tail_cache.append((message, self._count_tokens(message, serialized_message)))
+            self._tail_cache_seq = seq
+            self._trim_tail_cache()
+        else:
+            self._invalidate_tail_cache()
+
+    async def _bump_epoch(self) -> None:
+        """Record a non-append mutation so cached tails held by any reader are invalidated."""
+        await self._redis_client.hincrby(self.meta_key, "epoch", 1)  # type: ignore[misc]
+        self._invalidate_tail_cache()
+
+    def _count_tokens(self, message: ChatMessage, serialized_message: str) -> int:
+        """Count the tokens of a message with the configured counter or the default estimate."""
+        if self.token_counter is not None:
+            return self.token_counter(message)
+        return _estimate_tokens(serialized_message)
+
+    def _trim_tail_cache(self) -> None:
+        """Bound the cached tail to the read window and to the messages that Redis still retains."""
+        limits = [limit for limit in (self.max_read_messages, self.max_messages) if limit is not None]
+        if limits:
+            while len(self._tail_cache) > min(limits):
+                self._tail_cache.popleft()
+
+    async def _refresh_tail(self, limit: int | None) -> int:
+        """Bring the tail cache up to date with Redis in one scripted round-trip.
+
+        Args:
+            limit: Maximum number of most recent messages to keep, None for no limit.
+
+        Returns:
+            The current length of the Redis list.
+        """
+        if self._read_tail_script is None:
+            self._read_tail_script = self._redis_client.register_script(_READ_TAIL_SCRIPT)
+        seq, epoch, length, reset, items = await self._read_tail_script(
+            keys=[self.redis_key, self.meta_key],
+            args=[self._tail_cache_seq, self._tail_cache_epoch, -1 if limit is None else limit],
+        )
+        if int(reset):
+            self._tail_cache.clear()
+        for serialized_message in items:
+            message = self._deserialize_message(serialized_message)
+            self._tail_cache.append((message, self._count_tokens(message, serialized_message)))
+        self._tail_cache_seq = int(seq)
+        self._tail_cache_epoch = int(epoch)
+        self._trim_tail_cache()
+        return int(length)
+
+    async def _backfill_tail(self, length: int) -> bool:
+        """Prepend the next chunk of older messages to the tail cache.
+
+        The chunk is read together with the write sequence and epoch so a concurrent write
+        is detected instead of prepending a misaligned range.
+
+        Args:
+            length: Current length of the Redis list as of the last refresh.
+
+        Returns:
+            True if the cache was extended, False if there is nothing older or the cache
+            went stale (in which case it has been invalidated).
+        """
+        cached = len(self._tail_cache)
+        if cached >= length:
+            return False
+        async with self._redis_client.pipeline(transaction=True) as pipe:
+            await pipe.hmget(self.meta_key, ["seq", "epoch"])  # type: ignore[misc]
+            await pipe.lrange(self.redis_key, -(cached + _BACKFILL_CHUNK_SIZE), -(cached + 1))  # type: ignore[misc]
+            (seq, epoch), older = await pipe.execute()
+        if int(seq or 0) != self._tail_cache_seq or int(epoch or 0) != self._tail_cache_epoch:
+            self._invalidate_tail_cache()
+            return False
+        for serialized_message in reversed(older):
+            message = self._deserialize_message(serialized_message)
+            self._tail_cache.appendleft((message, self._count_tokens(message, serialized_message)))
+        return bool(older)
+
+    def _select_window(self, max_tokens: int | None) -> tuple[list[ChatMessage], bool]:
+        """Select the most recent cached messages that fit into the token budget.
+
+        Returns:
+            The selected messages and whether the budget was exhausted.
+        """
+        selected: list[ChatMessage] = []
+        used = 0
+        for message, tokens in reversed(self._tail_cache):
+            # Always return at least the latest message, even if it alone exceeds the budget
+            if max_tokens is not None and selected and used + tokens > max_tokens:
+                selected.reverse()
+                return selected, True
+            used += tokens
+            selected.append(message)
+        selected.reverse()
+        return selected, False
+
+    async def list_recent_messages(
+        self,
+        max_messages: int | None = None,
+        max_tokens: int | None = None,
+    ) -> list[ChatMessage]:
+        """Get the most recent messages from the store in chronological order.
+
+        Only the requested tail of the Redis list is fetched and decoded. With
+        ``cache_messages`` enabled, messages already decoded by a previous read are reused
+        and only the messages appended since are transferred.
+
+        Leading tool result messages are dropped from a window so it never starts with a
+        tool result whose function call was cut off.
+
+        Args:
+            max_messages: Maximum number of messages to return, None for no limit.
+            max_tokens: Token budget for the returned messages, None for no budget.
+
+        Returns:
+            List of ChatMessage objects in chronological order (oldest first).
+
+        Example:
+            .. code-block:: python
+
+                # Last 20 messages that fit into 4000 tokens
+                messages = await store.list_recent_messages(max_messages=20, max_tokens=4000)
+        """
+        await self._ensure_initial_messages_added()
+
+        if not self.cache_messages:
+            self._invalidate_tail_cache()
+        # With only a token budget, start from one chunk and backfill until the budget is used
+        limit = max_messages if max_messages is not None or max_tokens is None else _BACKFILL_CHUNK_SIZE
+        length = await self._refresh_tail(limit)
+        if max_messages is not None:
+            while len(self._tail_cache) > max_messages:
+                self._tail_cache.popleft()
+
+        if max_tokens is None:
+            messages = [message for message, _ in self._tail_cache]
+        else:
+            messages, exhausted = self._select_window(max_tokens)
+            while (
+                not exhausted
+                and (max_messages is None or len(self._tail_cache) < max_messages)
+                and await self._backfill_tail(length)
+            ):
+                messages, exhausted = self._select_window(max_tokens)
+            if self._tail_cache_seq < 0:
+                # A concurrent write invalidated the cache while backfilling, start over
+                return await self.list_recent_messages(max_messages, max_tokens)
+            if max_messages is not None:
+                messages = messages[-max_messages:]
+            if exhausted:
+                # Older messages fell out of the budget, no need to keep them decoded
+                while len(self._tail_cache) > len(messages):
+                    self._tail_cache.popleft()
+
+        if len(messages) < length:
+            while messages and messages[0].role == Role.TOOL:
+                messages.pop(0)
+        if not self.cache_messages:
+            self._invalidate_tail_cache()
+        return messages
 
     async def add_messages(self, messages: Sequence[ChatMessage]) -> None:
         """Add messages to the Redis store (ChatMessageStoreProtocol protocol method).
@@ -186,21 +494,15 @@ class RedisChatMessageStore:
         # Ensure any initial messages are persisted first
         await self._ensure_initial_messages_added()
 
-        # Add new messages using atomic pipeline operation
+        # Add new messages and apply the message limit in one atomic pipeline
         await self._add_redis_messages(messages)
 
-        # Apply message limit if configured (automatic cleanup)
-        if self.max_messages is not None:
-            current_count = await self._redis_client.llen(self.redis_key)  # type: ignore[misc]
-            if current_count > self.max_messages:
-                # Keep only the most recent max_messages using LTRIM
-                await self._redis_client.ltrim(self.redis_key, -self.max_messages, -1)  # type: ignore[misc]
-
     async def list_messages(self) -> list[ChatMessage]:
         """Get all messages from the store in chronological order (ChatMessageStoreProtocol protocol method).
 
         This method implements the required ChatMessageStoreProtocol protocol for retrieving messages.
-        Returns all messages stored in Redis, ordered from oldest (index 0) to newest (index -1).
+        Returns all messages stored in Redis, ordered from oldest (index 0) to newest (index -1),
+        or only the most recent window when ``max_read_messages`` or ``max_read_tokens`` is set.
 
         Returns:
             List of ChatMessage objects in chronological order (oldest first).
@@ -212,6 +514,9 @@ class RedisChatMessageStore:
                 # Get all conversation history
                 messages = await store.list_messages()
         """
+        if self.cache_messages or self.max_read_messages is not None or self.max_read_tokens is not None:
+            return await self.list_recent_messages(self.max_read_messages, self.max_read_tokens)
+
         # Ensure any initial messages are persisted to Redis first
         await self._ensure_initial_messages_added()
 
@@ -227,6 +532,37 @@ class RedisChatMessageStore:
 
         return messages
 
+    async def replace_messages(self, original: Sequence[ChatMessage], replacement: Sequence[ChatMessage]) -> bool:
+        """Replace a contiguous span of stored messages with a single message.
+
+        Used for history compaction: the span is located and compared with the stored messages
+        and replaced in one atomic script, so messages written concurrently are never lost.
+
+        Args:
+            original: The contiguous span of messages, as returned by ``list_messages``, to replace.
+            replacement: A sequence holding the single message to store in its place.
+
+        Returns:
+            True if the span was replaced, False if it is no longer stored unchanged.
+        """
+        if not original or len(replacement) != 1:
+            raise ValueError("RedisChatMessageStore can only replace a non-empty span with a single message")
+        await self._ensure_initial_messages_added()
+
+        if self._replace_span_script is None:
+            self._replace_span_script = self._redis_client.register_script(_REPLACE_SPAN_SCRIPT)
+        replaced = await self._replace_span_script(
+            keys=[self.redis_key, self.meta_key],
+            args=[
+                f"__compacted__:{uuid4().hex}",
+                self._serialize_message(replacement[0]),
+                *(self._serialize_message(message) for message in original),
+            ],
+        )
+        if replaced:
+            self._invalidate_tail_cache()
+        return bool(replaced)
+
     async def serialize(self, **kwargs: Any) -> Any:
         """Serialize the current store state for persistence (ChatMessageStoreProtocol protocol method).
 
@@ -247,6 +583,9 @@ class RedisChatMessageStore:
             redis_url=self.redis_url,
             key_prefix=self.key_prefix,
             max_messages=self.max_messages,
+            max_read_messages=self.max_read_messages,
+            max_read_tokens=self.max_read_tokens,
+            cache_messages=self.cache_messages,
         )
         return state.to_dict(exclude_none=False, **kwargs)
 
@@ -283,6 +622,9 @@ class RedisChatMessageStore:
             thread_id=state.thread_id,
             key_prefix=state.key_prefix,
             max_messages=state.max_messages,
+            max_read_messages=state.max_read_messages,
+            max_read_tokens=state.max_read_tokens,
+            cache_messages=state.cache_messages,
         )
 
     async def update_from_state(self, serialized_store_state: Any, **kwargs: Any) -> None:
@@ -311,11 +653,17 @@ class RedisChatMessageStore:
             self.redis_url = state.redis_url
         self.key_prefix = state.key_prefix
         self.max_messages = state.max_messages
+        self.max_read_messages = state.max_read_messages
+        self.max_read_tokens = state.max_read_tokens
+        self.cache_messages = state.cache_messages
+        self._invalidate_tail_cache()
 
         # Recreate Redis client if the URL changed
         if state.redis_url and state.redis_url != getattr(self, "_last_redis_url", None):
             self._redis_client = redis.from_url(state.redis_url, decode_responses=True)  # type: ignore[no-untyped-call]
             self._last_redis_url = state.redis_url
+            self._read_tail_script = None
+            self._replace_span_script = None
 
         # Reset initial message state since we're connecting to existing data
         self._initial_messages_added = False
@@ -340,7 +688,13 @@ class RedisChatMessageStore:
                 messages = await store.list_messages()
                 assert len(messages) == 0
         """
-        await self._redis_client.delete(self.redis_key)
+        # Bump the epoch rather than deleting the meta hash so a restarted sequence can never
+        # match a tail cached before the clear
+        async with self._redis_client.pipeline(transaction=True) as pipe:
+            await pipe.delete(self.redis_key)  # type: ignore[misc]
+            await pipe.hincrby(self.meta_key, "epoch", 1)  # type: ignore[misc]
+            await pipe.execute()
+        self._invalidate_tail_cache()
 
     def _serialize_message(self, message: ChatMessage) -> str:
         """Serialize a ChatMessage to JSON string.
@@ -441,6 +795,7 @@ class RedisChatMessageStore:
         # Use Redis LSET for efficient single-item update
         serialized_message = self._serialize_message(item)
         await self._redis_client.lset(self.redis_key, index, serialized_message)  # type: ignore[misc]
+        await self._bump_epoch()
 
     async def append(self, item: ChatMessage) -> None:
         """Append a message to the end of the store.
@@ -509,6 +864,7 @@ class RedisChatMessageStore:
 
         if removed_count == 0:
             raise ValueError("ChatMessage not found in store")
+        await self._bump_epoch()
 
     async def extend(self, items: Sequence[ChatMessage]) -> None:
         """Extend the store by appending all messages from the iterable.
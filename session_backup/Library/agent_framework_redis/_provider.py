@@ -1,14 +1,19 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
 import json
 import sys
+import time
+from collections import OrderedDict
 from collections.abc import MutableSequence, Sequence
 from functools import reduce
 from operator import and_
 from typing import Any, Literal, cast
+from weakref import WeakKeyDictionary
 
 import numpy as np
 from agent_framework import ChatMessage, Context, ContextProvider, Role
+from agent_framework._logging import get_logger
 from agent_framework.exceptions import (
     AgentException,
     ServiceInitializationError,
@@ -30,6 +35,55 @@ if sys.version_info >= (3, 12):
 else:
     from typing_extensions import override  # type: ignore[import] # pragma: no cover
 
+logger = get_logger()
+
+# Indexes (by redis url, index name, schema and overwrite flag) already created or validated in this process.
+_READY_INDEXES: set[tuple[str, str, str, bool]] = set()
+# Locks serializing the index setup, per event loop since asyncio locks cannot be shared across loops.
+_INDEX_LOCKS: WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple[str, str, str, bool], asyncio.Lock]] = (
+    WeakKeyDictionary()
+)
+
+
+class _EmbeddingCache:
+    """LRU cache with an optional time-to-live for embeddings, keyed by vectorizer and normalized text."""
+
+    def __init__(self, max_size: int, ttl: float | None) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple[str, str], tuple[float | None, list[float]]] = OrderedDict()
+
+    @staticmethod
+    def key(vectorizer: BaseVectorizer, text: str) -> tuple[str, str]:
+        """Build the cache key from the vectorizer identity and the whitespace normalized text."""
+        identity = f"{type(vectorizer).__name__}:{vectorizer.model}:{vectorizer.dims}:{vectorizer.dtype}"
+        return identity, " ".join(text.split())
+
+    def get(self, key: tuple[str, str]) -> list[float] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, embedding = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return embedding
+
+    def set(self, key: tuple[str, str], embedding: list[float]) -> None:
+        if self.max_size <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        self._entries[key] = (expires_at, embedding)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+# Embedding caches shared by all providers in the process with the same size and TTL; keys include the
+# vectorizer identity, so providers with different vectorizers can safely share one.
+_EMBEDDING_CACHES: dict[tuple[int, float | None], _EmbeddingCache] = {}
+
 
 class RedisProvider(ContextProvider):
     """Redis context provider with dynamic, filterable schema.
@@ -58,6 +112,12 @@ class RedisProvider(ContextProvider):
         context_prompt: str = ContextProvider.DEFAULT_CONTEXT_PROMPT,
         redis_index: Any = None,
         overwrite_index: bool = False,
+        # Performance
+        embedding_cache_size: int = 1024,
+        embedding_cache_ttl: float | None = 3600.0,
+        write_behind: bool = False,
+        write_batch_size: int = 64,
+        write_flush_interval: float = 0.5,
     ):
         """Create a Redis Context Provider.
 
@@ -77,6 +137,15 @@ class RedisProvider(ContextProvider):
             context_prompt: The context prompt to use for the provider.
             redis_index: The Redis index to use for the provider.
             overwrite_index: Whether to overwrite the existing Redis index.
+            embedding_cache_size: Maximum number of embeddings kept in the in-process LRU cache, 0 disables it.
+                The cache is shared by providers in the same process that use the same size and TTL.
+            embedding_cache_ttl: Seconds an embedding stays cached, None to keep it until evicted.
+            write_behind: Whether to store memories from ``invoked`` in the background. Messages are queued
+                and embedded and loaded in batches off the response path; call ``flush()`` to wait for pending
+                writes. They are also stored when the outermost ``async with`` exits, on ``aclose()`` and when the
+                event loop shuts down. Queued memories are not yet searchable.
+            write_batch_size: Maximum number of documents embedded and loaded per background batch.
+            write_flush_interval: Seconds the background writer waits to collect a batch.
 
         """
         self.redis_url = redis_url
@@ -102,6 +171,17 @@ class RedisProvider(ContextProvider):
         self._conversation_id: str | None = None
         self._index_initialized: bool = False
         self._schema_dict: dict[str, Any] | None = None
+        self._embedding_cache = _EMBEDDING_CACHES.setdefault(
+            (embedding_cache_size, embedding_cache_ttl), _EmbeddingCache(embedding_cache_size, embedding_cache_ttl)
+        )
+        self.write_behind = write_behind
+        self.write_batch_size = max(int(write_batch_size), 1)
+        self.write_flush_interval = write_flush_interval
+        self._pending_documents: list[dict[str, Any]] = []
+        self._pending_event: asyncio.Event | None = None
+        self._writer_task: asyncio.Task[None] | None = None
+        self._inflight_write: asyncio.Future[None] | None = None
+        self._context_depth = 0
         self.redis_index = redis_index or AsyncSearchIndex.from_dict(
             self.schema_dict, redis_url=self.redis_url, validate_on_load=True
         )
@@ -215,18 +295,58 @@ class RedisProvider(ContextProvider):
         if self._index_initialized:
             return
 
-        # Check if index already exists
-        index_exists = await self.redis_index.exists()
+        # Index readiness is checked once per process for each index, schema and overwrite flag
+        index_key = (
+            self.redis_url,
+            self.index_name,
+            json.dumps(self.schema_dict, sort_keys=True),
+            self.overwrite_index,
+        )
+        loop_locks = _INDEX_LOCKS.setdefault(asyncio.get_running_loop(), {})
+        lock = loop_locks.setdefault(index_key, asyncio.Lock())
+        async with lock:
+            if index_key not in _READY_INDEXES:
+                # Check if index already exists
+                index_exists = await self.redis_index.exists()
 
-        if not self.overwrite_index and index_exists:
-            # Validate schema compatibility before connecting
-            await self._validate_schema_compatibility()
+                if not self.overwrite_index and index_exists:
+                    # Validate schema compatibility before connecting
+                    await self._validate_schema_compatibility()
 
-        # Create the index (will connect to existing or create new)
-        await self.redis_index.create(overwrite=self.overwrite_index, drop=False)
+                # Create the index (will connect to existing or create new)
+                await self.redis_index.create(overwrite=self.overwrite_index, drop=False)
+                _READY_INDEXES.add(index_key)
 
         self._index_initialized = True
 
+    async def _embed(self, text: str) -> list[float]:
+        """Embed a single text, using the embedding cache."""
+        vectorizer = cast(BaseVectorizer, self.redis_vectorizer)
+        key = _EmbeddingCache.key(vectorizer, text)
+        embedding = self._embedding_cache.get(key)
+        if embedding is None:
+            embedding = cast(list[float], await vectorizer.aembed(text))
+            self._embedding_cache.set(key, embedding)
+        return embedding
+
+    async def _embed_many(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts in one batch call for the ones that are not cached."""
+        vectorizer = cast(BaseVectorizer, self.redis_vectorizer)
+        keys = [_EmbeddingCache.key(vectorizer, text) for text in texts]
+        embeddings = [self._embedding_cache.get(key) for key in keys]
+        missing = list(dict.fromkeys(key for key, embedding in zip(keys, embeddings, strict=True) if embedding is None))
+        if missing:
+            missing_texts = [texts[keys.index(key)] for key in missing]
+            computed = await vectorizer.aembed_many(missing_texts, batch_size=len(missing_texts))
+            fresh = dict(zip(missing, cast(list[list[float]], computed), strict=True))
+            for key, embedding in fresh.items():
+                self._embedding_cache.set(key, embedding)
+            embeddings = [
+                embedding if embedding is not None else fresh[key]
+                for key, embedding in zip(keys, embeddings, strict=True)
+            ]
+        return cast(list[list[float]], embeddings)
+
     async def _validate_schema_compatibility(self) -> None:
         """Validate that existing index schema matches current configuration.
 
@@ -310,6 +430,20 @@ class RedisProvider(ContextProvider):
         # Ensure provider has at least one scope set (symmetry with Mem0Provider)
         self._validate_filters()
         await self._ensure_index()
+        await self._load_documents(self._prepare_documents(data))
+
+    def _prepare_documents(self, data: dict[str, Any] | list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Fills the partition and conversation fields of documents from the provider's current scope.
+
+        Args:
+            data: Single document or list of documents to insert.
+
+        Returns:
+            The prepared documents.
+
+        Raises:
+            ServiceInvalidRequestError: If required fields are missing or invalid.
+        """
         docs = data if isinstance(data, list) else [data]
 
         prepared: list[dict[str, Any]] = []
@@ -333,11 +467,18 @@ class RedisProvider(ContextProvider):
                 d.setdefault(self.vector_field_name, None)
 
             prepared.append(d)
+        return prepared
 
+    async def _load_documents(self, prepared: list[dict[str, Any]]) -> None:
+        """Embeds (when configured) and loads prepared documents in a single batch.
+
+        Args:
+            prepared: Documents returned by ``_prepare_documents``.
+        """
         # Batch embed contents for every message
         if self.redis_vectorizer and self.vector_field_name:
             text_list = [d["content"] for d in prepared]
-            embeddings = await self.redis_vectorizer.aembed_many(text_list, batch_size=len(text_list))
+            embeddings = await self._embed_many(text_list)
             for i, d in enumerate(prepared):
                 vec = np.asarray(embeddings[i], dtype=np.float32).tobytes()
                 field_name: str = self.vector_field_name
@@ -347,6 +488,69 @@ class RedisProvider(ContextProvider):
         await self.redis_index.load(prepared)
         return
 
+    def _enqueue_documents(self, prepared: list[dict[str, Any]]) -> None:
+        """Queues prepared documents for the background writer, starting it if needed."""
+        # Same scope requirement as _add, checked now since the writer cannot report errors to the caller
+        self._validate_filters()
+        self._pending_documents.extend(prepared)
+        if self._pending_event is None:
+            self._pending_event = asyncio.Event()
+        self._pending_event.set()
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._write_behind_loop())
+
+    async def _write_behind_loop(self) -> None:
+        """Background writer that embeds and loads queued documents in batches."""
+        event = cast(asyncio.Event, self._pending_event)
+        try:
+            while True:
+                await event.wait()
+                if len(self._pending_documents) < self.write_batch_size:
+                    # Give concurrent turns a moment to contribute to the same batch
+                    await asyncio.sleep(self.write_flush_interval)
+                await self._write_pending()
+                if not self._pending_documents:
+                    event.clear()
+        except asyncio.CancelledError:
+            # Cancelled by aclose() once nothing is pending, or by the event loop shutting down
+            await self.flush()
+            raise
+
+    async def _write_pending(self) -> None:
+        """Writes one batch of queued documents, logging failures since no caller awaits the writer."""
+        if self._inflight_write is not None:
+            await asyncio.shield(self._inflight_write)
+        if not self._pending_documents:
+            return
+        batch = self._pending_documents[: self.write_batch_size]
+        del self._pending_documents[: self.write_batch_size]
+        inflight = self._inflight_write = asyncio.get_running_loop().create_future()
+        try:
+            await self._ensure_index()
+            await self._load_documents(batch)
+        except asyncio.CancelledError:
+            # Put the batch back so the writer's shutdown flush still stores it
+            self._pending_documents[:0] = batch
+            raise
+        except Exception as exc:
+            logger.warning(f"RedisProvider failed to store {len(batch)} memories in the background: {exc}")
+        finally:
+            inflight.set_result(None)
+            if self._inflight_write is inflight:
+                self._inflight_write = None
+
+    async def flush(self) -> None:
+        """Waits until all memories queued by ``invoked`` in write-behind mode are stored."""
+        while self._pending_documents or self._inflight_write is not None:
+            await self._write_pending()
+
+    async def aclose(self) -> None:
+        """Stores the memories queued in write-behind mode and stops the background writer."""
+        await self.flush()
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+            self._writer_task = None
+
     async def _redis_search(
         self,
         text: str,
@@ -407,7 +611,7 @@ class RedisProvider(ContextProvider):
         try:
             if self.redis_vectorizer and self.vector_field_name:
                 # Build hybrid query: combine full-text and vector similarity
-                vector = await self.redis_vectorizer.aembed(q)
+                vector = await self._embed(q)
                 query = HybridQuery(
                     text=q,
                     text_field_name="content",
@@ -517,7 +721,11 @@ class RedisProvider(ContextProvider):
                 }
                 messages.append(shaped)
         if messages:
-            await self._add(data=messages)
+            if self.write_behind:
+                # Scope fields are resolved now, embedding and loading happen off the response path
+                self._enqueue_documents(self._prepare_documents(messages))
+            else:
+                await self._add(data=messages)
 
     @override
     async def invoking(self, messages: ChatMessage | MutableSequence[ChatMessage], **kwargs: Any) -> Context:
@@ -553,16 +761,20 @@ class RedisProvider(ContextProvider):
     async def __aenter__(self) -> Self:
         """Async context manager entry.
 
-        No special setup is required; provided for symmetry with the Mem0 provider.
+        No special setup is required; the nesting depth is tracked for write-behind mode.
         """
+        self._context_depth += 1
         return self
 
     async def __aexit__(self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: Any) -> None:
         """Async context manager exit.
 
-        No cleanup is required; indexes/keys remain unless explicitly cleared.
+        In write-behind mode only the outermost exit waits for the queued memories, see
+        ``ContextProvider`` for how per-run exits are handled. Indexes/keys remain unless explicitly cleared.
         """
-        return
+        self._context_depth = max(self._context_depth - 1, 0)
+        if self._context_depth == 0:
+            await self.aclose()
 
     def _validate_filters(self) -> None:
         """Validates that at least one filter is provided.
@@ -0,0 +1,93 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import redis.asyncio as redis
+from agent_framework._logging import get_logger
+
+logger = get_logger()
+
+
+class RedisToolResultCache:
+    """Redis-backed cache for the results of cacheable AIFunctions.
+
+    Implements ``ToolResultCacheProtocol`` so cached tool results are shared across processes
+    and survive restarts. Results are stored as JSON strings with ``SET`` and an optional
+    ``EX``/``PX`` expiry, results that are not JSON serializable are not cached.
+
+    Examples:
+        .. code-block:: python
+
+            from agent_framework import ai_function
+            from agent_framework.redis import RedisToolResultCache
+
+            cache = RedisToolResultCache(redis_url="redis://localhost:6379")
+
+
+            @ai_function(cacheable=True, cache_ttl=300, cache=cache)
+            def get_bbc_news(category: str) -> str:
+                return scrape_headlines(category)
+    """
+
+    def __init__(
+        self,
+        redis_url: str | None = None,
+        key_prefix: str = "tool_results",
+    ) -> None:
+        """Initialize the Redis tool result cache.
+
+        Args:
+            redis_url: Redis connection URL (e.g., "redis://localhost:6379").
+            key_prefix: Prefix for Redis keys, the key format is {key_prefix}:{cache_key}.
+
+        Raises:
+            ValueError: If redis_url is None (Redis connection is required).
+        """
+        if redis_url is None:
+            raise ValueError("redis_url is required for Redis connection")
+        self.redis_url = redis_url
+        self.key_prefix = key_prefix
+        self._redis_client = redis.from_url(redis_url, decode_responses=True)  # type: ignore[no-untyped-call]
+
+    def _redis_key(self, key: str) -> str:
+        return f"{self.key_prefix}:{key}"
+
+    async def get(self, key: str) -> tuple[bool, Any]:
+        """Look up a cached result.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            A tuple of whether the key was found and the cached value.
+        """
+        serialized = await self._redis_client.get(self._redis_key(key))
+        if serialized is None:
+            return False, None
+        return True, json.loads(serialized)
+
+    async def set(self, key: str, value: Any, *, ttl: float | None = None) -> None:
+        """Store a result.
+
+        Args:
+            key: The cache key.
+            value: The function result to store.
+
+        Keyword Args:
+            ttl: Time to live in seconds, None means the entry does not expire.
+        """
+        try:
+            serialized = json.dumps(value)
+        except (TypeError, ValueError):
+            logger.debug(f"Not caching non-serializable tool result of type {type(value).__name__}")
+            return
+        await self._redis_client.set(
+            self._redis_key(key), serialized, px=max(int(ttl * 1000), 1) if ttl is not None else None
+        )
+
+    async def aclose(self) -> None:
+        """Close the Redis connection."""
+        await self._redis_client.aclose()  # type: ignore[misc]
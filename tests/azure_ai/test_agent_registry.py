@@ -0,0 +1,125 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from azure.core.exceptions import ResourceNotFoundError
+
+from agent_framework_azure_ai import AzureAIAgentClient, AzureAIAgentRegistry
+
+
+class _FakeRuns:
+    def __init__(self, client: "_FakeAgentsClient") -> None:
+        self._client = client
+
+    async def list(self, **kwargs: Any) -> AsyncIterator[Any]:
+        for run in ():
+            yield run
+
+    async def stream(self, thread_id: str, *, agent_id: str, **kwargs: Any) -> str:
+        if agent_id in self._client.deleted:
+            raise ResourceNotFoundError("agent not found")
+        return f"stream of {agent_id}"
+
+
+class _FakeAgentsClient:
+    """Agents client that keeps agents in memory; list_agents waits for ``listed`` when set."""
+
+    def __init__(self) -> None:
+        self.agents: list[Any] = []
+        self.deleted: set[str] = set()
+        self.listed: asyncio.Event | None = None
+        self.runs = _FakeRuns(self)
+
+    async def list_agents(self) -> AsyncIterator[Any]:
+        if self.listed is not None:
+            await self.listed.wait()
+        for agent in list(self.agents):
+            yield agent
+
+    async def create_agent(self, **definition: Any) -> Any:
+        agent = SimpleNamespace(id=f"asst_{len(self.agents)}", **definition)
+        self.agents.insert(0, agent)
+        return agent
+
+    async def get_agent(self, agent_id: str) -> Any:
+        if agent_id in self.deleted:
+            raise ResourceNotFoundError("agent not found")
+        return next(agent for agent in self.agents if agent.id == agent_id)
+
+    async def delete_agent(self, agent_id: str) -> None:
+        self.deleted.add(agent_id)
+
+    async def close(self) -> None:
+        pass
+
+
+def _client(agents_client: _FakeAgentsClient, registry: AzureAIAgentRegistry) -> AzureAIAgentClient:
+    return AzureAIAgentClient(
+        agents_client=agents_client,  # type: ignore[arg-type]
+        agent_name="writer",
+        model_deployment_name="gpt",
+        agent_registry=registry,
+    )
+
+
+async def test_closing_the_client_cancels_its_sweep() -> None:
+    agents_client = _FakeAgentsClient()
+    agents_client.listed = asyncio.Event()
+    registry = AzureAIAgentRegistry(stale_after=timedelta(days=1))
+    registry._loaded = True
+    await registry.get_or_create(agents_client, {"model": "gpt", "name": "writer"})  # type: ignore[arg-type]
+    (sweep,) = registry._sweeps
+    await asyncio.sleep(0)
+
+    await _client(agents_client, registry).close()
+
+    assert sweep.cancelled()
+    assert registry._sweeps == {}
+    assert "writer" not in registry._swept_names
+
+
+async def test_deleted_registry_agent_is_created_again() -> None:
+    agents_client = _FakeAgentsClient()
+    registry = AzureAIAgentRegistry(stale_after=None)
+    client = _client(agents_client, registry)
+    agent_id = await client._get_agent_id_or_create({"model": "gpt"})
+    await agents_client.delete_agent(agent_id)
+
+    stream, thread_id = await client._create_agent_stream("thread_1", agent_id, {"model": "gpt"}, None)
+
+    assert thread_id == "thread_1"
+    assert stream == f"stream of {agents_client.agents[0].id}"
+    assert agents_client.agents[0].id != agent_id
+
+
+async def test_missing_thread_is_not_mistaken_for_a_deleted_agent() -> None:
+    agents_client = _FakeAgentsClient()
+    registry = AzureAIAgentRegistry(stale_after=None)
+    client = _client(agents_client, registry)
+    agent_id = await client._get_agent_id_or_create({"model": "gpt"})
+
+    async def missing_thread(thread_id: str, **kwargs: Any) -> str:
+        raise ResourceNotFoundError("thread not found")
+
+    agents_client.runs.stream = missing_thread  # type: ignore[method-assign]
+
+    with pytest.raises(ResourceNotFoundError):
+        await client._create_agent_stream("thread_1", agent_id, {"model": "gpt"}, None)
+    assert len(agents_client.agents) == 1
+
+
+def test_endpoint_registries_are_pruned(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(AzureAIAgentRegistry, "_registries", type(AzureAIAgentRegistry._registries)())
+    monkeypatch.setattr(AzureAIAgentRegistry, "max_registries", 2)
+
+    first = AzureAIAgentRegistry.for_endpoint("https://a")
+    AzureAIAgentRegistry.for_endpoint("https://b")
+    assert AzureAIAgentRegistry.for_endpoint("https://a") is first
+    AzureAIAgentRegistry.for_endpoint("https://c")
+
+    assert list(AzureAIAgentRegistry._registries) == ["https://a", "https://c"]
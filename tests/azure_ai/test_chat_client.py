@@ -0,0 +1,93 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from collections.abc import AsyncIterator
+from types import SimpleNamespace
+from typing import Any
+
+from azure.ai.agents.models import RunStatus
+from azure.core.exceptions import HttpResponseError
+
+from agent_framework import FunctionResultContent
+from agent_framework_azure_ai import AzureAIAgentClient
+
+
+class _FakeRuns:
+    def __init__(self) -> None:
+        self.active: list[Any] = []
+        self.submitted: list[str] = []
+        self.streamed: list[str] = []
+        self.rejected_submits = 0
+
+    async def list(self, **kwargs: Any) -> AsyncIterator[Any]:
+        for run in self.active:
+            yield run
+
+    async def submit_tool_outputs_stream(self, *, run_id: str, **kwargs: Any) -> None:
+        if self.rejected_submits:
+            self.rejected_submits -= 1
+            raise HttpResponseError("run expired")
+        self.submitted.append(run_id)
+
+    async def stream(self, thread_id: str, *, agent_id: str, **kwargs: Any) -> str:
+        self.streamed.append(thread_id)
+        return "stream"
+
+
+class _FakeThreads:
+    def __init__(self) -> None:
+        self.created = 0
+
+    async def create(self, **kwargs: Any) -> Any:
+        self.created += 1
+        return SimpleNamespace(id=f"thread_{self.created}")
+
+
+def _client() -> AzureAIAgentClient:
+    agents_client = SimpleNamespace(runs=_FakeRuns(), threads=_FakeThreads())
+    return AzureAIAgentClient(agents_client=agents_client, agent_id="asst_1")  # type: ignore[arg-type]
+
+
+def _run(run_id: str, thread_id: str, status: str = RunStatus.REQUIRES_ACTION) -> Any:
+    return SimpleNamespace(id=run_id, thread_id=thread_id, status=status)
+
+
+def _tool_result(run_id: str) -> list[Any]:
+    return [FunctionResultContent(call_id=f'["{run_id}", "call_1"]', result="42")]
+
+
+async def test_tracked_threads_are_bounded() -> None:
+    client = _client()
+    client.MAX_TRACKED_THREADS = 2  # type: ignore[misc]
+
+    thread_ids = [await client._prepare_thread(None, None, {}) for _ in range(3)]
+
+    assert list(client._owned_threads) == thread_ids[1:]
+    assert set(client._thread_runs) == set(thread_ids[1:])
+
+
+async def test_expired_cached_run_falls_back_to_a_new_run() -> None:
+    client = _client()
+    runs: _FakeRuns = client.agents_client.runs  # type: ignore[assignment]
+    client._owned_threads["thread_1"] = None
+    client._thread_runs["thread_1"] = _run("run_1", "thread_1")
+    runs.rejected_submits = 1
+
+    stream, thread_id = await client._create_agent_stream("thread_1", "asst_1", {}, _tool_result("run_1"))
+
+    assert (stream, thread_id) == ("stream", "thread_1")
+    assert runs.streamed == ["thread_1"]
+
+
+async def test_rejected_cached_run_is_resubmitted_when_still_active() -> None:
+    client = _client()
+    runs: _FakeRuns = client.agents_client.runs  # type: ignore[assignment]
+    client._owned_threads["thread_1"] = None
+    client._thread_runs["thread_1"] = _run("run_1", "thread_1")
+    runs.rejected_submits = 1
+    runs.active = [_run("run_1", "thread_1")]
+
+    _, thread_id = await client._create_agent_stream("thread_1", "asst_1", {}, _tool_result("run_1"))
+
+    assert thread_id == "thread_1"
+    assert runs.submitted == ["run_1"]
+    assert runs.streamed == []
@@ -0,0 +1,9 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import sys
+from pathlib import Path
+
+# The benchmark scripts are run from their directory and import each other as top-level modules.
+_BENCHMARKS = Path(__file__).resolve().parents[2] / "_src" / "benchmarks"
+if str(_BENCHMARKS) not in sys.path:
+    sys.path.append(str(_BENCHMARKS))
@@ -0,0 +1,47 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import json
+from typing import Any
+
+import pytest
+
+import cold_start
+from import_time import PythonRunError
+
+
+@pytest.fixture
+def budgets(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cold_start, "DEFAULT_BUDGETS", {"import missing_module_xyz": 100.0, "import json": 1000.0})
+    monkeypatch.setattr("sys.argv", ["cold_start.py", "--skip-app", "--no-history", "--json", "--repeat", "1"])
+
+
+def _record(capsys: pytest.CaptureFixture[str]) -> dict[str, Any]:
+    return json.loads(capsys.readouterr().out)
+
+
+def test_failed_import_is_recorded_and_the_rest_still_measured(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str], budgets: None
+) -> None:
+    monkeypatch.setattr(cold_start, "measure_first_agent_run", lambda base_url, library: {"agent_first_run": 5.0})
+
+    assert cold_start.main() == 1
+
+    record = _record(capsys)
+    assert list(record["failures"]) == ["import:import missing_module_xyz"]
+    assert "ModuleNotFoundError" in record["failures"]["import:import missing_module_xyz"]
+    assert set(record["metrics"]) == {"import:import json", "agent_first_run"}
+
+
+def test_failed_agent_run_is_recorded(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str], budgets: None
+) -> None:
+    def fail(base_url: str, library: str | None) -> dict[str, float]:
+        raise PythonRunError(["first_agent_run.py"], "Traceback ...\nConnectionError: refused\n")
+
+    monkeypatch.setattr(cold_start, "measure_first_agent_run", fail)
+
+    assert cold_start.main() == 1
+
+    record = _record(capsys)
+    assert record["failures"]["agent_run"] == "ConnectionError: refused"
+    assert "import:import json" in record["metrics"]
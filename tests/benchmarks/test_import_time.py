@@ -0,0 +1,29 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import json
+
+import pytest
+
+import import_time
+
+
+def test_failing_statement_is_reported_and_the_rest_still_measured(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.setattr(import_time, "DEFAULT_BUDGETS", {"import missing_module_xyz": 100.0, "import json": 1000.0})
+    monkeypatch.setattr("sys.argv", ["import_time.py", "--repeat", "1", "--json"])
+
+    assert import_time.main() == 1
+
+    results = {result["statement"]: result for result in json.loads(capsys.readouterr().out)}
+    assert results["import missing_module_xyz"]["within_budget"] is False
+    assert "ModuleNotFoundError" in results["import missing_module_xyz"]["error"]
+    assert results["import json"]["within_budget"] is True
+    assert "error" not in results["import json"]
+
+
+def test_run_python_raises_with_the_error_output() -> None:
+    with pytest.raises(import_time.PythonRunError) as error:
+        import_time.run_python(["-c", "raise ValueError('boom')"])
+
+    assert error.value.summary == "ValueError: boom"
@@ -0,0 +1,24 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import inspect
+import sys
+from pathlib import Path
+
+import pytest
+
+# The framework packages live in session_backup/Library. It is appended, not prepended, so the
+# interpreter's own site-packages keep precedence over the Windows wheels bundled there.
+_LIBRARY = Path(__file__).resolve().parent.parent / "session_backup" / "Library"
+if str(_LIBRARY) not in sys.path:
+    sys.path.append(str(_LIBRARY))
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem: pytest.Function) -> bool | None:
+    """Run ``async def`` tests in a fresh event loop when pytest-asyncio is not installed."""
+    if not inspect.iscoroutinefunction(pyfuncitem.obj) or pyfuncitem.config.pluginmanager.hasplugin("asyncio"):
+        return None
+    arguments = {name: pyfuncitem.funcargs[name] for name in pyfuncitem._fixtureinfo.argnames}
+    asyncio.run(pyfuncitem.obj(**arguments))
+    return True
@@ -0,0 +1,56 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from collections.abc import AsyncIterable, Awaitable, Callable, MutableSequence
+from typing import Any
+
+import pytest
+
+from agent_framework import (
+    BaseChatClient,
+    ChatMessage,
+    ChatOptions,
+    ChatResponse,
+    ChatResponseUpdate,
+    use_function_invocation,
+)
+
+
+@use_function_invocation
+class MockBaseChatClient(BaseChatClient):
+    """Chat client that replays the configured responses, one per model request.
+
+    A streamed response is a list of updates; an update can also be an async callable that is awaited
+    before the next update is yielded, to model a slow stream.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.run_responses: list[ChatResponse] = []
+        self.streaming_responses: list[list[ChatResponseUpdate | Callable[[], Awaitable[None]]]] = []
+        self.call_count = 0
+
+    async def _inner_get_response(
+        self, *, messages: MutableSequence[ChatMessage], chat_options: ChatOptions, **kwargs: Any
+    ) -> ChatResponse:
+        self.call_count += 1
+        if not self.run_responses:
+            return ChatResponse(messages=ChatMessage(role="assistant", text="done"))
+        return self.run_responses.pop(0)
+
+    async def _inner_get_streaming_response(
+        self, *, messages: MutableSequence[ChatMessage], chat_options: ChatOptions, **kwargs: Any
+    ) -> AsyncIterable[ChatResponseUpdate]:
+        self.call_count += 1
+        if not self.streaming_responses:
+            yield ChatResponseUpdate(role="assistant", text="done")
+            return
+        for update in self.streaming_responses.pop(0):
+            if isinstance(update, ChatResponseUpdate):
+                yield update
+            else:
+                await update()
+
+
+@pytest.fixture
+def chat_client_base() -> MockBaseChatClient:
+    return MockBaseChatClient()
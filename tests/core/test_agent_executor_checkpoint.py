@@ -0,0 +1,74 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import logging
+from typing import Any
+
+import pytest
+
+from agent_framework import AgentExecutor, AgentThread, ChatAgent, ChatMessage, ChatMessageStore
+from agent_framework._workflows._conversation_state import (
+    ChatMessageTable,
+    SharedConversation,
+    current_chat_message_table,
+)
+
+
+async def _snapshot(executor: AgentExecutor) -> tuple[dict[str, Any], ChatMessageTable]:
+    table = ChatMessageTable()
+    token = current_chat_message_table.set(table)
+    try:
+        return await executor.snapshot_state(), table
+    finally:
+        current_chat_message_table.reset(token)
+
+
+async def _restore(executor: AgentExecutor, state: dict[str, Any], table: ChatMessageTable | None) -> None:
+    token = current_chat_message_table.set(table)
+    try:
+        await executor.restore_state(state)
+    finally:
+        current_chat_message_table.reset(token)
+
+
+def _executor(chat_client_base: Any, thread: AgentThread) -> AgentExecutor:
+    return AgentExecutor(ChatAgent(chat_client=chat_client_base, name="writer"), agent_thread=thread)
+
+
+async def test_referenced_messages_round_trip_through_the_table(chat_client_base: Any) -> None:
+    messages = [ChatMessage(role="user", text="hi"), ChatMessage(role="assistant", text="hello")]
+    executor = _executor(chat_client_base, AgentThread(message_store=ChatMessageStore(messages)))
+    executor._cache = SharedConversation(messages)
+
+    state, table = await _snapshot(executor)
+    restored = _executor(chat_client_base, AgentThread())
+    await _restore(restored, state, ChatMessageTable(table.encoded))
+
+    assert restored._agent_thread.message_store is not None
+    assert [m.text for m in await restored._agent_thread.message_store.list_messages()] == ["hi", "hello"]
+    assert [m.text for m in restored._cache] == ["hi", "hello"]
+
+
+async def test_referenced_messages_without_a_table_warn(
+    chat_client_base: Any, caplog: pytest.LogCaptureFixture
+) -> None:
+    messages = [ChatMessage(role="user", text="hi")]
+    executor = _executor(chat_client_base, AgentThread(message_store=ChatMessageStore(messages)))
+    executor._cache = SharedConversation(messages)
+    state, _ = await _snapshot(executor)
+
+    with caplog.at_level(logging.WARNING):
+        await _restore(executor, state, None)
+
+    assert "Failed to restore cache" in caplog.text
+    assert "Failed to restore agent thread" in caplog.text
+    assert len(executor._cache) == 0
+
+
+async def test_service_thread_id_is_restored(chat_client_base: Any) -> None:
+    executor = _executor(chat_client_base, AgentThread(service_thread_id="thread_1"))
+
+    state, table = await _snapshot(executor)
+    restored = _executor(chat_client_base, AgentThread())
+    await _restore(restored, state, ChatMessageTable(table.encoded))
+
+    assert restored._agent_thread.service_thread_id == "thread_1"
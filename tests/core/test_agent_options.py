@@ -0,0 +1,46 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from typing import Any
+
+from agent_framework import AIFunction, ChatAgent, ChatMessage
+
+
+def lookup(key: str) -> str:
+    """Look up a key."""
+    return key
+
+
+def _tool(agent: ChatAgent) -> AIFunction[Any, Any]:
+    assert agent.chat_options.tools is not None
+    tool = agent.chat_options.tools[0]
+    assert isinstance(tool, AIFunction)
+    return tool
+
+
+def test_function_tools_are_wrapped_once_per_agent(chat_client_base: Any) -> None:
+    first = ChatAgent(chat_client=chat_client_base, tools=[lookup])
+    second = ChatAgent(chat_client=chat_client_base, tools=[lookup])
+
+    assert _tool(first) is not _tool(second)
+    assert first._as_tool(lookup) is _tool(first)
+
+
+async def test_per_run_function_tools_reuse_the_agent_wrapper(chat_client_base: Any) -> None:
+    agent = ChatAgent(chat_client=chat_client_base)
+
+    await agent.run("hi", tools=[lookup])
+
+    assert agent._as_tool(lookup) is agent._as_tool(lookup)
+    assert agent._as_tool(lookup) is not ChatAgent(chat_client=chat_client_base)._as_tool(lookup)
+
+
+def test_requests_get_their_own_instructions_message(chat_client_base: Any) -> None:
+    first = chat_client_base._prepare_request_messages("hi", "be brief")
+    first[0].contents.append(first[1].contents[0])
+    first[0].additional_properties["changed"] = True
+    second = chat_client_base._prepare_request_messages("hi", "be brief")
+
+    assert second[0] is not first[0]
+    assert second[0].text == "be brief"
+    assert second[0].additional_properties == {}
+    assert isinstance(second[1], ChatMessage)
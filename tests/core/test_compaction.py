@@ -0,0 +1,66 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from typing import Any
+
+from agent_framework import AgentThread, ChatHistoryCompactor, ChatMessage, ChatMessageStore, ChatResponse
+
+
+class _SummaryClient:
+    """Answers every summarization request with a fixed summary."""
+
+    def __init__(self) -> None:
+        self.requests: list[list[ChatMessage]] = []
+
+    async def get_response(self, messages: list[ChatMessage], **kwargs: Any) -> ChatResponse:
+        self.requests.append(messages)
+        return ChatResponse(messages=ChatMessage(role="assistant", text="they talked"))
+
+
+def _count_words(text: str) -> int:
+    return len(text.split())
+
+
+def _conversation(turns: int) -> list[ChatMessage]:
+    return [
+        ChatMessage(role="user" if index % 2 == 0 else "assistant", text=f"message number {index}")
+        for index in range(turns)
+    ]
+
+
+async def test_compact_replaces_the_oldest_span_with_a_summary() -> None:
+    compactor = ChatHistoryCompactor(_SummaryClient(), max_tokens=40, keep_last_messages=2, tokenizer=_count_words)
+    store = ChatMessageStore(_conversation(8))
+
+    assert await compactor.compact(store)
+
+    messages = await store.list_messages()
+    assert messages[0].text.endswith("they talked")
+    assert [message.text for message in messages[1:]][-2:] == ["message number 6", "message number 7"]
+    originals = compactor.get_original_messages(messages[0])
+    assert [message.text for message in originals] == [f"message number {index}" for index in range(len(originals))]
+
+
+async def test_compaction_is_skipped_when_the_span_changed() -> None:
+    class _ClearingClient(_SummaryClient):
+        async def get_response(self, messages: list[ChatMessage], **kwargs: Any) -> ChatResponse:
+            store.messages.pop(0)
+            return await super().get_response(messages, **kwargs)
+
+    compactor = ChatHistoryCompactor(_ClearingClient(), max_tokens=40, keep_last_messages=2, tokenizer=_count_words)
+    store = ChatMessageStore(_conversation(8))
+
+    assert not await compactor.compact(store)
+    assert len(store.messages) == 7
+
+
+async def test_thread_compacts_in_the_background() -> None:
+    client = _SummaryClient()
+    compactor = ChatHistoryCompactor(client, max_tokens=40, keep_last_messages=2, tokenizer=_count_words)
+    thread = AgentThread(compactor=compactor)
+
+    await thread.on_new_messages(_conversation(8))
+
+    assert await thread.wait_for_compaction()
+    assert len(client.requests) == 1
+    assert thread.message_store is not None
+    assert len(await thread.message_store.list_messages()) < 8
@@ -0,0 +1,102 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+from collections.abc import MutableSequence
+from typing import Any
+
+from agent_framework import AggregateContextProvider, ChatMessage, Context, ContextProvider
+from agent_framework.observability import OtelAttr
+
+
+class _SlowProvider(ContextProvider):
+    def __init__(self, instructions: str, delay: float = 0, invoking_timeout: float | None = None) -> None:
+        self.instructions = instructions
+        self.delay = delay
+        self.invoking_timeout = invoking_timeout
+        self.invoked_calls: list[str] = []
+
+    async def invoking(self, messages: ChatMessage | MutableSequence[ChatMessage], **kwargs: Any) -> Context:
+        await asyncio.sleep(self.delay)
+        return Context(instructions=self.instructions)
+
+    async def invoked(self, request_messages: Any, response_messages: Any = None, **kwargs: Any) -> None:
+        await asyncio.sleep(self.delay)
+        self.invoked_calls.append(request_messages.text)
+
+
+class _RecordingHistogram:
+    def __init__(self) -> None:
+        self.records: list[tuple[float, dict[str, Any]]] = []
+
+    def record(self, amount: float, attributes: dict[str, Any] | None = None, **kwargs: Any) -> None:
+        self.records.append((amount, attributes or {}))
+
+
+async def test_provider_missing_its_deadline_contributes_no_context() -> None:
+    aggregate = AggregateContextProvider(
+        [_SlowProvider("fast. "), _SlowProvider("slow. ", delay=5)], invoking_timeout=0.05
+    )
+
+    context = await aggregate.invoking(ChatMessage(role="user", text="hi"))
+
+    assert context.instructions == "fast. "
+
+
+async def test_provider_deadline_overrides_the_default() -> None:
+    aggregate = AggregateContextProvider(
+        [_SlowProvider("patient. ", delay=0.05, invoking_timeout=5)], invoking_timeout=0.01
+    )
+
+    context = await aggregate.invoking(ChatMessage(role="user", text="hi"))
+
+    assert context.instructions == "patient. "
+
+
+async def test_background_invoked_is_delivered_in_order_on_flush() -> None:
+    provider = _SlowProvider("", delay=0.01)
+    aggregate = AggregateContextProvider(provider, background_invoked=True)
+
+    for text in ("one", "two", "three"):
+        await aggregate.invoked(ChatMessage(role="user", text=text))
+    assert provider.invoked_calls == []
+
+    await aggregate.flush()
+
+    assert provider.invoked_calls == ["one", "two", "three"]
+    await aggregate.aclose()
+
+
+async def test_background_invoked_failures_do_not_stop_the_queue() -> None:
+    class _Failing(ContextProvider):
+        async def invoking(self, messages: Any, **kwargs: Any) -> Context:
+            return Context()
+
+        async def invoked(self, request_messages: Any, response_messages: Any = None, **kwargs: Any) -> None:
+            if request_messages.text == "bad":
+                raise RuntimeError("write failed")
+
+    provider = _SlowProvider("")
+    aggregate = AggregateContextProvider([_Failing(), provider], background_invoked=True)
+
+    await aggregate.invoked(ChatMessage(role="user", text="bad"))
+    await aggregate.invoked(ChatMessage(role="user", text="good"))
+    await aggregate.aclose()
+
+    assert provider.invoked_calls == ["bad", "good"]
+    assert aggregate._invoked_worker is None
+
+
+async def test_provider_latency_is_recorded_per_operation() -> None:
+    histogram = _RecordingHistogram()
+    aggregate = AggregateContextProvider([_SlowProvider("a"), _SlowProvider("b", delay=5)], invoking_timeout=0.05)
+    aggregate._get_duration_histogram = lambda: histogram  # type: ignore[method-assign]
+
+    await aggregate.invoking(ChatMessage(role="user", text="hi"))
+
+    assert sorted(
+        (
+            attributes[OtelAttr.MEASUREMENT_CONTEXT_PROVIDER_OPERATION],
+            attributes[OtelAttr.MEASUREMENT_CONTEXT_PROVIDER_TIMED_OUT],
+        )
+        for _, attributes in histogram.records
+    ) == [("invoking", False), ("invoking", True)]
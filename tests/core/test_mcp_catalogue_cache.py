@@ -0,0 +1,129 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+import pytest
+from mcp import types
+
+from agent_framework import MCPCatalogueCache, _mcp
+from agent_framework._mcp import MCPTool
+
+
+class _FakeSession:
+    def __init__(self, *tool_names: str) -> None:
+        self.tool_names = list(tool_names)
+        self.list_calls = 0
+
+    async def list_tools(self) -> types.ListToolsResult:
+        self.list_calls += 1
+        return types.ListToolsResult(tools=[_tool(name) for name in self.tool_names])
+
+
+class _FakeTool(MCPTool):
+    def __init__(self, session: _FakeSession | None = None, **kwargs: Any) -> None:
+        super().__init__(name="fake", load_prompts=False, **kwargs)
+        self.session = session  # type: ignore[assignment]
+
+    def get_mcp_client(self) -> Any:
+        raise NotImplementedError
+
+    async def connect(self) -> None:
+        if await self._join_warm_up():
+            return
+        raise ConnectionError("server unavailable")
+
+
+def _tool(name: str) -> types.Tool:
+    return types.Tool(name=name, inputSchema={"type": "object", "properties": {"x": {"type": "integer"}}})
+
+
+def _dump(*names: str) -> list[dict[str, Any]]:
+    return [_tool(name).model_dump(mode="json", exclude_none=True) for name in names]
+
+
+async def test_expired_entries_are_ignored(tmp_path: Path) -> None:
+    cache = MCPCatalogueCache(tmp_path, max_age=60)
+    await cache.store("key", "tools", _dump("add"))
+    assert await cache.load("key", "tools") == _dump("add")
+
+    old = time.time() - 120
+    os.utime(tmp_path / "key.tools.json", (old, old))
+
+    assert await cache.load("key", "tools") is None
+    assert await MCPCatalogueCache(tmp_path, max_age=None).load("key", "tools") == _dump("add")
+
+
+async def test_cached_catalogue_is_revalidated_in_the_background(tmp_path: Path) -> None:
+    cache = MCPCatalogueCache(tmp_path)
+    await cache.store("key", "tools", _dump("old"))
+    session = _FakeSession("new")
+    tool = _FakeTool(session, catalogue_cache=cache)
+    tool._catalogue_key = "key"
+
+    await tool.load_tools()
+    # served from the cache first
+    assert [function.name for function in tool.functions] == ["old"]
+
+    await asyncio.gather(*tool._revalidation_tasks)
+
+    assert [function.name for function in tool.functions] == ["new"]
+    assert await cache.load("key", "tools") == _dump("new")
+
+
+async def test_revalidation_can_be_turned_off(tmp_path: Path) -> None:
+    cache = MCPCatalogueCache(tmp_path, revalidate=False)
+    await cache.store("key", "tools", _dump("old"))
+    session = _FakeSession("new")
+    tool = _FakeTool(session, catalogue_cache=cache)
+    tool._catalogue_key = "key"
+
+    await tool.load_tools()
+
+    assert not tool._revalidation_tasks
+    assert session.list_calls == 0
+
+
+async def test_functions_are_reused_until_the_catalogue_changes() -> None:
+    session = _FakeSession("add", "subtract")
+    tool = _FakeTool(session)
+    await tool.load_tools()
+
+    functions = tool.functions
+    assert tool.functions is functions
+
+    session.tool_names = ["add"]
+    await tool.load_tools()
+    assert [function.name for function in tool.functions] == ["add"]
+
+    session.tool_names = ["add", "subtract"]
+    await tool.load_tools()
+    tool.allowed_tools = ["subtract"]
+    assert [function.name for function in tool.functions] == ["subtract"]
+
+
+async def test_failed_warm_up_does_not_report_an_unretrieved_exception() -> None:
+    warm_up = _FakeTool().warm_up()
+    while not warm_up.done():
+        await asyncio.sleep(0)
+
+    # marked as retrieved before anyone asked, so the loop does not log it when the future is collected
+    assert not warm_up._log_traceback  # type: ignore[attr-defined]
+    assert isinstance(warm_up.exception(), ConnectionError)
+
+
+def test_input_models_are_kept_for_the_most_recently_used_schemas(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(_mcp, "_INPUT_MODEL_CACHE", OrderedDict())
+    monkeypatch.setattr(_mcp, "_INPUT_MODEL_CACHE_SIZE", 2)
+
+    first = _mcp._get_input_model_from_mcp_tool(_tool("first"))
+    _mcp._get_input_model_from_mcp_tool(_tool("second"))
+    assert _mcp._get_input_model_from_mcp_tool(_tool("first")) is first
+    _mcp._get_input_model_from_mcp_tool(_tool("third"))
+
+    assert len(_mcp._INPUT_MODEL_CACHE) == 2
+    assert _mcp._get_input_model_from_mcp_tool(_tool("first")) is first
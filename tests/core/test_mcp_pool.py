@@ -0,0 +1,125 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+from typing import Any
+
+import pytest
+from mcp import types
+
+from agent_framework import MCPToolPool
+from agent_framework._mcp import MCPTool
+from agent_framework.exceptions import ToolExecutionException
+
+
+class _FakeServer:
+    """Counts what the members of a pool did; ``broken`` sessions fail their calls and pings."""
+
+    def __init__(self) -> None:
+        self.sessions: list["_FakeSession"] = []
+        self.release = asyncio.Event()
+        self.release.set()
+        self.broken: set[int] = set()
+        self.closed = 0
+
+
+class _FakeSession:
+    def __init__(self, server: _FakeServer) -> None:
+        self.server = server
+        self.index = len(server.sessions)
+        self.calls = 0
+        self.list_calls = 0
+        server.sessions.append(self)
+
+    async def call_tool(self, name: str, arguments: dict[str, Any]) -> types.CallToolResult:
+        self.calls += 1
+        if self.index in self.server.broken:
+            raise ConnectionError("transport closed")
+        await self.server.release.wait()
+        return types.CallToolResult(content=[types.TextContent(type="text", text=f"{name} on {self.index}")])
+
+    async def send_ping(self) -> None:
+        if self.index in self.server.broken:
+            raise ConnectionError("transport closed")
+
+    async def list_tools(self) -> types.ListToolsResult:
+        self.list_calls += 1
+        return types.ListToolsResult(tools=[types.Tool(name="add", inputSchema={"type": "object"})])
+
+    async def list_prompts(self) -> types.ListPromptsResult:
+        self.list_calls += 1
+        return types.ListPromptsResult(prompts=[])
+
+
+class _FakeTool(MCPTool):
+    def __init__(self, server: _FakeServer) -> None:
+        super().__init__(name="fake")
+        self.server = server
+
+    def get_mcp_client(self) -> Any:
+        raise NotImplementedError
+
+    async def connect(self) -> None:
+        self.session = _FakeSession(self.server)  # type: ignore[assignment]
+        self.is_connected = True
+        if self.load_tools_flag:
+            await self.load_tools()
+
+    async def close(self) -> None:
+        self.session = None
+        self.is_connected = False
+        self.server.closed += 1
+
+
+def _pool(server: _FakeServer, size: int = 3, **kwargs: Any) -> MCPToolPool:
+    return MCPToolPool(lambda: _FakeTool(server), size=size, health_check_interval=None, **kwargs)
+
+
+async def test_catalogue_is_loaded_once_for_the_pool() -> None:
+    server = _FakeServer()
+    async with _pool(server) as pool:
+        assert [function.name for function in pool.functions] == ["add"]
+        assert [session.list_calls for session in server.sessions] == [2, 0, 0]
+
+
+async def test_calls_go_to_the_least_loaded_member() -> None:
+    server = _FakeServer()
+    server.release.clear()
+    async with _pool(server) as pool:
+        calls = [asyncio.create_task(pool.call_tool("add")) for _ in range(3)]
+        await asyncio.sleep(0)
+        assert pool.in_flight == [1, 1, 1]
+        server.release.set()
+        results = await asyncio.gather(*calls)
+
+    assert sorted(result[0].text for result in results) == ["add on 0", "add on 1", "add on 2"]
+    assert pool.in_flight == []
+
+
+async def test_failed_call_restarts_its_member() -> None:
+    server = _FakeServer()
+    server.broken.add(0)
+    async with _pool(server, size=1) as pool:
+        with pytest.raises(ToolExecutionException):
+            await pool.call_tool("add")
+        # the failed ping replaces the member with a new session
+        for _ in range(100):
+            if len(server.sessions) > 1 and pool._slots[0].ready.is_set():
+                break
+            await asyncio.sleep(0.01)
+
+        result = await pool.call_tool("add")
+
+    assert result[0].text == "add on 1"
+
+
+async def test_pool_can_be_closed_from_another_task() -> None:
+    server = _FakeServer()
+    pool = _pool(server)
+    await pool.connect()
+
+    await asyncio.create_task(pool.close())
+
+    assert server.closed == 3
+    assert not pool.is_connected
+    with pytest.raises(ToolExecutionException):
+        await pool.call_tool("add")
@@ -0,0 +1,73 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+from typing import Any
+
+from agent_framework import ChatAgent, FunctionInvocationContext, FunctionMiddleware, ai_function
+from agent_framework._middleware import FunctionMiddlewarePipeline
+
+
+class _Recording(FunctionMiddleware):
+    def __init__(self, name: str, calls: list[str]) -> None:
+        self.name = name
+        self.calls = calls
+
+    async def process(self, context: FunctionInvocationContext, next: Any) -> None:
+        self.calls.append(f"{self.name} before")
+        await next(context)
+        self.calls.append(f"{self.name} after")
+
+
+@ai_function
+def double(x: int) -> int:
+    """Double a number."""
+    return x * 2
+
+
+async def test_compiled_pipeline_runs_in_order_on_every_call() -> None:
+    calls: list[str] = []
+    pipeline = FunctionMiddlewarePipeline([_Recording("outer", calls), _Recording("inner", calls)])
+
+    async def final_handler(context: FunctionInvocationContext) -> int:
+        calls.append("function")
+        return context.arguments.x * 2  # type: ignore[attr-defined, no-any-return]
+
+    for x in (1, 2):
+        arguments = double.input_model(x=x)
+        context = FunctionInvocationContext(function=double, arguments=arguments)
+        assert await pipeline.execute(double, arguments, context, final_handler) == x * 2
+
+    assert calls == ["outer before", "inner before", "function", "inner after", "outer after"] * 2
+
+
+async def test_concurrent_calls_keep_their_own_results() -> None:
+    async def yield_control(context: FunctionInvocationContext, next: Any) -> None:
+        await asyncio.sleep(0)
+        await next(context)
+
+    pipeline = FunctionMiddlewarePipeline([yield_control])
+
+    async def call(x: int) -> Any:
+        async def final_handler(context: FunctionInvocationContext) -> int:
+            await asyncio.sleep(0.01 / x)
+            return x
+
+        arguments = double.input_model(x=x)
+        context = FunctionInvocationContext(function=double, arguments=arguments)
+        return await pipeline.execute(double, arguments, context, final_handler)
+
+    assert await asyncio.gather(*[call(x) for x in range(1, 6)]) == [1, 2, 3, 4, 5]
+
+
+async def test_agent_pipelines_are_rebuilt_when_middleware_changes(chat_client_base: Any) -> None:
+    calls: list[str] = []
+    agent = ChatAgent(chat_client=chat_client_base, middleware=[_Recording("first", calls)])
+
+    await agent.run("hi")
+    pipelines = agent._middleware_pipelines  # type: ignore[attr-defined]
+    await agent.run("hi")
+    assert agent._middleware_pipelines is pipelines  # type: ignore[attr-defined]
+
+    agent.middleware = [*agent.middleware, _Recording("second", calls)]  # type: ignore[misc]
+    await agent.run("hi")
+    assert agent._middleware_pipelines is not pipelines  # type: ignore[attr-defined]
@@ -0,0 +1,119 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import json
+import logging
+from typing import Any
+
+import pytest
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from agent_framework import ChatMessage, TextContent, observability
+from agent_framework.observability import (
+    _DEFERRED_MESSAGE_CAPTURES,
+    OBSERVABILITY_SETTINGS,
+    OtelAttr,
+    _MessageCapture,
+    _MessageCaptureSpanExporter,
+)
+
+
+@pytest.fixture
+def sensitive_data(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(OBSERVABILITY_SETTINGS, "enable_sensitive_data", True)
+    monkeypatch.setattr(OBSERVABILITY_SETTINGS, "sensitive_data_sample_rate", 1.0)
+    monkeypatch.setattr(_MessageCapture, "_conversations", {})
+
+
+def _use_provider(monkeypatch: pytest.MonkeyPatch, *exporters: Any) -> TracerProvider:
+    provider = TracerProvider()
+    for exporter in exporters:
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+    monkeypatch.setattr(observability.trace, "get_tracer_provider", lambda: provider)
+    _DEFERRED_MESSAGE_CAPTURES.invalidate()
+    return provider
+
+
+def _input_messages(span: Any) -> list[dict[str, Any]]:
+    return json.loads(span.attributes[OtelAttr.INPUT_MESSAGES])
+
+
+def test_chat_span_keeps_messages_captured_by_the_agent_span(
+    monkeypatch: pytest.MonkeyPatch, sensitive_data: None
+) -> None:
+    monkeypatch.setattr(OBSERVABILITY_SETTINGS, "sensitive_data_capture_mode", "delta")
+    exporter = InMemorySpanExporter()
+    tracer = _use_provider(monkeypatch, exporter).get_tracer(__name__)
+    question = ChatMessage(role="user", text="hi")
+
+    with tracer.start_as_current_span("agent") as agent_span:
+        capture = _MessageCapture.start(agent_span, "test", OtelAttr.AGENT_INVOKE_OPERATION)
+        assert capture is not None
+        capture.add([question])
+        with tracer.start_as_current_span("chat") as chat_span:
+            capture = _MessageCapture.start(chat_span, "test", OtelAttr.CHAT_COMPLETION_OPERATION)
+            assert capture is not None
+            capture.add([ChatMessage(role="system", text="be brief"), question])
+
+    spans = {span.name: span for span in exporter.get_finished_spans()}
+    assert [message["role"] for message in _input_messages(spans["agent"])] == ["user"]
+    assert [message["role"] for message in _input_messages(spans["chat"])] == ["system", "user"]
+
+
+def test_messages_are_set_eagerly_when_an_exporter_is_not_wrapped(
+    monkeypatch: pytest.MonkeyPatch, sensitive_data: None
+) -> None:
+    wrapped = InMemorySpanExporter()
+    plain = InMemorySpanExporter()
+    tracer = _use_provider(monkeypatch, _MessageCaptureSpanExporter(wrapped), plain).get_tracer(__name__)
+
+    with tracer.start_as_current_span("chat") as span:
+        capture = _MessageCapture.start(span, "test", OtelAttr.CHAT_COMPLETION_OPERATION)
+        assert capture is not None
+        capture.add([ChatMessage(role="user", text="hi")])
+
+    assert _input_messages(plain.get_finished_spans()[0])[0]["parts"][0]["content"] == "hi"
+    assert _input_messages(wrapped.get_finished_spans()[0])[0]["parts"][0]["content"] == "hi"
+
+
+def test_deferred_messages_are_snapshotted_when_captured(
+    monkeypatch: pytest.MonkeyPatch, sensitive_data: None
+) -> None:
+    exporter = InMemorySpanExporter()
+    tracer = _use_provider(monkeypatch, _MessageCaptureSpanExporter(exporter)).get_tracer(__name__)
+    message = ChatMessage(role="user", text="hi")
+
+    with tracer.start_as_current_span("chat") as span:
+        capture = _MessageCapture.start(span, "test", OtelAttr.CHAT_COMPLETION_OPERATION)
+        assert capture is not None
+        capture.add([message])
+        assert _DEFERRED_MESSAGE_CAPTURES.exporters() == 1
+        message.contents.append(TextContent(text="added later"))
+
+    assert [part["content"] for part in _input_messages(exporter.get_finished_spans()[0])[0]["parts"]] == ["hi"]
+
+
+def test_log_events_are_emitted_when_captured(
+    monkeypatch: pytest.MonkeyPatch, sensitive_data: None, caplog: pytest.LogCaptureFixture
+) -> None:
+    exporter = InMemorySpanExporter()
+    tracer = _use_provider(monkeypatch, _MessageCaptureSpanExporter(exporter)).get_tracer(__name__)
+
+    with caplog.at_level(logging.INFO, logger=observability.logger.name):
+        with tracer.start_as_current_span("chat") as span:
+            capture = _MessageCapture.start(span, "test", OtelAttr.CHAT_COMPLETION_OPERATION)
+            assert capture is not None
+            capture.add([ChatMessage(role="user", text="hi")])
+            assert not exporter.get_finished_spans()
+            assert [record.msg["contents"][0]["text"] for record in caplog.records] == ["hi"]
+
+
+def test_shut_down_exporters_stop_deferring(monkeypatch: pytest.MonkeyPatch) -> None:
+    exporter = _MessageCaptureSpanExporter(InMemorySpanExporter())
+    _use_provider(monkeypatch, exporter)
+    assert _DEFERRED_MESSAGE_CAPTURES.exporters() == 1
+
+    exporter.shutdown()
+
+    assert _DEFERRED_MESSAGE_CAPTURES.exporters() == 0
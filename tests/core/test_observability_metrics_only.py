@@ -0,0 +1,95 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from typing import Any
+
+import pytest
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+from agent_framework import _tools, ai_function
+from agent_framework.observability import (
+    OBSERVABILITY_SETTINGS,
+    EdgeGroupDeliveryStatus,
+    OtelAttr,
+    _WorkflowMetrics,
+    create_processing_span,
+    workflow_metrics,
+)
+
+
+@pytest.fixture
+def metrics_only(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(OBSERVABILITY_SETTINGS, "enable_otel", True)
+    monkeypatch.setattr(OBSERVABILITY_SETTINGS, "metrics_only", True)
+
+
+class _Histogram:
+    def __init__(self) -> None:
+        self.recorded: list[tuple[float, dict[str, Any]]] = []
+
+    def record(self, amount: float, attributes: dict[str, Any]) -> None:
+        self.recorded.append((amount, attributes))
+
+
+def _points(reader: InMemoryMetricReader, name: str) -> list[Any]:
+    data = reader.get_metrics_data()
+    return [
+        point
+        for resource_metrics in data.resource_metrics
+        for scope_metrics in resource_metrics.scope_metrics
+        for metric in scope_metrics.metrics
+        if metric.name == name
+        for point in metric.data.data_points
+    ]
+
+
+def test_metrics_only_creates_no_workflow_spans(metrics_only: None) -> None:
+    assert OBSERVABILITY_SETTINGS.ENABLED
+    assert not OBSERVABILITY_SETTINGS.TRACING_ENABLED
+
+    with create_processing_span("executor", "Executor", "Message", "str") as span:
+        assert not span.is_recording()
+    assert workflow_metrics() is not None
+
+
+async def test_metrics_only_tool_calls_record_their_duration_without_a_span(
+    monkeypatch: pytest.MonkeyPatch, metrics_only: None
+) -> None:
+    def no_span(**kwargs: Any) -> Any:
+        raise AssertionError("no span expected")
+
+    monkeypatch.setattr(_tools, "get_function_span", no_span)
+
+    @ai_function
+    def add(a: int, b: int) -> int:
+        """Add two numbers."""
+        return a + b
+
+    histogram = _Histogram()
+    add._invocation_duration_histogram = histogram  # type: ignore[assignment]
+
+    assert await add.invoke(a=1, b=2) == 3
+    assert [attributes for _, attributes in histogram.recorded] == [{OtelAttr.MEASUREMENT_FUNCTION_TAG_NAME: "add"}]
+
+
+def test_workflow_metrics_reuse_their_attribute_sets() -> None:
+    reader = InMemoryMetricReader()
+    instruments = _WorkflowMetrics(MeterProvider(metric_readers=[reader]).get_meter("test"))
+
+    instruments.record_edge_group_delivery("FanOutEdgeGroup", EdgeGroupDeliveryStatus.DELIVERED)
+    instruments.record_edge_group_delivery("FanOutEdgeGroup", EdgeGroupDeliveryStatus.DELIVERED)
+    instruments.record_executor_duration("writer", "AgentExecutor", 0.5)
+    instruments.record_executor_duration("writer", "AgentExecutor", 0.5, error=ValueError("boom"))
+
+    assert len(instruments._edge_group_attributes) == 1
+    # the error type is added to a copy, the cached attributes of the executor stay untouched
+    assert instruments._executor_attributes[("writer", "AgentExecutor")] == {
+        OtelAttr.EXECUTOR_ID: "writer",
+        OtelAttr.EXECUTOR_TYPE: "AgentExecutor",
+    }
+    deliveries = _points(reader, OtelAttr.MEASUREMENT_EDGE_GROUP_DELIVERIES)
+    assert [(point.value, point.attributes[OtelAttr.EDGE_GROUP_DELIVERY_STATUS]) for point in deliveries] == [
+        (2, EdgeGroupDeliveryStatus.DELIVERED.value)
+    ]
+    durations = _points(reader, OtelAttr.MEASUREMENT_EXECUTOR_DURATION)
+    assert sorted(point.attributes.get(OtelAttr.ERROR_TYPE, "") for point in durations) == ["", "ValueError"]
@@ -0,0 +1,60 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import gc
+import json
+
+import pytest
+
+from agent_framework._serialization import _SERIALIZATION_PLANS, SerializationMixin
+
+
+class _Record(SerializationMixin):
+    def __init__(self, name: str, score: float = 0.0, tags: list[str] | None = None) -> None:
+        self.name = name
+        self.score = score
+        self.tags = tags or []
+
+
+def test_to_json_is_byte_stable_by_default() -> None:
+    record = _Record(name="café", score=float("nan"), tags=["ü"])
+
+    assert record.to_json() == json.dumps(record.to_dict())
+
+
+def test_to_json_passes_kwargs_to_json_dumps() -> None:
+    record = _Record(name="café")
+
+    assert record.to_json(ensure_ascii=False, indent=2) == json.dumps(record.to_dict(), ensure_ascii=False, indent=2)
+
+
+def test_to_json_fast_round_trips() -> None:
+    record = _Record(name="café", score=1.5, tags=["a"])
+
+    restored = _Record.from_json(record.to_json(fast=True))
+
+    assert (restored.name, restored.score, restored.tags) == ("café", 1.5, ["a"])
+
+
+def test_from_json_accepts_nan_literals() -> None:
+    restored = _Record.from_json(_Record(name="x", score=float("nan")).to_json())
+
+    assert restored.score != restored.score
+
+
+def test_serialization_plans_do_not_keep_classes_alive() -> None:
+    cls = type("_Dynamic", (_Record,), {})
+    cls(name="x").to_dict()
+    assert cls in _SERIALIZATION_PLANS
+
+    count = len(_SERIALIZATION_PLANS)
+    del cls
+    gc.collect()
+
+    assert len(_SERIALIZATION_PLANS) == count - 1
+
+
+@pytest.mark.parametrize("exclude_none", [True, False])
+def test_to_dict_round_trip(exclude_none: bool) -> None:
+    data = _Record(name="x", tags=["a", "b"]).to_dict(exclude_none=exclude_none)
+
+    assert _Record.from_dict(data).tags == ["a", "b"]
@@ -0,0 +1,50 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from agent_framework import ChatMessage, FunctionResultContent, TokenBudgetChatMessageStore
+
+
+def _count_words(text: str) -> int:
+    return len(text.split())
+
+
+async def test_window_keeps_the_newest_messages_within_the_budget() -> None:
+    # each message is 4 overhead tokens plus one token per word
+    store = TokenBudgetChatMessageStore(max_tokens=15, tokenizer=_count_words)
+
+    await store.add_messages([ChatMessage(role="user", text=f"message {index}") for index in range(4)])
+
+    assert [message.text for message in await store.list_messages()] == ["message 2", "message 3"]
+    assert store.token_count == 12
+    assert len(await store.list_all_messages()) == 4
+
+
+async def test_overhead_counts_against_the_budget() -> None:
+    store = TokenBudgetChatMessageStore(max_tokens=15, tokenizer=_count_words, system_message="be brief")
+
+    await store.add_messages([ChatMessage(role="user", text=f"message {index}") for index in range(4)])
+
+    assert store.overhead_tokens == 6
+    assert [message.text for message in await store.list_messages()] == ["message 3"]
+
+
+async def test_window_does_not_start_with_a_tool_message() -> None:
+    store = TokenBudgetChatMessageStore(max_tokens=12, tokenizer=_count_words)
+
+    await store.add_messages([
+        ChatMessage(role="assistant", text="calling a tool"),
+        ChatMessage(role="tool", contents=[FunctionResultContent(call_id="1", result="ok")]),
+        ChatMessage(role="assistant", text="done"),
+    ])
+
+    assert [message.role.value for message in await store.list_messages()] == ["assistant"]
+
+
+async def test_serialize_round_trip_rebuilds_the_window() -> None:
+    store = TokenBudgetChatMessageStore(max_tokens=15, tokenizer=_count_words)
+    await store.add_messages([ChatMessage(role="user", text=f"message {index}") for index in range(4)])
+
+    restored = await TokenBudgetChatMessageStore.deserialize(await store.serialize(), tokenizer=_count_words)
+
+    assert restored.max_tokens == 15
+    assert len(await restored.list_all_messages()) == 4
+    assert [message.text for message in await restored.list_messages()] == ["message 2", "message 3"]
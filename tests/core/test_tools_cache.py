@@ -0,0 +1,74 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any
+
+from agent_framework import AIFunction, InMemoryToolResultCache, ai_function
+
+
+async def test_cache_key_includes_the_function_identity() -> None:
+    cache = InMemoryToolResultCache()
+
+    def first(x: int) -> str:
+        return "first"
+
+    def second(x: int) -> str:
+        return "second"
+
+    tools = [
+        AIFunction(name="lookup", func=function, cacheable=True, cache=cache)  # type: ignore[var-annotated]
+        for function in (first, second)
+    ]
+
+    assert [await tool.invoke(x=1) for tool in tools] == ["first", "second"]
+
+
+async def test_callers_get_copies_of_cached_results() -> None:
+    @ai_function(cacheable=True, cache=InMemoryToolResultCache())
+    def items(category: str) -> list[str]:
+        return ["a", "b"]
+
+    first = await items.invoke(category="x")
+    first.append("mutated")
+
+    assert await items.invoke(category="x") == ["a", "b"]
+    assert items.invocation_count == 1
+
+
+async def test_cancelled_leader_does_not_cancel_joined_calls() -> None:
+    release = asyncio.Event()
+
+    @ai_function(cacheable=True, cache=InMemoryToolResultCache())
+    async def slow(x: int) -> int:
+        await release.wait()
+        return x * 2
+
+    leader = asyncio.create_task(slow.invoke(x=2))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(slow.invoke(x=2))
+    await asyncio.sleep(0)
+    leader.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await follower == 4
+    assert leader.cancelled()
+    assert slow.invocation_count == 1
+
+
+async def test_cache_hits_skip_the_invocation_slot() -> None:
+    entered: list[int] = []
+
+    @asynccontextmanager
+    async def slot() -> Any:
+        entered.append(1)
+        yield
+
+    @ai_function(cacheable=True, cache=InMemoryToolResultCache())
+    def double(x: int) -> int:
+        return x * 2
+
+    assert await double.invoke(x=3, invocation_slot=slot) == 6
+    assert await double.invoke(x=3, invocation_slot=slot) == 6
+    assert entered == [1]
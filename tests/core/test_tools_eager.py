@@ -0,0 +1,107 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+from typing import Any
+
+from agent_framework import (
+    ChatResponseUpdate,
+    FunctionCallContent,
+    FunctionInvocationConfiguration,
+    FunctionInvocationContext,
+    FunctionMiddleware,
+    FunctionResultContent,
+    ai_function,
+)
+
+
+def _function_call(call_id: str, name: str, arguments: Any) -> ChatResponseUpdate:
+    return ChatResponseUpdate(
+        role="assistant", contents=[FunctionCallContent(call_id=call_id, name=name, arguments=arguments)]
+    )
+
+
+def _results(updates: list[ChatResponseUpdate]) -> list[Any]:
+    return [
+        content.result
+        for update in updates
+        for content in update.contents
+        if isinstance(content, FunctionResultContent)
+    ]
+
+
+async def test_call_with_empty_arguments_starts_while_streaming(chat_client_base: Any) -> None:
+    started = asyncio.Event()
+
+    @ai_function
+    def ping() -> str:
+        """Answer a ping."""
+        started.set()
+        return "pong"
+
+    async def wait_for_call() -> None:
+        # only completes when the call was started before the stream ended
+        await asyncio.wait_for(started.wait(), timeout=5)
+
+    chat_client_base.function_invocation_configuration = FunctionInvocationConfiguration(
+        eager_function_invocation=True
+    )
+    chat_client_base.streaming_responses = [[_function_call("1", "ping", {}), wait_for_call]]
+
+    updates = [update async for update in chat_client_base.get_streaming_response("hi", tools=[ping])]
+
+    assert _results(updates) == ["pong"]
+
+
+async def test_eager_calls_run_through_function_middleware(chat_client_base: Any) -> None:
+    class Override(FunctionMiddleware):
+        async def process(self, context: FunctionInvocationContext, next: Any) -> None:
+            await next(context)
+            context.result = f"intercepted {context.result}"
+
+    @ai_function
+    def echo(text: str) -> str:
+        """Echo the text."""
+        return text
+
+    chat_client_base.middleware = [Override()]
+    chat_client_base.function_invocation_configuration = FunctionInvocationConfiguration(
+        eager_function_invocation=True
+    )
+    chat_client_base.streaming_responses = [[_function_call("1", "echo", '{"text": "a"}')]]
+
+    updates = [update async for update in chat_client_base.get_streaming_response("hi", tools=[echo])]
+
+    assert _results(updates) == ["intercepted a"]
+
+
+async def test_closing_the_stream_cancels_and_awaits_started_calls(chat_client_base: Any) -> None:
+    started = asyncio.Event()
+    finished: list[str] = []
+
+    @ai_function
+    async def slow() -> str:
+        """Never finishes on its own."""
+        started.set()
+        try:
+            await asyncio.sleep(60)
+        finally:
+            finished.append("cleaned up")
+        return "late"
+
+    async def wait_for_call() -> None:
+        await asyncio.wait_for(started.wait(), timeout=5)
+
+    chat_client_base.function_invocation_configuration = FunctionInvocationConfiguration(
+        eager_function_invocation=True
+    )
+    chat_client_base.streaming_responses = [
+        [_function_call("1", "slow", {}), wait_for_call, ChatResponseUpdate(role="assistant", text="more")]
+    ]
+
+    stream = chat_client_base.get_streaming_response("hi", tools=[slow])
+    async for _ in stream:
+        if started.is_set():
+            break
+    await stream.aclose()
+
+    assert finished == ["cleaned up"]
@@ -0,0 +1,60 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextvars import ContextVar
+
+from agent_framework import FunctionInvocationConfiguration, ai_function
+
+_request_id: ContextVar[str] = ContextVar("_request_id", default="unset")
+
+
+@ai_function
+def current_pid() -> int:
+    """Return the process id of the worker."""
+    return os.getpid()
+
+
+@ai_function
+def current_request_id() -> str:
+    """Return the request id of the calling context."""
+    return _request_id.get()
+
+
+async def test_thread_executor_propagates_context_variables() -> None:
+    _request_id.set("req-1")
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert await current_request_id.invoke(sync_executor=executor) == "req-1"
+
+
+async def test_process_executor_runs_decorated_module_functions() -> None:
+    context = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        pid = await current_pid.invoke(sync_executor=executor)
+
+    assert pid != os.getpid()
+    assert current_pid.invocation_count == 1
+
+
+def test_named_executors_are_shared_across_configurations() -> None:
+    first = FunctionInvocationConfiguration(sync_function_executor="thread")._get_sync_executor()
+    second = FunctionInvocationConfiguration(sync_function_executor="thread")._get_sync_executor()
+
+    assert first is second
+
+
+def test_concurrency_semaphore_is_created_per_event_loop() -> None:
+    @ai_function(max_concurrency=1)
+    def limited() -> str:
+        return "ok"
+
+    async def semaphores() -> tuple[asyncio.Semaphore | None, asyncio.Semaphore | None]:
+        return limited._get_concurrency_semaphore(), limited._get_concurrency_semaphore()
+
+    first, same_loop = asyncio.run(semaphores())
+    other_loop, _ = asyncio.run(semaphores())
+
+    assert first is not None and first is same_loop
+    assert other_loop is not first
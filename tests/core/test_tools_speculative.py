@@ -0,0 +1,134 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+from typing import Any
+
+from agent_framework import (
+    ChatMessage,
+    ChatResponse,
+    FunctionCallContent,
+    FunctionInvocationConfiguration,
+    FunctionResultContent,
+    ai_function,
+)
+from agent_framework._tools import _SpeculativeFunctionCalls
+
+
+def _function_calls(*calls: tuple[str, str, str]) -> ChatResponse:
+    return ChatResponse(
+        messages=ChatMessage(
+            role="assistant",
+            contents=[FunctionCallContent(call_id=call_id, name=name, arguments=args) for call_id, name, args in calls],
+        )
+    )
+
+
+def _results(response: ChatResponse) -> dict[str, FunctionResultContent]:
+    return {
+        content.call_id: content
+        for message in response.messages
+        for content in message.contents
+        if isinstance(content, FunctionResultContent)
+    }
+
+
+async def test_only_side_effect_free_functions_run_speculatively(chat_client_base: Any) -> None:
+    @ai_function
+    def send_mail(to: str) -> str:
+        """Send a mail."""
+        return "sent"
+
+    @ai_function(side_effect_free=True)
+    def read_mail(folder: str) -> str:
+        """Read the mail."""
+        return "no new mail"
+
+    chat_client_base.function_invocation_configuration = FunctionInvocationConfiguration(
+        speculative_function_calls={"send_mail": {"to": "a"}, "read_mail": {"folder": "inbox"}}
+    )
+    chat_client_base.run_responses = [
+        _function_calls(("1", "read_mail", '{"folder": "inbox"}'), ("2", "send_mail", '{"to": "b"}'))
+    ]
+
+    response = await chat_client_base.get_response("hi", tools=[send_mail, read_mail])
+
+    assert {call_id: content.result for call_id, content in _results(response).items()} == {
+        "1": "no new mail",
+        "2": "sent",
+    }
+    # the speculative read was reused, the mail to "a" that the model did not request was never sent
+    assert read_mail.invocation_count == 1
+    assert send_mail.invocation_count == 1
+
+
+async def test_failing_prediction_skips_speculation(chat_client_base: Any) -> None:
+    @ai_function(side_effect_free=True)
+    def lookup(key: str) -> str:
+        """Look up a key."""
+        return key
+
+    def predict(messages: Any) -> dict[str, dict[str, Any]]:
+        raise RuntimeError("predictor failed")
+
+    chat_client_base.function_invocation_configuration = FunctionInvocationConfiguration(
+        speculative_function_calls=predict
+    )
+    chat_client_base.run_responses = [_function_calls(("1", "lookup", '{"key": "a"}'))]
+
+    response = await chat_client_base.get_response("hi", tools=[lookup])
+
+    assert _results(response)["1"].result == "a"
+
+
+async def test_speculative_calls_share_the_parallel_limit(chat_client_base: Any) -> None:
+    running = 0
+    peak = 0
+
+    async def track() -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    @ai_function(side_effect_free=True)
+    async def first(x: int) -> int:
+        """First lookup."""
+        await track()
+        return x
+
+    @ai_function(side_effect_free=True)
+    async def second(x: int) -> int:
+        """Second lookup."""
+        await track()
+        return x
+
+    chat_client_base.function_invocation_configuration = FunctionInvocationConfiguration(
+        max_parallel_function_calls=1, speculative_function_calls={"first": {"x": 1}}
+    )
+    chat_client_base.run_responses = [_function_calls(("1", "first", '{"x": 1}'), ("2", "second", '{"x": 2}'))]
+
+    response = await chat_client_base.get_response("hi", tools=[first, second])
+
+    assert {call_id: content.result for call_id, content in _results(response).items()} == {"1": 1, "2": 2}
+    assert first.invocation_count == 1
+    assert peak == 1
+
+
+async def test_claimed_result_keeps_all_fields() -> None:
+    error = ValueError("boom")
+
+    async def speculative_result() -> FunctionResultContent:
+        return FunctionResultContent(
+            call_id="speculative_lookup",
+            result="Error: Function failed.",
+            exception=error,
+            additional_properties={"source": "cache"},
+        )
+
+    result = await _SpeculativeFunctionCalls._result_for(asyncio.create_task(speculative_result()), "call_1")
+
+    assert isinstance(result, FunctionResultContent)
+    assert result.call_id == "call_1"
+    assert result.exception is error
+    assert result.additional_properties == {"source": "cache"}
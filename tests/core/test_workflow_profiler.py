@@ -0,0 +1,89 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import json
+from pathlib import Path
+from time import perf_counter
+
+import pytest
+
+from agent_framework import WorkflowBuilder, WorkflowContext, WorkflowProfiler, executor
+
+
+def _workflow(delay: float = 0.02, busy: float = 0.0, fail: bool = False):  # type: ignore[no-untyped-def]
+    @executor(id="upper")
+    async def upper(text: str, ctx: WorkflowContext[str]) -> None:
+        await asyncio.sleep(delay)
+        await ctx.send_message(text.upper())
+
+    @executor(id="emit")
+    async def emit(text: str, ctx: WorkflowContext[str, str]) -> None:
+        deadline = perf_counter() + busy
+        while perf_counter() < deadline:
+            pass
+        if fail:
+            raise ValueError("boom")
+        await ctx.yield_output(f"{text}!")
+
+    return WorkflowBuilder().set_start_executor(upper).add_edge(upper, emit).build()
+
+
+async def test_profiler_records_invocations_supersteps_and_edges() -> None:
+    profiler = WorkflowProfiler()
+
+    result = await _workflow(busy=0.02).run("hi", profiler=profiler)
+
+    assert result.get_outputs() == ["HI!"]
+    assert len(profiler.runs) == 1
+    assert [(step.index, step.queue_depth) for step in profiler.supersteps] == [(0, 0), (1, 1)]
+    invocations = {invocation.executor_id: invocation for invocation in profiler.invocations}
+    assert (invocations["upper"].superstep, invocations["emit"].superstep) == (0, 1)
+    # the sleeping executor waits, the busy one spends its time on the CPU
+    assert invocations["upper"].await_time > invocations["upper"].cpu_time
+    assert invocations["emit"].cpu_time > invocations["emit"].await_time
+    assert [(edge.source_ids, edge.target_id, edge.superstep) for edge in profiler.edge_deliveries] == [
+        (["upper"], "emit", 1)
+    ]
+    assert "WorkflowOutputEvent" in profiler.event_lag
+
+
+async def test_failed_invocations_are_marked() -> None:
+    profiler = WorkflowProfiler()
+
+    with pytest.raises(ValueError):
+        await _workflow(delay=0, fail=True).run("hi", profiler=profiler)
+
+    assert [(invocation.executor_id, invocation.failed) for invocation in profiler.invocations] == [
+        ("upper", False),
+        ("emit", True),
+    ]
+    assert profiler.runs[0][1] is not None
+
+
+async def test_exports_are_valid_traces(tmp_path: Path) -> None:
+    profiler = WorkflowProfiler()
+    await _workflow(delay=0).run("hi", profiler=profiler)
+
+    speedscope = json.loads(profiler.save(tmp_path / "profile.json").read_text())
+    frames = [frame["name"] for frame in speedscope["shared"]["frames"]]
+    assert {"upper", "emit", "upper -> emit"} <= set(frames)
+    for profile in speedscope["profiles"]:
+        opened = [event["frame"] for event in profile["events"] if event["type"] == "O"]
+        closed = [event["frame"] for event in profile["events"] if event["type"] == "C"]
+        assert sorted(opened) == sorted(closed)
+
+    chrome = json.loads(profiler.save(tmp_path / "trace.json", format="chrome").read_text())
+    spans = {event["name"] for event in chrome["traceEvents"] if event["ph"] == "X"}
+    assert {"upper", "emit"} <= spans
+    assert "upper" in profiler.summary()
+
+
+async def test_runs_without_a_profiler_record_nothing() -> None:
+    profiler = WorkflowProfiler()
+    workflow = _workflow(delay=0)
+
+    await workflow.run("hi", profiler=profiler)
+    await workflow.run("again")
+
+    assert len(profiler.runs) == 1
+    assert len(profiler.invocations) == 2
@@ -0,0 +1,87 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from typing import Any
+
+import pytest
+
+import agent_framework_devui._conversations as conversations
+from agent_framework import ChatMessage
+from agent_framework_devui._conversations import InMemoryConversationStore
+
+
+def _text_items(*texts: str) -> list[dict[str, Any]]:
+    return [{"role": "user", "content": [{"type": "text", "text": text}]} for text in texts]
+
+
+def _texts(items: list[Any]) -> list[str]:
+    return [item.content[0].text for item in items]
+
+
+async def test_pages_follow_the_cursor_in_both_directions() -> None:
+    store = InMemoryConversationStore()
+    conversation = store.create_conversation()
+    await store.add_items(conversation.id, _text_items("a", "b", "c", "d", "e"))
+
+    first, has_more = await store.list_items(conversation.id, limit=2)
+    second, _ = await store.list_items(conversation.id, limit=2, after=first[-1].id)
+    last, no_more = await store.list_items(conversation.id, limit=2, after=second[-1].id)
+    newest, _ = await store.list_items(conversation.id, limit=2, order="desc")
+    older, _ = await store.list_items(conversation.id, limit=2, order="desc", after=newest[-1].id)
+
+    assert (_texts(first), has_more) == (["a", "b"], True)
+    assert _texts(second) == ["c", "d"]
+    assert (_texts(last), no_more) == (["e"], False)
+    assert _texts(newest) == ["e", "d"]
+    assert _texts(older) == ["c", "b"]
+
+
+async def test_messages_are_converted_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    converted: list[str] = []
+    convert_message = conversations._convert_message
+
+    def counting_convert(message: ChatMessage, item_id: str) -> Any:
+        converted.append(message.text)
+        return convert_message(message, item_id)
+
+    monkeypatch.setattr(conversations, "_convert_message", counting_convert)
+    store = InMemoryConversationStore()
+    conversation = store.create_conversation()
+
+    await store.add_items(conversation.id, _text_items("a", "b"))
+    await store.list_items(conversation.id)
+    await store.add_items(conversation.id, _text_items("c"))
+    items, _ = await store.list_items(conversation.id)
+
+    assert converted == ["a", "b", "c"]
+    assert store.get_item(conversation.id, items[-1].id) is items[-1]
+
+
+async def test_rewritten_messages_rebuild_the_index() -> None:
+    store = InMemoryConversationStore()
+    conversation = store.create_conversation()
+    await store.add_items(conversation.id, _text_items("a", "b", "c"))
+    await store.list_items(conversation.id)
+
+    thread = store.get_thread(conversation.id)
+    assert thread is not None and thread.message_store is not None
+    original = await thread.message_store.list_messages()
+    assert await thread.message_store.replace_messages(  # type: ignore[attr-defined]
+        original[:2], [ChatMessage(role="user", text="summary"), ChatMessage(role="user", text="of a and b")]
+    )
+    items, _ = await store.list_items(conversation.id)
+
+    assert _texts(items) == ["summary", "of a and b", "c"]
+
+
+def test_metadata_index_follows_updates_and_deletes() -> None:
+    store = InMemoryConversationStore()
+    first = store.create_conversation({"agent_id": "a", "env": "dev"})
+    second = store.create_conversation({"agent_id": "a", "env": "prod"})
+
+    store.update_conversation(second.id, {"agent_id": "b", "env": "prod"})
+    store.delete_conversation(first.id)
+    third = store.create_conversation({"agent_id": "b", "env": "dev"})
+
+    assert [c.id for c in store.list_conversations_by_metadata({"agent_id": "a"})] == []
+    assert [c.id for c in store.list_conversations_by_metadata({"agent_id": "b"})] == [second.id, third.id]
+    assert [c.id for c in store.list_conversations_by_metadata({"agent_id": "b", "env": "dev"})] == [third.id]
@@ -0,0 +1,79 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import gc
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from agent_framework_devui import SQLiteConversationStore
+
+
+def _text_items(*texts: str) -> list[dict[str, Any]]:
+    return [{"role": "user", "content": [{"type": "text", "text": text}]} for text in texts]
+
+
+async def test_database_access_runs_off_the_event_loop(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    store = SQLiteConversationStore(tmp_path / "conversations.db")
+    conversation = store.create_conversation()
+    loop_thread = threading.get_ident()
+    on_loop: list[str] = []
+    execute, transaction = store._db.execute, store._db.transaction
+
+    def checked_execute(sql: str, parameters: Any = ()) -> Any:
+        if threading.get_ident() == loop_thread:
+            on_loop.append(sql)
+        return execute(sql, parameters)
+
+    def checked_transaction() -> Any:
+        if threading.get_ident() == loop_thread:
+            on_loop.append("transaction")
+        return transaction()
+
+    monkeypatch.setattr(store._db, "execute", checked_execute)
+    monkeypatch.setattr(store._db, "transaction", checked_transaction)
+
+    await store.add_items(conversation.id, _text_items("a", "b"))
+    items, _ = await store.list_items(conversation.id)
+    await store.get_checkpoint_storage(conversation.id).list_checkpoint_ids()
+
+    assert [item.content[0].text for item in items] == ["a", "b"]
+    assert on_loop == ["SELECT 1 FROM conversations WHERE id = ?"]
+    store.close()
+
+
+async def test_concurrent_adds_are_written_in_order(tmp_path: Path) -> None:
+    path = tmp_path / "conversations.db"
+    store = SQLiteConversationStore(path)
+    conversation = store.create_conversation()
+    thread = store.get_thread(conversation.id)
+    assert thread is not None
+
+    await asyncio.gather(*[store.add_items(conversation.id, _text_items(str(i))) for i in range(10)])
+    assert thread.message_store is not None
+    in_memory = [message.text for message in await thread.message_store.list_messages()]
+    store.close()
+
+    reopened = SQLiteConversationStore(path)
+    items, _ = await reopened.list_items(conversation.id)
+    assert [item.content[0].text for item in items] == in_memory == [str(i) for i in range(10)]
+    reopened.close()
+
+
+async def test_evicted_thread_in_use_is_not_rebuilt(tmp_path: Path) -> None:
+    store = SQLiteConversationStore(tmp_path / "conversations.db", max_hydrated_threads=1)
+    first, second = store.create_conversation(), store.create_conversation()
+
+    in_use = store.get_thread(first.id)
+    store.get_thread(second.id)
+
+    assert store.get_thread(first.id) is in_use
+    assert first.id in store._threads
+
+    store.get_thread(second.id)
+    del in_use
+    gc.collect()
+    assert first.id not in store._evicted_threads
+    store.close()
@@ -0,0 +1,110 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+from typing import Any
+
+from agent_framework import ChatMessage
+from agent_framework_mem0 import Mem0Provider
+
+
+class _FakeMem0Client:
+    """Records the searches and adds the provider makes."""
+
+    def __init__(self) -> None:
+        self.searches: list[tuple[str, str | None]] = []
+        self.added: list[list[dict[str, str]]] = []
+
+    async def search(self, *, query: str, run_id: str | None = None, **kwargs: Any) -> list[dict[str, Any]]:
+        self.searches.append((query, run_id))
+        return [{"memory": f"remembered for {query}"}]
+
+    async def add(self, *, messages: list[dict[str, str]], **kwargs: Any) -> None:
+        self.added.append(messages)
+
+
+class _ClosableMem0Client(_FakeMem0Client):
+    """A client the provider enters and exits."""
+
+    open = False
+
+    async def __aenter__(self) -> "_ClosableMem0Client":
+        self.open = True
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        self.open = False
+
+
+def _provider(client: _FakeMem0Client, **kwargs: Any) -> Mem0Provider:
+    return Mem0Provider(mem0_client=client, user_id="user", **kwargs)  # type: ignore[arg-type]
+
+
+async def test_prefetch_is_used_only_for_the_same_query() -> None:
+    client = _FakeMem0Client()
+    provider = _provider(client, prefetch_query="preferences", search_cache_ttl=0)
+
+    await provider.thread_created("thread-1")
+    await asyncio.sleep(0)
+    other = await provider.invoking(ChatMessage(role="user", text="weather"))
+    same = await provider.invoking(ChatMessage(role="user", text="preferences"))
+
+    assert other.messages[0].text.endswith("remembered for weather")
+    assert same.messages[0].text.endswith("remembered for preferences")
+    assert [query for query, _ in client.searches] == ["preferences", "weather"]
+
+
+async def test_prefetch_starts_for_local_threads() -> None:
+    client = _FakeMem0Client()
+    provider = _provider(client, prefetch_query="preferences")
+
+    async with provider:
+        await asyncio.sleep(0)
+        assert client.searches == [("preferences", None)]
+    async with provider:
+        await provider.invoking(ChatMessage(role="user", text="preferences"))
+
+    assert client.searches == [("preferences", None)]
+
+
+async def test_write_behind_memories_are_added_when_the_outermost_context_exits() -> None:
+    client = _ClosableMem0Client()
+    provider = _provider(client, write_behind=True, write_flush_interval=60)
+    provider._should_close_client = True
+
+    async with provider:
+        # the agent enters the provider again for each run
+        async with provider:
+            await provider.invoked(ChatMessage(role="user", text="first"))
+        async with provider:
+            await provider.invoked(ChatMessage(role="user", text="second"))
+        assert client.open
+
+    assert client.added == [[{"role": "user", "content": "first"}, {"role": "user", "content": "second"}]]
+    assert not client.open
+
+
+def test_write_behind_memories_are_added_when_the_loop_is_closed() -> None:
+    client = _FakeMem0Client()
+    provider = _provider(client, write_behind=True, write_flush_interval=60)
+
+    async def run() -> None:
+        await provider.invoked(ChatMessage(role="user", text="remember this"))
+
+    asyncio.run(run())
+
+    assert client.added == [[{"role": "user", "content": "remember this"}]]
+
+
+def test_flush_lock_is_created_per_event_loop() -> None:
+    provider = _provider(_FakeMem0Client(), write_behind=True)
+    locks: list[asyncio.Lock] = []
+
+    async def remember(text: str) -> None:
+        await provider.invoked(ChatMessage(role="user", text=text))
+        locks.append(provider._get_flush_lock())
+        await provider.aclose()
+
+    asyncio.run(remember("first"))
+    asyncio.run(remember("second"))
+
+    assert locks[0] is not locks[1]
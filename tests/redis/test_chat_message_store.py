@@ -0,0 +1,48 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import pytest
+from redis.crc import key_slot
+
+from agent_framework import ChatMessage
+from agent_framework_redis import RedisChatMessageStore
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+def _store(**kwargs: object) -> RedisChatMessageStore:
+    store = RedisChatMessageStore(redis_url="redis://localhost:6379", thread_id="t1", **kwargs)  # type: ignore[arg-type]
+    store._redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    return store
+
+
+async def test_cached_tail_is_trimmed_to_max_messages() -> None:
+    store = _store(max_messages=3, cache_messages=True)
+    await store.list_messages()
+
+    for index in range(5):
+        await store.add_messages([ChatMessage(role="user", text=f"m{index}")])
+
+    assert len(store._tail_cache) == 3
+    assert [message.text for message in await store.list_messages()] == ["m2", "m3", "m4"]
+
+
+@pytest.mark.parametrize(
+    ("thread_id", "meta_key"),
+    [("t1", "{chat_messages:t1}:meta"), ("{user_1}:t1", "chat_messages:{user_1}:t1:meta")],
+)
+def test_meta_key_hashes_to_the_slot_of_the_message_list(thread_id: str, meta_key: str) -> None:
+    store = RedisChatMessageStore(redis_url="redis://localhost:6379", thread_id=thread_id)
+
+    assert store.meta_key == meta_key
+    assert key_slot(store.meta_key.encode()) == key_slot(store.redis_key.encode())
+
+
+async def test_replace_messages_swaps_a_stored_span_for_a_summary() -> None:
+    store = _store()
+    await store.add_messages([ChatMessage(role="user", text=f"m{index}") for index in range(4)])
+    span = (await store.list_messages())[:3]
+
+    assert await store.replace_messages(span, [ChatMessage(role="assistant", text="summary")])
+    assert [message.text for message in await store.list_messages()] == ["summary", "m3"]
+    # the span is gone, so replacing it again is refused
+    assert not await store.replace_messages(span, [ChatMessage(role="assistant", text="summary")])
@@ -0,0 +1,78 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from agent_framework import ChatMessage
+from agent_framework.exceptions import ServiceInitializationError
+from agent_framework_redis import RedisProvider
+
+
+class _FakeIndex:
+    """Records the calls the provider makes to its search index."""
+
+    def __init__(self) -> None:
+        self.created: list[bool] = []
+        self.loaded: list[dict[str, Any]] = []
+
+    async def exists(self) -> bool:
+        return False
+
+    async def create(self, overwrite: bool = False, drop: bool = False) -> None:
+        self.created.append(overwrite)
+
+    async def load(self, documents: list[dict[str, Any]]) -> None:
+        self.loaded.extend(documents)
+
+
+def _provider(index: _FakeIndex, **kwargs: Any) -> RedisProvider:
+    kwargs.setdefault("index_name", f"context_{uuid4().hex}")
+    return RedisProvider(redis_index=index, **kwargs)
+
+
+async def test_write_behind_memories_are_stored_when_the_outermost_context_exits() -> None:
+    index = _FakeIndex()
+    provider = _provider(index, user_id="u1", write_behind=True, write_flush_interval=60)
+
+    async with provider:
+        # the agent enters the provider again for each run
+        async with provider:
+            await provider.invoked(ChatMessage(role="user", text="first"))
+        async with provider:
+            await provider.invoked(ChatMessage(role="user", text="second"))
+
+    assert [document["content"] for document in index.loaded] == ["first", "second"]
+
+
+def test_write_behind_memories_are_stored_when_the_loop_is_closed() -> None:
+    index = _FakeIndex()
+    provider = _provider(index, user_id="u1", write_behind=True, write_flush_interval=60)
+
+    async def run() -> None:
+        await provider.invoked(ChatMessage(role="user", text="remember this"))
+
+    asyncio.run(run())
+
+    assert [document["content"] for document in index.loaded] == ["remember this"]
+
+
+def test_write_behind_requires_a_scope() -> None:
+    provider = _provider(_FakeIndex(), write_behind=True)
+
+    with pytest.raises(ServiceInitializationError):
+        provider._enqueue_documents([{"content": "unscoped"}])
+    assert provider._pending_documents == []
+
+
+async def test_index_readiness_is_tracked_per_overwrite_flag() -> None:
+    index = _FakeIndex()
+    index_name = f"context_{uuid4().hex}"
+
+    await _provider(index, index_name=index_name, user_id="u1")._ensure_index()
+    await _provider(index, index_name=index_name, user_id="u1")._ensure_index()
+    await _provider(index, index_name=index_name, user_id="u1", overwrite_index=True)._ensure_index()
+
+    assert index.created == [False, True]